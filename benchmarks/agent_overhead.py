@@ -0,0 +1,594 @@
+"""Benchmark suite: framework overhead of the agent loop.
+
+Drives ``LLMAgent`` with an in-process ``ScriptedLLM`` so that what is
+measured is the framework itself (prompt building, rollout rendering, tool
+dispatch, memory, skills, subagents), not a model. Cases:
+
+- ``step``: per-step overhead with a zero-latency LLM
+- ``throughput``: tasks/s under ``run``, ``run_many`` and
+  ``run_supervised``, with a simulated LLM latency
+- ``rollout``: peak memory and per-step overhead as the rollout grows
+- ``features``: extra cost per task of skills, memory and subagents
+- ``plan``: end-to-end latency of independent lookups run by the
+  sequential loop vs. as a ``StepMode.PLANNED`` plan, with a simulated
+  LLM latency
+- ``logging``: per-step overhead with console logging at INFO vs. DEBUG,
+  written on the event loop vs. from a ``QueueListener`` thread
+- ``hedge``: p99 latency of LLM calls with a heavy-tailed simulated latency,
+  bare vs. behind a hedging ``ResilientLLM``
+- ``memory_write``: tasks/s of many concurrent ``run()``s recording into
+  one ``JSONMemoryStore``, per durability mode
+
+Results are written as JSON and compared against a stored baseline; the
+exit status is 1 if any metric regressed by more than ``--tolerance``.
+
+Usage::
+
+    python benchmarks/agent_overhead.py [--cases step,rollout] [--quick]
+        [--output results.json] [--baseline PATH] [--save-baseline]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import io
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator
+
+from llm_agents_from_scratch import LLMAgent, LLMAgentBuilder
+from llm_agents_from_scratch.data_structures import (
+    Durability,
+    StepMode,
+    Task,
+    TaskResult,
+    ToolCall,
+)
+from llm_agents_from_scratch.llms import (
+    LatencyModel,
+    ResilientLLM,
+    ScriptedLLM,
+)
+from llm_agents_from_scratch.logger import (
+    ROOT_LOGGER_NAME,
+    disable_console_logging,
+    disable_queue_logging,
+    enable_console_logging,
+    enable_queue_logging,
+)
+from llm_agents_from_scratch.memory import Memory
+from llm_agents_from_scratch.memory_stores import JSONMemoryStore
+from llm_agents_from_scratch.skills import SkillScope
+from llm_agents_from_scratch.subagents import SubAgentSpec
+from llm_agents_from_scratch.tools import SimpleFunctionTool
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "agent_overhead.json"
+
+# metric name -> {"value": float, "unit": str, "better": ...}, where better
+# is "lower", "higher", or "info" for metrics not compared to the baseline
+Metrics = dict[str, dict[str, Any]]
+
+
+def lookup_flight(origin: str, destination: str) -> str:
+    """Look up the next flight between two airports."""
+    return f"{origin}->{destination} departs 09:40, gate 12"
+
+
+def _plan(steps: int) -> list[str | ToolCall]:
+    """A script of ``steps`` steps, each one tool call then an answer."""
+    script: list[str | ToolCall] = []
+    for i in range(steps):
+        script.append(
+            ToolCall(
+                tool_name="lookup_flight",
+                arguments={"origin": "YYZ", "destination": f"LIS{i}"},
+            ),
+        )
+        script.append(f"Flight {i} found; next leg pending.")
+    return script
+
+
+def _agent(llm: ScriptedLLM, **kwargs: Any) -> LLMAgent:
+    return LLMAgent(
+        llm=llm,
+        tools=[SimpleFunctionTool(lookup_flight)],
+        **kwargs,
+    )
+
+
+def _tasks(n: int) -> list[Task]:
+    return [Task(instruction=f"Plan trip #{i} from YYZ.") for i in range(n)]
+
+
+async def _run_sequential(
+    agent: LLMAgent,
+    tasks: list[Task],
+    **run_kwargs: Any,
+) -> float:
+    """Run tasks one after another; return wall seconds."""
+    start = time.perf_counter()
+    for task in tasks:
+        await agent.run(task, skills_scopes=[SkillScope.PROJECT], **run_kwargs)
+    return time.perf_counter() - start
+
+
+async def _best_of(repeat: int, run: Callable[[], Awaitable[float]]) -> float:
+    """Fastest of ``repeat`` runs, the least noisy estimate of overhead."""
+    return min([await run() for _ in range(repeat)])
+
+
+async def _drive_supervised(agent: LLMAgent, task: Task) -> None:
+    """Drive a supervised task the way a notebook user would."""
+    handler = await agent.run_supervised(
+        task,
+        skills_scopes=[SkillScope.PROJECT],
+    )
+    step_result = None
+    while True:
+        next_step = await handler.get_next_step(step_result)
+        if isinstance(next_step, TaskResult):
+            await handler.complete(next_step)
+            return
+        step_result = await handler.run_step(next_step)
+
+
+def _metric(value: float, unit: str, better: str = "lower") -> dict[str, Any]:
+    return {"value": round(value, 3), "unit": unit, "better": better}
+
+
+async def bench_step(args: argparse.Namespace) -> Metrics:
+    """Per-step framework overhead with a zero-latency LLM."""
+    llm = ScriptedLLM(_plan(args.steps))
+    agent = _agent(llm)
+    tasks = _tasks(args.tasks)
+    await _run_sequential(agent, tasks[:1])  # warm-up
+    llm.reset()
+
+    wall = await _best_of(
+        args.repeat,
+        lambda: _run_sequential(agent, tasks),
+    )
+    num_calls = sum(llm.calls.values()) // args.repeat
+    num_steps = args.tasks * (args.steps + 1)  # + final answer step
+    return {
+        "step.overhead": _metric(wall / num_steps * 1e6, "us/step"),
+        "step.llm_call_overhead": _metric(wall / num_calls * 1e6, "us/call"),
+    }
+
+
+async def bench_throughput(args: argparse.Namespace) -> Metrics:
+    """Tasks/s under run, run_many and run_supervised."""
+    latency = LatencyModel("normal", mean=args.latency, stddev=0, seed=0)
+    llm = ScriptedLLM(_plan(args.steps), latency=latency)
+    agent = _agent(llm)
+    tasks = _tasks(args.tasks)
+
+    wall = await _run_sequential(agent, tasks)
+    llm_wall = llm.simulated_latency
+    llm.reset()
+
+    batch = await agent.run_many(
+        tasks,
+        concurrency=args.concurrency,
+        skills_scopes=[SkillScope.PROJECT],
+    )
+    llm.reset()
+
+    start = time.perf_counter()
+    for task in tasks:
+        # own asyncio task per run, so each follows the script from the start
+        await asyncio.create_task(_drive_supervised(agent, task))
+    supervised_wall = time.perf_counter() - start
+
+    return {
+        "throughput.run": _metric(args.tasks / wall, "tasks/s", "higher"),
+        "throughput.run_many": _metric(batch.throughput, "tasks/s", "higher"),
+        "throughput.run_supervised": _metric(
+            args.tasks / supervised_wall,
+            "tasks/s",
+            "higher",
+        ),
+        "throughput.run_overhead_share": _metric(
+            (wall - llm_wall) / wall * 100,
+            "%",
+        ),
+    }
+
+
+async def bench_rollout(args: argparse.Namespace) -> Metrics:
+    """Peak memory and per-step overhead as the rollout grows."""
+    metrics: Metrics = {}
+    for steps in args.rollout_steps:
+        llm = ScriptedLLM(_plan(steps))
+        agent = _agent(llm)
+        tracemalloc.start()
+        try:
+            wall = await _run_sequential(agent, _tasks(1))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        metrics[f"rollout.peak_memory.{steps}_steps"] = _metric(
+            peak / 1024,
+            "KiB",
+        )
+        # tracemalloc slows allocation down; time a second, untraced run
+        wall = await _best_of(
+            args.repeat,
+            lambda agent=agent: _run_sequential(agent, _tasks(1)),
+        )
+        metrics[f"rollout.overhead.{steps}_steps"] = _metric(
+            wall / (steps + 1) * 1e6,
+            "us/step",
+        )
+    return metrics
+
+
+def _write_skills(root: Path, n: int) -> None:
+    for i in range(n):
+        skill_dir = root / ".agents" / "skills" / f"skill-{i}"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: skill-{i}\ndescription: Benchmark skill {i}.\n---\n"
+            f"Follow step {i}.\n",
+        )
+
+
+async def bench_features(args: argparse.Namespace) -> Metrics:
+    """Extra cost per task of skills, memory and subagents."""
+    tasks = _tasks(args.tasks)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+
+        async def per_task(make_agent: Callable[[], LLMAgent]) -> float:
+            agent = make_agent()
+            await _run_sequential(agent, tasks[:1])  # warm-up
+            wall = await _best_of(
+                args.repeat,
+                lambda: _run_sequential(agent, tasks),
+            )
+            return wall / len(tasks)
+
+        base = await per_task(lambda: _agent(ScriptedLLM(_plan(args.steps))))
+
+        _write_skills(tmp_path / "project", args.skills)
+        with _cwd(tmp_path / "project"):
+            skills = await per_task(
+                lambda: _agent(ScriptedLLM(_plan(args.steps))),
+            )
+
+        (tmp_path / "memory").mkdir()
+        store = JSONMemoryStore(dir=tmp_path / "memory")
+        memory = await per_task(
+            lambda: _agent(
+                ScriptedLLM(_plan(args.steps)),
+                memories=[Memory(store=store)],
+            ),
+        )
+
+        helper = SubAgentSpec(
+            name="helper",
+            description="Books the flight.",
+            builder=LLMAgentBuilder(llm=ScriptedLLM(_plan(1))).with_tool(
+                SimpleFunctionTool(lookup_flight),
+            ),
+        )
+        dispatch = ToolCall(
+            tool_name="from_scratch__use_subagent",
+            arguments={"name": "helper", "task": "Book it."},
+        )
+        subagents = await per_task(
+            lambda: _agent(
+                ScriptedLLM([dispatch, "Booked.", *_plan(args.steps - 1)]),
+                subagents=[helper],
+            ),
+        )
+
+    metrics = {"features.none": _metric(base * 1e6, "us/task")}
+    for name, wall in [
+        ("skills", skills),
+        ("memory", memory),
+        ("subagents", subagents),
+    ]:
+        metrics[f"features.{name}"] = _metric(wall * 1e6, "us/task")
+        # a difference of two timings is too noisy to gate on
+        metrics[f"features.{name}.cost"] = _metric(
+            (wall - base) * 1e6,
+            "us/task",
+            better="info",
+        )
+    return metrics
+
+
+@contextmanager
+def _cwd(path: Path) -> Iterator[None]:
+    """Run with ``path`` as the project directory."""
+    previous = Path.cwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+async def bench_plan(args: argparse.Namespace) -> Metrics:
+    """Latency of one task of independent lookups: loop vs. parallel plan."""
+    latency = LatencyModel("normal", mean=args.latency, stddev=0, seed=0)
+    tasks = _tasks(1)
+
+    # classic: one lookup per step, each followed by a routing call
+    llm = ScriptedLLM(_plan(args.steps), latency=latency)
+    sequential = await _best_of(
+        args.repeat,
+        lambda: _run_sequential(_agent(llm), tasks),
+    )
+
+    # planned: every step follows the script from the start, i.e. makes
+    # one lookup; the plan has no dependencies, so all steps are ready
+    plan = {
+        "steps": [
+            {"id": f"s{i}", "instruction": f"Look up leg {i}."}
+            for i in range(args.steps)
+        ],
+    }
+    llm = ScriptedLLM(
+        _plan(1),
+        latency=latency,
+        structured_outputs={"TaskPlan": plan},
+    )
+    agent = _agent(llm, max_parallel_steps=args.concurrency)
+    planned = await _best_of(
+        args.repeat,
+        lambda: _run_sequential(agent, tasks, step_mode=StepMode.PLANNED),
+    )
+    return {
+        "plan.sequential_latency": _metric(sequential * 1e3, "ms", "info"),
+        "plan.planned_latency": _metric(planned * 1e3, "ms"),
+        "plan.speedup": _metric(sequential / planned, "x", "higher"),
+    }
+
+
+class _TerminalSink(io.TextIOBase):
+    """Discards output, blocking like a terminal for each write."""
+
+    WRITE_LATENCY = 50e-6
+
+    def write(self, s: str) -> int:
+        time.sleep(self.WRITE_LATENCY)
+        return len(s)
+
+
+async def bench_logging(args: argparse.Namespace) -> Metrics:
+    """Per-step overhead with console logging at INFO vs. DEBUG."""
+    llm = ScriptedLLM(_plan(args.steps))
+    agent = _agent(llm)
+    tasks = _tasks(args.tasks)
+    num_steps = args.tasks * (args.steps + 1)  # + final answer step
+    library_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    level = library_logger.level
+
+    metrics: Metrics = {}
+    with contextlib.redirect_stdout(_TerminalSink()):
+        for name, log_level, queued in [
+            ("info", "INFO", False),
+            ("debug", "DEBUG", False),
+            ("debug_queued", "DEBUG", True),
+        ]:
+            enable_console_logging(log_level)
+            if queued:
+                enable_queue_logging()
+            try:
+                wall = await _best_of(
+                    args.repeat,
+                    lambda: _run_sequential(agent, tasks),
+                )
+            finally:
+                disable_queue_logging()
+                disable_console_logging()
+            metrics[f"logging.step_overhead_{name}"] = _metric(
+                wall / num_steps * 1e6,
+                "us/step",
+            )
+    library_logger.setLevel(level)
+    return metrics
+
+
+async def bench_hedge(args: argparse.Namespace) -> Metrics:
+    """p99 LLM call latency with and without hedged requests."""
+    num_calls = args.tasks * 10
+    latency = LatencyModel(
+        "lognormal",
+        mean=args.latency,
+        stddev=args.latency * 3,
+        seed=0,
+    )
+    bare = ScriptedLLM(latency=latency)
+    hedged = ResilientLLM(
+        ScriptedLLM(latency=latency),
+        hedge_percentile=0.9,
+        min_samples=min(20, num_calls),
+    )
+
+    def p99(samples: list[float]) -> float:
+        return sorted(samples)[max(int(len(samples) * 0.99) - 1, 0)]
+
+    bare_latencies = []
+    for _ in range(num_calls):
+        start = time.perf_counter()
+        await bare.complete("hi")
+        bare_latencies.append(time.perf_counter() - start)
+    hedged_latencies = []
+    for _ in range(num_calls):
+        start = time.perf_counter()
+        await hedged.complete("hi")
+        hedged_latencies.append(time.perf_counter() - start)
+
+    stats = hedged.stats()
+    return {
+        "hedge.p99_unhedged": _metric(p99(bare_latencies) * 1e3, "ms", "info"),
+        "hedge.p99": _metric(p99(hedged_latencies) * 1e3, "ms", "info"),
+        "hedge.p99_speedup": _metric(
+            p99(bare_latencies) / p99(hedged_latencies),
+            "x",
+            "higher",
+        ),
+        "hedge.extra_requests": _metric(
+            stats.hedges / stats.calls * 100,
+            "%",
+            "info",
+        ),
+    }
+
+
+async def bench_memory_write(args: argparse.Namespace) -> Metrics:
+    """Concurrent runs recording episodes into one JSONMemoryStore."""
+    num_tasks = args.tasks * 10
+    # spread the runs out, so episodes arrive over time, not all at once
+    latency = LatencyModel(
+        "normal",
+        mean=args.latency,
+        stddev=args.latency / 2,
+        seed=0,
+    )
+    tasks = _tasks(num_tasks)
+
+    async def run(durability: Durability) -> float:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = JSONMemoryStore(dir=Path(tmp), durability=durability)
+            agent = _agent(
+                ScriptedLLM(_plan(1), latency=latency),
+                memories=[Memory(store=store)],
+            )
+            start = time.perf_counter()
+            await asyncio.gather(*[agent.run(task) for task in tasks])
+            await store.flush()
+            return time.perf_counter() - start
+
+    metrics: Metrics = {}
+    for durability in Durability:
+        wall = await _best_of(args.repeat, functools.partial(run, durability))
+        metrics[f"memory_write.{durability.value}"] = _metric(
+            num_tasks / wall,
+            "tasks/s",
+            "higher",
+        )
+    return metrics
+
+
+CASES: dict[str, Callable[[argparse.Namespace], Awaitable[Metrics]]] = {
+    "step": bench_step,
+    "throughput": bench_throughput,
+    "rollout": bench_rollout,
+    "features": bench_features,
+    "plan": bench_plan,
+    "logging": bench_logging,
+    "hedge": bench_hedge,
+    "memory_write": bench_memory_write,
+}
+
+
+def compare(
+    metrics: Metrics,
+    baseline: Metrics,
+    tolerance: float,
+) -> list[str]:
+    """Print metrics next to their baseline; return regressed metrics."""
+    regressions = []
+    print(f"{'metric':<40}{'value':>12}{'baseline':>12}{'change':>9}  unit")
+    for name, metric in metrics.items():
+        value = metric["value"]
+        reference = baseline.get(name, {}).get("value")
+        if not reference or metric["better"] == "info":
+            print(f"{name:<40}{value:>12.2f}{'-':>12}{'':>9}  {metric['unit']}")
+            continue
+        change = (value - reference) / abs(reference)
+        worse = -change if metric["better"] == "higher" else change
+        flag = " !" if worse > tolerance else ""
+        if flag:
+            regressions.append(name)
+        print(
+            f"{name:<40}{value:>12.2f}{reference:>12.2f}{change:>+9.0%}"
+            f"  {metric['unit']}{flag}",
+        )
+    return regressions
+
+
+def main() -> None:
+    """Run the selected cases, write results and compare to the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", default=",".join(CASES))
+    parser.add_argument("--tasks", type=int, default=20)
+    parser.add_argument("--steps", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.002,
+        help="simulated seconds per LLM call in the throughput case",
+    )
+    parser.add_argument("--skills", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--rollout-steps",
+        type=lambda s: [int(n) for n in s.split(",")],
+        default=[10, 50, 200],
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="small sizes, for smoke-testing the suite",
+    )
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    args = parser.parse_args()
+    if args.quick:
+        args.tasks, args.steps, args.repeat = 3, 2, 1
+        args.rollout_steps = [5, 20]
+
+    metrics: Metrics = {}
+    for name in args.cases.split(","):
+        metrics.update(asyncio.run(CASES[name](args)))
+
+    results = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": {
+                k: v for k, v in vars(args).items() if not isinstance(v, Path)
+            },
+        },
+        "metrics": metrics,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    baseline: Metrics = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["metrics"]
+    regressions = compare(metrics, baseline, args.tolerance)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Baseline saved to {args.baseline}")
+    elif regressions:
+        print(
+            f"Regressed beyond {args.tolerance:.0%}: {', '.join(regressions)}",
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Micro-benchmark: per-call overhead of tool schemas and validation.
+
+Compares what every tool call and every LLM request paid before schemas,
+validators and provider payloads were cached (``uncached``) against the
+current code path (``cached``).
+
+Usage::
+
+    python benchmarks/tool_overhead.py [--number 2000]
+"""
+
+import argparse
+import timeit
+from typing import Any, Callable
+
+from jsonschema import validate
+
+from llm_agents_from_scratch.data_structures import ToolCall
+from llm_agents_from_scratch.llms.ollama.utils import (
+    _get_tool_json_schema,
+    tool_to_ollama_tool,
+)
+from llm_agents_from_scratch.llms.openai.utils import (
+    _build_openai_tool,
+    tool_to_openai_tool,
+)
+from llm_agents_from_scratch.tools import SimpleFunctionTool
+from llm_agents_from_scratch.tools.simple_function import (
+    function_signature_to_json_schema,
+)
+from llm_agents_from_scratch.tools.utils import validate_tool_call_arguments
+
+
+def search_flights(  # noqa: PLR0913, PLR0917
+    origin: str,
+    destination: str,
+    date: str,
+    passengers: int = 1,
+    max_price: float | None = None,
+    nonstop: bool = False,
+) -> str:
+    """Search for flights."""
+    return f"{origin}->{destination} on {date}"
+
+
+def _cases(
+    tool: SimpleFunctionTool,
+    tool_call: ToolCall,
+) -> dict[str, tuple[Callable[[], Any], Callable[[], Any]]]:
+    """Benchmark cases as ``name -> (uncached, cached)``."""
+    from ollama import Tool as OllamaTool  # noqa: PLC0415
+
+    return {
+        "schema": (
+            lambda: function_signature_to_json_schema(tool.func),
+            lambda: tool.parameters_json_schema,
+        ),
+        "validate": (
+            lambda: validate(
+                tool_call.arguments,
+                schema=function_signature_to_json_schema(tool.func),
+            ),
+            lambda: validate_tool_call_arguments(
+                tool_call,
+                tool.parameters_json_schema,
+            ),
+        ),
+        "ollama payload": (
+            lambda: OllamaTool.model_validate(
+                _get_tool_json_schema(tool),
+            ),
+            lambda: tool_to_ollama_tool(tool),
+        ),
+        "openai payload": (
+            lambda: _build_openai_tool(tool),
+            lambda: tool_to_openai_tool(tool),
+        ),
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print microseconds per call."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    tool = SimpleFunctionTool(search_flights)
+    tool_call = ToolCall(
+        tool_name="search_flights",
+        arguments={"origin": "YYZ", "destination": "LIS", "date": "May 1"},
+    )
+
+    print(f"{'case':<16}{'uncached µs':>14}{'cached µs':>12}{'speedup':>10}")
+    for name, (uncached, cached) in _cases(tool, tool_call).items():
+        cached()  # warm the caches
+        before = timeit.timeit(uncached, number=args.number) / args.number
+        after = timeit.timeit(cached, number=args.number) / args.number
+        print(
+            f"{name:<16}{before * 1e6:>14.1f}{after * 1e6:>12.1f}"
+            f"{before / after:>9.1f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,22 @@
 """UseA2AAgentTool — dispatches a task to a named A2A peer agent."""
 
+import asyncio
+import contextlib
 import json
 from typing import Any
 
 import httpx
 from a2a.client import ClientConfig, create_client
 from a2a.helpers import new_text_message
+from a2a.types import CancelTaskRequest, SendMessageRequest, StreamResponse
 from a2a.types import Role as A2ARole
-from a2a.types import SendMessageRequest, StreamResponse
 
 from llm_agents_from_scratch.base.tool import AsyncBaseTool
 from llm_agents_from_scratch.data_structures import ToolCall, ToolCallResult
 from llm_agents_from_scratch.errors import A2AAgentNotFoundError
 
 from .spec import A2AAgentSpec
-from .utils import a2a_response_to_tool_call_result
+from .utils import a2a_response_task_id, a2a_response_to_tool_call_result
 
 
 def _validate_arguments(tool_call: ToolCall) -> ToolCallResult | None:
@@ -229,6 +231,7 @@ class UseA2AAgentTool(AsyncBaseTool):
             timeout=spec.timeout,
         ) as httpx_client:
             client = None
+            response: StreamResponse | None = None
             try:
                 client = await create_client(
                     agent=spec.agent_card,
@@ -244,9 +247,19 @@ class UseA2AAgentTool(AsyncBaseTool):
                 )
                 request = SendMessageRequest(message=message)
 
-                response: StreamResponse | None = None
                 async for chunk in client.send_message(request):
                     response = chunk
+            except asyncio.CancelledError:
+                # The peer keeps working on a dispatch we stop waiting for
+                # unless told otherwise. A resumed task's id is known up
+                # front; a new task's comes with the chunks received so far.
+                remote_id = task_id or a2a_response_task_id(response)
+                if client is not None and remote_id:
+                    with contextlib.suppress(Exception):
+                        await client.cancel_task(
+                            CancelTaskRequest(id=remote_id),
+                        )
+                raise
             except Exception as e:
                 return ToolCallResult(
                     tool_call_id=tool_call.id_,
@@ -36,6 +36,33 @@ def a2a_artifacts_text(artifacts: Sequence[Artifact]) -> str:
     return a2a_parts_text(parts)
 
 
+def a2a_response_task_id(response: StreamResponse | None) -> str | None:
+    """Return the id of the peer task a ``StreamResponse`` chunk is about.
+
+    Args:
+        response (StreamResponse | None): A chunk yielded by
+            ``client.send_message()``, or ``None``.
+
+    Returns:
+        str | None: The remote task id, or ``None`` if the chunk names
+            none (e.g. a direct message reply).
+    """
+    if response is None:
+        return None
+    kind = response.WhichOneof("payload")
+    if kind == "task":
+        task_id = response.task.id
+    elif kind == "status_update":
+        task_id = response.status_update.task_id
+    elif kind == "artifact_update":
+        task_id = response.artifact_update.task_id
+    elif kind == "message":
+        task_id = response.message.task_id
+    else:
+        return None
+    return task_id or None
+
+
 def a2a_response_to_tool_call_result(
     response: StreamResponse | None,
     agent_name: str,
@@ -1,5 +1,7 @@
 """StreamingLLMAgentA2AExecutor — streaming variant of LLMAgentA2AExecutor."""
 
+import asyncio
+
 from a2a.helpers import new_task_from_user_message, new_text_part
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
@@ -19,45 +21,43 @@ from a2a.utils.constants import PROTOCOL_VERSION_1_0, TransportProtocol
 from a2a.utils.errors import TaskNotFoundError
 
 from llm_agents_from_scratch.agent.llm_agent import LLMAgent
-from llm_agents_from_scratch.data_structures import Task, TaskResult, TaskStep
+from llm_agents_from_scratch.data_structures import Task, TaskEventKind
 
 
 class StreamingLLMAgentA2AExecutor(AgentExecutor):
     """Bridges inbound A2A tasks to an ``LLMAgent``, streaming updates.
 
-    Drives ``LLMAgent.run_supervised()`` directly instead of ``run()``:
-    ``SupervisedTaskHandler`` has no background task at all — execution
-    is entirely caller-driven via ``get_next_step()``/``run_step()``
-    (built for Ch8's HITL use case, structurally identical to what
-    streaming needs). This executor calls that loop itself, publishing
-    a ``TaskStatusUpdateEvent`` after each step instead of prompting a
-    human — the same substitution ``LLMAgentA2AExecutor`` makes for the
-    non-streaming case, just at per-step instead of whole-run
-    granularity.
-
-    Two updates are published per step, not one: ``get_next_step()``
-    makes its own LLM call to decide routing (except on the very first
-    step) — real, awaitable work in its own right, not just
-    bookkeeping — so its result (the planned instruction) is published
-    before ``run_step()`` executes it, and that step's result is
-    published after.
-
-    Because there's no separate background task, cancellation here is
-    simpler than ``LLMAgentA2AExecutor``'s: the SDK's own producer loop
-    already runs *this* executor's ``execute()`` as its own task, so
-    cancelling that task interrupts whatever step is currently
-    in-flight directly — there's no orphaned worker left running
-    underneath, unlike ``LLMAgentA2AExecutor.cancel()``'s need to
-    separately cancel ``TaskHandler.background_task``.
+    Runs the task with ``LLMAgent.run()``, exactly like
+    ``LLMAgentA2AExecutor``, and publishes A2A updates from the
+    ``TaskHandler``'s event stream (``TaskHandler.subscribe()``) rather
+    than driving the step loop itself. The agent's own loop therefore
+    keeps everything it does around the steps — memory recall and
+    recording, the step budget, tracing — and this executor only
+    translates events.
+
+    Two updates are published per step, not one: the planned
+    instruction when the step starts (``get_next_step()`` makes its own
+    LLM call to decide routing, real work in its own right), and the
+    step's result when it finishes.
+
+    While a step runs, its LLM output is forwarded token by token as
+    chunks of a per-step ``step_output`` artifact (``append=True``), so
+    clients see partial output immediately rather than only once the
+    step's status update arrives.
+
+    The event stream is bounded and drops its oldest events rather than
+    block, so a slow A2A client can lose intermediate updates (most
+    likely token chunks) but never stalls the agent; the terminal result
+    or error is always delivered.
 
     Attributes:
         agent (LLMAgent): The agent this executor serves.
-        _task_handlers (dict[str, LLMAgent.SupervisedTaskHandler]):
-            In-flight runs, keyed by task_id. ``execute()`` and
-            ``cancel()`` are separate calls with no shared local state
-            connecting them — this registry is what lets ``cancel()``
-            find the specific ``SupervisedTaskHandler`` a concurrent
-            ``execute()`` call (for a different task_id) is driving.
+        _task_handlers (dict[str, LLMAgent.TaskHandler]): In-flight
+            runs, keyed by task_id. ``execute()`` and ``cancel()`` are
+            separate calls with no shared local state connecting
+            them — this registry is what lets ``cancel()`` find the
+            specific ``TaskHandler`` a concurrent ``execute()`` call
+            (for a different task_id) is following.
     """
 
     def __init__(self, agent: LLMAgent) -> None:
@@ -67,25 +67,21 @@ class StreamingLLMAgentA2AExecutor(AgentExecutor):
             agent (LLMAgent): The agent to bridge inbound A2A tasks to.
         """
         self.agent = agent
-        self._task_handlers: dict[str, LLMAgent.SupervisedTaskHandler] = {}
+        self._task_handlers: dict[str, LLMAgent.TaskHandler] = {}
 
     async def execute(
         self,
         context: RequestContext,
         event_queue: EventQueue,
     ) -> None:
-        """Runs the agent step by step, publishing an update per step.
-
-        Only ``Exception`` is caught below, deliberately not
-        ``BaseException``: ``asyncio.CancelledError`` (raised here when
-        the SDK cancels the producer task running this coroutine, per
-        ``cancel()`` below) must propagate uncaught. The SDK's own
-        producer loop wrapping this call has its own
-        ``except CancelledError`` that closes the event queue and lets
-        the producer task actually terminate. Catching and returning
-        normally here instead would make ``execute()`` look like it
-        finished successfully, leaving that producer task running —
-        parked awaiting a request that will never come.
+        """Runs the agent, publishing an update per step event.
+
+        ``asyncio.CancelledError`` must propagate, for the same reason
+        as in ``LLMAgentA2AExecutor.execute()``: the SDK's own producer
+        loop wrapping this call relies on it to close the event queue
+        and terminate. A cancelled run therefore re-raises it rather
+        than publishing FAILED, and cancelling ``execute()`` itself
+        cancels the run it follows so no worker is left behind.
 
         Args:
             context (RequestContext): The request context containing
@@ -108,46 +104,54 @@ class StreamingLLMAgentA2AExecutor(AgentExecutor):
         await updater.start_work()
 
         instruction = context.get_user_input()
-        task_handler = await self.agent.run_supervised(
-            Task(instruction=instruction),
-        )
+        task_handler = self.agent.run(Task(instruction=instruction))
+        # subscribe before the loop starts so no event is missed
+        events = task_handler.subscribe(tokens=True)
         self._task_handlers[task.id] = task_handler
         try:
-            step_result = None
-            while not task_handler.done():
-                next_step = await task_handler.get_next_step(step_result)
-                match next_step:
-                    case TaskStep():
+            step_output = _StepOutput(updater)
+            async for event in events:
+                match event.kind:
+                    case TaskEventKind.STEP_STARTED if event.step:
                         await updater.update_status(
                             TaskState.TASK_STATE_WORKING,
                             message=updater.new_agent_message(
-                                [new_text_part(next_step.instruction)],
+                                [new_text_part(event.step.instruction)],
                             ),
                         )
-                        step_result = await task_handler.run_step(next_step)
+                    case TaskEventKind.TOKEN_DELTA if event.delta:
+                        await step_output.append(
+                            f"{task.id}-step-{event.step_index}",
+                            event.delta,
+                        )
+                    case TaskEventKind.STEP_FINISHED if event.step_result:
+                        await step_output.close()
                         await updater.update_status(
                             TaskState.TASK_STATE_WORKING,
                             message=updater.new_agent_message(
-                                [new_text_part(step_result.content)],
+                                [new_text_part(event.step_result.content)],
+                            ),
+                        )
+                    case TaskEventKind.RESULT if event.result:
+                        await updater.add_artifact(
+                            parts=[new_text_part(event.result.content)],
+                            name="task_result",
+                        )
+                        await updater.complete()
+                    case TaskEventKind.ERROR:
+                        if task_handler.cancelled():
+                            raise asyncio.CancelledError
+                        await updater.update_status(
+                            TaskState.TASK_STATE_FAILED,
+                            message=updater.new_agent_message(
+                                [new_text_part(event.error or "")],
                             ),
                         )
-                    case TaskResult():
-                        await task_handler.complete(next_step)
-        except Exception as e:
-            await updater.update_status(
-                TaskState.TASK_STATE_FAILED,
-                message=updater.new_agent_message([new_text_part(str(e))]),
-            )
-            return
         finally:
             self._task_handlers.pop(task.id, None)
-
-        result = task_handler.result()
-        await updater.add_artifact(
-            parts=[new_text_part(result.content)],
-            name="task_result",
-        )
-        await updater.complete()
+            if not task_handler.done():
+                task_handler.background_task.cancel()
+                task_handler.cancel()
 
     async def cancel(
         self,
@@ -176,20 +180,61 @@ class StreamingLLMAgentA2AExecutor(AgentExecutor):
                 f"No in-flight task found for id '{context.task_id}'.",
             )
 
-        # No background_task to worry about here (SupervisedTaskHandler
-        # has none) -- the SDK already cancels the producer task
-        # running our own execute() before calling cancel(), which
-        # interrupts whatever step is currently in-flight directly.
-        # Publish CANCELED first regardless, for the same reason as
-        # LLMAgentA2AExecutor.cancel(): avoid racing the SDK's own
-        # producer-loop cleanup over this event_queue.
+        # Publish CANCELED first, then settle the run, for the same
+        # reasons as LLMAgentA2AExecutor.cancel(): avoid racing the
+        # SDK's own producer-loop cleanup over this event_queue, and
+        # settle task_handler itself, which cancelling background_task
+        # alone never does.
         updater = TaskUpdater(event_queue, context.task_id, context.context_id)
         await updater.cancel()
-
+        task_handler.background_task.cancel()
+        try:  # noqa: SIM105
+            await task_handler.background_task
+        except asyncio.CancelledError:
+            pass
         if not task_handler.done():
             task_handler.cancel()
 
 
+class _StepOutput:
+    """Publishes a step's token deltas as chunks of one artifact."""
+
+    def __init__(self, updater: TaskUpdater) -> None:
+        self.updater = updater
+        self.artifact_id: str | None = None
+
+    async def append(self, artifact_id: str, delta: str) -> None:
+        """Publish a delta, closing the previous step's artifact first.
+
+        Args:
+            artifact_id (str): Id of the step's ``step_output`` artifact.
+            delta (str): The text delta.
+        """
+        if artifact_id != self.artifact_id:
+            await self.close()
+        await self.updater.add_artifact(
+            parts=[new_text_part(delta)],
+            artifact_id=artifact_id,
+            name="step_output",
+            append=self.artifact_id is not None,
+            last_chunk=False,
+        )
+        self.artifact_id = artifact_id
+
+    async def close(self) -> None:
+        """Publish the last chunk of the open artifact, if any."""
+        if self.artifact_id is None:
+            return
+        await self.updater.add_artifact(
+            parts=[new_text_part("")],
+            artifact_id=self.artifact_id,
+            name="step_output",
+            append=True,
+            last_chunk=True,
+        )
+        self.artifact_id = None
+
+
 def build_streaming_agent_card(  # noqa: PLR0913, PLR0917
     name: str,
     description: str,
@@ -1,4 +1,5 @@
 from .builder import LLMAgentBuilder
+from .comparison import compare_step_modes
 from .llm_agent import LLMAgent
 
-__all__ = ["LLMAgent", "LLMAgentBuilder"]
+__all__ = ["LLMAgent", "LLMAgentBuilder", "compare_step_modes"]
@@ -12,11 +12,21 @@ from llm_agents_from_scratch.agent.templates import (
     default_templates,
 )
 from llm_agents_from_scratch.base import LLM
+from llm_agents_from_scratch.base.checkpointer import BaseCheckpointer
+from llm_agents_from_scratch.base.compactor import BaseRolloutCompactor
 from llm_agents_from_scratch.base.tool import Tool
+from llm_agents_from_scratch.data_structures import (
+    PromptLayout,
+    Timeouts,
+    ToolResultPolicy,
+)
 from llm_agents_from_scratch.errors import LLMAgentBuilderError
 from llm_agents_from_scratch.memory.memory import Memory
+from llm_agents_from_scratch.memory.writer import MemoryWriter
+from llm_agents_from_scratch.skills.index import SkillIndex
 from llm_agents_from_scratch.tools import MCPTool
 from llm_agents_from_scratch.tools.mcp import MCPToolProvider
+from llm_agents_from_scratch.tracing import Tracer
 
 from .llm_agent import LLMAgent
 
@@ -38,9 +48,23 @@ class LLMAgentBuilder:
             Added in Chapter 9.
         a2a_agents (list[A2AAgentSpec]): A2A peer specs for the agent.
             Added in Chapter 10.
+        compactor (BaseRolloutCompactor | None): Rollout compactor for the
+            agent.
+        prompt_layout (PromptLayout): Prompt layout for the agent.
+        max_tool_rounds_per_step (int): Tool-call rounds per step.
+        tracer (Tracer | None): Tracer for the agent.
+        skill_index (SkillIndex | None): Skill index for the agent.
+        timeouts (Timeouts | None): Deadlines for the agent.
+        tool_result_policy (ToolResultPolicy | None): When the agent
+            spills tool results to a blob store.
+        checkpointer (BaseCheckpointer | None): Task checkpointer for the
+            agent.
+        max_parallel_steps (int): Steps of a plan run at once.
+        memory_writer (MemoryWriter | None): Background episode writer for
+            the agent.
     """
 
-    def __init__(  # noqa: PLR0913
+    def __init__(  # noqa: PLR0913, PLR0917
         self,
         llm: LLM | None = None,
         tools: list[Tool] | None = None,
@@ -52,6 +76,16 @@ class LLMAgentBuilder:
         subagents: "list[SubAgentSpec] | None" = None,
         # added in ch10
         a2a_agents: list[A2AAgentSpec] | None = None,
+        compactor: BaseRolloutCompactor | None = None,
+        prompt_layout: PromptLayout = PromptLayout.CLASSIC,
+        max_tool_rounds_per_step: int = 1,
+        tracer: Tracer | None = None,
+        skill_index: SkillIndex | None = None,
+        timeouts: Timeouts | None = None,
+        tool_result_policy: ToolResultPolicy | None = None,
+        checkpointer: BaseCheckpointer | None = None,
+        max_parallel_steps: int = 4,
+        memory_writer: MemoryWriter | None = None,
     ) -> None:
         """Initialize an LLMAgentBuilder.
 
@@ -102,6 +136,31 @@ class LLMAgentBuilder:
             a2a_agents (list[A2AAgentSpec] | None, optional): A2A peer
                 specs to register on the agent. Defaults to None. Added
                 in Chapter 10.
+            compactor (BaseRolloutCompactor | None, optional): Rollout
+                compactor bounding the rollout sent to the LLM. Defaults
+                to None (no compaction).
+            prompt_layout (PromptLayout, optional): How step prompts are
+                ordered. Defaults to ``PromptLayout.CLASSIC``.
+            max_tool_rounds_per_step (int, optional): Rounds of tool calls
+                one step may execute. Defaults to 1.
+            tracer (Tracer | None, optional): Records spans of the agent's
+                tasks. Defaults to None (no tracing).
+            skill_index (SkillIndex | None, optional): Persistent index for
+                skill discovery. Defaults to None.
+            timeouts (Timeouts | None, optional): Deadlines of tasks,
+                steps, LLM calls and tool calls. Defaults to None (all
+                unbounded).
+            tool_result_policy (ToolResultPolicy | None, optional): When
+                tool results are spilled to a task-scoped blob store.
+                Defaults to None (results are passed on whole).
+            checkpointer (BaseCheckpointer | None, optional): Stores task
+                checkpoints so interrupted tasks can be resumed. Defaults
+                to None (no checkpoints).
+            max_parallel_steps (int, optional): Steps of a planned task run
+                at the same time. Defaults to 4.
+            memory_writer (MemoryWriter | None, optional): Records episodes
+                in the background. Defaults to None (tasks wait for their
+                episodes to be written).
         """
         self.llm = llm
         self.templates = templates
@@ -113,6 +172,16 @@ class LLMAgentBuilder:
         self.subagents: list[SubAgentSpec] = subagents or []
         # added in ch10
         self.a2a_agents: list[A2AAgentSpec] = a2a_agents or []
+        self.compactor = compactor
+        self.prompt_layout = prompt_layout
+        self.max_tool_rounds_per_step = max_tool_rounds_per_step
+        self.tracer = tracer
+        self.skill_index = skill_index
+        self.timeouts = timeouts
+        self.tool_result_policy = tool_result_policy
+        self.checkpointer = checkpointer
+        self.max_parallel_steps = max_parallel_steps
+        self.memory_writer = memory_writer
 
     def with_llm(self, llm: LLM) -> Self:
         """Set llm of builder."""
@@ -190,6 +259,96 @@ class LLMAgentBuilder:
         self.a2a_agents.extend(specs)
         return self
 
+    def with_compactor(self, compactor: BaseRolloutCompactor) -> Self:
+        """Set rollout compactor of builder.
+
+        Args:
+            compactor (BaseRolloutCompactor): The rollout compactor.
+        """
+        self.compactor = compactor
+        return self
+
+    def with_prompt_layout(self, prompt_layout: PromptLayout) -> Self:
+        """Set prompt layout of builder.
+
+        Args:
+            prompt_layout (PromptLayout): The prompt layout.
+        """
+        self.prompt_layout = prompt_layout
+        return self
+
+    def with_max_tool_rounds_per_step(self, max_rounds: int) -> Self:
+        """Set tool-call rounds per step of builder.
+
+        Args:
+            max_rounds (int): Rounds of tool calls one step may execute.
+        """
+        self.max_tool_rounds_per_step = max_rounds
+        return self
+
+    def with_tracer(self, tracer: Tracer) -> Self:
+        """Set tracer of builder.
+
+        Args:
+            tracer (Tracer): The tracer.
+        """
+        self.tracer = tracer
+        return self
+
+    def with_skill_index(self, skill_index: SkillIndex) -> Self:
+        """Set skill index of builder.
+
+        Args:
+            skill_index (SkillIndex): The skill index.
+        """
+        self.skill_index = skill_index
+        return self
+
+    def with_timeouts(self, timeouts: Timeouts) -> Self:
+        """Set timeouts of builder.
+
+        Args:
+            timeouts (Timeouts): The deadlines for the agent.
+        """
+        self.timeouts = timeouts
+        return self
+
+    def with_tool_result_policy(self, policy: ToolResultPolicy) -> Self:
+        """Set tool result policy of builder.
+
+        Args:
+            policy (ToolResultPolicy): When tool results are spilled.
+        """
+        self.tool_result_policy = policy
+        return self
+
+    def with_checkpointer(self, checkpointer: BaseCheckpointer) -> Self:
+        """Set task checkpointer of builder.
+
+        Args:
+            checkpointer (BaseCheckpointer): The task checkpointer.
+        """
+        self.checkpointer = checkpointer
+        return self
+
+    def with_max_parallel_steps(self, max_parallel_steps: int) -> Self:
+        """Set steps of a plan run at once of builder.
+
+        Args:
+            max_parallel_steps (int): Steps of a plan run at the same time.
+        """
+        self.max_parallel_steps = max_parallel_steps
+        return self
+
+    def with_memory_writer(self, memory_writer: MemoryWriter) -> Self:
+        """Set background episode writer of builder.
+
+        Args:
+            memory_writer (MemoryWriter): The background episode writer.
+        """
+        self.memory_writer = memory_writer
+        return self
+
     async def build(self) -> LLMAgent:
         """Build an LLMAgent with configured tools and MCP providers.
 
@@ -229,4 +388,14 @@ class LLMAgentBuilder:
             memories=self.memories,  # added in ch07
             subagents=self.subagents,  # added in ch09
             a2a_agents=self.a2a_agents,  # added in ch10
+            compactor=self.compactor,
+            prompt_layout=self.prompt_layout,
+            max_tool_rounds_per_step=self.max_tool_rounds_per_step,
+            tracer=self.tracer,
+            skill_index=self.skill_index,
+            timeouts=self.timeouts,
+            tool_result_policy=self.tool_result_policy,
+            checkpointer=self.checkpointer,
+            max_parallel_steps=self.max_parallel_steps,
+            memory_writer=self.memory_writer,
         )
@@ -0,0 +1,63 @@
+"""Compare LLM usage of step modes."""
+
+import time
+from collections import Counter
+from typing import Any, Sequence
+
+from llm_agents_from_scratch.data_structures import (
+    StepMode,
+    StepModeReport,
+    Task,
+)
+
+from .llm_agent import LLMAgent
+
+
+async def compare_step_modes(
+    llm_agent: LLMAgent,
+    tasks: Sequence[Task],
+    step_modes: Sequence[StepMode | str] = (StepMode.CLASSIC, StepMode.FUSED),
+    **run_kwargs: Any,
+) -> dict[StepMode, StepModeReport]:
+    """Run the same tasks in each step mode and report LLM usage.
+
+    Tasks are run one at a time so latencies are comparable. Failed tasks
+    still count towards LLM calls and latency. If ``llm_agent`` has
+    memories configured, every run records an episode.
+
+    Example::
+
+        reports = await compare_step_modes(agent, tasks, max_steps=10)
+        for report in reports.values():
+            print(report)
+
+    Args:
+        llm_agent (LLMAgent): The agent to run the tasks with.
+        tasks (Sequence[Task]): The tasks to run in every mode.
+        step_modes (Sequence[StepMode | str]): The step modes to compare.
+            Defaults to classic and fused.
+        **run_kwargs (Any): Passed through to ``LLMAgent.run()``, e.g.
+            ``max_steps`` or ``skills_scopes``.
+
+    Returns:
+        dict[StepMode, StepModeReport]: One report per step mode.
+    """
+    reports = {}
+    for mode in map(StepMode, step_modes):
+        report = StepModeReport(step_mode=mode)
+        by_site: Counter[str] = Counter()
+        start = time.perf_counter()
+        for task in tasks:
+            handler = llm_agent.run(task, step_mode=mode, **run_kwargs)
+            try:
+                await handler
+            except Exception:
+                report.num_failed += 1
+            report.num_tasks += 1
+            report.llm_calls += len(handler.llm_calls)
+            report.llm_latency += sum(c.latency for c in handler.llm_calls)
+            by_site.update(c.site for c in handler.llm_calls)
+        report.wall_time = time.perf_counter() - start
+        report.llm_calls_by_site = dict(by_site)
+        reports[mode] = report
+    return reports
@@ -1,8 +1,19 @@
 """Agent Module."""
 
 import asyncio
+import hashlib
 import json
-from typing import TYPE_CHECKING, Any
+import time
+from contextvars import ContextVar
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Iterable,
+    TypeVar,
+)
 
 from rich.console import Console
 from rich.panel import Panel
@@ -11,38 +22,68 @@ from typing_extensions import Self
 
 from llm_agents_from_scratch.a2a.client.spec import A2AAgentSpec
 from llm_agents_from_scratch.a2a.client.tools import UseA2AAgentTool
-from llm_agents_from_scratch.base.llm import LLM
+from llm_agents_from_scratch.base.checkpointer import BaseCheckpointer
+from llm_agents_from_scratch.base.compactor import BaseRolloutCompactor
+from llm_agents_from_scratch.base.llm import LLM, current_run
 from llm_agents_from_scratch.base.tool import AsyncBaseTool, Tool
+from llm_agents_from_scratch.blobs import BlobStore, ReadBlobTool
+from llm_agents_from_scratch.blobs.constants import SPILLED_RESULT_TEMPLATE
 from llm_agents_from_scratch.data_structures import (
     ApprovalResult,
+    BatchRunResult,
+    BatchTaskResult,
     ChatMessage,
     ChatRole,
+    CompactionReport,
+    LLMCallRecord,
     NextStepDecision,
+    PlannedStep,
+    PromptLayout,
     RejectedTaskResult,
+    Rollout,
+    RolloutStep,
+    StepMode,
     Task,
+    TaskCheckpoint,
+    TaskEvent,
+    TaskEventKind,
+    TaskPlan,
     TaskResult,
     TaskStep,
     TaskStepResult,
+    Timeouts,
     ToolCall,
     ToolCallResult,
+    ToolResultPolicy,
 )
 from llm_agents_from_scratch.data_structures.memory import Episode
 from llm_agents_from_scratch.data_structures.skill import SkillScope
 from llm_agents_from_scratch.errors import (
+    AgentTimeoutError,
+    CheckpointNotFoundError,
     LLMAgentError,
+    LLMCallTimeoutError,
     MaxStepsReachedError,
+    MemoryRecallTimeoutError,
     RecordMemoryError,
+    StepTimeoutError,
     TaskHandlerError,
+    TaskTimeoutError,
+    ToolCallTimeoutError,
 )
-from llm_agents_from_scratch.logger import get_logger
+from llm_agents_from_scratch.llms.router import llm_site
+from llm_agents_from_scratch.logger import Lazy, get_logger
 from llm_agents_from_scratch.memory.memory import Memory
+from llm_agents_from_scratch.memory.writer import MemoryWriter
 from llm_agents_from_scratch.skills.constants import (
     EXPLICIT_SKILL_ACTIVATION_TEMPLATE,
     EXPLICIT_SKILL_ACTIVATION_WITH_PROMPT_TEMPLATE,
 )
 from llm_agents_from_scratch.skills.discovery import discover_skills
+from llm_agents_from_scratch.skills.index import SkillIndex
 from llm_agents_from_scratch.skills.skill import Skill
 from llm_agents_from_scratch.skills.tools import UseSkillTool
+from llm_agents_from_scratch.tracing import Tracer, current_tracer, trace_span
 
 from .templates import LLMAgentTemplates, default_templates
 
@@ -51,6 +92,82 @@ if TYPE_CHECKING:
     from llm_agents_from_scratch.subagents.tools import UseSubAgentTool
 
 
+# LLM methods TaskHandler streams while stream_step() has subscribers
+_STREAMABLE_METHODS = ("chat", "continue_chat_with_tool_results")
+
+# default bound of each TaskHandler.subscribe() queue
+EVENT_QUEUE_SIZE = 1024
+
+T = TypeVar("T")
+
+# the stream_step() subscribers of the step running in the current context;
+# concurrent planned steps each run in their own
+_step_delta_queues: ContextVar[list[asyncio.Queue[str | None]] | None] = (
+    ContextVar("_step_delta_queues", default=None)
+)
+# the index of the step running in the current context
+_step_index: ContextVar[int | None] = ContextVar("_step_index", default=None)
+
+
+async def _wait_for(
+    aw: Awaitable[T],
+    timeout: float | None,
+    error_cls: type[AgentTimeoutError],
+    message: str,
+) -> T:
+    """Await ``aw``, cancelling it and raising ``error_cls`` at the deadline.
+
+    Args:
+        aw (Awaitable[T]): What to await.
+        timeout (float | None): Seconds to allow. ``None`` waits forever.
+        error_cls (type[AgentTimeoutError]): Error raised on timeout.
+        message (str): Message of the error.
+
+    Returns:
+        T: The result of ``aw``.
+    """
+    if timeout is None:
+        return await aw
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        return await asyncio.wait_for(aw, timeout)
+    except asyncio.TimeoutError as e:
+        if loop.time() < deadline:
+            # raised by ``aw`` itself, e.g. a socket timeout in a tool
+            raise
+        raise error_cls(message) from e
+
+
+def _llm_input_attributes(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Span attributes describing the size of an LLM request."""
+    attributes: dict[str, Any] = {}
+    if (text := kwargs.get("input", kwargs.get("prompt"))) is not None:
+        attributes["llm.input_chars"] = len(text)
+    if (chat_history := kwargs.get("chat_history")) is not None:
+        attributes["llm.chat_history_messages"] = len(chat_history)
+        attributes["llm.chat_history_chars"] = sum(
+            len(m.content) for m in chat_history
+        )
+    if tool_call_results := kwargs.get("tool_call_results"):
+        attributes["llm.tool_results"] = len(tool_call_results)
+    if tools := kwargs.get("tools"):
+        attributes["llm.tools"] = len(tools)
+    return attributes
+
+
+def _llm_output_attributes(response: Any) -> dict[str, Any]:
+    """Span attributes describing the size of an LLM response."""
+    # chat methods return the response message last
+    message = response[-1] if isinstance(response, tuple) else response
+    if isinstance(message, ChatMessage):
+        return {
+            "llm.output_chars": len(message.content),
+            "llm.output_tool_calls": len(message.tool_calls or []),
+        }
+    return {"llm.output_type": type(message).__name__}
+
+
 def _prompt_for_approval(task_result: TaskResult) -> ApprovalResult:
     """Render a proposed task result and ask the operator to approve it.
 
@@ -105,6 +222,19 @@ class LLMAgent:
             name, so there's no flat-tool-namespace collision to guard
             against. Mirrors `subagents_registry`'s plain-name keying.
             Added in Chapter 10.
+        compactor (BaseRolloutCompactor | None): Bounds the rollout sent
+            to the LLM on every step. ``None`` sends it verbatim.
+        prompt_layout (PromptLayout): How step prompts are ordered.
+        max_tool_rounds_per_step (int): How many rounds of tool calls a
+            single ``run_step`` executes before deferring to the next step.
+        tracer (Tracer | None): Records spans of every task this agent runs.
+        skill_index (SkillIndex | None): Index used for skill discovery.
+        timeouts (Timeouts): Deadlines of tasks, steps, LLM and tool calls.
+        tool_result_policy (ToolResultPolicy | None): When tool results are
+            spilled to a task's blob store.
+        checkpointer (BaseCheckpointer | None): Stores task checkpoints
+            for ``resume()``.
+        max_parallel_steps (int): How many steps of a plan run at once.
     """
 
     def __init__(  # noqa: PLR0913, PLR0917
@@ -118,6 +248,16 @@ class LLMAgent:
         subagents: "list[SubAgentSpec] | None" = None,
         # added in ch10
         a2a_agents: list[A2AAgentSpec] | None = None,
+        compactor: BaseRolloutCompactor | None = None,
+        prompt_layout: PromptLayout = PromptLayout.CLASSIC,
+        max_tool_rounds_per_step: int = 1,
+        tracer: Tracer | None = None,
+        skill_index: SkillIndex | None = None,
+        timeouts: Timeouts | None = None,
+        tool_result_policy: ToolResultPolicy | None = None,
+        checkpointer: BaseCheckpointer | None = None,
+        max_parallel_steps: int = 4,
+        memory_writer: MemoryWriter | None = None,
     ):
         """Initialize an LLMAgent.
 
@@ -135,6 +275,48 @@ class LLMAgent:
             a2a_agents (list[A2AAgentSpec] | None): A2A peer agents this
                 coordinator can dispatch to. Defaults to None (no A2A
                 peers). Added in Chapter 10.
+            compactor (BaseRolloutCompactor | None): Rollout compactor
+                used to keep per-step prompts within a token budget.
+                Defaults to None (rollout sent verbatim).
+            prompt_layout (PromptLayout): How step prompts are ordered.
+                ``PromptLayout.STATIC_PREFIX`` keeps task-invariant content
+                first so providers can reuse cached prefixes across steps.
+                Defaults to ``PromptLayout.CLASSIC``.
+            max_tool_rounds_per_step (int): Rounds of tool calls one
+                ``run_step`` may execute. When the LLM answers tool results
+                with more tool calls, they run in the same conversation
+                until this budget is spent, instead of costing a
+                ``get_next_step`` plus a new ``run_step`` each. Defaults to
+                1 (follow-up tool calls are deferred to the next step).
+            tracer (Tracer | None): Records nested spans (task, step, LLM
+                calls, tool calls, memory) of every task this agent runs.
+                Subagents dispatched from those tasks record into it too.
+                Defaults to None (no tracing).
+            skill_index (SkillIndex | None): Persistent index consulted by
+                skill discovery at the start of every task, so unchanged
+                skills are not re-read. Defaults to None (every task reads
+                and parses every ``SKILL.md``).
+            timeouts (Timeouts | None): Deadlines of tasks, steps, LLM
+                calls and tool calls. Defaults to None (all unbounded).
+            tool_result_policy (ToolResultPolicy | None): Tool results
+                longer than ``max_chars`` are stored in a task-scoped
+                ``BlobStore`` and replaced by a preview and a handle the
+                agent can page through with ``ReadBlobTool``. Defaults to
+                None (results are passed on whole).
+            checkpointer (BaseCheckpointer | None): Stores a checkpoint of
+                every task after each completed step, so ``resume()`` can
+                continue an interrupted task. Defaults to None (no
+                checkpoints).
+            max_parallel_steps (int): Steps of a ``StepMode.PLANNED`` plan
+                run at the same time. Defaults to 4.
+            memory_writer (MemoryWriter | None): Records finished tasks'
+                episodes in the background, so a task resolves without
+                waiting for its memories to be written. Defaults to None
+                (the task resolves once its episode is written).
+
+        Raises:
+            LLMAgentError: If ``max_tool_rounds_per_step`` or
+                ``max_parallel_steps`` is less than 1.
         """
         self.llm = llm
         tools = tools or []
@@ -166,6 +348,20 @@ class LLMAgent:
         self.a2a_agents_registry: dict[str, A2AAgentSpec] = {
             s.name: s for s in a2a_agents
         }
+        self.compactor = compactor
+        self.prompt_layout = prompt_layout
+        if max_tool_rounds_per_step < 1:
+            raise LLMAgentError("`max_tool_rounds_per_step` must be >= 1.")
+        self.max_tool_rounds_per_step = max_tool_rounds_per_step
+        self.tracer = tracer
+        self.skill_index = skill_index
+        self.timeouts = timeouts or Timeouts()
+        self.tool_result_policy = tool_result_policy
+        self.checkpointer = checkpointer
+        if max_parallel_steps < 1:
+            raise LLMAgentError("`max_parallel_steps` must be >= 1.")
+        self.max_parallel_steps = max_parallel_steps
+        self.memory_writer = memory_writer
 
     @property
     def tools(self) -> list[Tool]:
@@ -192,7 +388,10 @@ class LLMAgent:
         Attributes:
             llm_agent (LLMAgent): The LLM agent.
             task: The task to execute.
-            rollout: The execution log of the task.
+            rollout: The execution log of the task, rendered as text.
+            structured_rollout (Rollout): The execution log of the task,
+                one record of ``ChatMessage``s per step. ``rollout`` is
+                rendered from it lazily.
             step_counter: The number of TaskSteps executed.
             logger: TaskHandler logger.
             skills_registry (dict[str, Skill]): Skills discovered at the
@@ -209,15 +408,29 @@ class LLMAgent:
             _use_a2a_agent_tool (UseA2AAgentTool | None): Task-scoped A2A
                 peer dispatch tool. Set when A2A peers are registered on
                 the agent; ``None`` otherwise. Added in Chapter 10.
+            compaction_reports (list[CompactionReport]): One report per
+                compaction, when the agent has a compactor.
+            step_mode (StepMode): How the next step is decided.
+            llm_calls (list[LLMCallRecord]): Every LLM call made by this
+                handler, in order.
+            events_dropped (int): Events discarded because a subscriber's
+                queue was full.
+            blob_store (BlobStore | None): Holds this task's oversized tool
+                results when the agent has a ``tool_result_policy``;
+                cleared once the task is done.
+            _read_blob_tool (ReadBlobTool | None): Task-scoped tool paging
+                through ``blob_store``. Set with ``blob_store``.
         """
 
-        def __init__(
+        def __init__(  # noqa: PLR0913, PLR0917
             self,
             llm_agent: "LLMAgent",
             task: Task,
             # added in ch06
             skills_scopes: list[SkillScope] | None = None,
             explicit_only_skills: set[str] | None = None,
+            step_mode: StepMode | str = StepMode.CLASSIC,
+            skills_registry: dict[str, Skill] | None = None,
             *args: Any,
             **kwargs: Any,
         ) -> None:
@@ -232,13 +445,18 @@ class LLMAgent:
                 explicit_only_skills (set[str] | None): Skill names to
                     exclude from the model catalog. Defaults to None.
                     Added in Chapter 6.
+                step_mode (StepMode | str): How the next step is decided.
+                    Defaults to ``StepMode.CLASSIC``.
+                skills_registry (dict[str, Skill] | None): Skills already
+                    discovered by the caller. When given, ``skills_scopes``
+                    is not scanned. Defaults to None.
                 *args: Additional positional arguments.
                 **kwargs: Additional keyword arguments.
             """
             super().__init__(*args, **kwargs)
             self.llm_agent = llm_agent
             self.task = task
-            self.rollout = ""
+            self.structured_rollout = Rollout()
             self.step_counter = 0
             self._background_task: asyncio.Task | None = None
             self.logger = get_logger(self.__class__.__name__)
@@ -248,7 +466,11 @@ class LLMAgent:
                 if skills_scopes is not None
                 else [SkillScope.USER, SkillScope.PROJECT]
             )
-            self.skills_registry: dict[str, Skill] = discover_skills(_scopes)
+            self.skills_registry: dict[str, Skill] = (
+                skills_registry
+                if skills_registry is not None
+                else discover_skills(_scopes, index=self.llm_agent.skill_index)
+            )
             self._explicit_only_skills: set[str] = explicit_only_skills or set()
             self._use_skill_tool: UseSkillTool | None = (
                 UseSkillTool(
@@ -280,6 +502,50 @@ class LLMAgent:
                 if self.llm_agent.a2a_agents_registry
                 else None
             )
+            self.compaction_reports: list[CompactionReport] = []
+            self._prompt_rollout_cache: tuple[int, str] | None = None
+            # PromptLayout.STATIC_PREFIX segments, built once per handler
+            self._static_system_prompt_cache: str | None = None
+            self._get_next_step_prefix_cache: str | None = None
+            self.step_mode = StepMode(step_mode)
+            self.llm_calls: list[LLMCallRecord] = []
+            self._has_pending_tool_calls = False
+            # subscribers of stream_step() waiting for the next step, and
+            # those of each running step; None marks the end of a step
+            self._delta_queues: list[asyncio.Queue[str | None]] = []
+            self._step_delta_queues: list[list[asyncio.Queue[str | None]]] = []
+            # indices execute_plan() numbered its steps with, by TaskStep.id_
+            self._planned_indices: dict[str, int] = {}
+            # subscribers of subscribe(), with whether they want tokens
+            self._event_queues: list[tuple[asyncio.Queue[TaskEvent], bool]] = []
+            self._terminal_event: TaskEvent | None = None
+            self.events_dropped = 0
+            self.blob_store: BlobStore | None = None
+            self._read_blob_tool: ReadBlobTool | None = None
+            if self.llm_agent.tool_result_policy is not None:
+                self.blob_store = BlobStore()
+                self._read_blob_tool = ReadBlobTool(
+                    blob_store=self.blob_store,
+                    max_chars=self.llm_agent.tool_result_policy.max_chars,
+                )
+            self.add_done_callback(self._on_done)
+
+        @property
+        def rollout(self) -> str:
+            """The execution log of the task, rendered as text."""
+            return self.structured_rollout.render(
+                self._format_step_for_rollout,
+            )
+
+        @rollout.setter
+        def rollout(self, value: str) -> None:
+            """Replace the rollout with free-form text.
+
+            The text becomes the ``prefix`` of a fresh ``Rollout``; steps
+            run afterwards are appended after it.
+            """
+            self.structured_rollout = Rollout(prefix=value)
+            self._prompt_rollout_cache = None
 
         @property
         def background_task(self) -> asyncio.Task:
@@ -299,6 +565,28 @@ class LLMAgent:
                 )
             self._background_task = asyncio_task
 
+        def cancel(self, msg: Any | None = None) -> bool:
+            """Cancel the handler and the background task running it.
+
+            Cancelling only the future would leave ``run()``'s loop (and
+            the LLM calls, tool calls and subagent runs it awaits) running
+            with nobody waiting for it. This is also what happens when a
+            task awaiting the handler, e.g. a subagent dispatch, is
+            cancelled.
+
+            Args:
+                msg (Any | None): Message of the ``CancelledError``.
+
+            Returns:
+                bool: ``False`` if the handler was already done.
+            """
+            if (
+                self._background_task is not None
+                and not self._background_task.done()
+            ):
+                self._background_task.cancel(msg)
+            return super().cancel(msg)
+
         @property
         def _skills_catalog(self) -> str:
             """Return formatted skills catalog, or empty string.
@@ -414,6 +702,448 @@ class LLMAgent:
 
             return "\n\n".join(rollout_lines)
 
+        async def _get_prompt_rollout(
+            self,
+            rollout: Rollout | None = None,
+        ) -> str:
+            """Return the rollout to paste into the next LLM prompt.
+
+            Without a compactor this is ``self.rollout``. With one, the
+            structured rollout is compacted once per step and the result
+            is reused by both ``get_next_step`` and the following
+            ``run_step``.
+
+            A ``rollout`` other than the task's, e.g. the dependencies of a
+            planned step, is rendered (and compacted) the same way but not
+            cached.
+            """
+            compactor = self.llm_agent.compactor
+            if rollout is not None and rollout is not self.structured_rollout:
+                if compactor is None or not rollout.steps:
+                    return rollout.render(self._format_step_for_rollout)
+                return await self._compact(compactor, rollout)
+            if compactor is None or not self.structured_rollout.steps:
+                return self.rollout
+
+            n_steps = len(self.structured_rollout.steps)
+            if self._prompt_rollout_cache is not None:
+                cached_steps, cached_rollout = self._prompt_rollout_cache
+                if cached_steps == n_steps:
+                    return cached_rollout
+
+            compacted = await self._compact(compactor, self.structured_rollout)
+            self._prompt_rollout_cache = (n_steps, compacted)
+            return compacted
+
+        async def _compact(
+            self,
+            compactor: BaseRolloutCompactor,
+            rollout: Rollout,
+        ) -> str:
+            """Compact ``rollout`` and record the report."""
+            compacted, report = await compactor.compact(
+                rollout=rollout,
+                format_step=self._format_step_for_rollout,
+            )
+            self.compaction_reports.append(report)
+            if report.compacted_steps:
+                self.logger.info("🗜️ Compacted rollout: %s", report)
+            return compacted
+
+        def stream_step(self) -> AsyncIterator[str]:
+            """Stream token deltas of the step currently running.
+
+            Subscribes immediately, so calling this just before
+            ``run_step()`` (or while the loop is between steps) captures the
+            next step from its first token. The iterator ends when that step
+            ends, or when the task is done. Of concurrent planned steps, it
+            follows the one started last. While anyone is subscribed,
+            ``chat`` and ``continue_chat_with_tool_results`` calls of the
+            step go through the LLM's streaming methods; routing calls
+            (``get_next_step``) are not streamed.
+
+            Example::
+
+                handler = agent.run(task)
+                while not handler.done():
+                    async for delta in handler.stream_step():
+                        print(delta, end="", flush=True)
+
+            Returns:
+                AsyncIterator[str]: Text deltas of the step's LLM responses.
+            """
+            queue: asyncio.Queue[str | None] = asyncio.Queue()
+            if self.done():
+                queue.put_nowait(None)
+            elif self._step_delta_queues:
+                self._step_delta_queues[-1].append(queue)
+            else:
+                self._delta_queues.append(queue)
+            return self._drain_deltas(queue)
+
+        async def _drain_deltas(
+            self,
+            queue: asyncio.Queue[str | None],
+        ) -> AsyncIterator[str]:
+            try:
+                while (delta := await queue.get()) is not None:
+                    yield delta
+            finally:
+                for queues in [self._delta_queues, *self._step_delta_queues]:
+                    if queue in queues:
+                        queues.remove(queue)
+
+        def _publish_delta(self, delta: str) -> None:
+            for queue in _step_delta_queues.get() or []:
+                queue.put_nowait(delta)
+            self._publish_event(
+                TaskEventKind.TOKEN_DELTA,
+                step_index=self._current_step_index,
+                delta=delta,
+            )
+
+        def _close_delta_streams(self) -> None:
+            """End every open ``stream_step()`` iterator."""
+            queues, self._delta_queues = self._delta_queues, []
+            for step_queues in self._step_delta_queues:
+                queues += step_queues
+                step_queues.clear()
+            for queue in queues:
+                queue.put_nowait(None)
+
+        def subscribe(
+            self,
+            maxsize: int = EVENT_QUEUE_SIZE,
+            tokens: bool = False,
+        ) -> AsyncIterator[TaskEvent]:
+            """Subscribe to the events of this handler's run.
+
+            Events are ``STEP_STARTED``, ``TOOL_CALL_STARTED``,
+            ``TOOL_CALL_FINISHED``, ``STEP_FINISHED`` and, optionally,
+            ``TOKEN_DELTA``; the iterator ends after the terminal ``RESULT``
+            or ``ERROR`` event. Subscribing does not take over the loop:
+            ``run()`` (with its memories, approval gate and step budget)
+            keeps driving the task.
+
+            Each subscriber gets its own queue of at most ``maxsize``
+            events. Publishing never waits: when a queue is full its oldest
+            event is dropped (counted in ``events_dropped``), so a slow
+            consumer loses events rather than stalling the agent. The
+            terminal event is always delivered.
+
+            Example::
+
+                handler = agent.run(task)
+                async for event in handler.subscribe():
+                    print(event.kind.value, event.step_index)
+
+            Args:
+                maxsize (int): Bound of the subscriber's queue. Defaults to
+                    ``EVENT_QUEUE_SIZE``.
+                tokens (bool): Whether to also receive ``TOKEN_DELTA``
+                    events. Steps stream their LLM responses while such a
+                    subscriber is open. Defaults to False.
+
+            Returns:
+                AsyncIterator[TaskEvent]: The events, in publication order.
+            """
+            queue: asyncio.Queue[TaskEvent] = asyncio.Queue(maxsize)
+            if self._terminal_event is not None:
+                queue.put_nowait(self._terminal_event)
+            else:
+                self._event_queues.append((queue, tokens))
+            return self._drain_events(queue)
+
+        async def _drain_events(
+            self,
+            queue: asyncio.Queue[TaskEvent],
+        ) -> AsyncIterator[TaskEvent]:
+            try:
+                while True:
+                    event = await queue.get()
+                    yield event
+                    if event.terminal:
+                        return
+            finally:
+                self._event_queues = [
+                    entry
+                    for entry in self._event_queues
+                    if entry[0] is not queue
+                ]
+
+        def _publish_event(self, kind: TaskEventKind, **fields: Any) -> None:
+            """Publish an event to every subscriber, dropping their oldest.
+
+            The event is only built when someone is subscribed to it.
+            """
+            queues = [
+                queue
+                for queue, tokens in self._event_queues
+                if tokens or kind is not TaskEventKind.TOKEN_DELTA
+            ]
+            if not queues:
+                return
+            event = TaskEvent(kind=kind, task_id=self.task.id_, **fields)
+            for queue in queues:
+                self._put_event(queue, event)
+
+        def _put_event(
+            self,
+            queue: asyncio.Queue[TaskEvent],
+            event: TaskEvent,
+        ) -> None:
+            """Enqueue without waiting, dropping the oldest event if full."""
+            if queue.full():
+                queue.get_nowait()
+                self.events_dropped += 1
+            queue.put_nowait(event)
+
+        def _on_done(self, _: asyncio.Future) -> None:
+            """End every stream with the outcome of the task."""
+            self._close_delta_streams()
+            if self.blob_store is not None:
+                self.blob_store.close()
+            if self.cancelled():
+                fields: dict[str, Any] = {
+                    "kind": TaskEventKind.ERROR,
+                    "error": "Task was cancelled.",
+                    "error_type": "CancelledError",
+                }
+            elif (error := self.exception()) is not None:
+                fields = {
+                    "kind": TaskEventKind.ERROR,
+                    "error": str(error),
+                    "error_type": error.__class__.__name__,
+                }
+            else:
+                fields = {"kind": TaskEventKind.RESULT, "result": self.result()}
+            self._terminal_event = TaskEvent(
+                task_id=self.task.id_,
+                step_index=self.step_counter,
+                **fields,
+            )
+            queues, self._event_queues = self._event_queues, []
+            for queue, _tokens in queues:
+                self._put_event(queue, self._terminal_event)
+
+        @property
+        def _current_step_index(self) -> int:
+            """The index of the step running in the current context."""
+            index = _step_index.get()
+            return self.step_counter if index is None else index
+
+        @property
+        def _streaming(self) -> bool:
+            """Whether anyone is subscribed to the step's token deltas."""
+            return bool(_step_delta_queues.get()) or any(
+                tokens for _, tokens in self._event_queues
+            )
+
+        async def _stream_llm(self, method: str, **kwargs: Any) -> Any:
+            """Call the streaming variant of ``method``, publishing deltas.
+
+            Returns:
+                Any: What the non-streaming ``method`` would return.
+            """
+            stream = getattr(self.llm_agent.llm, f"stream_{method}")(**kwargs)
+            response: ChatMessage | None = None
+            async for chunk in stream:
+                if chunk.delta:
+                    self._publish_delta(chunk.delta)
+                if chunk.message is not None:
+                    response = chunk.message
+            if response is None:
+                raise TaskHandlerError(
+                    f"`stream_{method}` ended without a complete message.",
+                )
+            if method == "chat":
+                user_message = ChatMessage(
+                    role=ChatRole.USER,
+                    content=kwargs["input"],
+                )
+                return user_message, response
+            tool_messages = [
+                ChatMessage.from_tool_call_result(r)
+                for r in kwargs["tool_call_results"]
+            ]
+            return tool_messages, response
+
+        async def _call_llm(self, site: str, method: str, **kwargs: Any) -> Any:
+            """Call a method of the backbone LLM and record the call.
+
+            The call is made inside ``llm_site(site)``, so an ``LLMRouter``
+            backbone can route it.
+
+            Args:
+                site (str): Where in the loop the call is made.
+                method (str): Name of the ``BaseLLM`` method to call.
+                **kwargs (Any): Keyword arguments for the method.
+
+            Returns:
+                Any: Whatever the LLM method returns.
+            """
+            start = time.perf_counter()
+            error = False
+            try:
+                with (
+                    llm_site(site),
+                    trace_span(
+                        f"llm.{method}",
+                        **{"llm.site": site, **_llm_input_attributes(kwargs)},
+                    ) as span,
+                ):
+                    if self._streaming and method in _STREAMABLE_METHODS:
+                        call = self._stream_llm(method, **kwargs)
+                    else:
+                        call = getattr(self.llm_agent.llm, method)(**kwargs)
+                    timeout = self.llm_agent.timeouts.llm_call
+                    response = await _wait_for(
+                        call,
+                        timeout,
+                        LLMCallTimeoutError,
+                        f"LLM call `{method}` timed out after {timeout}s.",
+                    )
+                    if span:
+                        span.set_attributes(**_llm_output_attributes(response))
+                    return response
+            except Exception:
+                error = True
+                raise
+            finally:
+                self.llm_calls.append(
+                    LLMCallRecord(
+                        site=site,
+                        method=method,
+                        latency=time.perf_counter() - start,
+                        error=error,
+                    ),
+                )
+
+        @property
+        def _fused_step_guidance(self) -> str:
+            if self.step_mode == StepMode.FUSED:
+                return self.llm_agent.templates["fused_step_guidance"]
+            return ""
+
+        @property
+        def _static_system_prompt(self) -> str:
+            """Task-invariant system prompt for ``STATIC_PREFIX`` layout.
+
+            System message, catalogs, then recalled memories. Built once and
+            reused for every step; ``load_memories`` invalidates it.
+            """
+            if self._static_system_prompt_cache is None:
+                parts = [
+                    self.llm_agent.templates["system_message"].strip(),
+                    self._skills_catalog,
+                    self._subagents_catalog,
+                    self._a2a_agents_catalog,
+                    self._fused_step_guidance,
+                    self._recalled_memories,
+                ]
+                self._static_system_prompt_cache = "\n\n".join(
+                    p for p in parts if p
+                )
+            return self._static_system_prompt_cache
+
+        @property
+        def _get_next_step_prefix(self) -> str:
+            """Task-invariant head of the ``get_next_step`` prompt."""
+            if self._get_next_step_prefix_cache is None:
+                self._get_next_step_prefix_cache = self.llm_agent.templates[
+                    "get_next_step_prefix"
+                ].format(instruction=self.task.instruction)
+            return self._get_next_step_prefix_cache
+
+        @property
+        def _llm_call_kwargs(self) -> dict[str, Any]:
+            """Extra kwargs for LLM calls, e.g. provider cache keys."""
+            if self.llm_agent.prompt_layout != PromptLayout.STATIC_PREFIX:
+                return {}
+            cache_key = hashlib.sha256(
+                self._static_system_prompt.encode("utf-8"),
+            ).hexdigest()[:32]
+            return self.llm_agent.llm.prompt_cache_kwargs(cache_key)
+
+        def _run_step_system_messages(
+            self,
+            current_rollout: str,
+        ) -> list[ChatMessage]:
+            """Build the system message(s) that open a ``run_step`` chat."""
+            if self.llm_agent.prompt_layout == PromptLayout.STATIC_PREFIX:
+                system_messages = [
+                    ChatMessage(
+                        role=ChatRole.SYSTEM,
+                        content=self._static_system_prompt,
+                    ),
+                ]
+                if current_rollout:
+                    system_messages.append(
+                        ChatMessage(
+                            role=ChatRole.SYSTEM,
+                            content=self.llm_agent.templates[
+                                "run_step_rollout_message"
+                            ].format(current_rollout=current_rollout),
+                        ),
+                    )
+                return system_messages
+
+            # include rollout as context in the system message
+            system_message = ChatMessage(
+                role=ChatRole.SYSTEM,
+                content=self.llm_agent.templates[
+                    "run_step_system_message"
+                ].format(
+                    llm_agent_system_message=self.llm_agent.templates[
+                        "system_message"
+                    ],
+                    current_rollout=current_rollout,
+                )
+                if current_rollout
+                else self.llm_agent.templates[
+                    "run_step_system_message_without_rollout"
+                ].format(
+                    llm_agent_system_message=self.llm_agent.templates[
+                        "system_message"
+                    ],
+                ),
+            )
+
+            # added in ch07: inject recalled memories
+            if memories := self._recalled_memories:
+                system_message = ChatMessage(
+                    role=ChatRole.SYSTEM,
+                    content=f"{system_message.content}\n\n{memories}",
+                )
+
+            # added in ch06: bolt on skills catalog when skills are available
+            if catalog := self._skills_catalog:
+                system_message = ChatMessage(
+                    role=ChatRole.SYSTEM,
+                    content=f"{system_message.content}\n\n{catalog}",
+                )
+
+            # added in ch09: bolt on subagents catalog when registered
+            if catalog := self._subagents_catalog:
+                system_message = ChatMessage(
+                    role=ChatRole.SYSTEM,
+                    content=f"{system_message.content}\n\n{catalog}",
+                )
+
+            # added in ch10: bolt on A2A agents catalog when registered
+            if catalog := self._a2a_agents_catalog:
+                system_message = ChatMessage(
+                    role=ChatRole.SYSTEM,
+                    content=f"{system_message.content}\n\n{catalog}",
+                )
+
+            if guidance := self._fused_step_guidance:
+                system_message = ChatMessage(
+                    role=ChatRole.SYSTEM,
+                    content=f"{system_message.content}\n\n{guidance}",
+                )
+            return [system_message]
+
         def _format_memories_for_system_prompt(
             self,
             memories: list[str],
@@ -447,7 +1177,8 @@ class LLMAgent:
             # added in ch08: rejection bypasses LLM routing
             if isinstance(previous_step_result, RejectedTaskResult):
                 self.logger.info(
-                    f"🧠 New Step (rejection): {previous_step_result.feedback}",
+                    "🧠 New Step (rejection): %s",
+                    previous_step_result.feedback,
                 )
                 return TaskStep(
                     task_id=self.task.id_,
@@ -458,21 +1189,38 @@ class LLMAgent:
                         feedback=previous_step_result.feedback,
                     ),
                 )
-            self.logger.debug(f"🧵 Rollout: {self.rollout}")
+            if self.step_mode == StepMode.FUSED:
+                return self._get_next_step_fused(previous_step_result)
 
-            prompt = self.llm_agent.templates["get_next_step"].format(
-                instruction=self.task.instruction,
-                current_rollout=self.rollout,
-                current_response=previous_step_result.content,
-            )
-            self.logger.debug(f"---NEXT STEP PROMPT: {prompt}")
+            current_rollout = await self._get_prompt_rollout()
+            self.logger.debug("🧵 Rollout: %s", current_rollout)
+
+            if self.llm_agent.prompt_layout == PromptLayout.STATIC_PREFIX:
+                suffix = self.llm_agent.templates[
+                    "get_next_step_suffix"
+                ].format(
+                    current_rollout=current_rollout,
+                    current_response=previous_step_result.content,
+                )
+                prompt = f"{self._get_next_step_prefix}\n\n{suffix}"
+            else:
+                prompt = self.llm_agent.templates["get_next_step"].format(
+                    instruction=self.task.instruction,
+                    current_rollout=current_rollout,
+                    current_response=previous_step_result.content,
+                )
+            self.logger.debug("---NEXT STEP PROMPT: %s", prompt)
             try:
-                next_step = await self.llm_agent.llm.structured_output(
+                next_step = await self._call_llm(
+                    "get_next_step",
+                    "structured_output",
                     prompt=prompt,
                     mdl=NextStepDecision,
+                    **self._llm_call_kwargs,
                 )
                 self.logger.debug(
-                    f"---NEXT STEP: {next_step.model_dump_json()}",
+                    "---NEXT STEP: %s",
+                    Lazy(next_step.model_dump_json),
                 )
             except Exception as e:
                 raise TaskHandlerError(
@@ -486,7 +1234,7 @@ class LLMAgent:
                     content=previous_step_result.content,
                 )
             else:  # next_step.kind == "next_step":
-                self.logger.info(f"🧠 New Step: {next_step.content}")
+                self.logger.info("🧠 New Step: %s", next_step.content)
                 retval = TaskStep(
                     task_id=self.task.id_,
                     instruction=next_step.content,
@@ -494,7 +1242,238 @@ class LLMAgent:
 
             return retval
 
-        async def run_step(self, step: TaskStep) -> TaskStepResult:  # noqa: PLR0912, PLR0915
+        def _get_next_step_fused(
+            self,
+            previous_step_result: TaskStepResult,
+        ) -> TaskStep | TaskResult:
+            """Decide the next step without an LLM call.
+
+            A step whose final response had no pending tool calls is the
+            final answer; otherwise the agent continues.
+            """
+            if not self._has_pending_tool_calls:
+                self.logger.info("No new step required.")
+                return TaskResult(
+                    task_id=self.task.id_,
+                    content=previous_step_result.content,
+                )
+            instruction = self.llm_agent.templates["fused_continue_instruction"]
+            self.logger.info("🧠 New Step: %s", instruction)
+            return TaskStep(task_id=self.task.id_, instruction=instruction)
+
+        def _dispatch_span_attributes(
+            self,
+            tool_call: ToolCall,
+        ) -> dict[str, Any]:
+            """Span attributes naming the target of a dispatch tool call."""
+            target = tool_call.arguments.get("name")
+            if (
+                self._use_subagent_tool
+                and tool_call.tool_name == self._use_subagent_tool.name
+            ):
+                return {"subagent.name": str(target)}
+            if (
+                self._use_a2a_agent_tool
+                and tool_call.tool_name == self._use_a2a_agent_tool.name
+            ):
+                return {"a2a.agent": str(target)}
+            return {}
+
+        async def _execute_tool_call(
+            self,
+            tool_call: ToolCall,
+        ) -> ToolCallResult:
+            """Execute a single tool call, turning failures into results.
+
+            Args:
+                tool_call (ToolCall): The tool call requested by the LLM.
+
+            Returns:
+                ToolCallResult: The tool's result, or an error result if the
+                    tool doesn't exist or raised.
+            """
+            self._publish_event(
+                TaskEventKind.TOOL_CALL_STARTED,
+                step_index=self._current_step_index,
+                tool_call=tool_call,
+            )
+            with trace_span(
+                "agent.tool_call",
+                **{
+                    "tool.name": tool_call.tool_name,
+                    "tool.arguments_chars": len(
+                        json.dumps(tool_call.arguments),
+                    ),
+                    **self._dispatch_span_attributes(tool_call),
+                },
+            ) as span:
+                self.logger.info(
+                    "🛠️ Executing Tool Call: %s",
+                    tool_call.tool_name,
+                )
+                if tool := (
+                    self.llm_agent.tools_registry.get(
+                        tool_call.tool_name,
+                    )
+                    or (
+                        self._use_skill_tool
+                        if self._use_skill_tool
+                        and tool_call.tool_name == self._use_skill_tool.name
+                        else None
+                    )
+                    or (
+                        self._use_subagent_tool
+                        if self._use_subagent_tool
+                        and tool_call.tool_name == self._use_subagent_tool.name
+                        else None
+                    )
+                    or (
+                        self._use_a2a_agent_tool
+                        if self._use_a2a_agent_tool
+                        and tool_call.tool_name == self._use_a2a_agent_tool.name
+                        else None
+                    )
+                    or (
+                        self._read_blob_tool
+                        if self._read_blob_tool
+                        and tool_call.tool_name == self._read_blob_tool.name
+                        else None
+                    )
+                ):
+                    timeout = self.llm_agent.timeouts.tool_call
+                    try:
+                        if isinstance(tool, AsyncBaseTool):
+                            call = tool(tool_call=tool_call)
+                        else:
+                            # run sync tools in a thread so the event loop
+                            # stays free for concurrent async tool calls;
+                            # on timeout the thread itself runs on, so
+                            # blocking tools should bound themselves too
+                            call = asyncio.to_thread(
+                                tool,
+                                tool_call=tool_call,
+                            )
+                        tool_call_result = await _wait_for(
+                            call,
+                            timeout,
+                            ToolCallTimeoutError,
+                            f"Tool call timed out after {timeout}s.",
+                        )
+                    except Exception as e:
+                        error_details = {
+                            "error_type": e.__class__.__name__,
+                            "message": (
+                                str(e)
+                                if isinstance(e, ToolCallTimeoutError)
+                                else "Internal error while executing tool: "
+                                f"{e!s}"
+                            ),
+                        }
+                        tool_call_result = ToolCallResult(
+                            tool_call_id=tool_call.id_,
+                            error=True,
+                            content=json.dumps(error_details),
+                        )
+                    if tool is not self._read_blob_tool:
+                        tool_call_result = self._spill(tool_call_result)
+                    if tool_call_result.error:
+                        self.logger.info(
+                            "❌ Tool Call Failure: %s",
+                            tool_call_result.content,
+                        )
+                    else:
+                        self.logger.info(
+                            "✅ Successful Tool Call: %s",
+                            tool_call_result.content,
+                        )
+                else:
+                    error_msg = (
+                        f"Tool with name {tool_call.tool_name} doesn't exist."
+                    )
+                    tool_call_result = ToolCallResult(
+                        tool_call_id=tool_call.id_,
+                        error=True,
+                        content=error_msg,
+                    )
+                    self.logger.info(
+                        "❌ Tool Call Failure: %s",
+                        tool_call_result.content,
+                    )
+                if span:
+                    content = str(tool_call_result.content)
+                    span.set_attributes(**{"tool.result_chars": len(content)})
+                    if tool_call_result.error:
+                        span.record_error(content)
+            self._publish_event(
+                TaskEventKind.TOOL_CALL_FINISHED,
+                step_index=self._current_step_index,
+                tool_call=tool_call,
+                tool_call_result=tool_call_result,
+            )
+            return tool_call_result
+
+        def _spill(self, tool_call_result: ToolCallResult) -> ToolCallResult:
+            """Move an oversized result to the blob store, leaving a preview.
+
+            Args:
+                tool_call_result (ToolCallResult): The tool's result.
+
+            Returns:
+                ToolCallResult: ``tool_call_result`` if it is within the
+                    agent's ``tool_result_policy``, otherwise a copy whose
+                    content is a preview and the handle of the full content.
+            """
+            policy = self.llm_agent.tool_result_policy
+            if policy is None or self._read_blob_tool is None:
+                return tool_call_result
+            content = tool_call_result.content
+            if not isinstance(content, str):
+                content = json.dumps(content, default=str)
+            if len(content) <= policy.max_chars:
+                return tool_call_result
+
+            handle = self._read_blob_tool.blob_store.put(content)
+            self.logger.info(
+                "📦 Spilled %d-char tool result to %s",
+                len(content),
+                handle,
+            )
+            preview = content[: policy.preview_chars]
+            return tool_call_result.model_copy(
+                update={
+                    "content": SPILLED_RESULT_TEMPLATE.format(
+                        preview=preview,
+                        preview_chars=len(preview),
+                        total_chars=len(content),
+                        handle=handle,
+                        tool_name=self._read_blob_tool.name,
+                    ),
+                },
+            )
+
+        @property
+        def _step_tools(self) -> list[Tool]:
+            """The agent's tools plus the task-scoped ones."""
+            # added in ch06: include use_skill tool when skills are available
+            # added in ch09: include use_subagent tool when registered
+            # added in ch10: include use_a2a_agent tool when registered
+            return (
+                self.llm_agent.tools
+                + ([self._use_skill_tool] if self._use_skill_tool else [])
+                + ([self._use_subagent_tool] if self._use_subagent_tool else [])
+                + (
+                    [self._use_a2a_agent_tool]
+                    if self._use_a2a_agent_tool
+                    else []
+                )
+                + ([self._read_blob_tool] if self._read_blob_tool else [])
+            )
+
+        async def run_step(
+            self,
+            step: TaskStep,
+            rollout: Rollout | None = None,
+        ) -> TaskStepResult:
             """Run next step of a given task.
 
             A single step is executed through a single-turn conversation that
@@ -502,66 +1481,78 @@ class LLMAgent:
             providing the instruction (from `get_next_step`) as well as the
             `assistant` that provides the result.
 
+            While iterators from ``stream_step()`` are open, the step's LLM
+            responses are streamed to them; they end with the step. The step
+            is bracketed by ``STEP_STARTED`` and ``STEP_FINISHED`` events.
+
+            The step, and every LLM and tool call in it, is bounded by the
+            agent's ``timeouts``.
+
             Args:
                 step (TaskStep): The step to execute.
+                rollout (Rollout | None): The rollout the step sees and is
+                    recorded into. Defaults to None (the task's
+                    ``structured_rollout``).
 
             Returns:
                 TaskStepResult: The result of the step execution.
+
+            Raises:
+                StepTimeoutError: If the step exceeds ``Timeouts.step``.
+                LLMCallTimeoutError: If an LLM call exceeds
+                    ``Timeouts.llm_call``.
             """
+            index = self._planned_indices.pop(
+                step.id_,
+                self.step_counter + 1,
+            )
+            self._publish_event(
+                TaskEventKind.STEP_STARTED,
+                step_index=index,
+                step=step,
+            )
+            # this step's stream_step() subscribers: those waiting so far
+            queues, self._delta_queues = self._delta_queues, []
+            self._step_delta_queues.append(queues)
+            token = _step_delta_queues.set(queues)
+            index_token = _step_index.set(index)
+            timeout = self.llm_agent.timeouts.step
+            try:
+                step_result = await _wait_for(
+                    self._run_step(step, rollout),
+                    timeout,
+                    StepTimeoutError,
+                    f"Step timed out after {timeout}s.",
+                )
+            finally:
+                _step_delta_queues.reset(token)
+                _step_index.reset(index_token)
+                self._step_delta_queues = [
+                    q for q in self._step_delta_queues if q is not queues
+                ]
+                for queue in queues:
+                    queue.put_nowait(None)
+            self._publish_event(
+                TaskEventKind.STEP_FINISHED,
+                step_index=index,
+                step_result=step_result,
+            )
+            return step_result
+
+        async def _run_step(  # noqa: PLR0912, PLR0915
+            self,
+            step: TaskStep,
+            rollout: Rollout | None = None,
+        ) -> TaskStepResult:
+            """Run next step of a given task; see ``run_step()``."""
             self.step_counter += 1
-            self.logger.info(f"⚙️ Processing Step: {step.instruction}")
-            self.logger.debug(f"🧵 Rollout: {self.rollout}")
+            self.logger.info("⚙️ Processing Step: %s", step.instruction)
+            current_rollout = await self._get_prompt_rollout(rollout)
+            self.logger.debug("🧵 Rollout: %s", current_rollout)
 
-            # include rollout as context in the system message
-            system_message = ChatMessage(
-                role=ChatRole.SYSTEM,
-                content=self.llm_agent.templates[
-                    "run_step_system_message"
-                ].format(
-                    llm_agent_system_message=self.llm_agent.templates[
-                        "system_message"
-                    ],
-                    current_rollout=self.rollout,
-                )
-                if self.rollout
-                else self.llm_agent.templates[
-                    "run_step_system_message_without_rollout"
-                ].format(
-                    llm_agent_system_message=self.llm_agent.templates[
-                        "system_message"
-                    ],
-                ),
-            )
-
-            # added in ch07: inject recalled memories
-            if memories := self._recalled_memories:
-                system_message = ChatMessage(
-                    role=ChatRole.SYSTEM,
-                    content=f"{system_message.content}\n\n{memories}",
-                )
-
-            # added in ch06: bolt on skills catalog when skills are available
-            if catalog := self._skills_catalog:
-                system_message = ChatMessage(
-                    role=ChatRole.SYSTEM,
-                    content=f"{system_message.content}\n\n{catalog}",
-                )
-
-            # added in ch09: bolt on subagents catalog when registered
-            if catalog := self._subagents_catalog:
-                system_message = ChatMessage(
-                    role=ChatRole.SYSTEM,
-                    content=f"{system_message.content}\n\n{catalog}",
-                )
-
-            # added in ch10: bolt on A2A agents catalog when registered
-            if catalog := self._a2a_agents_catalog:
-                system_message = ChatMessage(
-                    role=ChatRole.SYSTEM,
-                    content=f"{system_message.content}\n\n{catalog}",
-                )
-
-            self.logger.debug(f"💬 SYSTEM: {system_message.content}")
+            system_messages = self._run_step_system_messages(current_rollout)
+            for system_message in system_messages:
+                self.logger.debug("💬 SYSTEM: %s", system_message.content)
 
             # fictitious user's input
             user_input = self.llm_agent.templates[
@@ -569,176 +1560,243 @@ class LLMAgent:
             ].format(
                 instruction=step.instruction,
             )
-            self.logger.debug(f"💬 USER INPUT: {user_input}")
+            self.logger.debug("💬 USER INPUT: %s", user_input)
 
             # start single-turn conversation
-            # added in ch06: include use_skill tool when skills are available
-            # added in ch09: include use_subagent tool when registered
-            # added in ch10: include use_a2a_agent tool when registered
-            all_tools = (
-                self.llm_agent.tools
-                + ([self._use_skill_tool] if self._use_skill_tool else [])
-                + ([self._use_subagent_tool] if self._use_subagent_tool else [])
-                + (
-                    [self._use_a2a_agent_tool]
-                    if self._use_a2a_agent_tool
-                    else []
-                )
-            )
-            user_message, response_message = await self.llm_agent.llm.chat(
+            all_tools = self._step_tools
+            llm_call_kwargs = self._llm_call_kwargs
+            user_message, response_message = await self._call_llm(
+                "run_step",
+                "chat",
                 input=user_input,
-                chat_history=[system_message],
+                chat_history=system_messages,
                 tools=all_tools,
+                **llm_call_kwargs,
             )
-            self.logger.debug(f"💬 ASSISTANT: {response_message.content}")
-
-            # check if there are tool calls
-            if response_message.tool_calls:
-
-                async def _execute_tool_call(
-                    tool_call: ToolCall,
-                ) -> ToolCallResult:
-                    self.logger.info(
-                        f"🛠️ Executing Tool Call: {tool_call.tool_name}",
-                    )
-                    if tool := (
-                        self.llm_agent.tools_registry.get(
-                            tool_call.tool_name,
-                        )
-                        or (
-                            self._use_skill_tool
-                            if self._use_skill_tool
-                            and tool_call.tool_name == self._use_skill_tool.name
-                            else None
-                        )
-                        or (
-                            self._use_subagent_tool
-                            if self._use_subagent_tool
-                            and tool_call.tool_name
-                            == self._use_subagent_tool.name
-                            else None
-                        )
-                        or (
-                            self._use_a2a_agent_tool
-                            if self._use_a2a_agent_tool
-                            and tool_call.tool_name
-                            == self._use_a2a_agent_tool.name
-                            else None
-                        )
-                    ):
-                        try:
-                            if isinstance(tool, AsyncBaseTool):
-                                tool_call_result = await tool(
-                                    tool_call=tool_call,
-                                )
-                            else:
-                                # run sync tools in a thread so the event loop
-                                # stays free for concurrent async tool calls
-                                tool_call_result = await asyncio.to_thread(
-                                    tool,
-                                    tool_call=tool_call,
-                                )
-                        except Exception as e:
-                            error_details = {
-                                "error_type": e.__class__.__name__,
-                                "message": (
-                                    f"Internal error while executing "
-                                    f"tool: {e!s}"
-                                ),
-                            }
-                            tool_call_result = ToolCallResult(
-                                tool_call_id=tool_call.id_,
-                                error=True,
-                                content=json.dumps(error_details),
-                            )
-                        if tool_call_result.error:
-                            self.logger.info(
-                                "❌ Tool Call Failure: "
-                                f"{tool_call_result.content}",
-                            )
-                        else:
-                            self.logger.info(
-                                "✅ Successful Tool Call: "
-                                f"{tool_call_result.content}",
-                            )
-                    else:
-                        error_msg = (
-                            f"Tool with name {tool_call.tool_name} "
-                            "doesn't exist."
-                        )
-                        tool_call_result = ToolCallResult(
-                            tool_call_id=tool_call.id_,
-                            error=True,
-                            content=error_msg,
-                        )
-                        self.logger.info(
-                            f"❌ Tool Call Failure: {tool_call_result.content}",
-                        )
-                    return tool_call_result
-
+            self.logger.debug("💬 ASSISTANT: %s", response_message.content)
+
+            # execute tool calls, feeding results back to the LLM, for up to
+            # max_tool_rounds_per_step rounds
+            chat_history = [*system_messages, user_message, response_message]
+            last_message = response_message
+            max_rounds = self.llm_agent.max_tool_rounds_per_step
+            tool_round = 0
+            while last_message.tool_calls and tool_round < max_rounds:
+                tool_round += 1
+                if tool_round > 1:
+                    self.logger.info("🔁 Tool round %d", tool_round)
                 tool_call_results = await asyncio.gather(
                     *[
-                        _execute_tool_call(tc)
-                        for tc in response_message.tool_calls
+                        self._execute_tool_call(tc)
+                        for tc in last_message.tool_calls
                     ],
                 )
 
                 # send tool call results back to llm to get result
-                (
-                    tool_messages,
-                    another_response_message,
-                ) = await self.llm_agent.llm.continue_chat_with_tool_results(  # noqa: E501
+                continue_kwargs = dict(llm_call_kwargs)
+                if max_rounds > 1 or self.step_mode == StepMode.FUSED:
+                    # let the LLM chain further tool calls, within this step
+                    # or, in fused mode, as the reason to take another
+                    continue_kwargs["tools"] = all_tools
+                tool_messages, last_message = await self._call_llm(
+                    "run_step_tool_results",
+                    "continue_chat_with_tool_results",
                     tool_call_results=tool_call_results,
-                    chat_history=[
-                        system_message,
-                        user_message,
-                        response_message,
-                    ],
+                    chat_history=list(chat_history),
+                    **continue_kwargs,
                 )
-
-                # get final content and update chat history
-                if another_response_message.tool_calls:
-                    # if has tool calls, we'll make them in the next step
-                    final_content = "I need to make the following tool-calls:\n"
-                    final_content += "\n".join(
-                        t.model_dump_json(indent=4)
-                        for t in another_response_message.tool_calls
-                    )
-                else:
-                    final_content = another_response_message.content
-                chat_history = (
-                    [
-                        system_message,
-                        user_message,
-                        response_message,
-                    ]
-                    + tool_messages
-                    + [another_response_message]
+                chat_history += [*tool_messages, last_message]
+
+            # get final content
+            self._has_pending_tool_calls = bool(last_message.tool_calls)
+            if last_message.tool_calls:
+                # out of tool rounds, we'll make them in the next step
+                final_content = "I need to make the following tool-calls:\n"
+                final_content += "\n".join(
+                    t.model_dump_json(indent=4) for t in last_message.tool_calls
                 )
             else:
-                final_content = response_message.content
-                chat_history = [
-                    system_message,
-                    user_message,
-                    response_message,
-                ]
+                final_content = last_message.content
 
-            # augment rollout from this turn
-            formatted_step = self._format_step_for_rollout(
-                chat_history=chat_history,
+            # augment rollout from this turn; rendered lazily on read
+            if rollout is None:
+                rollout = self.structured_rollout
+            rollout.append(chat_history)
+
+            self.logger.info("✅ Step Result: %s", final_content)
+            return TaskStepResult(
+                task_step_id=step.id_,
+                content=final_content,
             )
-            if self.rollout:
-                self.rollout += "\n\n" + formatted_step
 
-            else:
-                self.rollout = formatted_step
+        async def plan(self) -> TaskPlan:
+            """Ask the LLM for a plan of the task's steps.
 
+            Returns:
+                TaskPlan: The steps and their dependencies.
+
+            Raises:
+                TaskHandlerError: If the LLM returns no valid plan.
+            """
+            tools = "\n".join(
+                f"- {t.name}: {t.description}" for t in self._step_tools
+            )
+            prompt = self.llm_agent.templates["plan_task"].format(
+                instruction=self.task.instruction,
+                tools=tools or "(none)",
+            )
+            self.logger.debug("---PLAN PROMPT: %s", prompt)
+            try:
+                plan: TaskPlan = await self._call_llm(
+                    "plan",
+                    "structured_output",
+                    prompt=prompt,
+                    mdl=TaskPlan,
+                    **self._llm_call_kwargs,
+                )
+            except Exception as e:
+                raise TaskHandlerError(
+                    f"Failed to plan task: {str(e)}",
+                ) from e
             self.logger.info(
-                f"✅ Step Result: {final_content}",
+                "🗺️ Plan: %d steps\n%s",
+                len(plan.steps),
+                Lazy(
+                    lambda: "\n".join(
+                        f"  {s.id} {s.depends_on or ''}: {s.instruction}"
+                        for s in plan.steps
+                    ),
+                ),
             )
-            return TaskStepResult(
-                task_step_id=step.id_,
-                content=final_content,
+            return plan
+
+        async def execute_plan(
+            self,
+            plan: TaskPlan,
+        ) -> dict[str, TaskStepResult]:
+            """Run the steps of a plan, each once its dependencies are done.
+
+            Ready steps run concurrently through ``run_step``, at most
+            ``max_parallel_steps`` of the agent at a time. Each step sees
+            the rollout so far plus the steps it depends on, directly or
+            not. Once all steps are done, they are appended to the rollout
+            in dependency order, so the merged rollout does not depend on
+            which step happened to finish first. If a step fails, the
+            steps still running are cancelled and nothing is appended.
+
+            Args:
+                plan (TaskPlan): The plan to execute.
+
+            Returns:
+                dict[str, TaskStepResult]: The result of every step, keyed
+                    by ``PlannedStep.id``, in dependency order.
+            """
+            order = plan.topological_order()
+            ancestors: dict[str, set[str]] = {}
+            for planned in order:
+                ancestors[planned.id] = set(planned.depends_on).union(
+                    *(ancestors[d] for d in planned.depends_on),
+                )
+            base = self.structured_rollout
+            records: dict[str, RolloutStep] = {}
+            results: dict[str, TaskStepResult] = {}
+            semaphore = asyncio.Semaphore(self.llm_agent.max_parallel_steps)
+
+            # numbered up front: step_counter moves as concurrent steps start
+            first_index = self.step_counter + 1
+            indices = {s.id: first_index + i for i, s in enumerate(order)}
+
+            async def _run(
+                planned: PlannedStep,
+                dependencies: list[asyncio.Task[None]],
+            ) -> None:
+                await asyncio.gather(*dependencies)
+                context = Rollout(
+                    prefix=base.prefix,
+                    steps=[
+                        *base.steps,
+                        *(
+                            records[s.id]
+                            for s in order
+                            if s.id in ancestors[planned.id]
+                        ),
+                    ],
+                )
+                async with semaphore:
+                    with trace_span(
+                        "agent.step",
+                        **{
+                            "step.index": indices[planned.id],
+                            "step.plan_id": planned.id,
+                        },
+                    ):
+                        step = TaskStep(
+                            task_id=self.task.id_,
+                            instruction=planned.instruction,
+                        )
+                        self._planned_indices[step.id_] = indices[planned.id]
+                        results[planned.id] = await self.run_step(
+                            step,
+                            rollout=context,
+                        )
+                records[planned.id] = context.steps[-1]
+
+            tasks: dict[str, asyncio.Task[None]] = {}
+            for planned in order:
+                tasks[planned.id] = asyncio.create_task(
+                    _run(planned, [tasks[d] for d in planned.depends_on]),
+                )
+            try:
+                await asyncio.gather(*tasks.values())
+            except BaseException:
+                for task in tasks.values():
+                    task.cancel()
+                await asyncio.gather(*tasks.values(), return_exceptions=True)
+                raise
+
+            for planned in order:
+                self.structured_rollout.append(records[planned.id].messages)
+            return {s.id: results[s.id] for s in order}
+
+        async def run_plan(
+            self,
+            max_steps: int | None = None,
+        ) -> TaskStepResult:
+            """Plan the task, execute the plan, then answer from its results.
+
+            Used by ``StepMode.PLANNED`` in place of the first step. The
+            plan's steps and the answering step count towards
+            ``step_counter``.
+
+            Args:
+                max_steps (int | None): The task's step budget. Defaults to
+                    None (unbounded).
+
+            Returns:
+                TaskStepResult: The result of the answering step.
+
+            Raises:
+                MaxStepsReachedError: If the plan needs more steps than the
+                    budget has left.
+            """
+            with trace_span("agent.plan") as span:
+                plan = await self.plan()
+                if span:
+                    span.set_attributes(**{"plan.steps": len(plan.steps)})
+                # + the answering step
+                needed = self.step_counter + len(plan.steps) + 1
+                if max_steps is not None and needed > max_steps:
+                    raise MaxStepsReachedError(
+                        f"Plan needs {needed} steps; max steps is {max_steps}.",
+                    )
+                await self.execute_plan(plan)
+            return await self.run_step(
+                TaskStep(
+                    task_id=self.task.id_,
+                    instruction=self.llm_agent.templates[
+                        "plan_synthesis_instruction"
+                    ].format(instruction=self.task.instruction),
+                ),
             )
 
         async def load_memories(self) -> None:
@@ -747,17 +1805,40 @@ class LLMAgent:
             Added in Chapter 7.
 
             Calls ``recall`` on each memory in ``self.llm_agent.memories``
-            and stores the formatted string in ``self._recalled_memories``
-            for prompt injection during ``run_step``. No-op when no memories
-            are configured.
+            concurrently and stores the formatted string in
+            ``self._recalled_memories`` for prompt injection during
+            ``run_step``. A memory that misses ``Timeouts.memory_recall``
+            is skipped. No-op when no memories are configured.
             """
-            loaded = []
-            for memory in self.llm_agent.memories:
-                block = await memory.recall(self.task)
-                loaded.append(block)
+            with trace_span(
+                "memory.load_memories",
+                **{"memory.backends": len(self.llm_agent.memories)},
+            ) as span:
+                loaded = await asyncio.gather(
+                    *[self._recall(m) for m in self.llm_agent.memories],
+                )
+                if span:
+                    span.set_attributes(
+                        **{"memory.recalled_chars": sum(map(len, loaded))},
+                    )
             self._recalled_memories = self._format_memories_for_system_prompt(
-                loaded,
+                list(loaded),
             )
+            self._static_system_prompt_cache = None
+
+        async def _recall(self, memory: Memory) -> str:
+            """Recall from one memory; empty if it misses its deadline."""
+            timeout = self.llm_agent.timeouts.memory_recall
+            try:
+                return await _wait_for(
+                    memory.recall(self.task),
+                    timeout,
+                    MemoryRecallTimeoutError,
+                    f"Memory recall timed out after {timeout}s.",
+                )
+            except MemoryRecallTimeoutError as e:
+                self.logger.warning("Skipping memory: %s", e)
+                return ""
 
         async def record_memory(
             self,
@@ -769,7 +1850,8 @@ class LLMAgent:
             Exactly one of ``result`` or ``error`` must be provided.
             Called before ``set_result()`` / ``set_exception()`` so that
             ``await agent.run(task)`` returns only after the episode is
-            written.
+            written, into all memories concurrently. With a
+            ``memory_writer``, the episode is only queued for writing.
 
             Added in Chapter 7.
 
@@ -791,8 +1873,106 @@ class LLMAgent:
                 result=result,
                 error=error,
             )
-            for memory in self.llm_agent.memories:
-                await memory.record(episode)
+            with trace_span(
+                "memory.record_memory",
+                **{
+                    "memory.backends": len(self.llm_agent.memories),
+                    "memory.rollout_chars": len(episode.rollout),
+                    "memory.error": error is not None,
+                },
+            ):
+                if not self.llm_agent.memories:
+                    return
+                if writer := self.llm_agent.memory_writer:
+                    await writer.submit(self.llm_agent.memories, episode)
+                    return
+                await asyncio.gather(
+                    *[m.record(episode) for m in self.llm_agent.memories],
+                )
+
+        def checkpoint(
+            self,
+            last_step_result: TaskStepResult | None = None,
+        ) -> TaskCheckpoint:
+            """Capture the state needed to resume this task.
+
+            Args:
+                last_step_result (TaskStepResult | None): Result of the
+                    last completed step. Defaults to None.
+
+            Returns:
+                TaskCheckpoint: A snapshot of the handler's state.
+            """
+            return TaskCheckpoint(
+                task=self.task,
+                step_counter=self.step_counter,
+                step_mode=self.step_mode,
+                # a fresh Rollout drops the render cache, which holds a
+                # bound method of this handler
+                rollout=Rollout(
+                    prefix=self.structured_rollout.prefix,
+                    steps=list(self.structured_rollout.steps),
+                ),
+                last_step_result=last_step_result,
+                recalled_memories=self._recalled_memories,
+                has_pending_tool_calls=self._has_pending_tool_calls,
+            )
+
+        def restore(self, checkpoint: TaskCheckpoint) -> None:
+            """Load the state captured by ``checkpoint()``.
+
+            Args:
+                checkpoint (TaskCheckpoint): The checkpoint to restore.
+            """
+            self.structured_rollout = Rollout(
+                prefix=checkpoint.rollout.prefix,
+                steps=list(checkpoint.rollout.steps),
+            )
+            self.step_counter = checkpoint.step_counter
+            self.step_mode = checkpoint.step_mode
+            self._recalled_memories = checkpoint.recalled_memories
+            self._has_pending_tool_calls = checkpoint.has_pending_tool_calls
+            self._prompt_rollout_cache = None
+            self._static_system_prompt_cache = None
+
+        async def save_checkpoint(
+            self,
+            last_step_result: TaskStepResult | None = None,
+        ) -> None:
+            """Save a checkpoint with the agent's checkpointer, if any.
+
+            A failed save is logged and otherwise ignored: losing a
+            checkpoint only costs the ability to resume, not the task.
+
+            Args:
+                last_step_result (TaskStepResult | None): Result of the
+                    last completed step. Defaults to None.
+            """
+            checkpointer = self.llm_agent.checkpointer
+            if checkpointer is None:
+                return
+            try:
+                await checkpointer.save(self.checkpoint(last_step_result))
+            except Exception as e:
+                self.logger.warning(
+                    "Failed to checkpoint task %s: %s",
+                    self.task.id_,
+                    e,
+                )
+
+        async def delete_checkpoint(self) -> None:
+            """Delete this task's checkpoint once it no longer needs one."""
+            checkpointer = self.llm_agent.checkpointer
+            if checkpointer is None:
+                return
+            try:
+                await checkpointer.delete(self.task.id_)
+            except Exception as e:
+                self.logger.warning(
+                    "Failed to delete checkpoint of task %s: %s",
+                    self.task.id_,
+                    e,
+                )
 
         async def request_approval(
             self,
@@ -914,7 +2094,7 @@ class LLMAgent:
             await self.record_memory(error=err)
             self.set_exception(err)
 
-    def run(
+    def run(  # noqa: PLR0913, PLR0917
         self,
         task: Task,
         max_steps: int | None = None,
@@ -923,9 +2103,16 @@ class LLMAgent:
         explicit_only_skills: set[str] | None = None,
         # added in ch08
         with_approval: bool = False,
+        step_mode: StepMode | str = StepMode.CLASSIC,
+        skills_registry: dict[str, Skill] | None = None,
     ) -> TaskHandler:
         """Agent's processing loop for executing tasks.
 
+        The run is bounded by ``timeouts.task`` of the agent; exceeding it
+        fails the handler with ``TaskTimeoutError``. Cancelling the handler
+        stops the run. With a ``checkpointer``, the handler's state is saved
+        after every step and deleted once the task has a result.
+
         Args:
             task (Task): the Task to perform.
             max_steps (int | None): Maximum number of steps to run for task.
@@ -944,6 +2131,16 @@ class LLMAgent:
                 step). Rejections do not consume the step budget; pair with
                 ``max_steps`` to bound repeated-rejection loops. Defaults
                 to ``False``. Added in Chapter 8.
+            step_mode (StepMode | str): ``"classic"`` asks the LLM whether
+                to continue after every step; ``"fused"`` skips that call
+                and treats a reply without tool calls as the final answer,
+                roughly halving LLM round trips. ``"planned"`` plans the
+                task as a graph of steps, runs independent steps
+                concurrently, then continues like ``"classic"``. Defaults
+                to ``"classic"``.
+            skills_registry (dict[str, Skill] | None): Pre-discovered
+                skills, which skips scanning ``skills_scopes``. Defaults to
+                None.
 
         Returns:
             TaskHandler: the TaskHandler object responsible for task execution.
@@ -953,56 +2150,208 @@ class LLMAgent:
             task=task,
             skills_scopes=skills_scopes,
             explicit_only_skills=explicit_only_skills,
+            step_mode=step_mode,
+            skills_registry=skills_registry,
         )
+        return self._launch(task_handler, max_steps, with_approval)
+
+    async def resume(  # noqa: PLR0913, PLR0917
+        self,
+        task_id: str,
+        max_steps: int | None = None,
+        skills_scopes: list[SkillScope] | None = None,
+        explicit_only_skills: set[str] | None = None,
+        with_approval: bool = False,
+        skills_registry: dict[str, Skill] | None = None,
+    ) -> TaskHandler:
+        """Continue a checkpointed task after its last completed step.
+
+        Loads the task's checkpoint from the agent's checkpointer, restores
+        the rollout, step count and recalled memories into a new
+        ``TaskHandler`` and runs the loop from there, so completed steps
+        (and their LLM calls and tool side-effects) are not repeated.
+        Memories are not recalled again. Blobs of spilled tool results are
+        not checkpointed; their handles in the rollout no longer resolve.
+
+        Args:
+            task_id (str): ID of the task to resume.
+            max_steps (int | None): Maximum number of steps for the task,
+                counting the steps run before the checkpoint. Defaults to
+                None.
+            skills_scopes (list[SkillScope] | None): Scopes to scan for
+                skills. Defaults to ``[USER, PROJECT]``.
+            explicit_only_skills (set[str] | None): Skill names to exclude
+                from the model catalog. Defaults to None.
+            with_approval (bool): Whether to gate results on human
+                approval. Defaults to ``False``.
+            skills_registry (dict[str, Skill] | None): Pre-discovered
+                skills, which skips scanning ``skills_scopes``. Defaults to
+                None.
+
+        Returns:
+            TaskHandler: the TaskHandler object responsible for task execution.
+
+        Raises:
+            LLMAgentError: If the agent has no checkpointer.
+            CheckpointNotFoundError: If the task has no checkpoint.
+        """
+        if self.checkpointer is None:
+            raise LLMAgentError("Resuming a task requires a `checkpointer`.")
+        checkpoint = await self.checkpointer.load(task_id)
+        if checkpoint is None:
+            raise CheckpointNotFoundError(
+                f"No checkpoint found for task '{task_id}'.",
+            )
+        task_handler = self.TaskHandler(
+            llm_agent=self,
+            task=checkpoint.task,
+            skills_scopes=skills_scopes,
+            explicit_only_skills=explicit_only_skills,
+            step_mode=checkpoint.step_mode,
+            skills_registry=skills_registry,
+        )
+        task_handler.restore(checkpoint)
+        return self._launch(
+            task_handler,
+            max_steps,
+            with_approval,
+            checkpoint=checkpoint,
+        )
+
+    def _launch(  # noqa: PLR0915
+        self,
+        task_handler: TaskHandler,
+        max_steps: int | None,
+        with_approval: bool,
+        checkpoint: TaskCheckpoint | None = None,
+    ) -> TaskHandler:
+        """Start the processing loop of a handler in a background task.
+
+        Args:
+            task_handler (TaskHandler): The handler to drive.
+            max_steps (int | None): Maximum number of steps to run for task.
+            with_approval (bool): Whether to gate results on human approval.
+            checkpoint (TaskCheckpoint | None): The checkpoint the handler
+                was restored from. Memories are then not recalled again and
+                the loop continues after the checkpointed step. Defaults to
+                None (a fresh start).
+
+        Returns:
+            TaskHandler: ``task_handler``, now running.
+        """
+        task = task_handler.task
 
         async def _process_loop() -> None:
+            """Run the processing loop inside the task's tracing span."""
+            if self.tracer is not None:
+                current_tracer.set(self.tracer)
+            current_run.set(task_handler)
+            with trace_span(
+                "agent.task",
+                **{
+                    "task.id": task.id_,
+                    "task.instruction_chars": len(task.instruction),
+                    "task.step_mode": task_handler.step_mode.value,
+                },
+            ) as task_span:
+                timeout = self.timeouts.task
+                try:
+                    await _wait_for(
+                        _run_loop(),
+                        timeout,
+                        TaskTimeoutError,
+                        f"Task timed out after {timeout}s.",
+                    )
+                except TaskTimeoutError as e:
+                    if not task_handler.done():
+                        await task_handler.record_memory(error=e)
+                        task_handler.set_exception(e)
+                if task_span and not task_handler.cancelled():
+                    task_span.set_attributes(
+                        **{"task.steps": task_handler.step_counter},
+                    )
+                    if (error := task_handler.exception()) is not None:
+                        task_span.record_error(error)
+
+        async def _run_loop() -> None:
             """The processing loop for the task handler execute its task.
 
             Cycle between get_next_step and run_step, until the task_handler
             is marked as done, either through a set result or an exception being
             set.
             """
-            self.logger.info(f"🚀 Starting task: {task.instruction}")
-            step_result = None
-
-            # added in ch07
-            await task_handler.load_memories()
+            step_result: TaskStepResult | RejectedTaskResult | None = None
+            if checkpoint is None:
+                self.logger.info("🚀 Starting task: %s", task.instruction)
+                # added in ch07
+                await task_handler.load_memories()
+            else:
+                self.logger.info(
+                    "⏩ Resuming task after step %d: %s",
+                    checkpoint.step_counter,
+                    task.instruction,
+                )
+                step_result = checkpoint.last_step_result
 
             while not task_handler.done():
                 try:
-                    if task_handler.step_counter == max_steps:
+                    if (
+                        max_steps is not None
+                        and task_handler.step_counter >= max_steps
+                    ):
                         raise MaxStepsReachedError("Max steps reached.")
 
-                    next_step = await task_handler.get_next_step(step_result)
+                    if (
+                        task_handler.step_mode == StepMode.PLANNED
+                        and step_result is None
+                    ):
+                        step_result = await task_handler.run_plan(max_steps)
+                        await task_handler.save_checkpoint(step_result)
+                        continue
 
-                    match next_step:
-                        case TaskStep():
-                            step_result = await task_handler.run_step(
-                                next_step,
-                            )
-                        case TaskResult():
-                            # added in ch08
-                            if with_approval:
-                                approval = await task_handler.request_approval(
+                    with trace_span(
+                        "agent.step",
+                        **{"step.index": task_handler.step_counter + 1},
+                    ):
+                        next_step = await task_handler.get_next_step(
+                            step_result,
+                        )
+
+                        match next_step:
+                            case TaskStep():
+                                step_result = await task_handler.run_step(
                                     next_step,
                                 )
-                                if not approval.approved:
-                                    step_result = RejectedTaskResult(
-                                        failed_result_content=next_step.content,
-                                        feedback=approval.feedback,
-                                    )
-                                    self.logger.info(
-                                        "🔁 Task result rejected; "
-                                        "re-entering loop with feedback.",
+                                await task_handler.save_checkpoint(step_result)
+                            case TaskResult():
+                                # added in ch08
+                                if with_approval:
+                                    approval = (
+                                        await task_handler.request_approval(
+                                            next_step,
+                                        )
                                     )
-                                    continue
-                            await task_handler.record_memory(
-                                result=next_step,
-                            )  # added in ch07
-                            task_handler.set_result(next_step)
-                            self.logger.info(
-                                f"🏁 Task completed: {next_step.content}",
-                            )
+                                    if not approval.approved:
+                                        step_result = RejectedTaskResult(
+                                            failed_result_content=(
+                                                next_step.content
+                                            ),
+                                            feedback=approval.feedback,
+                                        )
+                                        self.logger.info(
+                                            "🔁 Task result rejected; "
+                                            "re-entering loop with feedback.",
+                                        )
+                                        continue
+                                await task_handler.record_memory(
+                                    result=next_step,
+                                )  # added in ch07
+                                await task_handler.delete_checkpoint()
+                                task_handler.set_result(next_step)
+                                self.logger.info(
+                                    "🏁 Task completed: %s",
+                                    next_step.content,
+                                )
 
                 except Exception as e:
                     await task_handler.record_memory(error=e)  # added in ch07
@@ -1019,6 +2368,7 @@ class LLMAgent:
         max_steps: int | None = None,
         # added in ch08
         with_approval: bool = False,
+        step_mode: StepMode | str = StepMode.CLASSIC,
     ) -> TaskHandler:
         """User-explicit skill activation: the programmatic slash command.
 
@@ -1038,6 +2388,7 @@ class LLMAgent:
                 Defaults to None.
             with_approval (bool): Passed through to ``run()``. Added in
                 Chapter 8.
+            step_mode (StepMode | str): Passed through to ``run()``.
 
         Returns:
             TaskHandler: The handler responsible for task execution.
@@ -1058,7 +2409,161 @@ class LLMAgent:
             max_steps=max_steps,
             # added in ch08
             with_approval=with_approval,
+            step_mode=step_mode,
+        )
+
+    async def iter_run_many(  # noqa: PLR0913
+        self,
+        tasks: Iterable[Task],
+        concurrency: int = 8,
+        max_steps: int | None = None,
+        *,
+        skills_scopes: list[SkillScope] | None = None,
+        explicit_only_skills: set[str] | None = None,
+        step_mode: StepMode | str = StepMode.CLASSIC,
+    ) -> AsyncIterator[BatchTaskResult]:
+        """Run many tasks with bounded concurrency, yielding as they finish.
+
+        At most ``concurrency`` tasks are in flight at once. ``tasks`` is
+        consumed lazily, so a generator of thousands of tasks is only
+        pulled from as slots free up. Skills are discovered once and shared
+        by every task. A task that fails is reported as a
+        ``BatchTaskResult`` with ``error`` set and does not affect the
+        others. Closing the iterator early cancels the tasks in flight.
+
+        Example::
+
+            async for item in agent.iter_run_many(tasks, concurrency=16):
+                print(item.index, item.result or item.error)
+
+        Args:
+            tasks (Iterable[Task]): The tasks to run.
+            concurrency (int): Maximum number of tasks in flight.
+                Defaults to 8.
+            max_steps (int | None): Maximum number of steps per task.
+                Defaults to None.
+            skills_scopes (list[SkillScope] | None): Scopes to scan for
+                skills. Defaults to ``[USER, PROJECT]``.
+            explicit_only_skills (set[str] | None): Skill names to exclude
+                from the model catalog. Defaults to None.
+            step_mode (StepMode | str): Passed through to ``run()``.
+
+        Yields:
+            BatchTaskResult: The outcome of each task, in completion order.
+
+        Raises:
+            LLMAgentError: If ``concurrency`` is less than 1.
+        """
+        if concurrency < 1:
+            raise LLMAgentError("`concurrency` must be >= 1.")
+
+        skills_registry = discover_skills(
+            skills_scopes
+            if skills_scopes is not None
+            else [SkillScope.USER, SkillScope.PROJECT],
+            index=self.skill_index,
         )
+        pending_tasks = enumerate(tasks)
+        in_flight: dict[LLMAgent.TaskHandler, tuple[int, float]] = {}
+
+        def _fill() -> None:
+            for index, task in islice(
+                pending_tasks,
+                concurrency - len(in_flight),
+            ):
+                handler = self.run(
+                    task,
+                    max_steps=max_steps,
+                    explicit_only_skills=explicit_only_skills,
+                    step_mode=step_mode,
+                    skills_registry=skills_registry,
+                )
+                in_flight[handler] = (index, time.perf_counter())
+
+        _fill()
+        try:
+            while in_flight:
+                done, _ = await asyncio.wait(
+                    in_flight,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for handler in done:
+                    index, start = in_flight.pop(handler)
+                    item = BatchTaskResult(
+                        index=index,
+                        task=handler.task,
+                        latency=time.perf_counter() - start,
+                    )
+                    if (error := handler.exception()) is not None:
+                        item.error = str(error)
+                        item.error_type = type(error).__name__
+                    else:
+                        item.result = handler.result()
+                    yield item
+                _fill()
+        finally:
+            for handler in in_flight:
+                handler.background_task.cancel()
+                handler.cancel()
+
+    async def run_many(  # noqa: PLR0913
+        self,
+        tasks: Iterable[Task],
+        concurrency: int = 8,
+        max_steps: int | None = None,
+        *,
+        skills_scopes: list[SkillScope] | None = None,
+        explicit_only_skills: set[str] | None = None,
+        step_mode: StepMode | str = StepMode.CLASSIC,
+    ) -> BatchRunResult:
+        """Run many tasks with bounded concurrency.
+
+        Collects ``iter_run_many()`` into a single report, ordered as the
+        tasks were submitted.
+
+        Example::
+
+            batch = await agent.run_many(tasks, concurrency=16)
+            print(batch)  # 100 task(s), 2 failed, ... tasks/s
+            answers = batch.results
+
+        Args:
+            tasks (Iterable[Task]): The tasks to run.
+            concurrency (int): Maximum number of tasks in flight.
+                Defaults to 8.
+            max_steps (int | None): Maximum number of steps per task.
+                Defaults to None.
+            skills_scopes (list[SkillScope] | None): Scopes to scan for
+                skills. Defaults to ``[USER, PROJECT]``.
+            explicit_only_skills (set[str] | None): Skill names to exclude
+                from the model catalog. Defaults to None.
+            step_mode (StepMode | str): Passed through to ``run()``.
+
+        Returns:
+            BatchRunResult: Per-task outcomes plus throughput.
+
+        Raises:
+            LLMAgentError: If ``concurrency`` is less than 1.
+        """
+        batch = BatchRunResult(concurrency=concurrency)
+        start = time.perf_counter()
+        async for item in self.iter_run_many(
+            tasks,
+            concurrency=concurrency,
+            max_steps=max_steps,
+            skills_scopes=skills_scopes,
+            explicit_only_skills=explicit_only_skills,
+            step_mode=step_mode,
+        ):
+            batch.items.append(item)
+            self.logger.debug(
+                "📦 Batch progress: %d task(s) done",
+                len(batch.items),
+            )
+        batch.wall_time = time.perf_counter() - start
+        batch.items.sort(key=lambda item: item.index)
+        self.logger.info("📦 Batch finished: %s", batch)
+        return batch
 
     async def run_supervised(
         self,
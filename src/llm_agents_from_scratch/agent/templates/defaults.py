@@ -47,6 +47,79 @@ current_response will be used as the final answer.
 What is your decision?
 """.strip()
 
+# cache-friendly prompt layout: static part first, growing rollout last
+DEFAULT_GET_NEXT_STEP_PREFIX = """You are overseeing an assistant's progress
+in accomplishing a user instruction.
+
+<user-instruction>
+{instruction}
+</user-instruction>
+
+DECISION CRITERIA:
+- If current_response contains phrases like "I need to...", "Now I should...",
+  "Next I will...", or describes a pending action → kind="next_step"
+- If the task objective is FULLY achieved with a
+  final answer → kind="final_result"
+- When in doubt, choose "next_step"
+
+CRITICAL: Statements like "I need to call monte_carlo_estimate" mean the task
+is NOT complete. Generate a next_step instruction for the assistant to execute
+that tool call.
+
+NOTE: When kind="final_result", set content to an empty string. The
+current_response will be used as the final answer.
+""".strip()
+
+DEFAULT_GET_NEXT_STEP_SUFFIX = """<thinking-process>
+{current_rollout}
+</thinking-process>
+
+<current-response>
+{current_response}
+</current-response>
+
+What is your decision?
+""".strip()
+
+DEFAULT_RUN_STEP_ROLLOUT_MESSAGE = """
+You are in the middle of working through a task. Here's your thinking so far:
+
+<my-thinking>
+{current_rollout}
+</my-thinking>
+
+Continue your train of thought from where you left off.
+""".strip()
+
+# StepMode.FUSED: no routing call between steps
+DEFAULT_FUSED_STEP_GUIDANCE = """There is no separate review of your \
+progress: every reply of yours either calls tools or is final. When the \
+task is fully done, reply with the complete final answer and no tool calls. \
+While work remains, call the tools you need.""".strip()
+
+DEFAULT_FUSED_CONTINUE_INSTRUCTION = """Continue working on the task. \
+Make the tool call(s) you said you need, or give the final answer if the \
+task is done.""".strip()
+
+# StepMode.PLANNED: one planning call, then a DAG of steps
+DEFAULT_PLAN_TASK_PROMPT = """You are planning how an assistant will carry \
+out a task. Break the task into steps, each small enough for one or two \
+tool calls. Steps that do not need each other's results run at the same \
+time, so only list a dependency when a step needs another step's result. \
+Keep the plan as short as the task allows.
+
+<task>
+{instruction}
+</task>
+
+<available-tools>
+{tools}
+</available-tools>""".strip()
+
+DEFAULT_PLAN_SYNTHESIS_INSTRUCTION = """All planned steps are done. Using \
+their results, give the complete final answer to the task: {instruction}\
+""".strip()
+
 DEFAULT_RUN_STEP_USER_MESSAGE = "{instruction}"
 
 DEFAULT_STEP_ROLLOUT_CHAT_MESSAGE = "{actor}: {content}"
@@ -5,8 +5,15 @@ from typing import TypedDict
 from .defaults import (
     DEFAULT_A2A_AGENTS_CATALOG,
     DEFAULT_APPROVAL_REJECTION_FEEDBACK,
+    DEFAULT_FUSED_CONTINUE_INSTRUCTION,
+    DEFAULT_FUSED_STEP_GUIDANCE,
     DEFAULT_GET_NEXT_INSTRUCTION_PROMPT,
+    DEFAULT_GET_NEXT_STEP_PREFIX,
+    DEFAULT_GET_NEXT_STEP_SUFFIX,
     DEFAULT_MEMORIES_BLOCK,
+    DEFAULT_PLAN_SYNTHESIS_INSTRUCTION,
+    DEFAULT_PLAN_TASK_PROMPT,
+    DEFAULT_RUN_STEP_ROLLOUT_MESSAGE,
     DEFAULT_RUN_STEP_SYSTEM_MESSAGE,
     DEFAULT_RUN_STEP_SYSTEM_MESSAGE_WITHOUT_ROLLOUT,
     DEFAULT_RUN_STEP_USER_MESSAGE,
@@ -41,6 +48,16 @@ class LLMAgentTemplates(TypedDict):
     subagents_catalog: str
     # added in ch10
     a2a_agents_catalog: str
+    # for PromptLayout.STATIC_PREFIX
+    get_next_step_prefix: str
+    get_next_step_suffix: str
+    run_step_rollout_message: str
+    # for StepMode.FUSED
+    fused_step_guidance: str
+    fused_continue_instruction: str
+    # for StepMode.PLANNED
+    plan_task: str
+    plan_synthesis_instruction: str
 
 
 default_templates = LLMAgentTemplates(
@@ -62,4 +79,14 @@ default_templates = LLMAgentTemplates(
     subagents_catalog=DEFAULT_SUBAGENTS_CATALOG,
     # added in ch10
     a2a_agents_catalog=DEFAULT_A2A_AGENTS_CATALOG,
+    # for PromptLayout.STATIC_PREFIX
+    get_next_step_prefix=DEFAULT_GET_NEXT_STEP_PREFIX,
+    get_next_step_suffix=DEFAULT_GET_NEXT_STEP_SUFFIX,
+    run_step_rollout_message=DEFAULT_RUN_STEP_ROLLOUT_MESSAGE,
+    # for StepMode.FUSED
+    fused_step_guidance=DEFAULT_FUSED_STEP_GUIDANCE,
+    fused_continue_instruction=DEFAULT_FUSED_CONTINUE_INSTRUCTION,
+    # for StepMode.PLANNED
+    plan_task=DEFAULT_PLAN_TASK_PROMPT,
+    plan_synthesis_instruction=DEFAULT_PLAN_SYNTHESIS_INSTRUCTION,
 )
@@ -0,0 +1,56 @@
+"""Base checkpointer class."""
+
+from abc import ABC, abstractmethod
+
+from llm_agents_from_scratch.data_structures import TaskCheckpoint
+
+
+class BaseCheckpointer(ABC):
+    """Base class for task checkpointers.
+
+    A ``TaskHandler`` of an agent with a checkpointer saves a
+    ``TaskCheckpoint`` after every completed step and deletes it once the
+    task has a result. ``LLMAgent.resume()`` loads it back, so a task
+    interrupted by a crash continues after its last completed step instead
+    of paying for every step again.
+
+    Checkpointers are shared by every ``TaskHandler`` of an ``LLMAgent``
+    and keyed by task ID, so implementations must be safe to call
+    concurrently for different tasks.
+    """
+
+    @abstractmethod
+    async def save(self, checkpoint: TaskCheckpoint) -> None:
+        """Store a checkpoint, replacing any earlier one of the same task.
+
+        Args:
+            checkpoint (TaskCheckpoint): The checkpoint to store.
+        """
+
+    @abstractmethod
+    async def load(self, task_id: str) -> TaskCheckpoint | None:
+        """Return the latest checkpoint of a task.
+
+        Args:
+            task_id (str): ID of the task.
+
+        Returns:
+            TaskCheckpoint | None: The checkpoint, or ``None`` if the task
+                has none.
+        """
+
+    @abstractmethod
+    async def delete(self, task_id: str) -> None:
+        """Remove the checkpoint of a task. No-op if it has none.
+
+        Args:
+            task_id (str): ID of the task.
+        """
+
+    @abstractmethod
+    async def list_task_ids(self) -> list[str]:
+        """Return the IDs of all tasks with a checkpoint.
+
+        Returns:
+            list[str]: Task IDs, e.g. of tasks to resume after a restart.
+        """
@@ -0,0 +1,136 @@
+"""Base rollout compactor class."""
+
+from abc import ABC, abstractmethod
+from typing import Callable, Sequence, TypeAlias
+
+from llm_agents_from_scratch.data_structures import (
+    ChatMessage,
+    CompactionReport,
+    Rollout,
+)
+from llm_agents_from_scratch.data_structures.rollout import StepFormatter
+from llm_agents_from_scratch.utils import estimate_tokens
+
+TokenCounter: TypeAlias = Callable[[str], int]
+
+
+class BaseRolloutCompactor(ABC):
+    """Base class for rollout compactors.
+
+    A ``TaskHandler`` pastes its rollout into every ``get_next_step`` and
+    ``run_step`` prompt, so prompt size grows with every step. A compactor
+    bounds that growth: the last ``keep_last_steps`` steps are always kept
+    verbatim and, once the rollout exceeds ``max_tokens``, older steps are
+    handed to ``_compact_older_steps`` to be shrunk.
+
+    Subclasses only decide *how* older steps are shrunk (elided,
+    summarized, ...). The budget bookkeeping and reporting live here.
+
+    Compactors are shared by every ``TaskHandler`` of an ``LLMAgent``, so
+    implementations must not keep per-task state on ``self``.
+
+    Attributes:
+        max_tokens (int): Token budget for the rollout sent to the LLM.
+        keep_last_steps (int): Number of most recent steps always kept
+            verbatim.
+        token_counter (TokenCounter): Callable used to count tokens.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int,
+        keep_last_steps: int = 3,
+        token_counter: TokenCounter | None = None,
+    ) -> None:
+        """Initialize shared compactor state.
+
+        Args:
+            max_tokens (int): Token budget for the rollout sent to the LLM.
+            keep_last_steps (int): Number of most recent steps always kept
+                verbatim. Defaults to 3.
+            token_counter (TokenCounter | None): Callable used to count
+                tokens. Defaults to ``estimate_tokens``.
+        """
+        self.max_tokens = max_tokens
+        self.keep_last_steps = keep_last_steps
+        self.token_counter = token_counter or estimate_tokens
+
+    async def compact(
+        self,
+        rollout: Rollout,
+        format_step: StepFormatter,
+    ) -> tuple[str, CompactionReport]:
+        """Return the rollout text to send to the LLM and a report.
+
+        ``rollout.prefix``, if any, is always kept as is.
+
+        Args:
+            rollout (Rollout): The rollout of the task so far.
+            format_step (StepFormatter): Renders one step's chat history
+                as a rollout entry. Renders are cached on the rollout.
+
+        Returns:
+            tuple[str, CompactionReport]: The (possibly compacted) rollout
+                and the report describing what was saved.
+        """
+        steps = [s.messages for s in rollout.steps]
+        rendered = rollout.rendered_steps(format_step)
+        verbatim = rollout.render(format_step)
+        original_tokens = self.token_counter(verbatim)
+        n_older = max(len(steps) - self.keep_last_steps, 0)
+
+        if original_tokens <= self.max_tokens or n_older == 0:
+            return verbatim, CompactionReport(
+                step=len(steps),
+                original_tokens=original_tokens,
+                compacted_tokens=original_tokens,
+                verbatim_steps=len(steps),
+                compacted_steps=0,
+            )
+
+        recent = "\n\n".join(rendered[n_older:])
+        kept_tokens = self.token_counter(recent)
+        if rollout.prefix:
+            kept_tokens += self.token_counter(rollout.prefix)
+        budget = max(self.max_tokens - kept_tokens, 0)
+        older = await self._compact_older_steps(
+            steps=steps[:n_older],
+            rendered=rendered[:n_older],
+            format_step=format_step,
+            budget=budget,
+        )
+        compacted = "\n\n".join(
+            part for part in (rollout.prefix, older, recent) if part
+        )
+        return compacted, CompactionReport(
+            step=len(steps),
+            original_tokens=original_tokens,
+            compacted_tokens=self.token_counter(compacted),
+            verbatim_steps=len(steps) - n_older,
+            compacted_steps=n_older,
+        )
+
+    @abstractmethod
+    async def _compact_older_steps(
+        self,
+        steps: Sequence[list[ChatMessage]],
+        rendered: Sequence[str],
+        format_step: StepFormatter,
+        budget: int,
+    ) -> str:
+        """Shrink the steps that fall outside the verbatim window.
+
+        Subclasses must implement this method.
+
+        Args:
+            steps (Sequence[list[ChatMessage]]): Chat histories of the
+                older steps, oldest first.
+            rendered (Sequence[str]): The verbatim rendering of ``steps``.
+            format_step (StepFormatter): Renders one step's chat history.
+            budget (int): Tokens left for the older steps once the verbatim
+                window is accounted for. May be 0.
+
+        Returns:
+            str: Replacement text for the older steps. An empty string
+                drops them entirely.
+        """
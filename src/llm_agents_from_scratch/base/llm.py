@@ -1,12 +1,14 @@
 """Base LLM."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Sequence, TypeAlias, TypeVar
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Sequence, TypeAlias, TypeVar
 
 from pydantic import BaseModel
 
 from llm_agents_from_scratch.data_structures import (
     ChatMessage,
+    ChatStreamChunk,
     CompleteResult,
     ToolCallResult,
 )
@@ -15,6 +17,14 @@ from .tool import Tool
 
 StructuredOutputType = TypeVar("StructuredOutputType", bound=BaseModel)
 
+# Set by LLMAgent to the TaskHandler of each run. The asyncio tasks a run
+# spawns (deadlines, planned steps) inherit it, so LLMs that keep state
+# per run (e.g. ScriptedLLM) can key it on the run rather than the task.
+current_run: ContextVar[object | None] = ContextVar(
+    "current_run",
+    default=None,
+)
+
 
 class BaseLLM(ABC):
     """Base LLM Class."""
@@ -100,5 +110,208 @@ class BaseLLM(ABC):
                 is the response ChatMessage from the LLM.
         """
 
+    def prompt_cache_kwargs(self, cache_key: str) -> dict[str, Any]:
+        """Provider kwargs that route a request to a warm prompt cache.
+
+        Called by ``TaskHandler`` when using ``PromptLayout.STATIC_PREFIX``;
+        the returned kwargs are forwarded to ``chat``,
+        ``continue_chat_with_tool_results`` and ``structured_output``.
+        Providers that cache shared prefixes automatically need nothing,
+        hence the empty default.
+
+        Args:
+            cache_key (str): A key that is stable across requests sharing
+                the same static prompt prefix.
+
+        Returns:
+            dict[str, Any]: Additional keyword arguments for LLM calls.
+        """
+        return {}
+
+    async def stream_complete(
+        self,
+        prompt: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Text Complete, yielding the response as it is generated.
+
+        Falls back to ``complete()`` and yields the whole response at once;
+        providers that support streaming override this.
+
+        Args:
+            prompt (str): The prompt the LLM should use as input.
+            **kwargs (Any): Additional keyword arguments.
+
+        Yields:
+            str: Text generated since the previous delta.
+        """
+        result = await self.complete(prompt, **kwargs)
+        yield result.response
+
+    async def stream_chat(
+        self,
+        input: str,
+        chat_history: Sequence[ChatMessage] | None = None,
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Chat, yielding the response as it is generated.
+
+        Falls back to ``chat()`` and yields the whole response at once;
+        providers that support streaming override this. The user message
+        is not yielded: it is ``ChatMessage(role="user", content=input)``.
+
+        Args:
+            input (str): The user's current input.
+            chat_history (Sequence[ChatMessage]|None, optional): chat history.
+            tools (Sequence[BaseTool]|None, optional): tools that the LLM
+                can call.
+            **kwargs (Any): Additional keyword arguments.
+
+        Yields:
+            ChatStreamChunk: Text deltas, then a last chunk carrying the
+                complete response message, tool calls included.
+        """
+        _, response = await self.chat(
+            input,
+            chat_history=chat_history,
+            tools=tools,
+            **kwargs,
+        )
+        yield ChatStreamChunk(delta=response.content, message=response)
+
+    async def stream_continue_chat_with_tool_results(
+        self,
+        tool_call_results: Sequence[ToolCallResult],
+        chat_history: Sequence[ChatMessage],
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Continue a chat with tool call results, streaming the response.
+
+        Falls back to ``continue_chat_with_tool_results()``; providers that
+        support streaming override this. The tool messages are not
+        yielded: they are ``ChatMessage.from_tool_call_result()`` of each
+        result.
+
+        Args:
+            tool_call_results (Sequence[ToolCallResult]):
+                Tool call results.
+            chat_history (Sequence[ChatMessage]): The chat history.
+            tools (Sequence[BaseTool]|None, optional): tools that the LLM
+                can call.
+            **kwargs (Any): Additional keyword arguments.
+
+        Yields:
+            ChatStreamChunk: Text deltas, then a last chunk carrying the
+                complete response message, tool calls included.
+        """
+        _, response = await self.continue_chat_with_tool_results(
+            tool_call_results,
+            chat_history=chat_history,
+            tools=tools,
+            **kwargs,
+        )
+        yield ChatStreamChunk(delta=response.content, message=response)
+
+
+class WrappedLLM(BaseLLM):
+    """Base class for LLMs that add behaviour around another LLM.
+
+    Every ``BaseLLM`` method is routed through ``_invoke()`` with its
+    arguments as keyword arguments, so a subclass implements recording,
+    throttling, retries, etc. once rather than per method. The wrapped
+    LLM is used unchanged, so wrappers work with any provider and can be
+    stacked. Streaming methods keep ``BaseLLM``'s non-streaming fallbacks,
+    so they go through ``_invoke()`` as well.
+
+    Attributes:
+        llm (BaseLLM): The wrapped LLM.
+    """
+
+    def __init__(self, llm: BaseLLM) -> None:
+        """Initialize a WrappedLLM.
+
+        Args:
+            llm (BaseLLM): The LLM to wrap.
+        """
+        self.llm = llm
+
+    @abstractmethod
+    async def _invoke(self, method: str, **kwargs: Any) -> Any:
+        """Handle a call to one of the ``BaseLLM`` methods.
+
+        Implementations typically end by calling ``_call_wrapped()``.
+
+        Args:
+            method (str): Name of the ``BaseLLM`` method called.
+            **kwargs (Any): The method's arguments.
+
+        Returns:
+            Any: What the method returns.
+        """
+
+    async def _call_wrapped(self, method: str, **kwargs: Any) -> Any:
+        """Call ``method`` on the wrapped LLM."""
+        return await getattr(self.llm, method)(**kwargs)
+
+    async def complete(self, prompt: str, **kwargs: Any) -> CompleteResult:
+        """Text Complete via the wrapped LLM."""
+        return await self._invoke(  # type: ignore[no-any-return]
+            "complete",
+            prompt=prompt,
+            **kwargs,
+        )
+
+    async def structured_output(
+        self,
+        prompt: str,
+        mdl: type[StructuredOutputType],
+        **kwargs: Any,
+    ) -> StructuredOutputType:
+        """Structured output via the wrapped LLM."""
+        return await self._invoke(  # type: ignore[no-any-return]
+            "structured_output",
+            prompt=prompt,
+            mdl=mdl,
+            **kwargs,
+        )
+
+    async def chat(
+        self,
+        input: str,
+        chat_history: Sequence[ChatMessage] | None = None,
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> tuple[ChatMessage, ChatMessage]:
+        """Chat via the wrapped LLM."""
+        return await self._invoke(  # type: ignore[no-any-return]
+            "chat",
+            input=input,
+            chat_history=chat_history,
+            tools=tools,
+            **kwargs,
+        )
+
+    async def continue_chat_with_tool_results(
+        self,
+        tool_call_results: Sequence[ToolCallResult],
+        chat_history: Sequence[ChatMessage],
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> tuple[list[ChatMessage], ChatMessage]:
+        """Continue a chat with tool call results via the wrapped LLM."""
+        return await self._invoke(  # type: ignore[no-any-return]
+            "continue_chat_with_tool_results",
+            tool_call_results=tool_call_results,
+            chat_history=chat_history,
+            tools=tools,
+            **kwargs,
+        )
+
+    def prompt_cache_kwargs(self, cache_key: str) -> dict[str, Any]:
+        """Prompt cache kwargs of the wrapped LLM."""
+        return self.llm.prompt_cache_kwargs(cache_key)
+
 
 LLM: TypeAlias = BaseLLM
@@ -0,0 +1,6 @@
+"""Blobs module."""
+
+from .store import BlobStore
+from .tools import ReadBlobTool
+
+__all__ = ["BlobStore", "ReadBlobTool"]
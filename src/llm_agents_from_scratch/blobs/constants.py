@@ -0,0 +1,18 @@
+"""Blobs constants."""
+
+BLOB_DIR_PREFIX = "llm-agents-blobs-"
+
+# characters between two byte-offset checkpoints of a stored blob
+BLOB_CHECKPOINT_CHARS = 4096
+
+SPILLED_RESULT_TEMPLATE = """
+{preview}
+[Result truncated: showing {preview_chars} of {total_chars} characters. The \
+full result is stored as blob '{handle}'; call `{tool_name}` with this handle \
+and an offset to read the rest.]
+""".strip()
+
+BLOB_PAGE_TEMPLATE = """
+{page}
+[Blob '{handle}': characters {start}-{end} of {total_chars}.]
+""".strip()
@@ -0,0 +1,156 @@
+"""Task-scoped store for oversized tool results."""
+
+import shutil
+import tempfile
+import uuid
+from pathlib import Path
+
+from ..errors import BlobNotFoundError
+from .constants import BLOB_CHECKPOINT_CHARS, BLOB_DIR_PREFIX
+
+
+class _Blob:
+    """Where a blob is stored and how to seek into it."""
+
+    __slots__ = ("checkpoints", "num_chars", "path")
+
+    def __init__(self, path: Path, num_chars: int, checkpoints: list[int]):
+        self.path = path
+        self.num_chars = num_chars
+        # byte offset of every BLOB_CHECKPOINT_CHARS-th character
+        self.checkpoints = checkpoints
+
+
+class BlobStore:
+    """Spills text to disk and reads it back by handle and range.
+
+    Every ``TaskHandler`` with a ``ToolResultPolicy`` owns one, so large
+    tool results live on disk instead of in every later prompt. Blobs are
+    written as UTF-8 along with the byte offset of every 4096th character,
+    so reading a range costs a seek and a read of about that range, however
+    large the blob.
+
+    Example::
+
+        store = BlobStore()
+        handle = store.put(huge_text)
+        page = store.read(handle, offset=10_000, length=2_000)
+        store.close()
+
+    Attributes:
+        path (Path): Directory the blobs are written to. A temporary one is
+            only created once the first blob is stored.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        """Initialize a BlobStore.
+
+        Args:
+            path (str | Path | None): Directory to write blobs to, created
+                if missing. Defaults to a fresh temporary directory, which
+                ``close()`` removes.
+        """
+        self._owns_path = path is None
+        self._path = Path(path) if path is not None else None
+        self._blobs: dict[str, _Blob] = {}
+
+    @property
+    def path(self) -> Path:
+        """Directory the blobs are written to, created on first use."""
+        if self._path is None:
+            self._path = Path(tempfile.mkdtemp(prefix=BLOB_DIR_PREFIX))
+        elif not self._path.exists():
+            self._path.mkdir(parents=True, exist_ok=True)
+        return self._path
+
+    @property
+    def handles(self) -> list[str]:
+        """Handles of the stored blobs, in the order they were stored."""
+        return list(self._blobs)
+
+    def put(self, text: str) -> str:
+        """Store text and return its handle.
+
+        Args:
+            text (str): The text to store.
+
+        Returns:
+            str: The handle to read the text back with.
+        """
+        handle = f"blob-{uuid.uuid4().hex[:12]}"
+        path = self.path / f"{handle}.txt"
+        checkpoints = [0]
+        with path.open("wb") as f:
+            for start in range(0, len(text), BLOB_CHECKPOINT_CHARS):
+                chunk = text[start : start + BLOB_CHECKPOINT_CHARS]
+                checkpoints.append(checkpoints[-1] + f.write(chunk.encode()))
+        self._blobs[handle] = _Blob(path, len(text), checkpoints)
+        return handle
+
+    def size(self, handle: str) -> int:
+        """Return the length of a blob in characters.
+
+        Args:
+            handle (str): The blob's handle.
+
+        Returns:
+            int: Characters in the blob.
+
+        Raises:
+            BlobNotFoundError: If ``handle`` is unknown.
+        """
+        return self._get(handle).num_chars
+
+    def read(
+        self,
+        handle: str,
+        offset: int = 0,
+        length: int | None = None,
+    ) -> str:
+        """Read a range of characters of a blob.
+
+        Args:
+            handle (str): The blob's handle.
+            offset (int): First character to read. Defaults to 0.
+            length (int | None): Characters to read. Defaults to None (up
+                to the end of the blob).
+
+        Returns:
+            str: The characters in range; empty past the end of the blob.
+
+        Raises:
+            BlobNotFoundError: If ``handle`` is unknown.
+        """
+        blob = self._get(handle)
+        start = min(max(offset, 0), blob.num_chars)
+        end = (
+            blob.num_chars
+            if length is None
+            else min(start + max(length, 0), blob.num_chars)
+        )
+        if start >= end:
+            return ""
+        first = start // BLOB_CHECKPOINT_CHARS
+        last = -(-end // BLOB_CHECKPOINT_CHARS)  # ceil
+        with blob.path.open("rb") as f:
+            f.seek(blob.checkpoints[first])
+            data = f.read(blob.checkpoints[last] - blob.checkpoints[first])
+        skip = start - first * BLOB_CHECKPOINT_CHARS
+        return data.decode()[skip : skip + end - start]
+
+    def _get(self, handle: str) -> _Blob:
+        blob = self._blobs.get(handle)
+        if blob is None:
+            raise BlobNotFoundError(f"Blob '{handle}' not found.")
+        return blob
+
+    def close(self) -> None:
+        """Delete every blob, and the directory if the store created it."""
+        blobs, self._blobs = self._blobs, {}
+        if self._owns_path:
+            if self._path is not None:
+                shutil.rmtree(self._path, ignore_errors=True)
+                self._path = None
+            return
+        for blob in blobs.values():
+            blob.path.unlink(missing_ok=True)
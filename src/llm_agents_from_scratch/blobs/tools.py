@@ -0,0 +1,135 @@
+"""Tools for reading blobs."""
+
+import json
+from typing import Any
+
+from ..base.tool import BaseTool
+from ..data_structures import ToolCall, ToolCallResult
+from ..errors import BlobNotFoundError
+from .constants import BLOB_PAGE_TEMPLATE
+from .store import BlobStore
+
+
+class ReadBlobTool(BaseTool):
+    """A task-scoped tool for paging through a blob by handle and range.
+
+    Attributes:
+        blob_store (BlobStore): The store the handles refer to.
+        max_chars (int): Most characters returned by one call.
+    """
+
+    def __init__(self, blob_store: BlobStore, max_chars: int) -> None:
+        """Initialize a ReadBlobTool.
+
+        Args:
+            blob_store (BlobStore): The store the handles refer to.
+            max_chars (int): Most characters returned by one call.
+        """
+        self.blob_store = blob_store
+        self.max_chars = max_chars
+
+    @property
+    def name(self) -> str:
+        """Name of the read-blob tool."""
+        return "from_scratch__read_blob"
+
+    @property
+    def description(self) -> str:
+        """Description of the read-blob tool."""
+        return (
+            "Read part of a tool result that was too large to show in full,"
+            " by the blob handle given in its truncated preview. Use"
+            " 'offset' to page through it."
+        )
+
+    @property
+    def parameters_json_schema(self) -> dict[str, Any]:
+        """JSON schema for tool parameters."""
+        return {
+            "type": "object",
+            "properties": {
+                "handle": {
+                    "type": "string",
+                    "description": "Handle of the blob, e.g. 'blob-1a2b3c'.",
+                },
+                "offset": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "description": "First character to read. Defaults to 0.",
+                },
+                "length": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": self.max_chars,
+                    "description": (
+                        "Characters to read. Defaults to the maximum,"
+                        f" {self.max_chars}."
+                    ),
+                },
+            },
+            "required": ["handle"],
+        }
+
+    def __call__(
+        self,
+        tool_call: ToolCall,
+        *args: Any,
+        **kwargs: Any,
+    ) -> ToolCallResult:
+        """Execute the read-blob tool.
+
+        Args:
+            tool_call (ToolCall): The ToolCall to execute.
+            *args (Any): Additional positional arguments.
+            **kwargs (Any): Additional keyword arguments.
+
+        Returns:
+            ToolCallResult: The requested characters, or an error result.
+        """
+        handle = tool_call.arguments.get("handle")
+        offset = tool_call.arguments.get("offset", 0)
+        length = tool_call.arguments.get("length", self.max_chars)
+        if (
+            not isinstance(handle, str)
+            or not isinstance(offset, int)
+            or not isinstance(length, int)
+        ):
+            return ToolCallResult(
+                tool_call_id=tool_call.id_,
+                content=json.dumps(
+                    {
+                        "error_type": "ValueError",
+                        "message": (
+                            "'handle' must be a string, 'offset' and 'length'"
+                            " integers."
+                        ),
+                    },
+                ),
+                error=True,
+            )
+
+        length = min(max(length, 1), self.max_chars)
+        try:
+            total_chars = self.blob_store.size(handle)
+            page = self.blob_store.read(handle, offset, length)
+        except BlobNotFoundError as e:
+            return ToolCallResult(
+                tool_call_id=tool_call.id_,
+                content=json.dumps(
+                    {"error_type": "BlobNotFoundError", "message": str(e)},
+                ),
+                error=True,
+            )
+
+        start = min(max(offset, 0), total_chars)
+        return ToolCallResult(
+            tool_call_id=tool_call.id_,
+            content=BLOB_PAGE_TEMPLATE.format(
+                page=page,
+                handle=handle,
+                start=start,
+                end=start + len(page),
+                total_chars=total_chars,
+            ),
+            error=False,
+        )
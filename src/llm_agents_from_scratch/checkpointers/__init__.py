@@ -0,0 +1,9 @@
+"""Concrete task checkpointer implementations."""
+
+from .file import FileCheckpointer
+from .sqlite import SQLiteCheckpointer
+
+__all__ = [
+    "FileCheckpointer",
+    "SQLiteCheckpointer",
+]
@@ -0,0 +1,112 @@
+"""File-backed task checkpointer."""
+
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+
+from llm_agents_from_scratch.base.checkpointer import BaseCheckpointer
+from llm_agents_from_scratch.data_structures import TaskCheckpoint
+from llm_agents_from_scratch.errors import CheckpointError
+
+
+class FileCheckpointer(BaseCheckpointer):
+    """Task checkpointer keeping one JSON file per task in a directory.
+
+    Each save rewrites ``<dir>/<task_id>.json`` atomically, so a crash
+    mid-save leaves the previous checkpoint intact. File I/O runs in a
+    worker thread to keep the event loop free.
+
+    Attributes:
+        dir (Path): Directory holding the checkpoint files.
+    """
+
+    def __init__(self, dir: Path) -> None:
+        """Initialize a FileCheckpointer.
+
+        Args:
+            dir (Path): Directory holding the checkpoint files. Created on
+                the first ``save`` if it does not exist.
+        """
+        self.dir = Path(dir)
+
+    def _path(self, task_id: str) -> Path:
+        # keeps checkpoints inside ``dir`` and clear of temporary files
+        if (
+            not task_id
+            or task_id.startswith(".")
+            or "/" in task_id
+            or os.sep in task_id
+        ):
+            raise CheckpointError(f"Invalid task ID: {task_id!r}")
+        return self.dir / f"{task_id}.json"
+
+    def _save(self, checkpoint: TaskCheckpoint) -> None:
+        path = self._path(checkpoint.task.id_)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.dir, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(checkpoint.model_dump_json())
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+
+    async def save(self, checkpoint: TaskCheckpoint) -> None:
+        """Write a checkpoint, replacing the task's previous one.
+
+        Args:
+            checkpoint (TaskCheckpoint): The checkpoint to store.
+
+        Raises:
+            CheckpointError: If the task ID cannot be used as a file name.
+        """
+        await asyncio.to_thread(self._save, checkpoint)
+
+    def _load(self, task_id: str) -> TaskCheckpoint | None:
+        try:
+            data = self._path(task_id).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        return TaskCheckpoint.model_validate_json(data)
+
+    async def load(self, task_id: str) -> TaskCheckpoint | None:
+        """Return the latest checkpoint of a task.
+
+        Args:
+            task_id (str): ID of the task.
+
+        Returns:
+            TaskCheckpoint | None: The checkpoint, or ``None`` if the task
+                has none.
+
+        Raises:
+            CheckpointError: If the task ID cannot be used as a file name.
+        """
+        return await asyncio.to_thread(self._load, task_id)
+
+    async def delete(self, task_id: str) -> None:
+        """Remove the checkpoint file of a task. No-op if it has none.
+
+        Args:
+            task_id (str): ID of the task.
+
+        Raises:
+            CheckpointError: If the task ID cannot be used as a file name.
+        """
+        await asyncio.to_thread(self._path(task_id).unlink, missing_ok=True)
+
+    async def list_task_ids(self) -> list[str]:
+        """Return the IDs of all tasks with a checkpoint file.
+
+        Returns:
+            list[str]: Task IDs, sorted.
+        """
+        if not self.dir.is_dir():
+            return []
+        return sorted(
+            p.stem
+            for p in self.dir.glob("*.json")
+            if not p.name.startswith(".")
+        )
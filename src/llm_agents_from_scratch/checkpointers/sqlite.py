@@ -0,0 +1,129 @@
+"""SQLite-backed task checkpointer."""
+
+import asyncio
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+from llm_agents_from_scratch.base.checkpointer import BaseCheckpointer
+from llm_agents_from_scratch.data_structures import TaskCheckpoint
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    task_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+_UPSERT = """
+INSERT INTO checkpoints (task_id, data, updated_at) VALUES (?, ?, ?)
+ON CONFLICT (task_id) DO UPDATE SET
+    data = excluded.data,
+    updated_at = excluded.updated_at
+"""
+
+
+class SQLiteCheckpointer(BaseCheckpointer):
+    """Task checkpointer keeping checkpoints in a SQLite database.
+
+    One row per task, upserted on every save. The database runs in WAL
+    mode so saves from several processes sharing the file do not block
+    readers. Each operation opens its own connection in a worker thread,
+    so one instance can serve concurrent tasks.
+
+    Attributes:
+        path (Path): Location of the database file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize a SQLiteCheckpointer.
+
+        Args:
+            path (Path): Location of the database file. The file and its
+                table are created on first use.
+        """
+        self.path = Path(path)
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_CREATE_TABLE)
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def _save(self, checkpoint: TaskCheckpoint) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                _UPSERT,
+                (
+                    checkpoint.task.id_,
+                    checkpoint.model_dump_json(),
+                    checkpoint.updated_at,
+                ),
+            )
+
+    async def save(self, checkpoint: TaskCheckpoint) -> None:
+        """Upsert a checkpoint, replacing the task's previous one.
+
+        Args:
+            checkpoint (TaskCheckpoint): The checkpoint to store.
+        """
+        await asyncio.to_thread(self._save, checkpoint)
+
+    def _load(self, task_id: str) -> TaskCheckpoint | None:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT data FROM checkpoints WHERE task_id = ?",
+                (task_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return TaskCheckpoint.model_validate_json(row[0])
+
+    async def load(self, task_id: str) -> TaskCheckpoint | None:
+        """Return the latest checkpoint of a task.
+
+        Args:
+            task_id (str): ID of the task.
+
+        Returns:
+            TaskCheckpoint | None: The checkpoint, or ``None`` if the task
+                has none.
+        """
+        return await asyncio.to_thread(self._load, task_id)
+
+    def _delete(self, task_id: str) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM checkpoints WHERE task_id = ?",
+                (task_id,),
+            )
+
+    async def delete(self, task_id: str) -> None:
+        """Remove the checkpoint of a task. No-op if it has none.
+
+        Args:
+            task_id (str): ID of the task.
+        """
+        await asyncio.to_thread(self._delete, task_id)
+
+    def _list_task_ids(self) -> list[str]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT task_id FROM checkpoints ORDER BY task_id",
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    async def list_task_ids(self) -> list[str]:
+        """Return the IDs of all tasks with a checkpoint.
+
+        Returns:
+            list[str]: Task IDs, sorted.
+        """
+        return await asyncio.to_thread(self._list_task_ids)
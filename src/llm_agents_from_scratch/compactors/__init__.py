@@ -0,0 +1,9 @@
+"""Concrete rollout compactor implementations."""
+
+from .eliding import ElidingRolloutCompactor
+from .summarizing import SummarizingRolloutCompactor
+
+__all__ = [
+    "ElidingRolloutCompactor",
+    "SummarizingRolloutCompactor",
+]
@@ -0,0 +1,28 @@
+"""Compactors constants."""
+
+ELIDED_TOOL_RESULT_TEMPLATE = "[tool result elided: ~{tokens} tokens]"
+
+ELIDED_TOOL_CALLS_TEMPLATE = "Called tools: {tool_names}"
+
+OMITTED_STEPS_TEMPLATE = "[{count} earlier step(s) omitted to fit budget]"
+
+SUMMARIZE_STEPS_TEMPLATE = """
+You are compacting the execution log of an LLM agent working on a task.
+
+Rewrite the log below as a concise summary in at most {budget} tokens. Keep
+every decision made, every final answer to a step, and any fact later steps
+may depend on (names, numbers, file paths, errors). Drop raw tool payloads
+and repeated reasoning.
+
+<log>
+{log}
+</log>
+
+Return only the summary.
+""".strip()
+
+SUMMARY_TEMPLATE = """
+=== Summary of {count} earlier step(s) ===
+
+{summary}
+""".strip()
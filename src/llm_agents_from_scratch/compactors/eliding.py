@@ -0,0 +1,80 @@
+"""Eliding Rollout Compactor."""
+
+from typing import Sequence
+
+from llm_agents_from_scratch.base.compactor import (
+    BaseRolloutCompactor,
+    StepFormatter,
+)
+from llm_agents_from_scratch.data_structures import ChatMessage, ChatRole
+
+from .constants import (
+    ELIDED_TOOL_CALLS_TEMPLATE,
+    ELIDED_TOOL_RESULT_TEMPLATE,
+    OMITTED_STEPS_TEMPLATE,
+)
+
+
+class ElidingRolloutCompactor(BaseRolloutCompactor):
+    """Compacts older steps by dropping tool payloads, keeping decisions.
+
+    Older steps are re-rendered with every tool result replaced by a short
+    placeholder and every tool-call request reduced to the names of the
+    tools called. Instructions and step results are kept as is. If that is
+    still over budget, the oldest steps are dropped and replaced with a
+    single note saying how many were omitted.
+
+    Makes no LLM calls, so compaction is cheap and deterministic.
+    """
+
+    def _elide_step(
+        self,
+        chat_history: Sequence[ChatMessage],
+    ) -> list[ChatMessage]:
+        """Return a copy of a step's chat history without tool payloads."""
+        elided = []
+        for original in chat_history:
+            msg = original
+            if msg.role == ChatRole.TOOL:
+                msg = msg.model_copy(
+                    update={
+                        "content": ELIDED_TOOL_RESULT_TEMPLATE.format(
+                            tokens=self.token_counter(msg.content),
+                        ),
+                    },
+                )
+            elif msg.tool_calls and msg.role == ChatRole.ASSISTANT:
+                msg = msg.model_copy(
+                    update={
+                        "content": ELIDED_TOOL_CALLS_TEMPLATE.format(
+                            tool_names=", ".join(
+                                t.tool_name for t in msg.tool_calls
+                            ),
+                        ),
+                        "tool_calls": None,
+                    },
+                )
+            elided.append(msg)
+        return elided
+
+    async def _compact_older_steps(
+        self,
+        steps: Sequence[list[ChatMessage]],
+        rendered: Sequence[str],
+        format_step: StepFormatter,
+        budget: int,
+    ) -> str:
+        """Elide tool payloads, then drop the oldest steps if needed."""
+        elided = [format_step(self._elide_step(s)) for s in steps]
+
+        # drop oldest steps until the remainder fits
+        for start in range(len(elided) + 1):
+            kept = elided[start:]
+            parts = (
+                [OMITTED_STEPS_TEMPLATE.format(count=start)] if start else []
+            ) + kept
+            text = "\n\n".join(parts)
+            if self.token_counter(text) <= budget:
+                return text
+        # not even the omitted-steps note fits
+        return ""
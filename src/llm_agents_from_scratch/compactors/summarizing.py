@@ -0,0 +1,117 @@
+"""Summarizing Rollout Compactor."""
+
+import hashlib
+from collections import OrderedDict
+from typing import Sequence
+
+from llm_agents_from_scratch.base.compactor import (
+    BaseRolloutCompactor,
+    StepFormatter,
+    TokenCounter,
+)
+from llm_agents_from_scratch.base.llm import BaseLLM
+from llm_agents_from_scratch.data_structures import ChatMessage, LLMCallSite
+from llm_agents_from_scratch.llms.router import llm_site
+
+from .constants import SUMMARIZE_STEPS_TEMPLATE, SUMMARY_TEMPLATE
+
+
+class SummarizingRolloutCompactor(BaseRolloutCompactor):
+    """Compacts older steps into an LLM-written summary.
+
+    Summaries are built incrementally: when one more step slides out of the
+    verbatim window, the previous summary plus that step are summarized,
+    rather than the whole prefix again. Summaries are cached by a hash of
+    the rendered prefix they cover, so the cache is content-addressed and
+    safe to share across concurrent ``TaskHandler``s.
+
+    Attributes:
+        llm (BaseLLM): The LLM used to write summaries.
+        max_cache_size (int): Maximum number of cached summaries.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        llm: BaseLLM,
+        max_tokens: int,
+        keep_last_steps: int = 3,
+        token_counter: TokenCounter | None = None,
+        max_cache_size: int = 128,
+    ) -> None:
+        """Initialize a SummarizingRolloutCompactor.
+
+        Args:
+            llm (BaseLLM): The LLM used to write summaries. A smaller,
+                cheaper model than the agent's backbone is usually fine.
+            max_tokens (int): Token budget for the rollout sent to the LLM.
+            keep_last_steps (int): Number of most recent steps always kept
+                verbatim. Defaults to 3.
+            token_counter (TokenCounter | None): Callable used to count
+                tokens. Defaults to ``estimate_tokens``.
+            max_cache_size (int): Maximum number of cached summaries.
+                Defaults to 128.
+        """
+        super().__init__(
+            max_tokens=max_tokens,
+            keep_last_steps=keep_last_steps,
+            token_counter=token_counter,
+        )
+        self.llm = llm
+        self.max_cache_size = max_cache_size
+        self._cache: OrderedDict[str, str] = OrderedDict()
+
+    @staticmethod
+    def _prefix_keys(rendered: Sequence[str]) -> list[str]:
+        """Rolling hash of each rendered prefix, one key per prefix length."""
+        keys = []
+        digest = hashlib.sha256()
+        for text in rendered:
+            digest.update(text.encode("utf-8"))
+            digest.update(b"\x00")
+            keys.append(digest.copy().hexdigest())
+        return keys
+
+    def _cache_get(self, key: str) -> str | None:
+        summary = self._cache.get(key)
+        if summary is not None:
+            self._cache.move_to_end(key)
+        return summary
+
+    def _cache_put(self, key: str, summary: str) -> None:
+        self._cache[key] = summary
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_cache_size:
+            self._cache.popitem(last=False)
+
+    async def _summarize(self, log: str, budget: int) -> str:
+        with llm_site(LLMCallSite.COMPACTION):
+            result = await self.llm.complete(
+                SUMMARIZE_STEPS_TEMPLATE.format(budget=budget, log=log),
+            )
+        return result.response.strip()
+
+    async def _compact_older_steps(
+        self,
+        steps: Sequence[list[ChatMessage]],
+        rendered: Sequence[str],
+        format_step: StepFormatter,
+        budget: int,
+    ) -> str:
+        """Summarize older steps, reusing the cached summary of a prefix."""
+        if budget == 0:
+            return ""
+
+        keys = self._prefix_keys(rendered)
+        summary = self._cache_get(keys[-1])
+        if summary is None:
+            # find the longest already-summarized prefix
+            start, log_parts = 0, []
+            for i in range(len(keys) - 2, -1, -1):
+                if (previous := self._cache_get(keys[i])) is not None:
+                    start, log_parts = i + 1, [previous]
+                    break
+            log_parts.extend(rendered[start:])
+            summary = await self._summarize("\n\n".join(log_parts), budget)
+            self._cache_put(keys[-1], summary)
+
+        return SUMMARY_TEMPLATE.format(count=len(steps), summary=summary)
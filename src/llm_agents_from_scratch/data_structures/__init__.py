@@ -1,37 +1,105 @@
 from .agent import (
     ApprovalResult,
+    BatchRunResult,
+    BatchTaskResult,
+    LLMCallRecord,
     NextStepDecision,
+    PlannedStep,
+    PromptLayout,
     RejectedTaskResult,
+    StepMode,
+    StepModeReport,
     Task,
+    TaskPlan,
     TaskResult,
     TaskStep,
     TaskStepResult,
+    Timeouts,
 )
-from .llm import ChatMessage, ChatRole, CompleteResult
-from .memory import Episode, EpisodeFormatMode, RecallMode
+from .checkpoint import TaskCheckpoint
+from .compaction import CompactionReport
+from .events import TaskEvent, TaskEventKind
+from .llm import (
+    CassetteMatch,
+    CassetteMode,
+    ChatMessage,
+    ChatRole,
+    ChatStreamChunk,
+    CompleteResult,
+    GovernorStats,
+    LatencyDistribution,
+    LLMCallSite,
+    LLMPriority,
+    ResilienceStats,
+    RouteStats,
+)
+from .memory import (
+    Durability,
+    Episode,
+    EpisodeFormatMode,
+    EpisodeSegment,
+    RecallMode,
+    SegmentManifest,
+)
+from .rollout import Rollout, RolloutStep
 from .skill import SkillFrontmatter
-from .tool import ToolCall, ToolCallResult
+from .tool import ToolCall, ToolCallResult, ToolResultPolicy
+from .tracing import Span
 
 __all__ = [
     # agent
     "ApprovalResult",
+    "BatchRunResult",
+    "BatchTaskResult",
+    "LLMCallRecord",
     "NextStepDecision",
+    "PlannedStep",
+    "PromptLayout",
     "RejectedTaskResult",
+    "StepMode",
+    "StepModeReport",
     "Task",
+    "TaskPlan",
     "TaskResult",
     "TaskStep",
     "TaskStepResult",
+    "Timeouts",
+    # checkpoint
+    "TaskCheckpoint",
+    # compaction
+    "CompactionReport",
+    # events
+    "TaskEvent",
+    "TaskEventKind",
     # llm
     "ChatRole",
     "ChatMessage",
+    "ChatStreamChunk",
     "CompleteResult",
+    "CassetteMatch",
+    "CassetteMode",
+    "GovernorStats",
+    "LatencyDistribution",
+    "LLMCallSite",
+    "LLMPriority",
+    "ResilienceStats",
+    "RouteStats",
     # memory
+    "Durability",
     "Episode",
     "EpisodeFormatMode",
+    "EpisodeSegment",
     "RecallMode",
+    "SegmentManifest",
+    # rollout
+    "Rollout",
+    "RolloutStep",
     # skill
     "SkillFrontmatter",
     # tool
     "ToolCall",
     "ToolCallResult",
+    "ToolResultPolicy",
+    # tracing
+    "Span",
 ]
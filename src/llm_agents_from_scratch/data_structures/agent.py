@@ -1,9 +1,41 @@
 """Data Structures for LLM Agent."""
 
 import uuid
+from enum import Enum
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+from typing_extensions import Self
+
+
+class PromptLayout(str, Enum):
+    """How a ``TaskHandler`` orders the content of its prompts.
+
+    ``CLASSIC`` embeds the rollout inside the system message, ahead of the
+    recalled memories and catalogs. ``STATIC_PREFIX`` puts everything that
+    is fixed for the task first (system message, catalogs, memories), then
+    the growing rollout, then the per-step input, so consecutive prompts
+    share the longest possible prefix for provider prompt/KV caching.
+    """
+
+    CLASSIC = "classic"
+    STATIC_PREFIX = "static_prefix"
+
+
+class StepMode(str, Enum):
+    """How a ``TaskHandler`` decides what to do after each step.
+
+    ``CLASSIC`` asks the LLM for a ``NextStepDecision`` (a
+    ``structured_output`` call) between steps. ``FUSED`` skips that routing
+    call: a step whose final response has no pending tool calls is taken as
+    the task's final answer, otherwise the agent simply continues.
+    ``PLANNED`` first asks the LLM for a ``TaskPlan``, runs its steps
+    concurrently in dependency order, then continues like ``CLASSIC``.
+    """
+
+    CLASSIC = "classic"
+    FUSED = "fused"
+    PLANNED = "planned"
 
 
 class Task(BaseModel):
@@ -87,6 +119,190 @@ class NextStepDecision(BaseModel):
     )
 
 
+class PlannedStep(BaseModel):
+    """A step of a ``TaskPlan``."""
+
+    id: str = Field(description="Short unique ID of the step, e.g. 's1'.")
+    instruction: str = Field(
+        description="What the step should do, e.g. the tool call to make.",
+    )
+    depends_on: list[str] = Field(
+        default_factory=list,
+        description=(
+            "IDs of the steps whose results this step needs. Steps without "
+            "dependencies between them run at the same time."
+        ),
+    )
+
+
+class TaskPlan(BaseModel):
+    """Structured output used within TaskHandler.plan().
+
+    The steps form a directed acyclic graph through ``depends_on``.
+    """
+
+    steps: list[PlannedStep] = Field(min_length=1)
+
+    @model_validator(mode="after")
+    def _validate_graph(self) -> Self:
+        """Reject duplicate IDs, unknown dependencies and cycles."""
+        ids = [s.id for s in self.steps]
+        if len(set(ids)) < len(ids):
+            raise ValueError("Plan step IDs must be unique.")
+        for step in self.steps:
+            unknown = set(step.depends_on) - set(ids)
+            if unknown:
+                raise ValueError(
+                    f"Step '{step.id}' depends on unknown steps: "
+                    f"{sorted(unknown)}",
+                )
+        if len(self.topological_order()) < len(self.steps):
+            raise ValueError(
+                "Plan steps must not depend on each other in a cycle.",
+            )
+        return self
+
+    def topological_order(self) -> list[PlannedStep]:
+        """Return the steps with every step after its dependencies.
+
+        Ties keep the order of ``steps``. Steps on a dependency cycle are
+        left out.
+
+        Returns:
+            list[PlannedStep]: The steps in dependency order.
+        """
+        done: set[str] = set()
+        order: list[PlannedStep] = []
+        remaining = list(self.steps)
+        while remaining:
+            ready = [s for s in remaining if done.issuperset(s.depends_on)]
+            if not ready:
+                break
+            order.extend(ready)
+            done.update(s.id for s in ready)
+            remaining = [s for s in remaining if s.id not in done]
+        return order
+
+
+class LLMCallRecord(BaseModel):
+    """A single LLM call made by a ``TaskHandler``.
+
+    Attributes:
+        site: Where in the loop the call was made, e.g. ``"run_step"``.
+        method: The ``BaseLLM`` method called.
+        latency: Wall-clock seconds the call took.
+        error: Whether the call raised.
+    """
+
+    site: str
+    method: str
+    latency: float
+    error: bool = False
+
+
+class StepModeReport(BaseModel):
+    """Aggregate LLM usage of a batch of tasks run in one ``StepMode``.
+
+    Attributes:
+        step_mode: The step mode the tasks were run in.
+        num_tasks: Number of tasks run.
+        num_failed: Number of tasks that raised.
+        llm_calls: Total LLM calls across all tasks.
+        llm_calls_by_site: LLM calls broken down by call site.
+        llm_latency: Total seconds spent waiting on the LLM.
+        wall_time: Total seconds to run all tasks.
+    """
+
+    step_mode: StepMode
+    num_tasks: int = 0
+    num_failed: int = 0
+    llm_calls: int = 0
+    llm_calls_by_site: dict[str, int] = Field(default_factory=dict)
+    llm_latency: float = 0.0
+    wall_time: float = 0.0
+
+    @property
+    def llm_calls_per_task(self) -> float:
+        """Mean LLM calls per task."""
+        return self.llm_calls / self.num_tasks if self.num_tasks else 0.0
+
+    def __str__(self) -> str:
+        """String representation of StepModeReport."""
+        return (
+            f"{self.step_mode.value}: {self.num_tasks} task(s), "
+            f"{self.llm_calls} LLM call(s) "
+            f"({self.llm_calls_per_task:.1f}/task), "
+            f"{self.llm_latency:.2f}s LLM, {self.wall_time:.2f}s wall"
+        )
+
+
+class BatchTaskResult(BaseModel):
+    """The outcome of one task run by ``LLMAgent.run_many()``.
+
+    Attributes:
+        index: Position of the task in the submitted batch.
+        task: The task that was run.
+        result: The task result, or ``None`` if the task failed.
+        error: The error message if the task failed.
+        error_type: The class name of the error if the task failed.
+        latency: Wall-clock seconds from start to completion of the task.
+    """
+
+    index: int
+    task: Task
+    result: TaskResult | None = None
+    error: str | None = None
+    error_type: str | None = None
+    latency: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the task produced a result."""
+        return self.result is not None
+
+
+class BatchRunResult(BaseModel):
+    """Aggregate outcome of ``LLMAgent.run_many()``.
+
+    Attributes:
+        items: One ``BatchTaskResult`` per task, in submission order.
+        concurrency: Maximum number of tasks that were run at once.
+        wall_time: Total seconds to run the batch.
+    """
+
+    items: list[BatchTaskResult] = Field(default_factory=list)
+    concurrency: int
+    wall_time: float = 0.0
+
+    @property
+    def results(self) -> list[TaskResult | None]:
+        """Task results in submission order, ``None`` for failed tasks."""
+        return [item.result for item in self.items]
+
+    @property
+    def num_tasks(self) -> int:
+        """Number of tasks run."""
+        return len(self.items)
+
+    @property
+    def num_failed(self) -> int:
+        """Number of tasks that failed."""
+        return sum(not item.succeeded for item in self.items)
+
+    @property
+    def throughput(self) -> float:
+        """Completed tasks per second of wall time."""
+        return self.num_tasks / self.wall_time if self.wall_time else 0.0
+
+    def __str__(self) -> str:
+        """String representation of BatchRunResult."""
+        return (
+            f"{self.num_tasks} task(s), {self.num_failed} failed, "
+            f"concurrency {self.concurrency}, {self.wall_time:.2f}s wall "
+            f"({self.throughput:.2f} tasks/s)"
+        )
+
+
 class RejectedTaskResult(BaseModel):
     """Human rejection feedback from the approval gate.
 
@@ -123,3 +339,25 @@ class ApprovalResult(BaseModel):
         if self.approved:
             return "approved"
         return f"rejected: {self.feedback}"
+
+
+class Timeouts(BaseModel):
+    """Deadlines, in seconds, for the parts of an ``LLMAgent`` run.
+
+    ``None`` leaves that part unbounded. A timed-out tool call becomes an
+    error ``ToolCallResult`` the LLM can re-plan around, and a memory
+    whose recall times out is skipped; the other deadlines fail the task.
+
+    Attributes:
+        task: Deadline of a whole ``run()``, memory recall included.
+        step: Deadline of one ``run_step()``, tool calls included.
+        llm_call: Deadline of one call to the backbone LLM.
+        tool_call: Deadline of one tool call.
+        memory_recall: Deadline of one memory's recall at task start.
+    """
+
+    task: float | None = Field(default=None, gt=0)
+    step: float | None = Field(default=None, gt=0)
+    llm_call: float | None = Field(default=None, gt=0)
+    tool_call: float | None = Field(default=None, gt=0)
+    memory_recall: float | None = Field(default=None, gt=0)
@@ -0,0 +1,39 @@
+"""Data structures for task checkpoints."""
+
+import time
+
+from pydantic import BaseModel, Field
+
+from .agent import StepMode, Task, TaskStepResult
+from .rollout import Rollout
+
+
+class TaskCheckpoint(BaseModel):
+    """The state of a ``TaskHandler`` after its last completed step.
+
+    Everything ``LLMAgent.resume()`` needs to continue the loop where it
+    stopped: the rollout so far, the step count, the result the next
+    ``get_next_step()`` call routes on and the memories recalled at the
+    start of the task.
+
+    Attributes:
+        task: The task being run.
+        step_counter: Number of steps completed.
+        step_mode: How the next step is decided.
+        rollout: The task's structured rollout.
+        last_step_result: Result of the last completed step.
+        recalled_memories: Memories recalled at the start of the task,
+            formatted for the system prompt.
+        has_pending_tool_calls: Whether the last step ended with tool
+            calls it had no rounds left to make.
+        updated_at: Unix time in seconds when the checkpoint was taken.
+    """
+
+    task: Task
+    step_counter: int
+    step_mode: StepMode = StepMode.CLASSIC
+    rollout: Rollout = Field(default_factory=Rollout)
+    last_step_result: TaskStepResult | None = None
+    recalled_memories: str = ""
+    has_pending_tool_calls: bool = False
+    updated_at: float = Field(default_factory=time.time)
@@ -0,0 +1,36 @@
+"""Data structures for rollout compaction."""
+
+from pydantic import BaseModel
+
+
+class CompactionReport(BaseModel):
+    """Per-step report produced by a rollout compactor.
+
+    Attributes:
+        step: The ``TaskHandler.step_counter`` value at compaction time.
+        original_tokens: Estimated tokens of the verbatim rollout.
+        compacted_tokens: Estimated tokens of the rollout actually sent
+            to the LLM.
+        verbatim_steps: Number of (most recent) steps kept verbatim.
+        compacted_steps: Number of older steps that were elided,
+            summarized or dropped.
+    """
+
+    step: int
+    original_tokens: int
+    compacted_tokens: int
+    verbatim_steps: int
+    compacted_steps: int
+
+    @property
+    def tokens_saved(self) -> int:
+        """Estimated tokens saved by compaction for this step."""
+        return self.original_tokens - self.compacted_tokens
+
+    def __str__(self) -> str:
+        """String representation of CompactionReport."""
+        return (
+            f"step {self.step}: {self.original_tokens} -> "
+            f"{self.compacted_tokens} tokens "
+            f"(saved {self.tokens_saved})"
+        )
@@ -0,0 +1,67 @@
+"""Data structures for task events."""
+
+import time
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from .agent import TaskResult, TaskStep, TaskStepResult
+from .tool import ToolCall, ToolCallResult
+
+
+class TaskEventKind(str, Enum):
+    """What a ``TaskEvent`` reports.
+
+    ``RESULT`` and ``ERROR`` are terminal: exactly one of them ends every
+    event stream. ``TOKEN_DELTA`` events are only delivered to subscribers
+    that ask for them.
+    """
+
+    STEP_STARTED = "step_started"
+    TOOL_CALL_STARTED = "tool_call_started"
+    TOOL_CALL_FINISHED = "tool_call_finished"
+    TOKEN_DELTA = "token_delta"
+    STEP_FINISHED = "step_finished"
+    RESULT = "result"
+    ERROR = "error"
+
+
+class TaskEvent(BaseModel):
+    """Something that happened while a ``TaskHandler`` ran its task.
+
+    Only the payload fields matching ``kind`` are set.
+
+    Attributes:
+        kind: What the event reports.
+        task_id: ID of the task the event belongs to.
+        step_index: 1-based index of the step the event belongs to, or the
+            number of steps run for ``RESULT`` and ``ERROR``.
+        timestamp: Unix time in seconds when the event was published.
+        step: The step about to run (``STEP_STARTED``).
+        step_result: The result of the step (``STEP_FINISHED``).
+        tool_call: The tool call (``TOOL_CALL_STARTED``,
+            ``TOOL_CALL_FINISHED``).
+        tool_call_result: The tool call's result (``TOOL_CALL_FINISHED``).
+        delta: A text delta of the step's LLM response (``TOKEN_DELTA``).
+        result: The task result (``RESULT``).
+        error: The error message (``ERROR``).
+        error_type: The class name of the error (``ERROR``).
+    """
+
+    kind: TaskEventKind
+    task_id: str
+    step_index: int = 0
+    timestamp: float = Field(default_factory=time.time)
+    step: TaskStep | None = None
+    step_result: TaskStepResult | None = None
+    tool_call: ToolCall | None = None
+    tool_call_result: ToolCallResult | None = None
+    delta: str | None = None
+    result: TaskResult | None = None
+    error: str | None = None
+    error_type: str | None = None
+
+    @property
+    def terminal(self) -> bool:
+        """Whether this event ends the stream."""
+        return self.kind in (TaskEventKind.RESULT, TaskEventKind.ERROR)
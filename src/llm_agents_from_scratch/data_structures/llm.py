@@ -1,8 +1,8 @@
 """Data Structures for LLMs."""
 
-from enum import Enum
+from enum import Enum, IntEnum
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 from typing_extensions import Self
 
 from .tool import ToolCall, ToolCallResult
@@ -40,6 +40,18 @@ class ChatMessage(BaseModel):
         )
 
 
+class ChatStreamChunk(BaseModel):
+    """A piece of a streamed chat response.
+
+    Attributes:
+        delta: Text generated since the previous chunk.
+        message: The complete response message. Set on the last chunk only.
+    """
+
+    delta: str = ""
+    message: ChatMessage | None = None
+
+
 class CompleteResult(BaseModel):
     """The llm completion result data model.
 
@@ -50,3 +62,151 @@ class CompleteResult(BaseModel):
 
     response: str
     prompt: str
+
+
+class CassetteMode(str, Enum):
+    """How a ``CassetteLLM`` uses its cassette.
+
+    ``RECORD`` calls the wrapped LLM and records every call, replacing the
+    cassette. ``REPLAY`` serves calls from the cassette only, never calling
+    the wrapped LLM. ``AUTO`` replays recorded calls and records new ones.
+    """
+
+    RECORD = "record"
+    REPLAY = "replay"
+    AUTO = "auto"
+
+
+class CassetteMatch(str, Enum):
+    """How a ``CassetteLLM`` matches calls to recordings.
+
+    ``STRICT`` replays a recording only for an identical request (same
+    method, model, messages, tools and arguments). ``FUZZY`` falls back to
+    the next unused recording of the same method, in recorded order, so
+    runs whose prompts drift slightly (timestamps, ids) still replay.
+    """
+
+    STRICT = "strict"
+    FUZZY = "fuzzy"
+
+
+class LatencyDistribution(str, Enum):
+    """Distributions a ``LatencyModel`` samples LLM latencies from."""
+
+    CONSTANT = "constant"
+    UNIFORM = "uniform"
+    NORMAL = "normal"
+    LOGNORMAL = "lognormal"
+
+
+class LLMPriority(IntEnum):
+    """Priority class of an LLM request waiting on a ``GovernedLLM``.
+
+    Lower values are admitted first; requests of the same priority are
+    admitted in arrival order.
+    """
+
+    INTERACTIVE = 0
+    DEFAULT = 1
+    BACKGROUND = 2
+
+
+class GovernorStats(BaseModel):
+    """A snapshot of a ``GovernedLLM``'s admission queue.
+
+    Attributes:
+        in_flight: Requests currently running on the wrapped LLM.
+        queue_depth: Requests waiting to be admitted.
+        queue_depth_by_priority: Waiting requests per priority name.
+        peak_queue_depth: Most requests ever waiting at once.
+        admitted: Requests admitted so far.
+        total_wait: Seconds admitted requests spent waiting, summed.
+        max_wait: Longest wait of an admitted request, in seconds.
+    """
+
+    in_flight: int = 0
+    queue_depth: int = 0
+    queue_depth_by_priority: dict[str, int] = Field(default_factory=dict)
+    peak_queue_depth: int = 0
+    admitted: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        """Mean wait of an admitted request, in seconds."""
+        return self.total_wait / self.admitted if self.admitted else 0.0
+
+
+class ResilienceStats(BaseModel):
+    """Retry and hedging counters and latencies of a ``ResilientLLM``.
+
+    Latencies are those of successful attempts, over the most recent
+    attempts only. ``unhedged_p99`` estimates the p99 the same attempts
+    would have had without hedging: it takes the first request's own
+    latency, or, where that request was cancelled because its hedge won,
+    the time until then (a lower bound).
+
+    Attributes:
+        calls: Calls made.
+        retries: Attempts retried after a retryable error.
+        failures: Calls that raised, retries exhausted or not retryable.
+        hedges: Hedge requests sent.
+        hedge_wins: Hedge requests that answered before the first request.
+        p50: Median attempt latency, in seconds.
+        p95: 95th percentile attempt latency, in seconds.
+        p99: 99th percentile attempt latency, in seconds.
+        unhedged_p99: Estimated p99 attempt latency without hedging, in
+            seconds.
+    """
+
+    calls: int = 0
+    retries: int = 0
+    failures: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    p50: float = 0.0
+    p95: float = 0.0
+    p99: float = 0.0
+    unhedged_p99: float = 0.0
+
+    @property
+    def p99_saved(self) -> float:
+        """Seconds of p99 latency saved by hedging, at least."""
+        return max(self.unhedged_p99 - self.p99, 0.0)
+
+
+class LLMCallSite(str, Enum):
+    """Where an LLM call is made, for routing it with an ``LLMRouter``.
+
+    The values match ``LLMCallRecord.site`` for calls made by a
+    ``TaskHandler``.
+    """
+
+    GET_NEXT_STEP = "get_next_step"
+    RUN_STEP = "run_step"
+    RUN_STEP_TOOL_RESULTS = "run_step_tool_results"
+    PLAN = "plan"
+    REFLECTION = "reflection"
+    COMPACTION = "compaction"
+
+
+class RouteStats(BaseModel):
+    """Calls an ``LLMRouter`` sent down one route.
+
+    Attributes:
+        model: Model name of the route's LLM.
+        calls: Calls made.
+        errors: Calls that raised.
+        total_latency: Seconds the calls took, summed.
+    """
+
+    model: str
+    calls: int = 0
+    errors: int = 0
+    total_latency: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean latency of a call, in seconds."""
+        return self.total_latency / self.calls if self.calls else 0.0
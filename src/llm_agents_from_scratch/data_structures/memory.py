@@ -16,6 +16,20 @@ class RecallMode(str, Enum):
     SEARCH = "search"
 
 
+class Durability(str, Enum):
+    """When ``JSONMemoryStore.write()`` returns, relative to the disk.
+
+    ``NONE`` returns once the record is queued, ``FLUSH`` once its batch
+    is written to the OS (it survives the process crashing), and
+    ``FSYNC`` once its batch is fsync'd (it survives the machine
+    crashing).
+    """
+
+    NONE = "none"
+    FLUSH = "flush"
+    FSYNC = "fsync"
+
+
 class EpisodeFormatMode(str, Enum):
     """Serialization format used by ``Episode.format()``."""
 
@@ -109,3 +123,38 @@ class Episode(BaseModel):
     def __str__(self) -> str:
         """Return a prompt-ready XML string representation of the episode."""
         return self.format(mode=EpisodeFormatMode.XML)
+
+
+class EpisodeSegment(BaseModel):
+    """A JSONL segment file of a segmented ``JSONMemoryStore``.
+
+    Attributes:
+        name (str): File name of the segment, relative to the store's
+            directory.
+        created_at (datetime): When the segment was started.
+        records (int | None): Episode and tombstone records in the
+            segment, or ``None`` if not counted yet.
+        max_completed_at (datetime | None): Latest ``completed_at`` of the
+            episodes in the segment, or ``None`` if not known yet. Known
+            for every segment but the newest.
+    """
+
+    name: str
+    created_at: datetime = Field(default_factory=datetime.now)
+    records: int | None = None
+    max_completed_at: datetime | None = None
+
+
+class SegmentManifest(BaseModel):
+    """The segments of a segmented ``JSONMemoryStore``, oldest first.
+
+    Attributes:
+        version (int): Manifest format version.
+        next_segment (int): Number of the next segment file.
+        segments (list[EpisodeSegment]): The segments; appends go to the
+            last one.
+    """
+
+    version: int = 1
+    next_segment: int = 1
+    segments: list[EpisodeSegment] = Field(default_factory=list)
@@ -0,0 +1,92 @@
+"""Data Structures for Rollouts."""
+
+from typing import Callable, TypeAlias
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from .llm import ChatMessage
+
+StepFormatter: TypeAlias = Callable[[list[ChatMessage]], str]
+
+
+class RolloutStep(BaseModel):
+    """A single step of a rollout.
+
+    Attributes:
+        messages: The step's chat history, as exchanged with the LLM.
+    """
+
+    messages: list[ChatMessage]
+
+
+class Rollout(BaseModel):
+    """Append-only record of the steps run for a task.
+
+    Keeps every step's original ``ChatMessage``s so the rollout can be
+    re-rendered, compacted or truncated without re-parsing text. Rendering
+    is lazy and incremental: each step is rendered at most once per
+    formatter, and the joined text of already-rendered steps is cached so
+    ``render()`` only formats steps appended since the last call.
+
+    Steps must be added through ``append()``; mutating ``steps`` in place
+    leaves the render cache stale.
+
+    Attributes:
+        prefix: Free-form text preceding the first step, e.g. a rollout
+            carried over from elsewhere.
+        steps: The recorded steps, oldest first.
+    """
+
+    prefix: str = ""
+    steps: list[RolloutStep] = Field(default_factory=list)
+    _format_step: StepFormatter | None = PrivateAttr(default=None)
+    _rendered: list[str] = PrivateAttr(default_factory=list)
+    _text: str = PrivateAttr(default="")
+    _text_steps: int = PrivateAttr(default=0)
+
+    def append(self, messages: list[ChatMessage]) -> None:
+        """Record a step's chat history. Nothing is rendered until needed.
+
+        Args:
+            messages (list[ChatMessage]): The step's chat history.
+        """
+        self.steps.append(RolloutStep(messages=messages))
+
+    def _sync_cache(self, format_step: StepFormatter) -> None:
+        # bound methods compare equal when bound to the same object
+        if self._format_step != format_step:
+            self._format_step = format_step
+            self._rendered = []
+            self._text = self.prefix
+            self._text_steps = 0
+        for step in self.steps[len(self._rendered) :]:
+            self._rendered.append(format_step(step.messages))
+
+    def rendered_steps(self, format_step: StepFormatter) -> list[str]:
+        """Return each step rendered with ``format_step``, cached.
+
+        Args:
+            format_step (StepFormatter): Renders one step's chat history.
+
+        Returns:
+            list[str]: One rendered entry per step, oldest first.
+        """
+        self._sync_cache(format_step)
+        return list(self._rendered)
+
+    def render(self, format_step: StepFormatter) -> str:
+        """Return the full rollout text, rendering only new steps.
+
+        Args:
+            format_step (StepFormatter): Renders one step's chat history.
+
+        Returns:
+            str: ``prefix`` and every step, joined by blank lines.
+        """
+        self._sync_cache(format_step)
+        new = self._rendered[self._text_steps :]
+        if new:
+            parts = [self._text, *new] if self._text else new
+            self._text = "\n\n".join(parts)
+            self._text_steps = len(self._rendered)
+        return self._text
@@ -32,3 +32,20 @@ class ToolCallResult(BaseModel):
     tool_call_id: str
     content: Any | None
     error: bool = False
+
+
+class ToolResultPolicy(BaseModel):
+    """When a ``TaskHandler`` spills tool results to its blob store.
+
+    A result whose content is longer than ``max_chars`` is stored in full,
+    and the LLM gets its first ``preview_chars`` characters plus a handle
+    to page through the rest with ``ReadBlobTool``.
+
+    Attributes:
+        max_chars: Longest result content passed to the LLM verbatim. Also
+            the most characters one ``ReadBlobTool`` call returns.
+        preview_chars: Characters of a spilled result shown to the LLM.
+    """
+
+    max_chars: int = Field(default=16_000, gt=0)
+    preview_chars: int = Field(default=2_000, ge=0)
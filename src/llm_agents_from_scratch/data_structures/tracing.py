@@ -0,0 +1,62 @@
+"""Data structures for tracing."""
+
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+
+class Span(BaseModel):
+    """A timed, named unit of work recorded by a ``Tracer``.
+
+    Attributes:
+        name: What the span measures, e.g. ``"agent.step"``.
+        trace_id: 32 hex chars shared by every span of one trace.
+        span_id: 16 hex chars identifying this span.
+        parent_span_id: ``span_id`` of the enclosing span, if any.
+        start_time_ns: Unix time in nanoseconds when the span started.
+        end_time_ns: Unix time in nanoseconds when the span ended, or
+            ``None`` while it is still open.
+        attributes: Sizes, names and other details of the work.
+        status: ``"error"`` if the work failed, otherwise ``"ok"``.
+        error: The error message when ``status`` is ``"error"``.
+        error_type: The class name of the error.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None = None
+    start_time_ns: int
+    end_time_ns: int | None = None
+    attributes: dict[str, Any] = Field(default_factory=dict)
+    status: Literal["ok", "error"] = "ok"
+    error: str | None = None
+    error_type: str | None = None
+
+    @property
+    def duration(self) -> float:
+        """Seconds between start and end, 0.0 while the span is open."""
+        if self.end_time_ns is None:
+            return 0.0
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+    def set_attributes(self, **attributes: Any) -> None:
+        """Add or overwrite attributes of the span."""
+        self.attributes.update(attributes)
+
+    def record_error(self, error: BaseException | str) -> None:
+        """Mark the span as failed.
+
+        Args:
+            error (BaseException | str): The exception, or a message when
+                the failure did not raise (e.g. an error tool result).
+        """
+        self.status = "error"
+        self.error = str(error)
+        if isinstance(error, BaseException):
+            self.error_type = type(error).__name__
+
+    def __str__(self) -> str:
+        """String representation of Span."""
+        suffix = f" [error: {self.error}]" if self.status == "error" else ""
+        return f"{self.name} ({self.duration * 1000:.1f}ms){suffix}"
@@ -3,18 +3,37 @@ from .a2a import (
     A2AAgentNotFoundError,
     A2AError,
 )
-from .agent import LLMAgentBuilderError, LLMAgentError, MaxStepsReachedError
+from .agent import (
+    AgentTimeoutError,
+    LLMAgentBuilderError,
+    LLMAgentError,
+    LLMCallTimeoutError,
+    MaxStepsReachedError,
+    MemoryRecallTimeoutError,
+    StepTimeoutError,
+    TaskTimeoutError,
+    ToolCallTimeoutError,
+)
+from .checkpoint import CheckpointError, CheckpointNotFoundError
 from .core import (
     LLMAgentsFromScratchError,
     LLMAgentsFromScratchWarning,
     MissingExtraError,
 )
+from .llm import (
+    CassetteError,
+    CassetteMissError,
+    GovernorError,
+    LLMError,
+    ResilienceError,
+)
 from .mcp import MCPError, MCPWarning, MissingMCPServerParamsError
 from .memory_store import (
     EpisodeNotFoundError,
     MaxResultsExceededWarning,
     MemoryStoreError,
     MemoryStoreWarning,
+    MemoryWriterError,
 )
 from .skill import (
     EmptySkillBodyError,
@@ -30,7 +49,7 @@ from .skill import (
     SkillValidationWarning,
 )
 from .subagents import SubAgentNotFoundError, SubAgentsError
-from .task_handler import RecordMemoryError, TaskHandlerError
+from .task_handler import BlobNotFoundError, RecordMemoryError, TaskHandlerError
 
 __all__ = [
     # core
@@ -41,15 +60,31 @@ __all__ = [
     "A2AError",
     "A2AAgentNotFoundError",
     "A2AAgentCardMissingInterfaceError",
+    # checkpoint
+    "CheckpointError",
+    "CheckpointNotFoundError",
     # memory store
     "MemoryStoreError",
     "MemoryStoreWarning",
     "MaxResultsExceededWarning",
     "EpisodeNotFoundError",
+    "MemoryWriterError",
     # agent
     "LLMAgentError",
     "LLMAgentBuilderError",
     "MaxStepsReachedError",
+    "AgentTimeoutError",
+    "TaskTimeoutError",
+    "StepTimeoutError",
+    "LLMCallTimeoutError",
+    "ToolCallTimeoutError",
+    "MemoryRecallTimeoutError",
+    # llm
+    "LLMError",
+    "CassetteError",
+    "CassetteMissError",
+    "GovernorError",
+    "ResilienceError",
     # mcp
     "MCPError",
     "MissingMCPServerParamsError",
@@ -69,6 +104,7 @@ __all__ = [
     # task handler
     "TaskHandlerError",
     "RecordMemoryError",
+    "BlobNotFoundError",
     # subagents
     "SubAgentsError",
     "SubAgentNotFoundError",
@@ -15,6 +15,50 @@ class MaxStepsReachedError(LLMAgentError):
     pass
 
 
+class AgentTimeoutError(LLMAgentError):
+    """Base error for deadlines of ``Timeouts`` being exceeded."""
+
+    pass
+
+
+class TaskTimeoutError(AgentTimeoutError):
+    """Raised if a task exceeds ``Timeouts.task``."""
+
+    pass
+
+
+class StepTimeoutError(AgentTimeoutError):
+    """Raised if a step exceeds ``Timeouts.step``."""
+
+    pass
+
+
+class LLMCallTimeoutError(AgentTimeoutError):
+    """Raised if a call to the backbone LLM exceeds ``Timeouts.llm_call``."""
+
+    pass
+
+
+class ToolCallTimeoutError(AgentTimeoutError):
+    """Raised if a tool call exceeds ``Timeouts.tool_call``.
+
+    Never escapes ``run_step()``: the timed-out call is reported to the LLM
+    as an error ``ToolCallResult`` instead.
+    """
+
+    pass
+
+
+class MemoryRecallTimeoutError(AgentTimeoutError):
+    """Raised if a memory's recall exceeds ``Timeouts.memory_recall``.
+
+    Never escapes ``load_memories()``: the memory is skipped for the task
+    instead.
+    """
+
+    pass
+
+
 class LLMAgentBuilderError(LLMAgentError):
     """Base error for all LLMAgentBuilder-related exceptions."""
 
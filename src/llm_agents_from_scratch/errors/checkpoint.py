@@ -0,0 +1,15 @@
+"""Errors for checkpointers."""
+
+from .core import LLMAgentsFromScratchError
+
+
+class CheckpointError(LLMAgentsFromScratchError):
+    """Base error for all checkpoint-related exceptions."""
+
+    pass
+
+
+class CheckpointNotFoundError(CheckpointError):
+    """Raised when resuming a task that has no checkpoint."""
+
+    pass
@@ -0,0 +1,33 @@
+"""Errors for LLMs."""
+
+from .core import LLMAgentsFromScratchError
+
+
+class LLMError(LLMAgentsFromScratchError):
+    """Base error for all LLM-related exceptions."""
+
+    pass
+
+
+class CassetteError(LLMError):
+    """Base error for all CassetteLLM-related exceptions."""
+
+    pass
+
+
+class CassetteMissError(CassetteError):
+    """Raised when a request has no recording to replay."""
+
+    pass
+
+
+class GovernorError(LLMError):
+    """Raised when a GovernedLLM or its rate limits are misconfigured."""
+
+    pass
+
+
+class ResilienceError(LLMError):
+    """Raised when a ResilientLLM is misconfigured."""
+
+    pass
@@ -25,3 +25,9 @@ class EpisodeNotFoundError(MemoryStoreError):
     """Raised when delete()/update() targets an episode ID not in the store."""
 
     pass
+
+
+class MemoryWriterError(LLMAgentsFromScratchError):
+    """Raised when a MemoryWriter is misconfigured."""
+
+    pass
@@ -13,3 +13,9 @@ class RecordMemoryError(TaskHandlerError):
     """Raised when record_memory() is called with invalid arguments."""
 
     pass
+
+
+class BlobNotFoundError(TaskHandlerError):
+    """Raised when a blob handle is unknown to the ``BlobStore``."""
+
+    pass
@@ -1,3 +1,20 @@
+from .cassette import CassetteLLM
+from .governed import GovernedLLM, TokenBucket, llm_priority
 from .ollama import OllamaLLM
+from .resilient import ResilientLLM, is_retryable
+from .router import LLMRouter, llm_site
+from .scripted import LatencyModel, ScriptedLLM
 
-__all__ = ["OllamaLLM"]
+__all__ = [
+    "CassetteLLM",
+    "GovernedLLM",
+    "LLMRouter",
+    "LatencyModel",
+    "OllamaLLM",
+    "ResilientLLM",
+    "ScriptedLLM",
+    "TokenBucket",
+    "is_retryable",
+    "llm_priority",
+    "llm_site",
+]
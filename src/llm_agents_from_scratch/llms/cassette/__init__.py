@@ -0,0 +1,3 @@
+from .llm import CassetteLLM
+
+__all__ = ["CassetteLLM"]
@@ -0,0 +1,196 @@
+"""Record/replay LLM for deterministic offline runs."""
+
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from llm_agents_from_scratch.base.llm import BaseLLM, WrappedLLM
+from llm_agents_from_scratch.data_structures import CassetteMatch, CassetteMode
+from llm_agents_from_scratch.errors import CassetteError, CassetteMissError
+
+from .utils import (
+    canonicalize,
+    deserialize_response,
+    request_key,
+    serialize_response,
+)
+
+
+class CassetteLLM(WrappedLLM):
+    """Records LLM calls to a local cassette and replays them.
+
+    Wraps any ``BaseLLM`` (e.g. ``OllamaLLM`` or ``OpenAILLM``, unchanged).
+    Each call to ``complete``, ``structured_output``, ``chat`` or
+    ``continue_chat_with_tool_results`` is keyed by a SHA-256 hash of its
+    canonical request: method, model, messages, tools and any extra
+    arguments. Recordings are appended to a JSON Lines file, one call per
+    line, so a cassette can be committed next to tests and inspected by
+    hand.
+
+    In ``REPLAY`` mode no request reaches the wrapped LLM, which makes agent
+    runs deterministic, free and usable offline; a request without a
+    recording raises ``CassetteMissError``. Identical requests recorded
+    more than once are replayed in recorded order.
+
+    Example::
+
+        llm = CassetteLLM(
+            OllamaLLM(model="qwen3:8b"),
+            path="tests/cassettes/hailstone.jsonl",
+            mode=CassetteMode.AUTO,
+        )
+        agent = LLMAgent(llm=llm)
+
+    Attributes:
+        llm (BaseLLM): The wrapped LLM.
+        path (Path): Location of the cassette file.
+        mode (CassetteMode): How the cassette is used.
+        match (CassetteMatch): How calls are matched to recordings.
+        hits (int): Calls served from the cassette.
+        misses (int): Calls passed to the wrapped LLM.
+    """
+
+    def __init__(
+        self,
+        llm: BaseLLM,
+        path: str | Path,
+        mode: CassetteMode = CassetteMode.AUTO,
+        match: CassetteMatch = CassetteMatch.STRICT,
+    ) -> None:
+        """Initialize a CassetteLLM.
+
+        Args:
+            llm (BaseLLM): The LLM to record.
+            path (str | Path): Location of the cassette file.
+            mode (CassetteMode, optional): How the cassette is used.
+                Defaults to ``CassetteMode.AUTO``.
+            match (CassetteMatch, optional): How calls are matched to
+                recordings. Defaults to ``CassetteMatch.STRICT``.
+        """
+        super().__init__(llm)
+        self.path = Path(path)
+        self.mode = CassetteMode(mode)
+        self.match = CassetteMatch(match)
+        self.hits = 0
+        self.misses = 0
+        self._entries: list[dict[str, Any]] | None = None
+        self._by_key: defaultdict[str, list[int]] = defaultdict(list)
+        self._by_method: defaultdict[str, list[int]] = defaultdict(list)
+        self._used: set[int] = set()
+
+    @property
+    def model(self) -> str:
+        """Model name of the wrapped LLM, part of every request key."""
+        return str(getattr(self.llm, "model", type(self.llm).__name__))
+
+    @property
+    def entries(self) -> list[dict[str, Any]]:
+        """Recorded calls, in recorded order, loaded on first use."""
+        if self._entries is None:
+            self._entries = []
+            if self.mode == CassetteMode.RECORD:
+                # recording starts a fresh cassette
+                self.path.unlink(missing_ok=True)
+            else:
+                for entry in self._load():
+                    self._add(entry)
+        return self._entries
+
+    def _load(self) -> list[dict[str, Any]]:
+        """Read the cassette file."""
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            if self.mode == CassetteMode.REPLAY:
+                raise CassetteError(
+                    f"Cassette not found: {self.path}",
+                ) from None
+            return []
+        try:
+            return [json.loads(line) for line in lines if line.strip()]
+        except ValueError as e:
+            raise CassetteError(f"Invalid cassette: {self.path}") from e
+
+    def _add(self, entry: dict[str, Any]) -> None:
+        assert self._entries is not None
+        ix = len(self._entries)
+        self._entries.append(entry)
+        self._by_key[entry["key"]].append(ix)
+        self._by_method[entry["method"]].append(ix)
+
+    def _lookup(self, key: str, method: str) -> dict[str, Any] | None:
+        """Find the recording to replay for a request, if any."""
+        entries = self.entries
+        candidates = self._by_key.get(key, [])
+        if candidates:
+            # identical requests replay in order, the last one repeatedly
+            ix = next(
+                (i for i in candidates if i not in self._used),
+                candidates[-1],
+            )
+        elif self.match == CassetteMatch.FUZZY:
+            unused = (
+                i
+                for i in self._by_method.get(method, [])
+                if i not in self._used
+            )
+            fuzzy_ix = next(unused, None)
+            if fuzzy_ix is None:
+                return None
+            ix = fuzzy_ix
+        else:
+            return None
+        self._used.add(ix)
+        return entries[ix]
+
+    def _record(
+        self,
+        key: str,
+        method: str,
+        request: dict[str, Any],
+        response: Any,
+    ) -> None:
+        """Append a call to the cassette."""
+        entry = {
+            "key": key,
+            "method": method,
+            "request": request,
+            "response": serialize_response(method, response),
+        }
+        # load, or reset in RECORD mode, before appending
+        entries = self.entries
+        self._add(entry)
+        self._used.add(len(entries) - 1)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    async def _invoke(self, method: str, **kwargs: Any) -> Any:
+        """Replay a call from the cassette, or make and record it."""
+        request = {
+            "method": method,
+            "model": self.model,
+            "kwargs": canonicalize(kwargs),
+        }
+        key = request_key(request)
+
+        if self.mode != CassetteMode.RECORD:
+            entry = self._lookup(key, method)
+            if entry is not None:
+                self.hits += 1
+                return deserialize_response(
+                    method,
+                    entry["response"],
+                    mdl=kwargs.get("mdl"),
+                )
+            if self.mode == CassetteMode.REPLAY:
+                raise CassetteMissError(
+                    f"No recording of `{method}` request {key[:12]} "
+                    f"in cassette {self.path}",
+                )
+
+        self.misses += 1
+        response = await self._call_wrapped(method, **kwargs)
+        self._record(key, method, request, response)
+        return response
@@ -0,0 +1,136 @@
+"""Utils for CassetteLLM."""
+
+import hashlib
+import json
+from typing import Any
+
+from pydantic import BaseModel
+
+from llm_agents_from_scratch.base.tool import AsyncBaseTool, BaseTool
+from llm_agents_from_scratch.data_structures import (
+    ChatMessage,
+    CompleteResult,
+    ToolCall,
+    ToolCallResult,
+)
+
+
+def canonicalize(value: Any) -> Any:  # noqa: PLR0911
+    """Convert LLM call arguments to plain, order-stable JSON values.
+
+    Tool call ids are left out: providers generate fresh ones per run, and
+    they say nothing about what the LLM was asked.
+
+    Args:
+        value (Any): An argument of a ``BaseLLM`` method.
+
+    Returns:
+        Any: A JSON-serializable equivalent of ``value``.
+    """
+    if isinstance(value, ToolCall):
+        return {
+            "tool_name": value.tool_name,
+            "arguments": canonicalize(value.arguments),
+        }
+    if isinstance(value, ToolCallResult):
+        return {
+            "content": canonicalize(value.content),
+            "error": value.error,
+        }
+    if isinstance(value, ChatMessage):
+        return {
+            "role": value.role.value,
+            "content": value.content,
+            "tool_calls": canonicalize(value.tool_calls),
+        }
+    if isinstance(value, (BaseTool, AsyncBaseTool)):
+        return {
+            "name": value.name,
+            "description": value.description,
+            "parameters": value.parameters_json_schema,
+        }
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, type) and issubclass(value, BaseModel):
+        return {
+            "model": value.__name__,
+            "schema": value.model_json_schema(),
+        }
+    if isinstance(value, dict):
+        return {str(k): canonicalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [canonicalize(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def request_key(request: dict[str, Any]) -> str:
+    """Hash a canonical request.
+
+    Args:
+        request (dict[str, Any]): Output of ``canonicalize()``.
+
+    Returns:
+        str: Hex SHA-256 of the request's canonical JSON.
+    """
+    payload = json.dumps(request, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def serialize_response(method: str, response: Any) -> Any:
+    """Convert a ``BaseLLM`` method's return value to JSON.
+
+    Args:
+        method (str): The ``BaseLLM`` method called.
+        response (Any): What it returned.
+
+    Returns:
+        Any: A JSON-serializable form of ``response``.
+    """
+    if method == "chat":
+        user_message, response_message = response
+        return [
+            user_message.model_dump(mode="json"),
+            response_message.model_dump(mode="json"),
+        ]
+    if method == "continue_chat_with_tool_results":
+        tool_messages, response_message = response
+        return {
+            "tool_messages": [m.model_dump(mode="json") for m in tool_messages],
+            "response": response_message.model_dump(mode="json"),
+        }
+    # complete and structured_output return a single pydantic model
+    return response.model_dump(mode="json")
+
+
+def deserialize_response(
+    method: str,
+    data: Any,
+    mdl: type[BaseModel] | None = None,
+) -> Any:
+    """Rebuild a ``BaseLLM`` method's return value from JSON.
+
+    Args:
+        method (str): The ``BaseLLM`` method called.
+        data (Any): Output of ``serialize_response()``.
+        mdl (type[BaseModel] | None): The requested model, for
+            ``structured_output``.
+
+    Returns:
+        Any: The return value as the method would have produced it.
+    """
+    if method == "chat":
+        user_message, response_message = data
+        return (
+            ChatMessage.model_validate(user_message),
+            ChatMessage.model_validate(response_message),
+        )
+    if method == "continue_chat_with_tool_results":
+        return (
+            [ChatMessage.model_validate(m) for m in data["tool_messages"]],
+            ChatMessage.model_validate(data["response"]),
+        )
+    if method == "structured_output" and mdl is not None:
+        return mdl.model_validate(data)
+    return CompleteResult.model_validate(data)
@@ -0,0 +1,4 @@
+from .bucket import TokenBucket
+from .llm import GovernedLLM, llm_priority
+
+__all__ = ["GovernedLLM", "TokenBucket", "llm_priority"]
@@ -0,0 +1,73 @@
+"""Token bucket rate limiter."""
+
+import time
+
+from llm_agents_from_scratch.errors import GovernorError
+
+
+class TokenBucket:
+    """A token bucket refilled continuously at a fixed rate.
+
+    Holds at most ``capacity`` tokens. Taking more tokens than the bucket
+    holds is allowed and leaves it in debt, which later requests wait out;
+    that keeps the long-run rate at ``rate`` even when the exact cost of a
+    request is only known after it ran.
+
+    Attributes:
+        rate (float): Tokens added per second.
+        capacity (float): Most tokens the bucket holds, i.e. the burst.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """Initialize a full TokenBucket.
+
+        Args:
+            rate (float): Tokens added per second. Must be positive.
+            capacity (float | None): Most tokens the bucket holds. Defaults
+                to ``rate`` (one second's worth).
+
+        Raises:
+            GovernorError: If ``rate`` or ``capacity`` is not positive.
+        """
+        if rate <= 0:
+            raise GovernorError("`rate` must be > 0.")
+        capacity = rate if capacity is None else capacity
+        if capacity <= 0:
+            raise GovernorError("`capacity` must be > 0.")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available; negative while in debt."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate,
+        )
+        self._updated = now
+        return self._tokens
+
+    def delay(self, amount: float) -> float:
+        """Seconds until ``amount`` tokens can be taken.
+
+        A request larger than ``capacity`` only waits for a full bucket.
+
+        Args:
+            amount (float): Tokens to take.
+
+        Returns:
+            float: Seconds to wait; 0 if the tokens are available now.
+        """
+        missing = min(amount, self.capacity) - self.tokens
+        return max(missing / self.rate, 0.0)
+
+    def take(self, amount: float) -> None:
+        """Take ``amount`` tokens, going into debt if there are too few.
+
+        Args:
+            amount (float): Tokens to take.
+        """
+        self._tokens = self.tokens - amount
@@ -0,0 +1,349 @@
+"""LLM wrapper bounding concurrency and request and token rates."""
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Iterator, Sequence
+
+from pydantic import BaseModel
+
+from llm_agents_from_scratch.base.llm import BaseLLM, WrappedLLM
+from llm_agents_from_scratch.base.tool import Tool
+from llm_agents_from_scratch.data_structures import (
+    ChatMessage,
+    ChatStreamChunk,
+    CompleteResult,
+    GovernorStats,
+    LLMPriority,
+    ToolCallResult,
+)
+from llm_agents_from_scratch.errors import GovernorError
+from llm_agents_from_scratch.utils import estimate_tokens
+
+from .bucket import TokenBucket
+
+current_priority: ContextVar[LLMPriority] = ContextVar(
+    "current_priority",
+    default=LLMPriority.DEFAULT,
+)
+
+
+@contextmanager
+def llm_priority(priority: LLMPriority) -> Iterator[None]:
+    """Run the LLM calls made inside the block at ``priority``.
+
+    The priority is kept in a context variable, so it also applies to
+    asyncio tasks started inside the block.
+
+    Example::
+
+        with llm_priority(LLMPriority.BACKGROUND):
+            await llm.complete(prompt)
+
+    Args:
+        priority (LLMPriority): Priority class of the calls.
+    """
+    token = current_priority.set(priority)
+    try:
+        yield
+    finally:
+        current_priority.reset(token)
+
+
+def _request_text(kwargs: dict[str, Any]) -> str:
+    """The text of an LLM request that counts towards its input tokens."""
+    texts = [kwargs.get("prompt") or "", kwargs.get("input") or ""]
+    texts += [m.content for m in kwargs.get("chat_history") or []]
+    texts += [str(r.content) for r in kwargs.get("tool_call_results") or []]
+    return "\n".join(texts)
+
+
+def _response_text(response: Any) -> str:
+    """The text of an LLM response that counts towards its output tokens."""
+    # chat methods return the response message last
+    if isinstance(response, tuple):
+        response = response[-1]
+    if isinstance(response, ChatMessage):
+        return response.content
+    if isinstance(response, CompleteResult):
+        return response.response
+    if isinstance(response, BaseModel):
+        return response.model_dump_json()
+    return ""
+
+
+class GovernedLLM(WrappedLLM):
+    """Shares one LLM between callers without overloading it.
+
+    Every call first waits in an admission queue until there is a free
+    in-flight slot, a request in the requests-per-second bucket and its
+    estimated input tokens in the tokens-per-minute bucket. Waiting calls
+    are admitted by priority (see ``llm_priority()``), then in arrival
+    order. Output tokens are charged to the tokens-per-minute bucket once
+    the response arrives. Tokens are estimated with ``estimate_tokens``
+    unless a ``token_counter`` is given. Streaming calls are forwarded to
+    the wrapped LLM's streaming methods once admitted, and hold their slot
+    until the stream ends.
+
+    Wrap the provider once and hand the wrapper to every agent, subagent
+    and memory that should share its limits::
+
+        llm = GovernedLLM(
+            OpenAILLM(model="gpt-4o-mini"),
+            max_in_flight=8,
+            requests_per_second=5,
+            tokens_per_minute=200_000,
+        )
+        agent = LLMAgent(llm=llm)
+
+    Attributes:
+        llm (BaseLLM): The wrapped LLM.
+        max_in_flight (int | None): Most calls running at once.
+        requests (TokenBucket | None): Requests-per-second bucket.
+        tokens (TokenBucket | None): Tokens-per-minute bucket, counted in
+            tokens per second.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        llm: BaseLLM,
+        max_in_flight: int | None = None,
+        requests_per_second: float | None = None,
+        tokens_per_minute: float | None = None,
+        burst: float | None = None,
+        token_counter: Callable[[str], int] | None = None,
+    ) -> None:
+        """Initialize a GovernedLLM.
+
+        Args:
+            llm (BaseLLM): The LLM to govern.
+            max_in_flight (int | None): Most calls running at once.
+                Defaults to None (unbounded).
+            requests_per_second (float | None): Sustained request rate.
+                Defaults to None (unbounded).
+            tokens_per_minute (float | None): Sustained input plus output
+                token rate. Defaults to None (unbounded).
+            burst (float | None): Requests that may start back to back
+                before ``requests_per_second`` applies. Defaults to one
+                second's worth.
+            token_counter (Callable[[str], int] | None): Counts the tokens
+                of a text. Defaults to ``estimate_tokens``.
+
+        Raises:
+            GovernorError: If a limit is not positive.
+        """
+        super().__init__(llm)
+        if max_in_flight is not None and max_in_flight < 1:
+            raise GovernorError("`max_in_flight` must be >= 1.")
+        self.max_in_flight = max_in_flight
+        self.requests = (
+            TokenBucket(requests_per_second, burst)
+            if requests_per_second is not None
+            else None
+        )
+        self.tokens = (
+            TokenBucket(tokens_per_minute / 60, tokens_per_minute)
+            if tokens_per_minute is not None
+            else None
+        )
+        self.token_counter = token_counter or estimate_tokens
+        self._in_flight = 0
+        # (priority, arrival, input tokens, enqueued at, admission future)
+        self._waiters: list[
+            tuple[int, int, int, float, asyncio.Future[None]]
+        ] = []
+        self._arrivals = itertools.count()
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._stats = GovernorStats()
+
+    @property
+    def model(self) -> str:
+        """Model name of the wrapped LLM."""
+        return str(getattr(self.llm, "model", type(self.llm).__name__))
+
+    def stats(self) -> GovernorStats:
+        """Return the current queue depth and admission counters.
+
+        Returns:
+            GovernorStats: A snapshot of the admission queue.
+        """
+        by_priority: dict[str, int] = {}
+        for priority, *_, future in self._waiters:
+            if not future.done():
+                name = LLMPriority(priority).name.lower()
+                by_priority[name] = by_priority.get(name, 0) + 1
+        return self._stats.model_copy(
+            update={
+                "in_flight": self._in_flight,
+                "queue_depth": sum(by_priority.values()),
+                "queue_depth_by_priority": by_priority,
+            },
+        )
+
+    async def _invoke(self, method: str, **kwargs: Any) -> Any:
+        """Wait for admission, then call the wrapped LLM."""
+        await self._admit(self._input_tokens(kwargs))
+        try:
+            response = await self._call_wrapped(method, **kwargs)
+        finally:
+            self._release()
+        self._charge_output(_response_text(response))
+        return response
+
+    async def _stream(self, method: str, **kwargs: Any) -> AsyncIterator[Any]:
+        """Wait for admission, then stream from the wrapped LLM."""
+        await self._admit(self._input_tokens(kwargs))
+        deltas: list[str] = []
+        message: ChatMessage | None = None
+        try:
+            async for chunk in getattr(self.llm, method)(**kwargs):
+                if isinstance(chunk, ChatStreamChunk):
+                    deltas.append(chunk.delta)
+                    message = chunk.message or message
+                else:  # stream_complete yields text
+                    deltas.append(chunk)
+                yield chunk
+        finally:
+            self._release()
+            # whatever was streamed, should the caller stop early
+            self._charge_output(
+                message.content if message is not None else "".join(deltas),
+            )
+
+    async def stream_complete(
+        self,
+        prompt: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Stream a completion from the wrapped LLM once admitted."""
+        async for delta in self._stream(
+            "stream_complete",
+            prompt=prompt,
+            **kwargs,
+        ):
+            yield delta
+
+    async def stream_chat(
+        self,
+        input: str,
+        chat_history: Sequence[ChatMessage] | None = None,
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Stream a chat from the wrapped LLM once admitted."""
+        async for chunk in self._stream(
+            "stream_chat",
+            input=input,
+            chat_history=chat_history,
+            tools=tools,
+            **kwargs,
+        ):
+            yield chunk
+
+    async def stream_continue_chat_with_tool_results(
+        self,
+        tool_call_results: Sequence[ToolCallResult],
+        chat_history: Sequence[ChatMessage],
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Stream the continuation of a chat from the wrapped LLM."""
+        async for chunk in self._stream(
+            "stream_continue_chat_with_tool_results",
+            tool_call_results=tool_call_results,
+            chat_history=chat_history,
+            tools=tools,
+            **kwargs,
+        ):
+            yield chunk
+
+    def _input_tokens(self, kwargs: dict[str, Any]) -> int:
+        """Estimated input tokens of a request, if tokens are limited."""
+        if self.tokens is None:
+            return 0
+        return self.token_counter(_request_text(kwargs))
+
+    def _charge_output(self, text: str) -> None:
+        """Charge the tokens of a response to the tokens bucket."""
+        if self.tokens is not None:
+            self.tokens.take(self.token_counter(text))
+
+    def _release(self) -> None:
+        """Free an in-flight slot."""
+        self._in_flight -= 1
+        self._wake()
+
+    async def _admit(self, input_tokens: int) -> None:
+        """Queue for an in-flight slot and rate budget; return once held."""
+        enqueued_at = time.monotonic()
+        future: asyncio.Future[None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        heapq.heappush(
+            self._waiters,
+            (
+                current_priority.get(),
+                next(self._arrivals),
+                input_tokens,
+                enqueued_at,
+                future,
+            ),
+        )
+        self._stats.peak_queue_depth = max(
+            self._stats.peak_queue_depth,
+            sum(not w[-1].done() for w in self._waiters),
+        )
+        self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # admitted just before being cancelled: free the slot
+                self._in_flight -= 1
+            self._wake()
+            raise
+
+    def _wake(self) -> None:
+        """Start the dispatcher unless it is already running."""
+        if (
+            self._dispatcher is None
+            or self._dispatcher.done()
+            # e.g. a previous asyncio.run()
+            or self._dispatcher.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        """Admit waiting calls in priority order while limits allow."""
+        while self._waiters:
+            _, _, input_tokens, enqueued_at, future = self._waiters[0]
+            if future.done():  # cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+            if (
+                self.max_in_flight is not None
+                and self._in_flight >= self.max_in_flight
+            ):
+                return  # a finishing call wakes the dispatcher again
+            delay = max(
+                self.requests.delay(1) if self.requests else 0.0,
+                self.tokens.delay(input_tokens) if self.tokens else 0.0,
+            )
+            if delay > 0:
+                # re-check afterwards: a more urgent call may have arrived
+                await asyncio.sleep(delay)
+                continue
+            heapq.heappop(self._waiters)
+            if self.requests is not None:
+                self.requests.take(1)
+            if self.tokens is not None:
+                self.tokens.take(input_tokens)
+            self._in_flight += 1
+            wait = time.monotonic() - enqueued_at
+            self._stats.admitted += 1
+            self._stats.total_wait += wait
+            self._stats.max_wait = max(self._stats.max_wait, wait)
+            future.set_result(None)
@@ -2,14 +2,16 @@
 
 import json
 import re
-from typing import Any, Sequence
+from typing import Any, AsyncIterator, Sequence
 
 from ollama import AsyncClient
+from ollama import Message as OllamaMessage
 
 from llm_agents_from_scratch.base.llm import LLM, StructuredOutputType
 from llm_agents_from_scratch.base.tool import Tool
 from llm_agents_from_scratch.data_structures import (
     ChatMessage,
+    ChatStreamChunk,
     CompleteResult,
     ToolCallResult,
 )
@@ -158,6 +160,7 @@ class OllamaLLM(LLM):
             messages=o_messages,
             tools=o_tools,
             think=self.think,
+            **kwargs,
         )
 
         return user_message, ollama_message_to_chat_message(result.message)
@@ -201,10 +204,139 @@ class OllamaLLM(LLM):
             messages=o_messages,
             tools=o_tools,
             think=self.think,
+            **kwargs,
         )
 
         return tool_messages, ollama_message_to_chat_message(o_result.message)
 
+    async def stream_complete(
+        self,
+        prompt: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Stream the completion of a prompt with an Ollama LLM.
+
+        Args:
+            prompt (str): The prompt to complete.
+            **kwargs (Any): Additional keyword arguments.
+
+        Yields:
+            str: Text generated since the previous delta.
+        """
+        stream = await self._client.generate(
+            model=self.model,
+            prompt=prompt,
+            stream=True,
+            **kwargs,
+        )
+        async for part in stream:
+            if part.response:
+                yield part.response
+
+    async def stream_chat(
+        self,
+        input: str,
+        chat_history: Sequence[ChatMessage] | None = None,
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Stream a chat with an Ollama LLM.
+
+        Args:
+            input (str): The user's current input.
+            chat_history (list[ChatMessage] | None, optional): The chat
+                history.
+            tools (list[BaseTool] | None, optional): The tools available to the
+                LLM.
+            **kwargs (Any): Additional keyword arguments.
+
+        Yields:
+            ChatStreamChunk: Text deltas, then the complete response.
+        """
+        o_messages = [
+            chat_message_to_ollama_message(cm) for cm in chat_history or []
+        ]
+        o_messages.append(
+            chat_message_to_ollama_message(
+                ChatMessage(role="user", content=input),
+            ),
+        )
+        async for chunk in self._stream_chat_messages(
+            o_messages,
+            tools,
+            **kwargs,
+        ):
+            yield chunk
+
+    async def stream_continue_chat_with_tool_results(
+        self,
+        tool_call_results: Sequence[ToolCallResult],
+        chat_history: Sequence[ChatMessage],
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Stream the continuation of a chat with tool call results.
+
+        Args:
+            tool_call_results (Sequence[ToolCallResult]): The tool call results.
+            chat_history (Sequence[ChatMessage]): The chat history.
+            tools (Sequence[BaseTool]|None, optional): tools that the LLM
+                can call.
+            **kwargs (Any): Additional keyword arguments.
+
+        Yields:
+            ChatStreamChunk: Text deltas, then the complete response.
+        """
+        o_messages = [
+            chat_message_to_ollama_message(cm) for cm in chat_history
+        ] + [
+            chat_message_to_ollama_message(
+                ChatMessage.from_tool_call_result(tc),
+            )
+            for tc in tool_call_results
+        ]
+        async for chunk in self._stream_chat_messages(
+            o_messages,
+            tools,
+            **kwargs,
+        ):
+            yield chunk
+
+    async def _stream_chat_messages(
+        self,
+        o_messages: list[OllamaMessage],
+        tools: Sequence[Tool] | None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Send a streaming chat request and assemble the response.
+
+        Ollama sends tool calls whole, in one of the parts; text arrives as
+        deltas which are yielded as they come.
+        """
+        o_tools = [tool_to_ollama_tool(t) for t in tools] if tools else None
+        stream = await self._client.chat(
+            model=self.model,
+            messages=o_messages,
+            tools=o_tools,
+            think=self.think,
+            stream=True,
+            **kwargs,
+        )
+        content: list[str] = []
+        tool_calls: list[OllamaMessage.ToolCall] = []
+        async for part in stream:
+            if part.message.content:
+                content.append(part.message.content)
+                yield ChatStreamChunk(delta=part.message.content)
+            if part.message.tool_calls:
+                tool_calls.extend(part.message.tool_calls)
+        message = OllamaMessage(
+            role="assistant",
+            content="".join(content),
+            tool_calls=tool_calls or None,
+        )
+        yield ChatStreamChunk(message=ollama_message_to_chat_message(message))
+
     async def _structured_output_json_prompt(
         self,
         prompt: str,
@@ -12,6 +12,7 @@ from llm_agents_from_scratch.data_structures import (
     ChatRole,
     ToolCall,
 )
+from llm_agents_from_scratch.tools.utils import cached_tool_payload
 
 
 def ollama_message_to_chat_message(
@@ -129,11 +130,16 @@ def _get_tool_json_schema(tool: Tool) -> dict[str, Any]:
 def tool_to_ollama_tool(tool: Tool) -> OllamaTool:
     """Convert a BaseTool or AsyncBaseTool to an ~ollama.Tool type.
 
+    The conversion is cached per tool, see ``cached_tool_payload``.
+
     Args:
         tool (Tool): The base tool to convert.
 
     Returns:
         ~ollama.Tool: The converted tool.
     """
-    json_schema = _get_tool_json_schema(tool)
-    return OllamaTool.model_validate(json_schema)
+    return cached_tool_payload(
+        tool,
+        "ollama",
+        lambda t: OllamaTool.model_validate(_get_tool_json_schema(t)),
+    )
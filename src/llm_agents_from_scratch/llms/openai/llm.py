@@ -1,11 +1,12 @@
 """BONUS Material: OpenAI LLM."""
 
-from typing import TYPE_CHECKING, Any, Sequence
+from typing import TYPE_CHECKING, Any, AsyncIterator, Sequence, cast
 
 from llm_agents_from_scratch.base.llm import LLM, StructuredOutputType
 from llm_agents_from_scratch.base.tool import Tool
 from llm_agents_from_scratch.data_structures import (
     ChatMessage,
+    ChatStreamChunk,
     CompleteResult,
     ToolCallResult,
 )
@@ -18,10 +19,12 @@ from .utils import (
 )
 
 if TYPE_CHECKING:
+    from openai import AsyncStream
     from openai.types.responses import (
         ParsedResponse,
         Response,
         ResponseInputItemParam,
+        ResponseStreamEvent,
     )
 
 
@@ -88,6 +91,17 @@ class OpenAILLM(LLM):
         )
         return response.output_parsed  # type: ignore[no-any-return]
 
+    def prompt_cache_kwargs(self, cache_key: str) -> dict[str, Any]:
+        """Route requests sharing a static prefix to the same cache.
+
+        Args:
+            cache_key (str): Stable key for the static prompt prefix.
+
+        Returns:
+            dict[str, Any]: ``prompt_cache_key`` for ``responses.create``.
+        """
+        return {"prompt_cache_key": cache_key}
+
     def _prepare_input_and_instructions_from_history(
         self,
         chat_history: Sequence[ChatMessage],
@@ -226,3 +240,152 @@ class OpenAILLM(LLM):
         )
 
         return tool_messages, openai_response_to_chat_message(response)
+
+    async def stream_complete(
+        self,
+        prompt: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Implements streaming complete LLM interaction mode.
+
+        Args:
+            prompt (str): The prompt to complete.
+            **kwargs (Any): Additional keyword arguments.
+
+        Yields:
+            str: Text generated since the previous delta.
+        """
+        from openai.types.responses import (  # noqa: PLC0415
+            ResponseTextDeltaEvent,
+        )
+
+        # ``**kwargs`` keeps the overloads from seeing ``stream=True``
+        stream = cast(
+            "AsyncStream[ResponseStreamEvent]",
+            await self.client.responses.create(
+                model=self.model,
+                input=prompt,
+                stream=True,
+                **kwargs,
+            ),
+        )
+        async for event in stream:
+            if isinstance(event, ResponseTextDeltaEvent):
+                yield event.delta
+
+    async def stream_chat(
+        self,
+        input: str,
+        chat_history: Sequence[ChatMessage] | None = None,
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Implements streaming chat LLM interaction mode.
+
+        Args:
+            input (str): The user's current input.
+            chat_history (list[ChatMessage] | None, optional): The chat
+                history.
+            tools (list[BaseTool] | None, optional): The tools available to the
+                LLM.
+            **kwargs (Any): Additional keyword arguments.
+
+        Yields:
+            ChatStreamChunk: Text deltas, then the complete response.
+        """
+        context, instructions = (
+            self._prepare_input_and_instructions_from_history(
+                chat_history or [],
+            )
+        )
+        context.extend(
+            chat_message_to_openai_response_input_param(
+                ChatMessage(role="user", content=input),
+            ),
+        )
+        async for chunk in self._stream_response(
+            context,
+            instructions,
+            tools,
+            **kwargs,
+        ):
+            yield chunk
+
+    async def stream_continue_chat_with_tool_results(
+        self,
+        tool_call_results: Sequence[ToolCallResult],
+        chat_history: Sequence[ChatMessage],
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Implements streaming continue chat with tool results.
+
+        Args:
+            tool_call_results (Sequence[ToolCallResult]): The tool call results.
+            chat_history (Sequence[ChatMessage]): The chat history.
+            tools (Sequence[BaseTool]|None, optional): tools that the LLM
+                can call.
+            **kwargs (Any): Additional keyword arguments.
+
+        Yields:
+            ChatStreamChunk: Text deltas, then the complete response.
+        """
+        context, instructions = (
+            self._prepare_input_and_instructions_from_history(
+                chat_history or [],
+            )
+        )
+        for tc in tool_call_results:
+            context.extend(
+                chat_message_to_openai_response_input_param(
+                    ChatMessage.from_tool_call_result(tc),
+                ),
+            )
+        async for chunk in self._stream_response(
+            context,
+            instructions,
+            tools,
+            **kwargs,
+        ):
+            yield chunk
+
+    async def _stream_response(
+        self,
+        context: list["ResponseInputItemParam"],
+        instructions: str | None,
+        tools: Sequence[Tool] | None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Send a streaming Responses API request.
+
+        Text deltas are yielded as they arrive; the complete response,
+        tool calls included, comes with the ``response.completed`` event.
+        """
+        from openai import omit  # noqa: PLC0415
+        from openai.types.responses import (  # noqa: PLC0415
+            ResponseCompletedEvent,
+            ResponseTextDeltaEvent,
+        )
+
+        openai_tools = (
+            [tool_to_openai_tool(t) for t in tools] if tools else omit
+        )
+        # ``**kwargs`` keeps the overloads from seeing ``stream=True``
+        stream = cast(
+            "AsyncStream[ResponseStreamEvent]",
+            await self.client.responses.create(
+                model=self.model,
+                instructions=instructions,
+                input=context,
+                tools=openai_tools,
+                stream=True,
+                **kwargs,
+            ),
+        )
+        async for event in stream:
+            if isinstance(event, ResponseTextDeltaEvent):
+                yield ChatStreamChunk(delta=event.delta)
+            elif isinstance(event, ResponseCompletedEvent):
+                yield ChatStreamChunk(
+                    message=openai_response_to_chat_message(event.response),
+                )
@@ -11,6 +11,7 @@ from llm_agents_from_scratch.data_structures.tool import (
     ToolCall,
     ToolCallResult,
 )
+from llm_agents_from_scratch.tools.utils import cached_tool_payload
 
 from .errors import DataConversionError
 
@@ -102,15 +103,7 @@ def chat_message_to_openai_response_input_param(
     return [input_message]
 
 
-def tool_to_openai_tool(tool: Tool) -> "ToolParam":
-    """Convert a BaseTool or AsyncBaseTool to an ~openai.ToolParam type.
-
-    Args:
-        tool (Tool): The base tool to convert.
-
-    Returns:
-        ~openai.ToolParam: The converted tool.
-    """
+def _build_openai_tool(tool: Tool) -> "ToolParam":
     from openai.types.responses import FunctionToolParam  # noqa: PLC0415
 
     openai_tool: FunctionToolParam = {
@@ -121,3 +114,17 @@ def tool_to_openai_tool(tool: Tool) -> "ToolParam":
         "strict": True,
     }
     return openai_tool
+
+
+def tool_to_openai_tool(tool: Tool) -> "ToolParam":
+    """Convert a BaseTool or AsyncBaseTool to an ~openai.ToolParam type.
+
+    The conversion is cached per tool, see ``cached_tool_payload``.
+
+    Args:
+        tool (Tool): The base tool to convert.
+
+    Returns:
+        ~openai.ToolParam: The converted tool.
+    """
+    return cached_tool_payload(tool, "openai", _build_openai_tool)
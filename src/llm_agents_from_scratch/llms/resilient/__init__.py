@@ -0,0 +1,3 @@
+from .llm import ResilientLLM, is_retryable
+
+__all__ = ["ResilientLLM", "is_retryable"]
@@ -0,0 +1,311 @@
+"""LLM wrapper retrying transient errors and hedging slow requests."""
+
+import asyncio
+import math
+import random
+import time
+from collections import deque
+from typing import Any, Callable
+
+from llm_agents_from_scratch.base.llm import BaseLLM, WrappedLLM
+from llm_agents_from_scratch.data_structures import ResilienceStats
+from llm_agents_from_scratch.errors import ResilienceError
+
+# HTTP statuses worth retrying: timeouts, conflicts, rate limits and
+# server-side errors
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 425, 429})
+SERVER_ERROR_STATUS = 500
+# provider SDK errors (openai, httpx, ollama, ...) recognised by class name
+_RETRYABLE_ERROR_NAMES = (
+    "Timeout",
+    "Connection",
+    "RateLimit",
+    "Overloaded",
+    "InternalServer",
+    "ServiceUnavailable",
+)
+
+
+def _status_code(error: BaseException) -> int | None:
+    """The HTTP status of a provider error, if it carries one."""
+    for source in (error, getattr(error, "response", None)):
+        status = getattr(source, "status_code", None)
+        if isinstance(status, int):
+            return status
+    return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an LLM call that raised ``error`` is worth retrying.
+
+    Timeouts, connection errors, rate limits and server errors are
+    transient; anything else (bad requests, authentication, invalid
+    structured output, ...) is assumed to fail the same way again.
+    Provider errors are recognised by their HTTP status or class name, so
+    no provider SDK needs to be installed.
+
+    Args:
+        error (BaseException): The error an LLM call raised.
+
+    Returns:
+        bool: ``True`` if the call should be retried.
+    """
+    if isinstance(error, (TimeoutError, asyncio.TimeoutError, ConnectionError)):
+        return True
+    status = _status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES or status >= SERVER_ERROR_STATUS
+    return any(
+        marker in cls.__name__
+        for cls in type(error).__mro__
+        for marker in _RETRYABLE_ERROR_NAMES
+    )
+
+
+def _retry_after(error: BaseException) -> float | None:
+    """Seconds a provider asked to wait before retrying, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    try:
+        return float(headers["retry-after"]) if headers else None
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank percentile ``q`` (0-1) of ``samples``."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(q * len(ordered)) - 1, 0)]
+
+
+class ResilientLLM(WrappedLLM):
+    """Retries transient LLM errors and hedges slow requests.
+
+    A call that raises a retryable error (see ``is_retryable()``) is
+    retried up to ``max_retries`` times after a backoff with full jitter:
+    a random delay up to ``base_delay * 2 ** attempt``, capped at
+    ``max_delay``, or the provider's ``Retry-After`` if longer. Other
+    errors, and the last retryable one, are raised unchanged.
+
+    With hedging enabled, an attempt still running after the hedge delay
+    is duplicated, to the same LLM or to ``hedge_llm``, and whichever
+    answers first wins; the other request is cancelled. The delay is the
+    ``hedge_percentile`` of recent first-request latencies once
+    ``min_samples`` have been seen, and ``hedge_after`` otherwise. A
+    percentile of 0.95 hedges about one call in twenty.
+
+    Streaming methods are not forwarded: a request that was retried or
+    hedged mid-stream would repeat its deltas. They keep ``BaseLLM``'s
+    fallbacks instead, which make one non-streaming call, retried and
+    hedged as above, and yield the whole response as a single chunk.
+
+    Example::
+
+        llm = ResilientLLM(
+            OpenAILLM(model="gpt-4o-mini"),
+            max_retries=3,
+            hedge_percentile=0.95,
+        )
+        agent = LLMAgent(llm=llm)
+
+    Attributes:
+        llm (BaseLLM): The wrapped LLM.
+        hedge_llm (BaseLLM | None): LLM hedge requests go to, if not
+            ``llm``. It receives the same arguments as ``llm``.
+        max_retries (int): Retries after the first attempt.
+        base_delay (float): Backoff before the first retry, in seconds.
+        max_delay (float): Longest backoff, in seconds.
+        hedge_after (float | None): Hedge delay, in seconds, until enough
+            latencies were seen for ``hedge_percentile``.
+        hedge_percentile (float | None): Latency percentile (0-1) after
+            which an attempt is hedged.
+        min_samples (int): Latencies needed before ``hedge_percentile``
+            is used.
+        retry_on (Callable[[BaseException], bool]): Decides whether an
+            error is retried.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        llm: BaseLLM,
+        max_retries: int = 2,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        hedge_after: float | None = None,
+        hedge_percentile: float | None = None,
+        hedge_llm: BaseLLM | None = None,
+        min_samples: int = 20,
+        latency_window: int = 1000,
+        retry_on: Callable[[BaseException], bool] | None = None,
+    ) -> None:
+        """Initialize a ResilientLLM.
+
+        Args:
+            llm (BaseLLM): The LLM to call.
+            max_retries (int): Retries after the first attempt. Defaults
+                to 2.
+            base_delay (float): Backoff before the first retry, in
+                seconds; doubles with every retry. Defaults to 0.5.
+            max_delay (float): Longest backoff, in seconds. Defaults to
+                8.0.
+            hedge_after (float | None): Fixed hedge delay, in seconds.
+                Defaults to None.
+            hedge_percentile (float | None): Latency percentile (0-1)
+                after which an attempt is hedged. Defaults to None.
+            hedge_llm (BaseLLM | None): Second backend for hedge
+                requests. Defaults to None (hedge to ``llm``).
+            min_samples (int): Latencies needed before
+                ``hedge_percentile`` is used. Defaults to 20.
+            latency_window (int): Number of recent latencies kept for
+                percentiles and stats. Defaults to 1000.
+            retry_on (Callable[[BaseException], bool] | None): Decides
+                whether an error is retried. Defaults to
+                ``is_retryable``.
+
+        Raises:
+            ResilienceError: If a setting is out of range, or
+                ``hedge_llm`` is given without a hedge delay.
+        """
+        super().__init__(llm)
+        if max_retries < 0:
+            raise ResilienceError("`max_retries` must be >= 0.")
+        if base_delay < 0 or max_delay < 0:
+            raise ResilienceError("Backoff delays must be >= 0.")
+        if hedge_after is not None and hedge_after < 0:
+            raise ResilienceError("`hedge_after` must be >= 0.")
+        if hedge_percentile is not None and not 0 < hedge_percentile < 1:
+            raise ResilienceError("`hedge_percentile` must be in (0, 1).")
+        if hedge_llm is not None and (
+            hedge_after is None and hedge_percentile is None
+        ):
+            raise ResilienceError(
+                "`hedge_llm` needs `hedge_after` or `hedge_percentile`.",
+            )
+        if min_samples < 1 or latency_window < min_samples:
+            raise ResilienceError(
+                "Need 1 <= `min_samples` <= `latency_window`.",
+            )
+        self.hedge_llm = hedge_llm
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge_after = hedge_after
+        self.hedge_percentile = hedge_percentile
+        self.min_samples = min_samples
+        self.retry_on = retry_on or is_retryable
+        self._stats = ResilienceStats()
+        # latencies of successful attempts, and of their first requests
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+        self._unhedged: deque[float] = deque(maxlen=latency_window)
+        self._random = random.Random()
+
+    @property
+    def model(self) -> str:
+        """Model name of the wrapped LLM."""
+        return str(getattr(self.llm, "model", type(self.llm).__name__))
+
+    def stats(self) -> ResilienceStats:
+        """Return retry and hedge counters and recent latencies.
+
+        Returns:
+            ResilienceStats: A snapshot of the counters and percentiles.
+        """
+        latencies = list(self._latencies)
+        return self._stats.model_copy(
+            update={
+                "p50": _percentile(latencies, 0.5),
+                "p95": _percentile(latencies, 0.95),
+                "p99": _percentile(latencies, 0.99),
+                "unhedged_p99": _percentile(list(self._unhedged), 0.99),
+            },
+        )
+
+    def hedge_delay(self) -> float | None:
+        """Seconds an attempt may run before it is hedged.
+
+        Returns:
+            float | None: The delay, or ``None`` if attempts are not
+                hedged (yet).
+        """
+        if (
+            self.hedge_percentile is not None
+            and len(self._unhedged) >= self.min_samples
+        ):
+            return _percentile(list(self._unhedged), self.hedge_percentile)
+        return self.hedge_after
+
+    async def _invoke(self, method: str, **kwargs: Any) -> Any:
+        """Call the wrapped LLM, retrying retryable errors."""
+        self._stats.calls += 1
+        attempt = 0
+        while True:
+            try:
+                return await self._attempt(method, kwargs)
+            except Exception as e:
+                if attempt >= self.max_retries or not self.retry_on(e):
+                    self._stats.failures += 1
+                    raise
+                delay = self._random.uniform(
+                    0,
+                    min(self.max_delay, self.base_delay * 2**attempt),
+                )
+                delay = max(delay, min(_retry_after(e) or 0, self.max_delay))
+                attempt += 1
+                self._stats.retries += 1
+                await asyncio.sleep(delay)
+
+    async def _attempt(self, method: str, kwargs: dict[str, Any]) -> Any:
+        """Make one attempt, hedging it if it runs past the hedge delay."""
+        start = time.monotonic()
+        first_done_at: list[float] = []
+        first = asyncio.ensure_future(self._call_wrapped(method, **kwargs))
+        first.add_done_callback(
+            lambda _: first_done_at.append(time.monotonic()),
+        )
+        requests: set[asyncio.Future[Any]] = {first}
+        try:
+            done, _ = await asyncio.wait(requests, timeout=self.hedge_delay())
+            if not done:
+                self._stats.hedges += 1
+                hedge_llm = self.hedge_llm or self.llm
+                requests.add(
+                    asyncio.ensure_future(
+                        getattr(hedge_llm, method)(**kwargs),
+                    ),
+                )
+            winner = await self._first_success(requests)
+        finally:
+            for request in requests:
+                request.cancel()
+
+        end = time.monotonic()
+        if winner is not first:
+            self._stats.hedge_wins += 1
+        self._latencies.append(end - start)
+        # a cancelled first request would have taken at least this long
+        self._unhedged.append((first_done_at or [end])[0] - start)
+        return winner.result()
+
+    @staticmethod
+    async def _first_success(
+        requests: set[asyncio.Future[Any]],
+    ) -> asyncio.Future[Any]:
+        """Wait for the first request to succeed.
+
+        Raises:
+            Exception: The first error, if every request failed.
+        """
+        pending = set(requests)
+        errors = []
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for request in done:
+                error = request.exception()
+                if error is None:
+                    return request
+                errors.append(error)
+        raise errors[0]
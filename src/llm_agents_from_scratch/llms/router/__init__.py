@@ -0,0 +1,3 @@
+from .llm import LLMRouter, llm_site
+
+__all__ = ["LLMRouter", "llm_site"]
@@ -0,0 +1,225 @@
+"""LLM that sends each call site to its own LLM."""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Iterator, Mapping, Sequence
+
+from llm_agents_from_scratch.base.llm import BaseLLM, WrappedLLM
+from llm_agents_from_scratch.base.tool import Tool
+from llm_agents_from_scratch.data_structures import (
+    ChatMessage,
+    ChatStreamChunk,
+    LLMCallSite,
+    RouteStats,
+    ToolCallResult,
+)
+
+DEFAULT_ROUTE = "default"
+# stands in for provider prompt cache kwargs until the route is known
+_CACHE_KEY_KWARG = "_router_prompt_cache_key"
+
+current_llm_site: ContextVar[str | None] = ContextVar(
+    "current_llm_site",
+    default=None,
+)
+
+
+@contextmanager
+def llm_site(site: LLMCallSite | str) -> Iterator[None]:
+    """Mark the LLM calls made inside the block as made at ``site``.
+
+    ``TaskHandler``, the summarizing compactor and memory reflections mark
+    their calls already; use this for calls of your own.
+
+    Example::
+
+        with llm_site("triage"):
+            await llm.structured_output(prompt, mdl=Triage)
+
+    Args:
+        site (LLMCallSite | str): The call site.
+    """
+    token = current_llm_site.set(_site(site))
+    try:
+        yield
+    finally:
+        current_llm_site.reset(token)
+
+
+class LLMRouter(WrappedLLM):
+    """Sends each call site to its own LLM, with its own options.
+
+    Calls are routed by the site they are made at (see ``LLMCallSite``
+    and ``llm_site()``); sites without a route go to ``llm``. The
+    options of a site are merged into the keyword arguments of every call
+    made there, so they must be understood by the site's LLM. Prompt
+    cache kwargs are requested from the LLM a call is routed to.
+
+    A typical setup sends the small routing decisions to a fast model::
+
+        llm = LLMRouter(
+            OpenAILLM(model="gpt-4o"),
+            routes={
+                LLMCallSite.GET_NEXT_STEP: OpenAILLM(model="gpt-4o-mini"),
+                LLMCallSite.REFLECTION: OllamaLLM(model="qwen3:0.6b"),
+            },
+            options={LLMCallSite.GET_NEXT_STEP: {"temperature": 0}},
+        )
+        agent = LLMAgent(llm=llm)
+
+    Attributes:
+        llm (BaseLLM): The LLM of sites without a route.
+        routes (dict[str, BaseLLM]): LLM per call site.
+        options (dict[str, dict[str, Any]]): Extra keyword arguments per
+            call site.
+    """
+
+    def __init__(
+        self,
+        llm: BaseLLM,
+        routes: Mapping[LLMCallSite | str, BaseLLM] | None = None,
+        options: Mapping[LLMCallSite | str, dict[str, Any]] | None = None,
+    ) -> None:
+        """Initialize an LLMRouter.
+
+        Args:
+            llm (BaseLLM): The LLM of sites without a route.
+            routes (Mapping[LLMCallSite | str, BaseLLM] | None): LLM per
+                call site. Defaults to None.
+            options (Mapping[LLMCallSite | str, dict[str, Any]] | None):
+                Extra keyword arguments per call site, e.g. sampling
+                options. Defaults to None.
+        """
+        super().__init__(llm)
+        self.routes = {_site(k): v for k, v in (routes or {}).items()}
+        self.options = {_site(k): v for k, v in (options or {}).items()}
+        self._stats: dict[str, RouteStats] = {}
+
+    @property
+    def model(self) -> str:
+        """Model name of the default LLM."""
+        return _model_name(self.llm)
+
+    def route(self, site: LLMCallSite | str | None) -> BaseLLM:
+        """Return the LLM calls made at ``site`` go to.
+
+        Args:
+            site (LLMCallSite | str | None): The call site, or None.
+
+        Returns:
+            BaseLLM: The site's LLM, or ``llm`` if it has no route.
+        """
+        return self.routes.get(_site(site), self.llm) if site else self.llm
+
+    def stats(self) -> dict[str, RouteStats]:
+        """Return call counts and latencies per route.
+
+        Returns:
+            dict[str, RouteStats]: Stats keyed by call site, with calls
+                made outside any site under ``"default"``.
+        """
+        return {k: v.model_copy() for k, v in self._stats.items()}
+
+    def prompt_cache_kwargs(self, cache_key: str) -> dict[str, Any]:
+        """Defer prompt cache kwargs until the call is routed."""
+        return {_CACHE_KEY_KWARG: cache_key}
+
+    def _prepare(
+        self,
+        kwargs: dict[str, Any],
+    ) -> tuple[RouteStats, BaseLLM, dict[str, Any]]:
+        """Pick the LLM for the current site and build its kwargs."""
+        site = current_llm_site.get()
+        llm = self.route(site)
+        cache_key = kwargs.pop(_CACHE_KEY_KWARG, None)
+        if cache_key is not None:
+            kwargs.update(llm.prompt_cache_kwargs(cache_key))
+        kwargs.update(self.options.get(site or "", {}))
+        name = site or DEFAULT_ROUTE
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = RouteStats(model=_model_name(llm))
+        return stats, llm, kwargs
+
+    async def _invoke(self, method: str, **kwargs: Any) -> Any:
+        """Call the LLM routed to for the current call site."""
+        stats, llm, kwargs = self._prepare(kwargs)
+        start = time.perf_counter()
+        try:
+            return await getattr(llm, method)(**kwargs)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.calls += 1
+            stats.total_latency += time.perf_counter() - start
+
+    async def _stream(self, method: str, **kwargs: Any) -> AsyncIterator[Any]:
+        """Stream from the LLM routed to for the current call site."""
+        stats, llm, kwargs = self._prepare(kwargs)
+        start = time.perf_counter()
+        try:
+            async for chunk in getattr(llm, method)(**kwargs):
+                yield chunk
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.calls += 1
+            stats.total_latency += time.perf_counter() - start
+
+    async def stream_complete(
+        self,
+        prompt: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Stream a completion from the routed LLM."""
+        async for delta in self._stream(
+            "stream_complete",
+            prompt=prompt,
+            **kwargs,
+        ):
+            yield delta
+
+    async def stream_chat(
+        self,
+        input: str,
+        chat_history: Sequence[ChatMessage] | None = None,
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Stream a chat from the routed LLM."""
+        async for chunk in self._stream(
+            "stream_chat",
+            input=input,
+            chat_history=chat_history,
+            tools=tools,
+            **kwargs,
+        ):
+            yield chunk
+
+    async def stream_continue_chat_with_tool_results(
+        self,
+        tool_call_results: Sequence[ToolCallResult],
+        chat_history: Sequence[ChatMessage],
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Stream the continuation of a chat from the routed LLM."""
+        async for chunk in self._stream(
+            "stream_continue_chat_with_tool_results",
+            tool_call_results=tool_call_results,
+            chat_history=chat_history,
+            tools=tools,
+            **kwargs,
+        ):
+            yield chunk
+
+
+def _site(site: LLMCallSite | str) -> str:
+    return site.value if isinstance(site, LLMCallSite) else site
+
+
+def _model_name(llm: BaseLLM) -> str:
+    return str(getattr(llm, "model", type(llm).__name__))
@@ -0,0 +1,4 @@
+from .latency import LatencyModel
+from .llm import ScriptedLLM
+
+__all__ = ["LatencyModel", "ScriptedLLM"]
@@ -0,0 +1,78 @@
+"""Latency model for ScriptedLLM."""
+
+import math
+import random
+
+from llm_agents_from_scratch.data_structures import LatencyDistribution
+
+
+class LatencyModel:
+    """Samples simulated LLM latencies from a distribution.
+
+    Example::
+
+        # ~200ms calls with a long tail, reproducible across runs
+        latency = LatencyModel("lognormal", mean=0.2, stddev=0.1, seed=0)
+        llm = ScriptedLLM(script, latency=latency)
+
+    Attributes:
+        distribution (LatencyDistribution): The distribution sampled from.
+        mean (float): Mean latency, in seconds.
+        stddev (float): Standard deviation, in seconds. For ``UNIFORM``
+            samples lie within ``mean ± stddev``.
+    """
+
+    def __init__(
+        self,
+        distribution: LatencyDistribution | str = LatencyDistribution.CONSTANT,
+        mean: float = 0.0,
+        stddev: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize a LatencyModel.
+
+        Args:
+            distribution (LatencyDistribution | str, optional): The
+                distribution to sample from. Defaults to ``CONSTANT``.
+            mean (float, optional): Mean latency, in seconds. Defaults to
+                0.0 (no latency).
+            stddev (float, optional): Standard deviation, in seconds.
+                Defaults to 0.0.
+            seed (int | None, optional): Seed for reproducible samples.
+                Defaults to None.
+        """
+        self.distribution = LatencyDistribution(distribution)
+        self.mean = mean
+        self.stddev = stddev
+        self._random = random.Random(seed)
+
+    def sample(self) -> float:
+        """Sample a latency.
+
+        Returns:
+            float: A latency in seconds, never negative.
+        """
+        if self.distribution == LatencyDistribution.UNIFORM:
+            value = self._random.uniform(
+                self.mean - self.stddev,
+                self.mean + self.stddev,
+            )
+        elif self.distribution == LatencyDistribution.NORMAL:
+            value = self._random.gauss(self.mean, self.stddev)
+        elif self.distribution == LatencyDistribution.LOGNORMAL:
+            if self.mean <= 0:
+                return 0.0
+            # parameters of the underlying normal giving this mean/stddev
+            sigma2 = math.log1p((self.stddev / self.mean) ** 2)
+            mu = math.log(self.mean) - sigma2 / 2
+            value = self._random.lognormvariate(mu, math.sqrt(sigma2))
+        else:
+            value = self.mean
+        return max(value, 0.0)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the LatencyModel."""
+        return (
+            f"LatencyModel(distribution={self.distribution.value!r}, "
+            f"mean={self.mean}, stddev={self.stddev})"
+        )
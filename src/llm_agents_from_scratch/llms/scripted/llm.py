@@ -0,0 +1,230 @@
+"""Scripted in-process LLM for benchmarks and tests."""
+
+import asyncio
+import re
+from collections import Counter
+from typing import Any, AsyncIterator, Sequence, TypeAlias
+from weakref import WeakKeyDictionary
+
+from llm_agents_from_scratch.base.llm import (
+    LLM,
+    StructuredOutputType,
+    current_run,
+)
+from llm_agents_from_scratch.base.tool import Tool
+from llm_agents_from_scratch.data_structures import (
+    ChatMessage,
+    ChatRole,
+    ChatStreamChunk,
+    CompleteResult,
+    NextStepDecision,
+    ToolCall,
+    ToolCallResult,
+)
+
+from .latency import LatencyModel
+
+ScriptTurn: TypeAlias = str | ToolCall | Sequence[ToolCall]
+
+
+class ScriptedLLM(LLM):
+    """An LLM that follows a fixed script of tool calls and answers.
+
+    Each ``chat`` or ``continue_chat_with_tool_results`` call answers with
+    the next turn of the script: a ``ToolCall`` (or several, made in
+    parallel) or a plain text answer. Once the script is exhausted, it
+    answers with ``final_answer``. ``get_next_step``'s routing call is
+    answered ``"next_step"`` while turns remain and ``"final_result"``
+    afterwards, so an agent runs exactly the scripted plan.
+
+    Every agent run follows the script from the start, so concurrent
+    runs (e.g. ``LLMAgent.run_many``) each see the whole plan; outside a
+    run, every asyncio task does. The asyncio tasks a run spawns (e.g.
+    deadlines on Python < 3.12, planned steps) share its position. Each call
+    sleeps for a latency sampled from ``latency``, which makes the
+    framework's own overhead measurable: it is what remains of a run's
+    wall time after ``simulated_latency``.
+
+    Example::
+
+        llm = ScriptedLLM(
+            [ToolCall(tool_name="add", arguments={"x": 1, "y": 2}), "3"],
+            latency=LatencyModel("normal", mean=0.2, stddev=0.05),
+        )
+        agent = LLMAgent(llm=llm, tools=[SimpleFunctionTool(add)])
+
+    Attributes:
+        script (list[ScriptTurn]): The turns to play, in order.
+        latency (LatencyModel): Samples the latency of each call.
+        final_answer (str): Answer once the script is exhausted.
+        model (str): Name reported as the model.
+        calls (Counter[str]): Calls made, by method.
+        simulated_latency (float): Total seconds slept across calls.
+    """
+
+    def __init__(
+        self,
+        script: Sequence[ScriptTurn] | None = None,
+        latency: LatencyModel | None = None,
+        final_answer: str = "Done.",
+        structured_outputs: dict[str, dict[str, Any]] | None = None,
+        model: str = "scripted",
+    ) -> None:
+        """Initialize a ScriptedLLM.
+
+        Args:
+            script (Sequence[ScriptTurn] | None, optional): The turns to
+                play, in order. Defaults to None (answer immediately).
+            latency (LatencyModel | None, optional): Samples the latency
+                of each call. Defaults to None (no latency).
+            final_answer (str, optional): Answer once the script is
+                exhausted. Defaults to ``"Done."``.
+            structured_outputs (dict | None, optional): Data returned by
+                ``structured_output`` for models other than
+                ``NextStepDecision``, keyed by model class name. Defaults
+                to None.
+            model (str, optional): Name reported as the model. Defaults to
+                ``"scripted"``.
+        """
+        self.script = list(script or [])
+        self.latency = latency or LatencyModel()
+        self.final_answer = final_answer
+        self.structured_outputs = structured_outputs or {}
+        self.model = model
+        self.calls: Counter[str] = Counter()
+        self.simulated_latency = 0.0
+        self._cursors: WeakKeyDictionary[object, int] = WeakKeyDictionary()
+
+    def _cursor_key(self) -> object | None:
+        """The current agent run, or the current asyncio task outside one."""
+        run = current_run.get()
+        return run if run is not None else asyncio.current_task()
+
+    def _cursor(self) -> int:
+        """Position in the script of the current run or asyncio task."""
+        key = self._cursor_key()
+        return self._cursors.get(key, 0) if key is not None else 0
+
+    def _next_turn(self) -> ChatMessage:
+        """Play the current run's next turn of the script."""
+        cursor = self._cursor()
+        if cursor >= len(self.script):
+            return ChatMessage(
+                role=ChatRole.ASSISTANT,
+                content=self.final_answer,
+            )
+        if (key := self._cursor_key()) is not None:
+            self._cursors[key] = cursor + 1
+        turn = self.script[cursor]
+        if isinstance(turn, str):
+            return ChatMessage(role=ChatRole.ASSISTANT, content=turn)
+        tool_calls = [turn] if isinstance(turn, ToolCall) else list(turn)
+        return ChatMessage(
+            role=ChatRole.ASSISTANT,
+            content="",
+            # fresh ids, as a provider would generate
+            tool_calls=[
+                ToolCall(tool_name=tc.tool_name, arguments=dict(tc.arguments))
+                for tc in tool_calls
+            ],
+        )
+
+    async def _simulate(self, method: str) -> None:
+        """Count a call and sleep for a sampled latency."""
+        self.calls[method] += 1
+        delay = self.latency.sample()
+        self.simulated_latency += delay
+        await asyncio.sleep(delay)
+
+    def reset(self) -> None:
+        """Forget call counts, latency totals and script positions."""
+        self.calls.clear()
+        self.simulated_latency = 0.0
+        self._cursors.clear()
+
+    async def complete(self, prompt: str, **kwargs: Any) -> CompleteResult:
+        """Complete with the final answer."""
+        await self._simulate("complete")
+        return CompleteResult(response=self.final_answer, prompt=prompt)
+
+    async def structured_output(
+        self,
+        prompt: str,
+        mdl: type[StructuredOutputType],
+        **kwargs: Any,
+    ) -> StructuredOutputType:
+        """Route to the next scripted turn, or return configured data."""
+        await self._simulate("structured_output")
+        if issubclass(mdl, NextStepDecision):
+            if self._cursor() < len(self.script):
+                return mdl(kind="next_step", content="Continue the plan.")
+            return mdl(kind="final_result", content=self.final_answer)
+        return mdl.model_validate(
+            self.structured_outputs.get(mdl.__name__, {}),
+        )
+
+    async def chat(
+        self,
+        input: str,
+        chat_history: Sequence[ChatMessage] | None = None,
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> tuple[ChatMessage, ChatMessage]:
+        """Answer with the next scripted turn."""
+        await self._simulate("chat")
+        return (
+            ChatMessage(role=ChatRole.USER, content=input),
+            self._next_turn(),
+        )
+
+    async def continue_chat_with_tool_results(
+        self,
+        tool_call_results: Sequence[ToolCallResult],
+        chat_history: Sequence[ChatMessage],
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> tuple[list[ChatMessage], ChatMessage]:
+        """Answer tool results with the next scripted turn."""
+        await self._simulate("continue_chat_with_tool_results")
+        tool_messages = [
+            ChatMessage.from_tool_call_result(r) for r in tool_call_results
+        ]
+        return tool_messages, self._next_turn()
+
+    async def stream_chat(
+        self,
+        input: str,
+        chat_history: Sequence[ChatMessage] | None = None,
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Stream the next scripted turn, one word per delta."""
+        _, message = await self.chat(input, chat_history, tools, **kwargs)
+        for chunk in _word_chunks(message):
+            yield chunk
+
+    async def stream_continue_chat_with_tool_results(
+        self,
+        tool_call_results: Sequence[ToolCallResult],
+        chat_history: Sequence[ChatMessage],
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        """Stream the next scripted turn, one word per delta."""
+        _, message = await self.continue_chat_with_tool_results(
+            tool_call_results,
+            chat_history,
+            tools,
+            **kwargs,
+        )
+        for chunk in _word_chunks(message):
+            yield chunk
+
+
+def _word_chunks(message: ChatMessage) -> list[ChatStreamChunk]:
+    """Split a message into word deltas plus a final complete chunk."""
+    chunks = [
+        ChatStreamChunk(delta=word)
+        for word in re.findall(r"\S+\s*", message.content)
+    ]
+    return [*chunks, ChatStreamChunk(message=message)]
@@ -1,8 +1,13 @@
 """LLM Agents From Scratch Library Logger."""
 
+import atexit
 import logging
+import queue
 import sys
 from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Any, Callable
 
 from colorama import Fore, Style, init
 from typing_extensions import override
@@ -13,6 +18,7 @@ init(autoreset=True)
 ROOT_LOGGER_NAME = "llm_agents_fs"
 DEFAULT_LOG_LEVEL = logging.INFO
 DEFAULT_MSG_MAX_LENGTH = 150
+FILE_LOG_FORMAT = "%(asctime)s %(levelname)s (%(name)s) %(message)s"
 
 # Set by UseSubAgentTool around a dispatched subagent's run() so every log
 # line emitted from within that run — coordinator and subagent share the
@@ -22,6 +28,50 @@ current_subagent_name: ContextVar[str | None] = ContextVar(
     default=None,
 )
 
+# set while the library's handlers run on a listener thread
+_queue_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+
+class Lazy:
+    """Defers computing a log argument until the record is formatted.
+
+    Logging calls with ``%``-style arguments only format their message
+    if a handler will emit it; ``Lazy`` extends that to arguments that
+    are themselves expensive to compute. The argument is computed once,
+    however many handlers format the record::
+
+        logger.debug("---NEXT STEP: %s", Lazy(step.model_dump_json))
+    """
+
+    __slots__ = ("_args", "_fn", "_value")
+
+    def __init__(self, fn: Callable[..., Any], *args: Any) -> None:
+        """Initialize a Lazy log argument.
+
+        Args:
+            fn (Callable[..., Any]): Computes the argument.
+            *args (Any): Arguments for ``fn``.
+        """
+        self._fn = fn
+        self._args = args
+        self._value: str | None = None
+
+    def __str__(self) -> str:
+        """Compute the argument, the first time only."""
+        if self._value is None:
+            self._value = str(self._fn(*self._args))
+        return self._value
+
+
+def _subagent_prefix(record: logging.LogRecord) -> str | None:
+    """The subagent a record was logged from, if any.
+
+    Records passed through the logging queue carry it as an attribute,
+    since the listener thread does not share the caller's context.
+    """
+    return getattr(record, "subagent_name", None) or current_subagent_name.get()
+
 
 class ColoredFormatter(logging.Formatter):
     """Colored formatter for logging."""
@@ -50,12 +100,37 @@ class ColoredFormatter(logging.Formatter):
         )
 
         prefix = ""
-        if subagent_name := current_subagent_name.get():
+        if subagent_name := _subagent_prefix(record):
             prefix = f"{Fore.CYAN}[{subagent_name}]{Style.RESET_ALL} "
 
         return f"{prefix}{colored_levelname} ({logger_name}) :      {log_msg}"
 
 
+class FileFormatter(logging.Formatter):
+    """Plain formatter for log files: timestamped, untruncated, no colors."""
+
+    def __init__(self) -> None:
+        """Initialize a FileFormatter."""
+        super().__init__(FILE_LOG_FORMAT)
+
+    @override
+    def format(self, record: logging.LogRecord) -> str:
+        formatted = super().format(record)
+        if subagent_name := _subagent_prefix(record):
+            return f"[{subagent_name}] {formatted}"
+        return formatted
+
+
+class _ContextQueueHandler(QueueHandler):
+    """Queue handler that keeps the subagent name with each record."""
+
+    @override
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        prepared: logging.LogRecord = super().prepare(record)
+        prepared.subagent_name = current_subagent_name.get()
+        return prepared
+
+
 def get_logger(name: str | None = None) -> logging.Logger:
     """Get a logger for the library.
 
@@ -75,28 +150,71 @@ def get_logger(name: str | None = None) -> logging.Logger:
     return logger
 
 
+def _is_console_handler(handler: logging.Handler) -> bool:
+    # FileHandler is a StreamHandler too
+    return isinstance(handler, logging.StreamHandler) and not isinstance(
+        handler,
+        logging.FileHandler,
+    )
+
+
+def _output_handlers() -> list[logging.Handler]:
+    """Handlers writing the library's records, queued or not."""
+    if _queue_listener is not None:
+        return list(_queue_listener.handlers)
+    library_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    return [
+        h
+        for h in library_logger.handlers
+        if not isinstance(h, logging.NullHandler)
+    ]
+
+
+def _add_handler(handler: logging.Handler) -> None:
+    if _queue_listener is not None:
+        _queue_listener.handlers = (*_queue_listener.handlers, handler)
+    else:
+        logging.getLogger(ROOT_LOGGER_NAME).addHandler(handler)
+
+
+def _remove_handlers(predicate: Callable[[logging.Handler], bool]) -> None:
+    library_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    for handler in _output_handlers():
+        if not predicate(handler):
+            continue
+        if _queue_listener is not None:
+            _queue_listener.handlers = tuple(
+                h for h in _queue_listener.handlers if h is not handler
+            )
+        else:
+            library_logger.removeHandler(handler)
+        if isinstance(handler, logging.FileHandler):
+            handler.close()
+
+
+def _set_level(level: str | int) -> int:
+    if isinstance(level, str):
+        level = getattr(logging, level.upper())
+    logging.getLogger(ROOT_LOGGER_NAME).setLevel(level)
+    return level  # type: ignore[return-value]
+
+
 def enable_console_logging(level: str | int = DEFAULT_LOG_LEVEL) -> None:
     """Enable colored console logging for the library.
 
     Args:
         level: Logging level (e.g., "INFO", "DEBUG", logging.INFO)
     """
-    if isinstance(level, str):
-        level = getattr(logging, level.upper())
-
-    library_logger = logging.getLogger(ROOT_LOGGER_NAME)
-    library_logger.setLevel(level)
+    level = _set_level(level)
 
     # Remove existing console handlers to avoid duplicates
-    for handler in library_logger.handlers[:]:
-        if isinstance(handler, logging.StreamHandler):
-            library_logger.removeHandler(handler)
+    _remove_handlers(_is_console_handler)
 
     # Add new console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(ColoredFormatter())
-    library_logger.addHandler(console_handler)
+    _add_handler(console_handler)
 
 
 def disable_console_logging() -> None:
@@ -104,10 +222,84 @@ def disable_console_logging() -> None:
     library_logger = logging.getLogger(ROOT_LOGGER_NAME)
 
     # Remove console handlers
-    for handler in library_logger.handlers[:]:
-        if isinstance(handler, logging.StreamHandler):
-            library_logger.removeHandler(handler)
+    _remove_handlers(_is_console_handler)
 
     # Ensure NullHandler exists
     if not library_logger.handlers:
         library_logger.addHandler(logging.NullHandler())
+
+
+def enable_file_logging(
+    path: str | Path,
+    level: str | int = DEFAULT_LOG_LEVEL,
+) -> None:
+    """Enable logging the library's records to a file.
+
+    Records are appended untruncated and without colors, see
+    ``FileFormatter``. Replaces any log file enabled before.
+
+    Args:
+        path: The log file. Its directory must exist.
+        level: Logging level (e.g., "INFO", "DEBUG", logging.INFO)
+    """
+    level = _set_level(level)
+    _remove_handlers(lambda h: isinstance(h, logging.FileHandler))
+
+    file_handler = logging.FileHandler(path, encoding="utf-8")
+    file_handler.setLevel(level)
+    file_handler.setFormatter(FileFormatter())
+    _add_handler(file_handler)
+
+
+def disable_file_logging() -> None:
+    """Disable file logging for the library, closing the log file."""
+    _remove_handlers(lambda h: isinstance(h, logging.FileHandler))
+
+
+def enable_queue_logging() -> None:
+    """Write the library's log output from a background thread.
+
+    Console and file handlers otherwise write on the thread that logs,
+    i.e. block the event loop. This moves the library's handlers, and any
+    enabled later, behind a ``QueueHandler``: logging a record only
+    formats its message and puts it on a queue, and a ``QueueListener``
+    thread does the rest. Call ``disable_queue_logging()`` to flush the
+    queue and write from the calling thread again; this also happens at
+    interpreter exit.
+    """
+    global _queue_listener, _queue_handler  # noqa: PLW0603
+    if _queue_listener is not None:
+        return
+
+    library_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    handlers = _output_handlers()
+    for handler in handlers:
+        library_logger.removeHandler(handler)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_handler = _ContextQueueHandler(log_queue)
+    _queue_listener = QueueListener(
+        log_queue,
+        *handlers,
+        respect_handler_level=True,
+    )
+    library_logger.addHandler(_queue_handler)
+    _queue_listener.start()
+
+
+def disable_queue_logging() -> None:
+    """Flush queued records and write from the logging thread again."""
+    global _queue_listener, _queue_handler  # noqa: PLW0603
+    if _queue_listener is None or _queue_handler is None:
+        return
+
+    listener, _queue_listener = _queue_listener, None
+    library_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    library_logger.removeHandler(_queue_handler)
+    _queue_handler = None
+    listener.stop()
+    for handler in listener.handlers:
+        library_logger.addHandler(handler)
+
+
+atexit.register(disable_queue_logging)
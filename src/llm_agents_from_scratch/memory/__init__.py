@@ -8,10 +8,12 @@ from llm_agents_from_scratch.memory_stores import (
 from . import recipes
 from .memory import Memory, MetadataFn
 from .recipes import recency_memory, reflective_memory, similarity_memory
+from .writer import MemoryWriter
 
 __all__ = [
     "JSONMemoryStore",
     "Memory",
+    "MemoryWriter",
     "MetadataFn",
     "QdrantMemoryStore",
     "recency_memory",
@@ -3,7 +3,10 @@
 from pathlib import Path
 
 from llm_agents_from_scratch.base.llm import BaseLLM
+from llm_agents_from_scratch.data_structures import LLMCallSite, LLMPriority
 from llm_agents_from_scratch.data_structures.memory import Episode
+from llm_agents_from_scratch.llms.governed import llm_priority
+from llm_agents_from_scratch.llms.router import llm_site
 from llm_agents_from_scratch.memory.memory import Memory
 from llm_agents_from_scratch.memory_stores.json import JSONMemoryStore
 from llm_agents_from_scratch.memory_stores.qdrant.store import (
@@ -82,6 +85,9 @@ def reflective_memory(
     similarity search so semantically related past reflections surface
     naturally.
 
+    Reflections are requested at ``LLMPriority.BACKGROUND``, from the
+    ``LLMCallSite.REFLECTION`` call site.
+
     Args:
         llm (BaseLLM): LLM used to generate the reflection.
         collection (str): Name of the Qdrant collection. Defaults to
@@ -103,7 +109,13 @@ def reflective_memory(
             instruction=episode.task.instruction,
             result=episode.result.content,
         )
-        result = await llm.complete(prompt)
+        # no one waits on a reflection; let task calls on a GovernedLLM
+        # go first
+        with (
+            llm_priority(LLMPriority.BACKGROUND),
+            llm_site(LLMCallSite.REFLECTION),
+        ):
+            result = await llm.complete(prompt)
         return result.response  # type: ignore[no-any-return]
 
     return Memory(
@@ -0,0 +1,213 @@
+"""Background recording of episodes."""
+
+import asyncio
+from collections import deque
+from typing import Callable, Sequence, TypeAlias
+
+from llm_agents_from_scratch.data_structures.memory import Episode
+from llm_agents_from_scratch.errors import MemoryWriterError
+from llm_agents_from_scratch.logger import get_logger
+
+from .memory import Memory
+
+ErrorCallback: TypeAlias = Callable[[Memory, Episode, Exception], None]
+
+# (memories to record into, episode)
+_Item: TypeAlias = tuple[Sequence[Memory], Episode]
+
+
+class MemoryWriter:
+    """Records episodes in the background, off the task's critical path.
+
+    Recording an episode can cost an LLM call (reflections) and an
+    embedding (similarity stores). Given a writer, ``LLMAgent`` only
+    queues the episode and resolves the task at once; ``max_workers``
+    background tasks drain the queue, recording each episode into its
+    memories concurrently. When ``max_pending`` episodes are queued,
+    ``submit()`` waits, so a slow store slows tasks down rather than
+    growing the queue without bound.
+
+    Failed writes do not fail any task: they are logged, counted, kept in
+    ``failures`` and passed to ``on_error``. Episodes still queued when
+    the event loop shuts down (e.g. at the end of ``asyncio.run()``) are
+    written before the workers exit; ``flush()`` waits for the queue to
+    drain at any other time.
+
+    Example::
+
+        writer = MemoryWriter()
+        agent = LLMAgent(llm=llm, memories=[memory], memory_writer=writer)
+        ...
+        await writer.close()
+
+    Attributes:
+        max_pending (int): Most episodes queued at once.
+        max_workers (int): Episodes recorded at once.
+        on_error (ErrorCallback | None): Called with the memory, episode
+            and error of every failed write.
+        written (int): Episode writes that succeeded.
+        failed (int): Episode writes that raised.
+        failures (deque[tuple[Episode, Exception]]): The most recent
+            failed writes.
+    """
+
+    def __init__(
+        self,
+        max_pending: int = 100,
+        max_workers: int = 1,
+        on_error: ErrorCallback | None = None,
+        max_failures: int = 100,
+    ) -> None:
+        """Initialize a MemoryWriter.
+
+        Args:
+            max_pending (int): Most episodes queued at once. Defaults to
+                100.
+            max_workers (int): Episodes recorded at once. Defaults to 1.
+            on_error (ErrorCallback | None): Called with the memory,
+                episode and error of every failed write. Defaults to None.
+            max_failures (int): Failed writes kept in ``failures``.
+                Defaults to 100.
+
+        Raises:
+            MemoryWriterError: If ``max_pending`` or ``max_workers`` is
+                less than 1.
+        """
+        if max_pending < 1 or max_workers < 1:
+            raise MemoryWriterError(
+                "`max_pending` and `max_workers` must be >= 1.",
+            )
+        self.max_pending = max_pending
+        self.max_workers = max_workers
+        self.on_error = on_error
+        self.written = 0
+        self.failed = 0
+        self.failures: deque[tuple[Episode, Exception]] = deque(
+            maxlen=max_failures,
+        )
+        self.logger = get_logger(self.__class__.__name__)
+        self._pending = 0
+        self._queue: asyncio.Queue[_Item] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+
+    @property
+    def pending(self) -> int:
+        """Episodes queued or being written."""
+        return self._pending
+
+    def _start(self) -> asyncio.Queue[_Item]:
+        """Create the queue and workers on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or all(
+            # e.g. a previous asyncio.run()
+            w.done() or w.get_loop() is not loop
+            for w in self._workers
+        ):
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._pending = 0
+            self._workers = [
+                asyncio.create_task(self._work(self._queue))
+                for _ in range(self.max_workers)
+            ]
+        return self._queue
+
+    async def submit(
+        self,
+        memories: Sequence[Memory],
+        episode: Episode,
+    ) -> None:
+        """Queue an episode for recording into ``memories``.
+
+        Waits while ``max_pending`` episodes are queued.
+
+        Args:
+            memories (Sequence[Memory]): Memories to record into.
+            episode (Episode): The episode to record.
+        """
+        queue = self._start()
+        self._pending += 1
+        try:
+            await queue.put((memories, episode))
+        except BaseException:
+            self._pending -= 1
+            raise
+
+    async def flush(self) -> None:
+        """Wait until every queued episode has been written or failed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Flush the queue, then stop the workers."""
+        await self.flush()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    async def _work(self, queue: asyncio.Queue[_Item]) -> None:
+        """Record queued episodes; drain the queue when cancelled."""
+        episode: Episode | None = None
+        remaining: list[Memory] = []
+        try:
+            while True:
+                memories, episode = await queue.get()
+                remaining = list(memories)
+                await self._record(remaining, episode)
+                self._task_done(queue)
+                episode = None
+        except asyncio.CancelledError:
+            # loop shutdown: the write in flight was interrupted, so finish
+            # it for the memories not yet written, then write what is left
+            if episode is not None:
+                await self._record(remaining, episode)
+                self._task_done(queue)
+            while not queue.empty():
+                memories, episode = queue.get_nowait()
+                await self._record(list(memories), episode)
+                self._task_done(queue)
+            raise
+
+    def _task_done(self, queue: asyncio.Queue[_Item]) -> None:
+        self._pending -= 1
+        queue.task_done()
+
+    async def _record(self, memories: list[Memory], episode: Episode) -> None:
+        """Record ``episode`` into ``memories``, removing each when done."""
+        await asyncio.gather(
+            *[
+                self._record_one(memory, episode, memories)
+                for memory in memories
+            ],
+        )
+
+    async def _record_one(
+        self,
+        memory: Memory,
+        episode: Episode,
+        remaining: list[Memory],
+    ) -> None:
+        try:
+            await memory.record(episode)
+        except Exception as e:
+            self.failed += 1
+            self.failures.append((episode, e))
+            self.logger.warning(
+                "Failed to record episode of task %s: %s",
+                episode.task.id_,
+                e,
+            )
+            if self.on_error is not None:
+                try:
+                    self.on_error(memory, episode, e)
+                except Exception as callback_error:
+                    # a failing callback must not stop the worker
+                    self.logger.warning(
+                        "on_error failed for task %s: %s",
+                        episode.task.id_,
+                        callback_error,
+                    )
+        else:
+            self.written += 1
+        remaining.remove(memory)
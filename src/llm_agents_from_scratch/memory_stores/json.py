@@ -1,36 +1,142 @@
 """JSONL-file-backed episodic memory store."""
 
+import asyncio
+import bisect
+import concurrent.futures
+import heapq
+import json
+import os
+import re
+import tempfile
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Iterator, NamedTuple, TypeAlias
+
+from pydantic import TypeAdapter
 
 from llm_agents_from_scratch.base.memory_store import BaseMemoryStore
-from llm_agents_from_scratch.data_structures.memory import Episode, RecallMode
-from llm_agents_from_scratch.errors import EpisodeNotFoundError
+from llm_agents_from_scratch.data_structures.memory import (
+    Durability,
+    Episode,
+    EpisodeSegment,
+    RecallMode,
+    SegmentManifest,
+)
+from llm_agents_from_scratch.errors import (
+    EpisodeNotFoundError,
+    MemoryStoreError,
+)
+from llm_agents_from_scratch.logger import get_logger
+
+# key of the record that deletes an episode
+TOMBSTONE_KEY = "deleted_id_"
+MANIFEST_SUFFIX = ".manifest.json"
+
+_DATETIME = TypeAdapter(datetime)
+# ID and timestamp of a record as ``Episode.model_dump_json()`` lays it
+# out (first and last field), read without decoding the rollout; other
+# layouts fall back to ``json.loads``
+_ID_HEAD = re.compile(rb'\{"id_":"([^"\\]*)"')
+_COMPLETED_AT_TAIL = re.compile(rb'"completed_at":"([^"\\]*)"\}$')
+_TOMBSTONE = re.compile(rb'\{"deleted_id_": "([^"\\]*)"\}')
+_TAIL_BYTES = 64
+_BLOCK_SIZE = 1 << 16
+
+
+class _Entry(NamedTuple):
+    """Where the live record of an episode is."""
+
+    segment: str
+    offset: int
+    length: int
+    completed_at: datetime
+
+
+class _Record(NamedTuple):
+    """A record queued for appending."""
+
+    line: bytes
+    id_: str
+    # None for a tombstone
+    completed_at: datetime | None
+
+
+# a segment to compact: the segment, its size and record count when the
+# copy started, and its live records by offset
+_SegmentPlan: TypeAlias = tuple[
+    EpisodeSegment,
+    int,
+    int,
+    list[tuple[str, _Entry]],
+]
 
 
 class JSONMemoryStore(BaseMemoryStore):
-    """Episodic memory store backed by a JSONL file on disk.
-
-    Each episode is stored as one JSON object per line (JSONL format).
-    New episodes are appended to the file — no full rewrite on each write.
-    The full file is read into memory on construction and on ``read_recent``.
+    """Episodic memory store backed by JSONL files on disk.
+
+    Episodes are stored in an append-only log with one JSON object per
+    line (JSONL format): ``write`` and ``update`` append the episode, and
+    ``delete`` appends a tombstone (``{"deleted_id_": ...}``); the last
+    record of an episode wins. Every mutation therefore appends a single
+    line, whatever the size of the store.
+
+    By default the log is the single file ``dir / filename``. Given
+    ``segment_max_bytes`` or ``segment_max_age``, it is split into
+    segment files instead, rolled over when the newest one reaches either
+    limit, and listed in a small manifest (``<stem>.manifest.json``). An
+    existing single file becomes the first segment.
+
+    Nothing is read on construction but the manifest. Recent-mode recall
+    reads the newest segment backwards, and older segments only while
+    they may hold more recent episodes. ``count``, ``delete``, ``update``
+    and ``summary`` need an index from episode ID to the offset of its
+    live record, which is built on first use from each record's ID and
+    timestamp. Either way, only the episodes returned are decoded.
+
+    Appends run on a background thread, never on the event loop, and are
+    group-committed: records queued while an append is in progress, or
+    within ``commit_window`` of the first, go to disk in a single write.
+    ``durability`` sets whether ``write`` and ``delete`` wait for that
+    write, and for an fsync (see ``Durability``). Reads first wait for
+    queued records, so they always see earlier writes. Records still
+    queued when the event loop shuts down are written before it closes.
+
+    When superseded records and tombstones make up ``compact_ratio`` of
+    the log, it is compacted in the background: each segment holding dead
+    records is copied, live records only, to a temporary file that
+    atomically replaces it, so readers never see a partial file. Records
+    appended while compaction runs are carried over.
 
     Attributes:
         path (Path): Full path to the backing JSONL file (``dir / filename``).
+            Segment files are named after it.
+        compact_ratio (float): Share of dead records that triggers
+            compaction.
+        segment_max_bytes (int | None): Size at which a new segment is
+            started.
+        segment_max_age (timedelta | None): Age at which a new segment is
+            started.
+        durability (Durability): What ``write`` and ``delete`` wait for.
+        commit_window (float): Seconds appends wait for more records.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913, PLR0917
         self,
         dir: Path,
         filename: str = "episodes.jsonl",
         max_results: int = 5,
         recall_mode: RecallMode = RecallMode.RECENT,
+        compact_ratio: float = 0.5,
+        segment_max_bytes: int | None = None,
+        segment_max_age: timedelta | None = None,
+        durability: Durability = Durability.FLUSH,
+        commit_window: float = 0.0,
     ) -> None:
         """Initialize a JSONMemoryStore.
 
-        Loads any existing episodes from ``dir / filename`` on construction.
-        The file is created on the first ``write`` call if it does not yet
-        exist.
+        Reads the manifest of a segmented store, if any; episodes are read
+        on demand. The file is created on the first ``write`` call if it
+        does not yet exist.
 
         Args:
             dir (Path): Directory in which the backing JSONL file is stored.
@@ -43,37 +149,417 @@ class JSONMemoryStore(BaseMemoryStore):
             recall_mode (RecallMode): Retrieval strategy used by
                 ``search()``. Defaults to ``RecallMode.RECENT`` since
                 this store does not support similarity search.
+            compact_ratio (float): Share (0-1] of dead records, i.e.
+                superseded episodes and tombstones, at which the log is
+                compacted. Defaults to 0.5.
+            segment_max_bytes (int | None): Start a new segment once the
+                newest one holds this many bytes. Defaults to None.
+            segment_max_age (timedelta | None): Start a new segment once
+                the newest one is this old. Defaults to None.
+            durability (Durability): Whether ``write`` and ``delete``
+                return once the record is queued, written to the OS or
+                fsync'd. Defaults to ``Durability.FLUSH``.
+            commit_window (float): Seconds an append waits for more
+                records to batch with, trading latency for fewer writes.
+                Defaults to 0.0 (batch what queues up meanwhile).
+
+        Raises:
+            MemoryStoreError: If ``compact_ratio`` is not in (0, 1], a
+                segment limit is not positive, or ``commit_window`` is
+                negative.
         """
+        if not 0 < compact_ratio <= 1:
+            raise MemoryStoreError("`compact_ratio` must be in (0, 1].")
+        if (segment_max_bytes is not None and segment_max_bytes <= 0) or (
+            segment_max_age is not None and segment_max_age <= timedelta()
+        ):
+            raise MemoryStoreError("Segment limits must be positive.")
+        if commit_window < 0:
+            raise MemoryStoreError("`commit_window` must be >= 0.")
         super().__init__(max_results=max_results, recall_mode=recall_mode)
+        self.dir = dir
         self.path = dir / filename
-        self._episodes: list[Episode] = self._load()
+        self.compact_ratio = compact_ratio
+        self.segment_max_bytes = segment_max_bytes
+        self.segment_max_age = segment_max_age
+        self.durability = Durability(durability)
+        self.commit_window = commit_window
+        self.logger = get_logger(self.__class__.__name__)
+        self._manifest_path = dir / f"{self.path.stem}{MANIFEST_SUFFIX}"
+        self._single_segment = EpisodeSegment(name=filename)
+        self._manifest = self._load_manifest()
+        # unsaved manifest of a new segmented store
+        self._manifest_dirty = False
+        if self._manifest is None and self._rolls:
+            self._manifest = self._new_manifest()
+            self._manifest_dirty = True
+        # built on first use
+        self._entries: dict[str, _Entry] | None = None
+        # (completed_at, id_) of live episodes, oldest first
+        self._order: list[tuple[datetime, str]] = []
+        self._compaction: asyncio.Task[None] | None = None
+        # records waiting for the next append, and its outcome
+        self._pending: list[_Record] = []
+        self._pending_done: asyncio.Future[None] | None = None
+        self._inflight_done: asyncio.Future[None] | None = None
+        self._committer: asyncio.Task[None] | None = None
+        # one thread, so appends land in the order they were queued
+        self._io = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix=self.__class__.__name__,
+        )
+        # held by appends, and by compaction while it reads or swaps files
+        self._lock = asyncio.Lock()
+
+    @property
+    def _rolls(self) -> bool:
+        return (
+            self.segment_max_bytes is not None
+            or self.segment_max_age is not None
+        )
 
-    def _load(self) -> list[Episode]:
-        if not self.path.exists():
-            return []
-        with open(self.path) as f:
-            return [
-                Episode.model_validate_json(line) for line in f if line.strip()
+    @property
+    def segments(self) -> list[EpisodeSegment]:
+        """The segments of the log, oldest first."""
+        if self._manifest is None:
+            return [self._single_segment]
+        return self._manifest.segments
+
+    def _load_manifest(self) -> SegmentManifest | None:
+        if not self._manifest_path.exists():
+            return None
+        return SegmentManifest.model_validate_json(
+            self._manifest_path.read_bytes(),
+        )
+
+    def _new_manifest(self) -> SegmentManifest:
+        if self.path.exists():
+            # adopt the single file as the first segment
+            return SegmentManifest(
+                segments=[EpisodeSegment(name=self.path.name)],
+            )
+        manifest = SegmentManifest()
+        manifest.segments.append(self._new_segment(manifest))
+        return manifest
+
+    def _new_segment(self, manifest: SegmentManifest) -> EpisodeSegment:
+        name = f"{self.path.stem}.{manifest.next_segment:06d}{self.path.suffix}"
+        manifest.next_segment += 1
+        return EpisodeSegment(name=name)
+
+    def _save_manifest(self) -> None:
+        """Replace the manifest atomically."""
+        if self._manifest is None:
+            return
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.dir,
+            prefix=f".{self._manifest_path.name}.",
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self._manifest.model_dump_json())
+            os.replace(tmp_path, self._manifest_path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+        self._manifest_dirty = False
+
+    def _segment_path(self, segment: EpisodeSegment | str) -> Path:
+        name = segment if isinstance(segment, str) else segment.name
+        return self.dir / name
+
+    def _index(self) -> dict[str, _Entry]:
+        """Return the index, building it from the log on first use."""
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        for segment in self.segments:
+            records = 0
+            path = self._segment_path(segment)
+            if path.exists():
+                for offset, line in _lines(path):
+                    records += 1
+                    self._apply(segment.name, offset, line)
+            segment.records = records
+        return self._entries
+
+    async def _settled_index(self) -> dict[str, _Entry]:
+        """Return the index once the records queued so far are in it."""
+        await self.flush()
+        if self._entries is None:
+            async with self._lock:
+                return self._index()
+        return self._entries
+
+    def _apply(self, segment: str, offset: int, line: bytes) -> None:
+        """Apply a record at ``offset`` of ``segment`` to the index."""
+        id_, completed_at = _parse_key(line)
+        self._unindex(id_)
+        if completed_at is not None:
+            self._add(id_, _Entry(segment, offset, len(line), completed_at))
+
+    def _add(self, id_: str, entry: _Entry) -> None:
+        if self._entries is not None:
+            self._entries[id_] = entry
+            bisect.insort(self._order, (entry.completed_at, id_))
+
+    def _unindex(self, id_: str) -> None:
+        entry = (self._entries or {}).pop(id_, None)
+        if entry is not None:
+            del self._order[
+                bisect.bisect_left(self._order, (entry.completed_at, id_))
             ]
 
+    def _enqueue(self, record: _Record) -> asyncio.Future[None]:
+        """Queue a record for the next append.
+
+        Returns:
+            asyncio.Future[None]: Resolved once the record's append is done
+                (fsync included under ``Durability.FSYNC``).
+        """
+        if self._pending_done is None:
+            self._pending_done = asyncio.get_running_loop().create_future()
+            # failures are logged; don't also warn when nobody awaits them
+            self._pending_done.add_done_callback(_consume_error)
+        self._pending.append(record)
+        if self._committer is None or self._committer.done():
+            self._committer = asyncio.create_task(self._commit())
+        return self._pending_done
+
+    async def _commit(self) -> None:
+        """Append queued records, one batch per write, until none are left."""
+        # the batch taken from the queue and not yet landed
+        batch: list[_Record] = []
+        done: asyncio.Future[None] | None = None
+        inflight: concurrent.futures.Future[list[tuple[str, int]]] | None
+        inflight = None
+        try:
+            while self._pending:
+                if self.commit_window:
+                    await asyncio.sleep(self.commit_window)
+                batch, self._pending = self._pending, []
+                done, self._pending_done = self._pending_done, None
+                self._inflight_done = done
+                error: Exception | None = None
+                async with self._lock:
+                    inflight = self._io.submit(
+                        self._append_batch,
+                        [r.line for r in batch],
+                    )
+                    try:
+                        placed = await asyncio.wrap_future(inflight)
+                    except Exception as e:
+                        error = e
+                    inflight = None
+                if error is None:
+                    self._land(batch, placed)
+                else:
+                    self.logger.warning(
+                        "Appending %d records to %s failed: %s",
+                        len(batch),
+                        self.path,
+                        error,
+                    )
+                batch = []
+                self._inflight_done = None
+                if done is not None and not done.done():
+                    if error is None:
+                        done.set_result(None)
+                    else:
+                        done.set_exception(error)
+        except asyncio.CancelledError:
+            # loop shutdown: land the append in flight and the queued
+            # records rather than drop them
+            self._drain(batch, done, inflight)
+            raise
+
+    def _drain(
+        self,
+        batch: list[_Record],
+        done: asyncio.Future[None] | None,
+        inflight: concurrent.futures.Future[list[tuple[str, int]]] | None,
+    ) -> None:
+        """Write ``batch`` and the queued records on the loop thread."""
+        waiting = [f for f in (done, self._pending_done) if f is not None]
+        self._inflight_done = self._pending_done = None
+        error: Exception | None = None
+        try:
+            if inflight is not None and not inflight.cancelled():
+                self._land(batch, inflight.result(), compact=False)
+            else:
+                # taken from the queue but never submitted
+                self._pending[:0] = batch
+            if self._pending:
+                batch, self._pending = self._pending, []
+                placed = self._append_batch([r.line for r in batch])
+                self._land(batch, placed, compact=False)
+        except Exception as e:
+            error = e
+        for f in waiting:
+            if f.done():
+                continue
+            if error is None:
+                f.set_result(None)
+            else:
+                f.set_exception(error)
+
+    def _append_batch(self, lines: list[bytes]) -> list[tuple[str, int]]:
+        """Append records to the log in one write; runs on ``_io``.
+
+        Returns:
+            list[tuple[str, int]]: The segment and offset of each record.
+        """
+        segment = self.segments[-1]
+        if self._rolls and self._is_full(segment):
+            segment = self._roll()
+        with open(self._segment_path(segment), "ab") as f:
+            offset = f.seek(0, os.SEEK_END)
+            f.write(b"".join(lines))
+            if self.durability == Durability.FSYNC:
+                f.flush()
+                os.fsync(f.fileno())
+        if segment.records is not None:
+            segment.records += len(lines)
+        if self._manifest_dirty:
+            self._save_manifest()
+        placed = []
+        for line in lines:
+            placed.append((segment.name, offset))
+            offset += len(line)
+        return placed
+
+    def _land(
+        self,
+        batch: list[_Record],
+        placed: list[tuple[str, int]],
+        compact: bool = True,
+    ) -> None:
+        """Point the index at the records of an append."""
+        if self._entries is None:
+            return
+        for record, (segment, offset) in zip(batch, placed, strict=True):
+            self._unindex(record.id_)
+            if record.completed_at is not None:
+                self._add(
+                    record.id_,
+                    _Entry(
+                        segment,
+                        offset,
+                        len(record.line),
+                        record.completed_at,
+                    ),
+                )
+        if compact:
+            self._maybe_compact()
+
+    async def flush(self) -> None:
+        """Wait until the records queued so far have been appended."""
+        waiting = [
+            f
+            for f in (self._inflight_done, self._pending_done)
+            if f is not None
+        ]
+        if waiting:
+            await asyncio.wait(waiting)
+
+    def _is_full(self, segment: EpisodeSegment) -> bool:
+        path = self._segment_path(segment)
+        size = path.stat().st_size if path.exists() else 0
+        if not size:
+            return False
+        if (
+            self.segment_max_bytes is not None
+            and size >= self.segment_max_bytes
+        ):
+            return True
+        if self.segment_max_age is not None:
+            return datetime.now() - segment.created_at >= self.segment_max_age
+        return False
+
+    def _roll(self) -> EpisodeSegment:
+        """Seal the newest segment and start a new one."""
+        assert self._manifest is not None
+        sealed = self._manifest.segments[-1]
+        records = 0
+        for _, line in _lines(self._segment_path(sealed)):
+            records += 1
+            _, completed_at = _parse_key(line)
+            if completed_at is not None and (
+                sealed.max_completed_at is None
+                or completed_at > sealed.max_completed_at
+            ):
+                sealed.max_completed_at = completed_at
+        sealed.records = records
+        segment = self._new_segment(self._manifest)
+        segment.records = 0
+        self._manifest.segments.append(segment)
+        self._save_manifest()
+        return segment
+
+    def _decode(self, entries: list[_Entry]) -> list[Episode]:
+        """Decode the records at ``entries``, in order."""
+        files: dict[str, IO[bytes]] = {}
+        try:
+            episodes = []
+            for entry in entries:
+                f = files.get(entry.segment)
+                if f is None:
+                    path = self._segment_path(entry.segment)
+                    f = files[entry.segment] = open(path, "rb")  # noqa: SIM115
+                f.seek(entry.offset)
+                episodes.append(
+                    Episode.model_validate_json(f.read(entry.length)),
+                )
+            return episodes
+        finally:
+            for f in files.values():
+                f.close()
+
+    def _read(self, ids: list[str]) -> list[Episode]:
+        """Decode the live records of ``ids``, in order."""
+        entries = self._index()
+        return self._decode([entries[id_] for id_ in ids])
+
+    @property
+    def _episodes(self) -> list[Episode]:
+        """All live episodes, oldest first (decodes the whole store)."""
+        self._index()
+        return self._read([id_ for _, id_ in self._order])
+
+    @property
+    def garbage_ratio(self) -> float:
+        """Share of records in the log that are dead (0.0 until indexed)."""
+        if self._entries is None:
+            return 0.0
+        live = len(self._entries)
+        records = sum(s.records or 0 for s in self.segments)
+        if not records:
+            return 0.0
+        return 1 - live / records
+
     async def write(self, episode: Episode) -> None:
         """Persist an episode to the store.
 
-        Appends one JSON line to the backing file. Does not rewrite existing
-        content.
+        Queues one JSON line for appending to the newest segment, and
+        waits for the append as ``durability`` says. Does not rewrite
+        existing content. Writing an episode whose ID is already stored
+        replaces it.
 
         Args:
             episode (Episode): The completed episode to store.
         """
-        self._episodes.append(episode)
-        with open(self.path, "a") as f:
-            f.write(episode.model_dump_json() + "\n")
+        line = (episode.model_dump_json() + "\n").encode()
+        done = self._enqueue(_Record(line, episode.id_, episode.completed_at))
+        if self.durability != Durability.NONE:
+            await asyncio.shield(done)
 
     async def _read_recent(self, n: int) -> list[Episode]:
         """Return the N most recently recorded episodes.
 
-        Reads all episodes from the in-memory list. A production
-        implementation would tail the file to avoid reading it in full.
+        Takes the newest IDs from the index if it is built, and reads the
+        log backwards from its newest segment otherwise. Only the returned
+        episodes are decoded, under the lock, so a compaction never swaps
+        a segment between locating a record and reading it.
 
         Args:
             n (int): Maximum number of episodes to return.
@@ -81,11 +567,61 @@ class JSONMemoryStore(BaseMemoryStore):
         Returns:
             list[Episode]: Episodes ordered from most recent to oldest.
         """
-        return sorted(
-            self._episodes,
-            key=lambda e: e.completed_at,
-            reverse=True,
-        )[:n]
+        if n <= 0:
+            return []
+        await self.flush()
+        async with self._lock:
+            if self._entries is not None:
+                return self._read(
+                    [id_ for _, id_ in reversed(self._order[-n:])],
+                )
+            return self._decode(self._scan_recent(n))
+
+    def _scan_recent(self, n: int) -> list[_Entry]:
+        """Find the ``n`` latest live records by reading the log backwards."""
+        segments = self.segments
+        # latest completed_at of each sealed segment and those before it:
+        # segments are not in completion order (update() and out-of-order
+        # writes append older episodes), so stop only once none is left
+        bounds: list[datetime | None] = []
+        bound: datetime | None = None
+        for sealed in segments[:-1]:
+            if sealed.max_completed_at is not None and (
+                bound is None or sealed.max_completed_at > bound
+            ):
+                bound = sealed.max_completed_at
+            bounds.append(bound)
+        seen: set[str] = set()
+        # min-heap of the n latest live records found so far
+        latest: list[tuple[datetime, str, _Entry]] = []
+        for i in reversed(range(len(segments))):
+            if (
+                i < len(bounds)
+                and len(latest) == n
+                and ((b := bounds[i]) is None or b < latest[0][0])
+            ):
+                break
+            segment = segments[i]
+            path = self._segment_path(segment)
+            if not path.exists():
+                continue
+            for offset, line in _reverse_lines(path):
+                id_, completed_at = _parse_key(line)
+                if id_ in seen:
+                    continue  # superseded by a later record
+                seen.add(id_)
+                if completed_at is None:
+                    continue
+                item = (
+                    completed_at,
+                    id_,
+                    _Entry(segment.name, offset, len(line), completed_at),
+                )
+                if len(latest) < n:
+                    heapq.heappush(latest, item)
+                elif item[:2] > latest[0][:2]:
+                    heapq.heapreplace(latest, item)
+        return [entry for *_, entry in sorted(latest, reverse=True)]
 
     async def count(self) -> int:
         """Return the total number of episodes in the store.
@@ -93,7 +629,7 @@ class JSONMemoryStore(BaseMemoryStore):
         Returns:
             int: Episode count.
         """
-        return len(self._episodes)
+        return len(await self._settled_index())
 
     async def summary(self) -> str:
         """Return a human-readable summary of the store contents.
@@ -104,15 +640,19 @@ class JSONMemoryStore(BaseMemoryStore):
         Returns:
             str: Multi-line summary of the store.
         """
-        total = len(self._episodes)
-        lines = [f"JSONMemoryStore: {total} episodes | path={self.path}"]
-        if total > 0:
-            by_time = sorted(
-                self._episodes,
-                key=lambda e: e.completed_at,
+        await self.flush()
+        async with self._lock:
+            total = len(self._index())
+            ends = (
+                self._read([self._order[0][1], self._order[-1][1]])
+                if total > 0
+                else []
             )
-            oldest = by_time[0]
-            newest = by_time[-1]
+        lines = [f"JSONMemoryStore: {total} episodes | path={self.path}"]
+        if self._manifest is not None:
+            lines[0] += f" | segments={len(self.segments)}"
+        if ends:
+            oldest, newest = ends
             lines.append(
                 f"  newest: {str(newest.completed_at)[:19]}"
                 f" | {newest.task.instruction[:60]}",
@@ -123,17 +663,12 @@ class JSONMemoryStore(BaseMemoryStore):
             )
         return "\n".join(lines)
 
-    def _rewrite_jsonl(self) -> None:
-        with open(self.path, "w") as f:
-            for ep in self._episodes:
-                f.write(ep.model_dump_json() + "\n")
-
     async def delete(self, id_: str) -> None:
         """Delete an episode by its unique identifier.
 
         Raises ``EpisodeNotFoundError`` if no episode with ``id_`` exists.
-        Otherwise removes it from the in-memory list and rewrites the
-        backing file.
+        Otherwise appends a tombstone for it to the log, waiting as
+        ``durability`` says.
 
         Args:
             id_ (str): The ``Episode.id_`` of the episode to remove.
@@ -141,23 +676,21 @@ class JSONMemoryStore(BaseMemoryStore):
         Raises:
             EpisodeNotFoundError: If no episode with ``id_`` exists.
         """
-        idx = next(
-            (i for i, ep in enumerate(self._episodes) if ep.id_ == id_),
-            None,
-        )
-        if idx is None:
+        if id_ not in await self._settled_index():
             raise EpisodeNotFoundError(
                 f"Episode '{id_}' not found in JSONMemoryStore.",
             )
-        self._episodes.pop(idx)
-        self._rewrite_jsonl()
+        line = (json.dumps({TOMBSTONE_KEY: id_}) + "\n").encode()
+        done = self._enqueue(_Record(line, id_, None))
+        if self.durability != Durability.NONE:
+            await asyncio.shield(done)
 
     async def update(self, episode: Episode) -> None:
         """Replace an existing episode with an updated version.
 
         Matches by ``episode.id_``. Raises ``EpisodeNotFoundError`` if no
-        matching episode exists. Otherwise replaces it in-place and rewrites
-        the backing file.
+        matching episode exists. Otherwise appends the updated episode,
+        which supersedes the stored one.
 
         Args:
             episode (Episode): The updated episode. Matched by ``id_``.
@@ -165,14 +698,142 @@ class JSONMemoryStore(BaseMemoryStore):
         Raises:
             EpisodeNotFoundError: If no episode with ``episode.id_`` exists.
         """
-        for i, ep in enumerate(self._episodes):
-            if ep.id_ == episode.id_:
-                self._episodes[i] = episode
-                self._rewrite_jsonl()
-                return
-        raise EpisodeNotFoundError(
-            f"Episode '{episode.id_}' not found in JSONMemoryStore.",
-        )
+        if episode.id_ not in await self._settled_index():
+            raise EpisodeNotFoundError(
+                f"Episode '{episode.id_}' not found in JSONMemoryStore.",
+            )
+        await self.write(episode)
+
+    async def compact(self) -> None:
+        """Rewrite the segments holding dead records with live ones only.
+
+        Waits for a compaction already running instead of starting
+        another.
+        """
+        if self._compaction is None or self._compaction.done():
+            self._compaction = asyncio.create_task(self._compact())
+        await asyncio.shield(self._compaction)
+
+    def _maybe_compact(self) -> None:
+        if self.garbage_ratio < self.compact_ratio or (
+            self._compaction is not None and not self._compaction.done()
+        ):
+            return
+        self._compaction = asyncio.create_task(self._compact())
+        self._compaction.add_done_callback(self._log_compaction_error)
+
+    def _log_compaction_error(self, task: asyncio.Task[None]) -> None:
+        if not task.cancelled() and (error := task.exception()) is not None:
+            self.logger.warning("Compacting %s failed: %s", self.path, error)
+
+    async def _compact(self) -> None:
+        """Copy live records to new files, then swap them in atomically."""
+        async with self._lock:
+            plan = self._compaction_plan(self._index())
+        copies: list[tuple[str, dict[str, int]]] = []
+        moved: dict[str, tuple[int, dict[str, int], int]] = {}
+        try:
+            for segment, _, _, kept in plan:
+                copies.append(
+                    await asyncio.to_thread(
+                        _copy_records,
+                        self._segment_path(segment),
+                        kept,
+                    ),
+                )
+            async with self._lock:
+                swap = self._io.submit(self._swap_in, plan, copies, moved)
+                try:
+                    await asyncio.wrap_future(swap)
+                finally:
+                    # a cancelled wait leaves a started swap running
+                    concurrent.futures.wait([swap])
+                self._remap(moved)
+        except BaseException:
+            for tmp_path, _ in copies:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+            if moved:
+                # some segments were swapped; rebuild the index from disk
+                self._entries = None
+                self._order = []
+            raise
+
+    def _remap(self, moved: dict[str, tuple[int, dict[str, int], int]]) -> None:
+        """Point the index into the compacted segments."""
+        entries = self._index()
+        for id_, entry in entries.items():
+            if entry.segment not in moved:
+                continue
+            start, offsets, shift = moved[entry.segment]
+            offset = (
+                entry.offset + shift if entry.offset >= start else offsets[id_]
+            )
+            entries[id_] = entry._replace(offset=offset)
+
+    def _compaction_plan(
+        self,
+        entries: dict[str, _Entry],
+    ) -> list[_SegmentPlan]:
+        """Pick the segments holding dead records, oldest first."""
+        live: dict[str, list[tuple[str, _Entry]]] = {}
+        for id_, entry in entries.items():
+            live.setdefault(entry.segment, []).append((id_, entry))
+        plan = []
+        for segment in self.segments:
+            path = self._segment_path(segment)
+            records = segment.records or 0
+            kept = live.get(segment.name, [])
+            if path.exists() and records > len(kept):
+                kept.sort(key=lambda item: item[1].offset)
+                plan.append((segment, path.stat().st_size, records, kept))
+        return plan
+
+    def _swap_in(
+        self,
+        plan: list[_SegmentPlan],
+        copies: list[tuple[str, dict[str, int]]],
+        moved: dict[str, tuple[int, dict[str, int], int]],
+    ) -> None:
+        """Replace compacted segments with their copies; runs on ``_io``.
+
+        Records appended to a segment since its copy started are added to
+        the copy first. Segments are replaced oldest first, so a crash
+        never drops a tombstone before the record it deletes. ``moved``
+        receives, per replaced segment, its size when the copy started,
+        the new offsets of the copied records and the shift of the
+        appended ones. Sealed segments left empty are then removed.
+        """
+        for (segment, start, records, _), (tmp_path, offsets) in zip(
+            plan,
+            copies,
+            strict=True,
+        ):
+            path = self._segment_path(segment)
+            with open(tmp_path, "ab") as tmp, open(path, "rb") as f:
+                base = tmp.seek(0, os.SEEK_END)
+                f.seek(start)
+                tmp.write(f.read())
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            os.replace(tmp_path, path)
+            moved[segment.name] = (start, offsets, base - start)
+            appended = (segment.records or 0) - records
+            segment.records = len(offsets) + appended
+        self._drop_empty_segments()
+
+    def _drop_empty_segments(self) -> None:
+        """Remove sealed segments left without records."""
+        if self._manifest is None:
+            return
+        *sealed, newest = self._manifest.segments
+        empty = [s for s in sealed if s.records == 0]
+        if not empty:
+            return
+        self._manifest.segments = [s for s in sealed if s.records] + [newest]
+        self._save_manifest()
+        for segment in empty:
+            self._segment_path(segment).unlink(missing_ok=True)
 
     async def _search(
         self,
@@ -197,3 +858,99 @@ class JSONMemoryStore(BaseMemoryStore):
             "JSONMemoryStore does not support similarity search. "
             "Use a vector-backed store instead.",
         )
+
+
+def _consume_error(future: asyncio.Future[None]) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+def _parse_key(line: bytes) -> tuple[str, datetime | None]:
+    """Read the episode ID and ``completed_at`` of a record.
+
+    Returns:
+        tuple[str, datetime | None]: The ID, and ``completed_at`` or
+            ``None`` for a tombstone.
+    """
+    line = line.rstrip()
+    head = _ID_HEAD.match(line)
+    tail = _COMPLETED_AT_TAIL.search(line, max(len(line) - _TAIL_BYTES, 0))
+    if head and tail:
+        return head[1].decode(), _parse_datetime(tail[1].decode())
+    if tombstone := _TOMBSTONE.fullmatch(line):
+        return tombstone[1].decode(), None
+    record = json.loads(line)
+    if TOMBSTONE_KEY in record:
+        return record[TOMBSTONE_KEY], None
+    return record["id_"], _parse_datetime(record["completed_at"])
+
+
+def _parse_datetime(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # e.g. a "Z" suffix before Python 3.11
+        return _DATETIME.validate_python(value)
+
+
+def _lines(path: Path) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(offset, line)`` for the non-blank lines of ``path``."""
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield offset, line
+            offset += len(line)
+
+
+def _reverse_lines(path: Path) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(offset, line)`` for the non-blank lines of ``path``.
+
+    Lines come last first, without their newline; the file is read
+    backwards block by block.
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        # start of a line that began before the block just read
+        head = b""
+        while pos > 0:
+            size = min(_BLOCK_SIZE, pos)
+            pos -= size
+            f.seek(pos)
+            chunk = f.read(size) + head
+            lines = chunk.split(b"\n")
+            head = lines.pop(0)
+            end = pos + len(chunk)
+            for line in reversed(lines):
+                start = end - len(line)
+                if line.strip():
+                    yield start, line
+                end = start - 1
+        if head.strip():
+            yield 0, head
+
+
+def _copy_records(
+    path: Path,
+    entries: list[tuple[str, _Entry]],
+) -> tuple[str, dict[str, int]]:
+    """Copy the records of ``entries`` from ``path`` to a temporary file.
+
+    Returns:
+        tuple[str, dict[str, int]]: The temporary file, and the new offset
+            of each copied record by ID.
+    """
+    offsets = {}
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as dst, open(path, "rb") as src:
+            for id_, entry in entries:
+                src.seek(entry.offset)
+                offsets[id_] = dst.tell()
+                dst.write(src.read(entry.length))
+            dst.flush()
+            os.fsync(dst.fileno())
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return tmp_path, offsets
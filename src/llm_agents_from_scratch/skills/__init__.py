@@ -2,6 +2,7 @@
 
 from ..data_structures.skill import SkillScope
 from ..tools.default import PythonInterpreterTool, ReadFileTool
+from .index import SkillIndex
 from .skill import Skill
 
 TOOLS_FOR_SKILL_RESOURCES: list = [ReadFileTool(), PythonInterpreterTool()]
@@ -11,4 +12,4 @@ Include these when building an agent whose skills use ``assets/``, ``scripts/``,
 or ``references/`` subdirectories. Opt-in only — not added automatically.
 """
 
-__all__ = ["Skill", "SkillScope", "TOOLS_FOR_SKILL_RESOURCES"]
+__all__ = ["Skill", "SkillIndex", "SkillScope", "TOOLS_FOR_SKILL_RESOURCES"]
@@ -4,6 +4,10 @@ MAX_NAME_LENGTH = 64
 
 SKILL_SUBDIR = ".agents/skills"
 
+# relative to the home directory; see SkillIndex
+SKILL_INDEX_PATH = ".agents/skills_index.json"
+SKILL_INDEX_VERSION = 1
+
 CATALOG_SKILL_TEMPLATE = """
   <skill>
     <name>{name}</name>
@@ -2,6 +2,7 @@
 
 import warnings
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import yaml
 from pydantic import ValidationError
@@ -22,6 +23,9 @@ from .constants import MAX_NAME_LENGTH
 from .skill import Skill
 from .utils import get_skills_path
 
+if TYPE_CHECKING:
+    from .index import SkillIndex
+
 
 def validate_skill_dir(
     dir: Path,
@@ -94,7 +98,10 @@ def validate_skill_dir(
     return frontmatter, skill_warnings
 
 
-def discover_skills(scopes: list[SkillScope]) -> dict[str, Skill]:
+def discover_skills(
+    scopes: list[SkillScope],
+    index: "SkillIndex | None" = None,
+) -> dict[str, Skill]:
     """Scan directories for skills across the provided scopes.
 
     Scopes are processed in the order given — on name collision, the last
@@ -103,24 +110,31 @@ def discover_skills(scopes: list[SkillScope]) -> dict[str, Skill]:
 
     Args:
         scopes: The scopes to scan, in processing order.
+        index: Optional ``SkillIndex``. Unchanged skills are then served
+            from the index after a ``stat``, instead of being re-read and
+            re-parsed. Defaults to None.
 
     Returns:
         dict[str, Skill]: Discovered skills keyed by name, deduplicated with
             last-scope precedence.
     """
+    validate = index.validate if index else validate_skill_dir
     skills: dict[str, Skill] = {}
     for scope in scopes:
         skills_path = get_skills_path(scope)
         if not skills_path.exists():
             continue
 
+        seen: set[str] = set()
         for skill_dir in sorted(skills_path.iterdir()):
             if not skill_dir.is_dir():
                 continue
+            location = (skill_dir / "SKILL.md").resolve()
+            seen.add(str(location))
 
             # validate dir is an actual Skill dir
             try:
-                frontmatter, skill_warnings = validate_skill_dir(skill_dir)
+                frontmatter, skill_warnings = validate(skill_dir)
             except SkillValidationError as e:
                 warnings.warn(
                     str(e),
@@ -143,8 +157,13 @@ def discover_skills(scopes: list[SkillScope]) -> dict[str, Skill]:
                 )
             skills[frontmatter.name] = Skill(
                 frontmatter=frontmatter,
-                location=(skill_dir / "SKILL.md").resolve(),
+                location=location,
                 scope=scope,  # type: ignore[arg-type]
             )
 
+        if index:
+            index.prune(skills_path, seen)
+
+    if index:
+        index.save()
     return skills
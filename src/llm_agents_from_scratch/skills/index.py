@@ -0,0 +1,211 @@
+"""Persistent skill index for fast discovery."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from .. import errors
+from ..data_structures.skill import SkillFrontmatter
+from ..errors import (
+    EmptySkillBodyError,
+    InvalidFrontmatterError,
+    MissingSkillMdError,
+    SkillValidationError,
+    SkillValidationWarning,
+)
+from .constants import SKILL_INDEX_PATH, SKILL_INDEX_VERSION
+from .discovery import validate_skill_dir
+
+# validation errors that depend only on SKILL.md content, so a cached
+# outcome stays valid until the file changes
+_CACHEABLE_ERRORS = (InvalidFrontmatterError, EmptySkillBodyError)
+
+
+class SkillIndex:
+    """On-disk cache of skill validation results, keyed by path and mtime.
+
+    ``discover_skills`` otherwise opens and YAML-parses every ``SKILL.md``
+    on every call. With an index, a ``SKILL.md`` whose modification time
+    and size are unchanged since it was last validated only costs a
+    ``stat``; changed or new skills are validated as usual and recorded.
+    The index is loaded once per instance and written back only when it
+    changed, so one instance can be shared by every ``TaskHandler`` of an
+    agent, and the file by every process on the machine.
+
+    Example::
+
+        index = SkillIndex()
+        skills = discover_skills([SkillScope.USER], index=index)
+        agent = LLMAgent(llm=llm, skill_index=index)
+
+    Attributes:
+        path (Path): Location of the index file.
+        hits (int): Validations answered from the index.
+        misses (int): Validations that had to read ``SKILL.md``.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        """Initialize a SkillIndex.
+
+        Args:
+            path (str | Path | None): Location of the index file. Defaults
+                to ``~/.agents/skills_index.json``.
+        """
+        self.path = Path(path) if path else Path.home() / SKILL_INDEX_PATH
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._dirty = False
+
+    @property
+    def entries(self) -> dict[str, dict[str, Any]]:
+        """Index entries keyed by ``SKILL.md`` path, loaded on first use."""
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Read the index file, ignoring it if missing or unreadable."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != SKILL_INDEX_VERSION
+        ):
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def validate(
+        self,
+        dir: Path,
+    ) -> tuple[SkillFrontmatter, list[SkillValidationWarning]]:
+        """Validate a skill directory, reusing the cached result if fresh.
+
+        Drop-in replacement for ``validate_skill_dir``: same return value,
+        same errors, cached or not.
+
+        Args:
+            dir: Path to the directory to validate.
+
+        Returns:
+            Tuple[SkillFrontmatter, list[SkillValidationWarning]]: The
+                validated skill metadata and its cosmetic warnings.
+
+        Raises:
+            SkillValidationError: If the skill directory has a fatal issue.
+        """
+        skill_md_path = dir / "SKILL.md"
+        try:
+            stat = skill_md_path.stat()
+        except OSError as e:
+            raise MissingSkillMdError(
+                f"Missing SKILL.md file in skill directory: {dir}",
+            ) from e
+
+        key = str(skill_md_path.resolve())
+        fingerprint = [stat.st_mtime_ns, stat.st_size]
+        entry = self.entries.get(key)
+        if entry is not None and entry.get("fingerprint") == fingerprint:
+            self.hits += 1
+            return self._from_entry(entry)
+
+        self.misses += 1
+        try:
+            frontmatter, skill_warnings = validate_skill_dir(dir)
+        except _CACHEABLE_ERRORS as e:
+            self._record(
+                key,
+                {
+                    "fingerprint": fingerprint,
+                    "error": [type(e).__name__, str(e)],
+                },
+            )
+            raise
+        self._record(
+            key,
+            {
+                "fingerprint": fingerprint,
+                "frontmatter": frontmatter.model_dump(
+                    mode="json",
+                    by_alias=True,
+                    exclude_none=True,
+                ),
+                "warnings": [
+                    [type(w).__name__, str(w)] for w in skill_warnings
+                ],
+            },
+        )
+        return frontmatter, skill_warnings
+
+    def _record(self, key: str, entry: dict[str, Any]) -> None:
+        self.entries[key] = entry
+        self._dirty = True
+
+    @staticmethod
+    def _from_entry(
+        entry: dict[str, Any],
+    ) -> tuple[SkillFrontmatter, list[SkillValidationWarning]]:
+        """Rebuild a validation outcome from an index entry."""
+        if "error" in entry:
+            error_type, message = entry["error"]
+            error_cls = getattr(errors, error_type, SkillValidationError)
+            raise error_cls(message)
+        skill_warnings = [
+            getattr(errors, warning_type, SkillValidationWarning)(message)
+            for warning_type, message in entry["warnings"]
+        ]
+        return (
+            SkillFrontmatter.model_validate(entry["frontmatter"]),
+            skill_warnings,
+        )
+
+    def prune(self, skills_path: Path, seen: set[str]) -> None:
+        """Forget skills under ``skills_path`` that were not seen.
+
+        Args:
+            skills_path (Path): A directory that was fully scanned.
+            seen (set[str]): Resolved ``SKILL.md`` paths found in it.
+        """
+        root = skills_path.resolve()
+        stale = [
+            key
+            for key in self.entries
+            if key not in seen and Path(key).parent.parent == root
+        ]
+        for key in stale:
+            del self.entries[key]
+        self._dirty = self._dirty or bool(stale)
+
+    def save(self) -> None:
+        """Write the index back to disk if it changed.
+
+        The file is replaced atomically, so concurrent readers never see
+        a partial index. Failing to write only costs the cache, so
+        ``OSError`` is swallowed.
+        """
+        if not self._dirty:
+            return
+        payload = json.dumps(
+            {"version": SKILL_INDEX_VERSION, "entries": self.entries},
+        )
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.path.parent,
+                prefix=f".{self.path.name}.",
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            return
+        self._dirty = False
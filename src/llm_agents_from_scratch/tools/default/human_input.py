@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+from functools import cached_property
 from typing import Any
 
 from rich.console import Console
@@ -66,9 +67,9 @@ class HumanInputTool(BaseTool):
             "Optionally provide a list of choices to constrain the response."
         )
 
-    @property
+    @cached_property
     def parameters_json_schema(self) -> dict[str, Any]:
-        """JSON schema for human input parameters."""
+        """JSON schema for human input parameters, built once per tool."""
         return {
             "type": "object",
             "properties": {
@@ -217,9 +218,9 @@ class SharedConsoleHumanInputTool(AsyncBaseTool):
             "Optionally provide a list of choices to constrain the response."
         )
 
-    @property
+    @cached_property
     def parameters_json_schema(self) -> dict[str, Any]:
-        """JSON schema for human input parameters."""
+        """JSON schema for human input parameters, built once per tool."""
         return {
             "type": "object",
             "properties": {
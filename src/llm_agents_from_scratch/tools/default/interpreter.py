@@ -1,5 +1,6 @@
 """PythonInterpreterTool default tool."""
 
+import asyncio
 import json
 import subprocess
 import sys
@@ -7,12 +8,31 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
-from ...base.tool import BaseTool
+from ...base.tool import AsyncBaseTool
 from ...data_structures import ToolCall, ToolCallResult
 
 
-class PythonInterpreterTool(BaseTool):
-    """A tool for executing a local Python script."""
+class PythonInterpreterTool(AsyncBaseTool):
+    """A tool for executing a local Python script.
+
+    Attributes:
+        timeout (float | None): Seconds a script may run before it is
+            killed and an error result returned. ``None`` lets it run
+            until the call is cancelled.
+    """
+
+    def __init__(self, timeout: float | None = None) -> None:
+        """Initialize a PythonInterpreterTool.
+
+        The script runs in a subprocess that is killed when the call is
+        cancelled, e.g. by the agent's ``Timeouts.tool_call`` deadline,
+        or once it has run for ``timeout`` seconds.
+
+        Args:
+            timeout (float | None): Seconds a script may run. Defaults to
+                None (unbounded).
+        """
+        self.timeout = timeout
 
     @property
     def name(self) -> str:
@@ -62,7 +82,7 @@ class PythonInterpreterTool(BaseTool):
             },
         }
 
-    def __call__(
+    async def __call__(
         self,
         tool_call: ToolCall,
         *args: Any,
@@ -124,25 +144,50 @@ class PythonInterpreterTool(BaseTool):
             script_path = raw_path  # type: ignore[assignment]
 
         try:
-            result = subprocess.run(
-                [sys.executable, script_path],
-                check=False,
-                capture_output=True,
-                text=True,
-                input=stdin_text,
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                script_path,
+                stdin=subprocess.PIPE if stdin_text is not None else None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 cwd=cwd,
             )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(
+                        stdin_text.encode() if stdin_text is not None else None,
+                    ),
+                    self.timeout,
+                )
+            finally:
+                if process.returncode is None:
+                    # timed out or cancelled: don't leave the script running
+                    process.kill()
+                    await process.wait()
+        except asyncio.TimeoutError:
+            return ToolCallResult(
+                tool_call_id=tool_call.id_,
+                content=json.dumps(
+                    {
+                        "error_type": "TimeoutError",
+                        "message": (
+                            f"Script killed after running {self.timeout}s."
+                        ),
+                    },
+                ),
+                error=True,
+            )
         finally:
             if tmp_path:
                 tmp_path.unlink(missing_ok=True)
 
-        if result.returncode != 0:
+        if process.returncode != 0:
             return ToolCallResult(
                 tool_call_id=tool_call.id_,
                 content=json.dumps(
                     {
                         "error_type": "RuntimeError",
-                        "message": result.stderr,
+                        "message": stderr.decode(),
                     },
                 ),
                 error=True,
@@ -150,6 +195,6 @@ class PythonInterpreterTool(BaseTool):
 
         return ToolCallResult(
             tool_call_id=tool_call.id_,
-            content=result.stdout,
+            content=stdout.decode(),
             error=False,
         )
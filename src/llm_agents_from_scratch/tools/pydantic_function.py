@@ -2,6 +2,7 @@
 
 import inspect
 import json
+from functools import cached_property
 from typing import Any, Awaitable, Callable, Protocol, get_type_hints
 
 from pydantic import BaseModel
@@ -130,9 +131,9 @@ class PydanticFunctionTool(BaseTool):
             self._desc or self.func.__doc__ or f"Tool for {self.func.__name__}"
         )
 
-    @property
+    @cached_property
     def parameters_json_schema(self) -> dict[str, Any]:
-        """JSON schema for tool parameters."""
+        """JSON schema for tool parameters, computed once per tool."""
         return self.params_mdl.model_json_schema()
 
     def __call__(
@@ -213,9 +214,9 @@ class AsyncPydanticFunctionTool(AsyncBaseTool):
             self._desc or self.func.__doc__ or f"Tool for {self.func.__name__}"
         )
 
-    @property
+    @cached_property
     def parameters_json_schema(self) -> dict[str, Any]:
-        """JSON schema for tool parameters."""
+        """JSON schema for tool parameters, computed once per tool."""
         return self.params_mdl.model_json_schema()
 
     async def __call__(
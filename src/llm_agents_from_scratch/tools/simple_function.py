@@ -2,6 +2,7 @@
 
 import inspect
 import json
+from functools import cached_property
 from typing import Any, Awaitable, Callable, get_type_hints
 
 from llm_agents_from_scratch.base.tool import AsyncBaseTool, BaseTool
@@ -101,9 +102,9 @@ class SimpleFunctionTool(BaseTool):
             self._desc or self.func.__doc__ or f"Tool for {self.func.__name__}"
         )
 
-    @property
+    @cached_property
     def parameters_json_schema(self) -> dict[str, Any]:
-        """JSON schema for tool parameters."""
+        """JSON schema for tool parameters, computed once per tool."""
         return function_signature_to_json_schema(self.func)
 
     def __call__(
@@ -187,9 +188,9 @@ class AsyncSimpleFunctionTool(AsyncBaseTool):
             self._desc or self.func.__doc__ or f"Tool for {self.func.__name__}"
         )
 
-    @property
+    @cached_property
     def parameters_json_schema(self) -> dict[str, Any]:
-        """JSON schema for tool parameters."""
+        """JSON schema for tool parameters, computed once per tool."""
         return function_signature_to_json_schema(self.func)
 
     async def __call__(
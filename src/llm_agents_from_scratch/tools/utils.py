@@ -1,11 +1,63 @@
 """Utility functions for tools."""
 
-from typing import Any
+from collections import OrderedDict
+from typing import Any, Callable, TypeVar
+from weakref import WeakKeyDictionary
 
-from jsonschema import SchemaError, ValidationError, validate
+from jsonschema import SchemaError, ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 
+from ..base.tool import Tool
 from ..data_structures import ToolCall
 
+ToolPayload = TypeVar("ToolPayload")
+
+VALIDATOR_CACHE_SIZE = 256
+
+# compiled validators keyed by id() of the schema; the schema itself is
+# kept alongside so the id cannot be reused while the entry is alive
+_validators: OrderedDict[int, tuple[dict[str, Any], Validator]] = OrderedDict()
+# provider payloads per tool, each stored with the (name, description,
+# schema) it was built from
+_tool_payloads: WeakKeyDictionary[
+    Tool,
+    dict[str, tuple[str, str, dict[str, Any], Any]],
+] = WeakKeyDictionary()
+
+
+def get_validator(schema: dict[str, Any]) -> Validator:
+    """Return a compiled validator for a JSON schema.
+
+    The schema is checked and the validator built only the first time a
+    given schema object is seen. Tools that return the same schema object
+    on every access (e.g. ``SimpleFunctionTool``) therefore pay for this
+    once; schema objects must not be mutated after their first use.
+
+    Args:
+        schema: The JSON schema to validate against.
+
+    Returns:
+        Validator: A validator for ``schema``.
+
+    Raises:
+        SchemaError: If ``schema`` is not a valid JSON schema.
+    """
+    key = id(schema)
+    cached = _validators.get(key)
+    if cached is not None and cached[0] is schema:
+        _validators.move_to_end(key)
+        return cached[1]
+
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
+    _validators[key] = (schema, validator)
+    if len(_validators) > VALIDATOR_CACHE_SIZE:
+        _validators.popitem(last=False)
+    return validator
+
 
 def validate_tool_call_arguments(
     tool_call: ToolCall,
@@ -23,10 +75,54 @@ def validate_tool_call_arguments(
         validation failure.
     """
     try:
-        validate(tool_call.arguments, schema=schema)
+        validator = get_validator(schema)
+        # same error selection as ~jsonschema.validate
+        error = best_match(validator.iter_errors(tool_call.arguments))
+        if error is not None:
+            raise error
     except (SchemaError, ValidationError) as e:
         return {
             "error_type": e.__class__.__name__,
             "message": e.message,
         }
     return None
+
+
+def cached_tool_payload(
+    tool: Tool,
+    provider: str,
+    build: Callable[[Tool], ToolPayload],
+) -> ToolPayload:
+    """Return a provider-specific tool payload, building it only once.
+
+    LLM providers convert every tool on every request. This keeps the
+    converted payload per tool and provider, and rebuilds it only if the
+    tool's name, description or schema object changed.
+
+    Args:
+        tool: The tool to convert.
+        provider: Name of the payload format, e.g. ``"ollama"``.
+        build: Converts ``tool`` into the provider payload.
+
+    Returns:
+        ToolPayload: The (possibly cached) provider payload.
+    """
+    name, description = tool.name, tool.description
+    schema = tool.parameters_json_schema
+    try:
+        payloads = _tool_payloads.setdefault(tool, {})
+    except TypeError:  # tool is not hashable or weak-referenceable
+        return build(tool)
+
+    cached = payloads.get(provider)
+    if (
+        cached is not None
+        and cached[0] == name
+        and cached[1] == description
+        and cached[2] is schema
+    ):
+        return cached[3]  # type: ignore[no-any-return]
+
+    payload = build(tool)
+    payloads[provider] = (name, description, schema, payload)
+    return payload
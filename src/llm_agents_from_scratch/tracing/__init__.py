@@ -0,0 +1,9 @@
+"""Hierarchical tracing with OpenTelemetry-compatible export."""
+
+from .tracer import Tracer, current_tracer, trace_span
+
+__all__ = [
+    "Tracer",
+    "current_tracer",
+    "trace_span",
+]
@@ -0,0 +1,4 @@
+"""Constants for tracing."""
+
+OTLP_SERVICE_NAME = "llm-agents-from-scratch"
+OTLP_SCOPE_NAME = "llm_agents_from_scratch"
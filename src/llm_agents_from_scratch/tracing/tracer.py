@@ -0,0 +1,213 @@
+"""Hierarchical tracing of agent runs."""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Iterator
+
+from llm_agents_from_scratch.data_structures import Span
+from llm_agents_from_scratch.logger import current_subagent_name
+
+from .constants import OTLP_SCOPE_NAME, OTLP_SERVICE_NAME
+
+# Set by LLMAgent.run() inside its processing loop so that everything the
+# loop awaits (including subagent runs, whose asyncio.Tasks copy this
+# context) records into the same tracer without it being passed around.
+current_tracer: ContextVar["Tracer | None"] = ContextVar(
+    "current_tracer",
+    default=None,
+)
+_current_span: ContextVar[Span | None] = ContextVar(
+    "_current_span",
+    default=None,
+)
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    """Convert an attribute value to an OTLP ``AnyValue``."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # OTLP JSON encodes 64-bit integers as strings
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_span(span: Span) -> dict[str, Any]:
+    """Convert a ``Span`` to an OTLP JSON span."""
+    otlp: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,  # SPAN_KIND_INTERNAL
+        "startTimeUnixNano": str(span.start_time_ns),
+        "endTimeUnixNano": str(span.end_time_ns or span.start_time_ns),
+        "attributes": [
+            {"key": key, "value": _otlp_value(value)}
+            for key, value in span.attributes.items()
+        ],
+        "status": {"code": 1},  # STATUS_CODE_OK
+    }
+    if span.parent_span_id:
+        otlp["parentSpanId"] = span.parent_span_id
+    if span.status == "error":
+        otlp["status"] = {"code": 2, "message": span.error or ""}
+        otlp["events"] = [
+            {
+                "name": "exception",
+                "timeUnixNano": otlp["endTimeUnixNano"],
+                "attributes": [
+                    {
+                        "key": "exception.type",
+                        "value": _otlp_value(span.error_type or "Error"),
+                    },
+                    {
+                        "key": "exception.message",
+                        "value": _otlp_value(span.error or ""),
+                    },
+                ],
+            },
+        ]
+    return otlp
+
+
+class Tracer:
+    """Records nested spans of an agent run.
+
+    Spans nest through a context variable, so a span opened while another
+    is open (in the same task, or in an ``asyncio.Task`` created from it)
+    becomes its child. Finished spans are kept in memory, in the order
+    they end, and can be written to a local file as OpenTelemetry (OTLP)
+    JSON, which tools such as Jaeger or ``otel-desktop-viewer`` import
+    directly.
+
+    Example::
+
+        tracer = Tracer()
+        agent = LLMAgent(llm=llm, tracer=tracer)
+        await agent.run(task)
+        tracer.export("trace.json")
+
+    Attributes:
+        spans (list[Span]): Finished spans, in the order they ended.
+        service_name (str): ``service.name`` resource attribute on export.
+    """
+
+    def __init__(self, service_name: str = OTLP_SERVICE_NAME) -> None:
+        """Initialize a Tracer.
+
+        Args:
+            service_name (str): ``service.name`` resource attribute on
+                export. Defaults to ``"llm-agents-from-scratch"``.
+        """
+        self.spans: list[Span] = []
+        self.service_name = service_name
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """Open a span for the duration of the ``with`` block.
+
+        An exception leaving the block marks the span as failed and is
+        re-raised. Inside a subagent run, spans are tagged with the
+        subagent's name.
+
+        Args:
+            name (str): What the span measures.
+            **attributes (Any): Initial attributes of the span.
+
+        Yields:
+            Span: The open span, to add attributes as the work progresses.
+        """
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+            span_id=os.urandom(8).hex(),
+            parent_span_id=parent.span_id if parent else None,
+            start_time_ns=time.time_ns(),
+            attributes=attributes,
+        )
+        if subagent_name := current_subagent_name.get():
+            span.attributes["agent.subagent"] = subagent_name
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_time_ns = time.time_ns()
+            self.spans.append(span)
+
+    def clear(self) -> None:
+        """Drop all finished spans."""
+        self.spans.clear()
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Return finished spans as an OTLP ``ExportTraceServiceRequest``.
+
+        Returns:
+            dict[str, Any]: The OTLP JSON payload.
+        """
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": _otlp_value(self.service_name),
+                            },
+                        ],
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": OTLP_SCOPE_NAME},
+                            "spans": [_otlp_span(s) for s in self.spans],
+                        },
+                    ],
+                },
+            ],
+        }
+
+    def export(self, path: str | Path) -> Path:
+        """Write finished spans to a local file as OTLP JSON.
+
+        Args:
+            path (str | Path): The file to write. Overwritten if it exists.
+
+        Returns:
+            Path: The path written to.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_otlp(), indent=2))
+        return path
+
+
+@contextmanager
+def trace_span(name: str, **attributes: Any) -> Iterator[Span | None]:
+    """Open a span on the current tracer, if there is one.
+
+    Instrumented library code uses this so tracing costs nothing when
+    no ``Tracer`` is configured.
+
+    Args:
+        name (str): What the span measures.
+        **attributes (Any): Initial attributes of the span.
+
+    Yields:
+        Span | None: The open span, or ``None`` when not tracing.
+    """
+    tracer = current_tracer.get()
+    if tracer is None:
+        yield None
+        return
+    with tracer.span(name, **attributes) as span:
+        yield span
@@ -20,3 +20,19 @@ def check_extra_was_installed(extra: str, packages: str | list[str]) -> None:
             f"llm-agents-from-scratch[{extra}]`."
         )
         raise MissingExtraError(msg)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheaply estimate the number of tokens in a piece of text.
+
+    Uses the common ~4 characters per token heuristic rather than a real
+    tokenizer, so it is model-agnostic and adds no dependency. Good enough
+    for budgeting; not for billing.
+
+    Args:
+        text (str): The text to estimate.
+
+    Returns:
+        int: Estimated token count.
+    """
+    return (len(text) + 3) // 4
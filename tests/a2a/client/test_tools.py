@@ -1,5 +1,6 @@
 """Unit tests for UseA2AAgentTool."""
 
+import asyncio
 import json
 from typing import Any, AsyncIterator
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -10,6 +11,7 @@ from a2a.types import (
     AgentCard,
     AgentInterface,
     Artifact,
+    CancelTaskRequest,
     Message,
     Part,
     Role,
@@ -456,3 +458,75 @@ async def test_use_a2a_agent_tool_catches_response_conversion_error() -> None:
     assert details["error_type"] == "RuntimeError"
     assert details["a2a_agent"] == "researcher"
     assert "boom" in details["message"]
+
+
+@pytest.mark.asyncio
+async def test_use_a2a_agent_tool_cancels_resumed_remote_task() -> None:
+    """Tests cancelling a resumed dispatch cancels the peer's task too."""
+    started = asyncio.Event()
+
+    async def send_message(
+        request: SendMessageRequest,
+    ) -> AsyncIterator[StreamResponse]:
+        started.set()
+        await asyncio.sleep(300)
+        yield StreamResponse()
+
+    client = MagicMock()
+    client.send_message = send_message
+    client.cancel_task = AsyncMock()
+    client.close = AsyncMock()
+
+    with _patch_create_client(client):
+        tool = UseA2AAgentTool(a2a_agents_registry={"researcher": _spec()})
+        tool_call = ToolCall(
+            tool_name=TOOL_NAME,
+            arguments={"name": "researcher", "task": "more", "task_id": "r1"},
+        )
+        dispatch = asyncio.create_task(tool(tool_call=tool_call))
+        await started.wait()
+        dispatch.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await dispatch
+
+    client.cancel_task.assert_awaited_once_with(CancelTaskRequest(id="r1"))
+    client.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_use_a2a_agent_tool_cancels_new_remote_task() -> None:
+    """Tests cancelling a new dispatch cancels the task the peer started."""
+    started = asyncio.Event()
+
+    async def send_message(
+        request: SendMessageRequest,
+    ) -> AsyncIterator[StreamResponse]:
+        yield StreamResponse(
+            task=Task(
+                id="r2",
+                status=TaskStatus(state=TaskState.TASK_STATE_WORKING),
+            ),
+        )
+        started.set()
+        await asyncio.sleep(300)
+        yield StreamResponse()
+
+    client = MagicMock()
+    client.send_message = send_message
+    client.cancel_task = AsyncMock()
+    client.close = AsyncMock()
+
+    with _patch_create_client(client):
+        tool = UseA2AAgentTool(a2a_agents_registry={"researcher": _spec()})
+        tool_call = ToolCall(
+            tool_name=TOOL_NAME,
+            arguments={"name": "researcher", "task": "do it"},
+        )
+        dispatch = asyncio.create_task(tool(tool_call=tool_call))
+        await started.wait()
+        dispatch.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await dispatch
+
+    client.cancel_task.assert_awaited_once_with(CancelTaskRequest(id="r2"))
+    client.close.assert_awaited_once()
@@ -16,6 +16,7 @@ from a2a.types import (
 from llm_agents_from_scratch.a2a.client.utils import (
     a2a_artifacts_text,
     a2a_parts_text,
+    a2a_response_task_id,
     a2a_response_to_tool_call_result,
     a2a_task_to_tool_call_result,
 )
@@ -55,6 +56,32 @@ def test_a2a_artifacts_text_no_artifacts() -> None:
     assert a2a_artifacts_text([]) == ""
 
 
+def test_a2a_response_task_id_by_payload() -> None:
+    """Tests the remote task id is read from every payload that has one."""
+    task = Task(
+        id="t1",
+        status=TaskStatus(state=TaskState.TASK_STATE_WORKING),
+    )
+
+    assert a2a_response_task_id(StreamResponse(task=task)) == "t1"
+    assert (
+        a2a_response_task_id(
+            StreamResponse(
+                message=Message(role=Role.ROLE_AGENT, task_id="t2"),
+            ),
+        )
+        == "t2"
+    )
+    assert (
+        a2a_response_task_id(
+            StreamResponse(message=Message(role=Role.ROLE_AGENT)),
+        )
+        is None
+    )
+    assert a2a_response_task_id(StreamResponse()) is None
+    assert a2a_response_task_id(None) is None
+
+
 def test_a2a_response_to_tool_call_result_none_response_is_error() -> None:
     """Tests returns an error for a None response."""
     result = a2a_response_to_tool_call_result(None, "researcher", "tc1")
@@ -16,7 +16,8 @@ from llm_agents_from_scratch.a2a.server.streaming_executor import (
     StreamingLLMAgentA2AExecutor,
 )
 from llm_agents_from_scratch.base.llm import BaseLLM
-from llm_agents_from_scratch.data_structures import Task, TaskResult, TaskStep
+from llm_agents_from_scratch.data_structures import TaskResult, TaskStep
+from llm_agents_from_scratch.llms import ScriptedLLM
 
 
 def _context(
@@ -83,12 +84,63 @@ async def test_execute_completes_task(mock_llm: BaseLLM) -> None:
     updates_per_step = 2  # planned instruction + step result
     # +1 for start_work()'s own WORKING update.
     assert working_count == 1 + num_steps * updates_per_step
-    artifacts = [e for e in events if hasattr(e, "artifact")]
+    artifacts = [
+        e
+        for e in events
+        if hasattr(e, "artifact") and e.artifact.name == "task_result"
+    ]
     assert len(artifacts) == 1
     assert artifacts[0].artifact.parts[0].text == "the answer"
     assert context.task_id not in executor._task_handlers
 
 
+@pytest.mark.asyncio
+async def test_execute_streams_step_output() -> None:
+    """Tests each step's tokens are published as step_output chunks."""
+    agent = LLMAgent(llm=ScriptedLLM(["the partial answer"]))
+    executor = StreamingLLMAgentA2AExecutor(agent=agent)
+    queue = EventQueueLegacy()
+
+    await executor.execute(_context(), queue)
+
+    events = await _drain(queue)
+    chunks = [
+        e
+        for e in events
+        if hasattr(e, "artifact") and e.artifact.name == "step_output"
+    ]
+    assert "".join(c.artifact.parts[0].text for c in chunks) == (
+        "the partial answer"
+    )
+    assert len({c.artifact.artifact_id for c in chunks}) == 1
+    assert [c.append for c in chunks] == [False, True, True, True]
+    assert [c.last_chunk for c in chunks] == [False, False, False, True]
+
+
+@pytest.mark.asyncio
+async def test_execute_runs_agent_loop(mock_llm: BaseLLM) -> None:
+    """Tests the run goes through agent.run(), recording its memory."""
+    agent = LLMAgent(llm=mock_llm)
+    executor = StreamingLLMAgentA2AExecutor(agent=agent)
+    queue = EventQueueLegacy()
+
+    with (
+        patch.object(LLMAgent.TaskHandler, "get_next_step") as mock_next_step,
+        patch.object(
+            LLMAgent.TaskHandler,
+            "record_memory",
+        ) as mock_record_memory,
+    ):
+        result = TaskResult(task_id="x", content="the answer")
+        mock_next_step.side_effect = [result]
+        await executor.execute(_context(), queue)
+
+    mock_record_memory.assert_awaited_once_with(result=result)
+    events = await _drain(queue)
+    statuses = [e.status.state for e in events if hasattr(e, "status")]
+    assert statuses[-1] == TaskState.TASK_STATE_COMPLETED
+
+
 @pytest.mark.asyncio
 async def test_execute_enqueues_new_task_when_no_current_task(
     mock_llm: BaseLLM,
@@ -201,12 +253,9 @@ async def test_execute_propagates_cancellation_mid_run(
 ) -> None:
     """Tests execute() propagates cancellation of its own producer task.
 
-    Unlike LLMAgentA2AExecutor, execute()'s step loop awaits
-    get_next_step()/run_step() directly rather than a background-task-
-    driven task_handler, so there's nothing for cancel() itself to
-    interrupt -- the interruption comes from the SDK cancelling the
-    producer task running execute() (here, execute_task) before it
-    ever calls cancel(). This mirrors that ordering directly.
+    The SDK cancels the producer task running execute() (here,
+    execute_task) before it calls cancel(); this mirrors that ordering
+    directly. The run execute() was following must not outlive it.
     """
     agent = LLMAgent(llm=mock_llm)
     executor = StreamingLLMAgentA2AExecutor(agent=agent)
@@ -223,6 +272,7 @@ async def test_execute_propagates_cancellation_mid_run(
             _wait_until(lambda: "t1" in executor._task_handlers),
             timeout=1,
         )
+        task_handler = executor._task_handlers["t1"]
 
         execute_task.cancel()
         await executor.cancel(context, queue)
@@ -231,6 +281,7 @@ async def test_execute_propagates_cancellation_mid_run(
 
     assert execute_task.cancelled()
     assert "t1" not in executor._task_handlers
+    assert task_handler.background_task.done()
 
     events = await _drain(queue)
     statuses = [e.status.state for e in events if hasattr(e, "status")]
@@ -244,14 +295,27 @@ async def test_cancel_cancels_in_flight_task(mock_llm: BaseLLM) -> None:
     executor = StreamingLLMAgentA2AExecutor(agent=agent)
     queue = EventQueueLegacy()
 
-    task_handler = await agent.run_supervised(Task(instruction="hang forever"))
-    executor._task_handlers["t1"] = task_handler
+    async def _hang(*args: object, **kwargs: object) -> None:
+        await asyncio.sleep(300)
 
-    context = _context()
-    await executor.cancel(context, queue)
+    with patch.object(LLMAgent.TaskHandler, "get_next_step") as mock_next_step:
+        mock_next_step.side_effect = _hang
+        execute_task = asyncio.create_task(
+            executor.execute(_context(), queue),
+        )
+        await asyncio.wait_for(
+            _wait_until(lambda: mock_next_step.called),
+            timeout=1,
+        )
+        task_handler = executor._task_handlers["t1"]
+
+        await executor.cancel(_context(), queue)
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(execute_task, timeout=1)
 
     assert task_handler.done()
     assert task_handler.cancelled()
+    assert task_handler.background_task.done()
 
     events = await _drain(queue)
     statuses = [e.status.state for e in events if hasattr(e, "status")]
@@ -1,35 +1,53 @@
 import asyncio
 import contextlib
+from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from a2a.types import AgentCard, AgentInterface
 
 from llm_agents_from_scratch.a2a import A2AAgentSpec
-from llm_agents_from_scratch.agent import LLMAgent, LLMAgentBuilder
+from llm_agents_from_scratch.agent import (
+    LLMAgent,
+    LLMAgentBuilder,
+    compare_step_modes,
+)
 from llm_agents_from_scratch.base.llm import BaseLLM
 from llm_agents_from_scratch.base.tool import BaseTool
+from llm_agents_from_scratch.checkpointers import FileCheckpointer
 from llm_agents_from_scratch.data_structures import (
     ApprovalResult,
+    ChatMessage,
+    ChatRole,
     Episode,
+    NextStepDecision,
     RejectedTaskResult,
+    StepMode,
+    TaskPlan,
+    ToolCall,
 )
 from llm_agents_from_scratch.data_structures.agent import (
     Task,
     TaskResult,
     TaskStep,
+    Timeouts,
 )
 from llm_agents_from_scratch.errors import (
+    CheckpointNotFoundError,
     LLMAgentError,
     MaxStepsReachedError,
     RecordMemoryError,
 )
+from llm_agents_from_scratch.llms import LatencyModel, ScriptedLLM
+from llm_agents_from_scratch.memory import MemoryWriter
 from llm_agents_from_scratch.memory.memory import Memory
 from llm_agents_from_scratch.skills.constants import (
     EXPLICIT_SKILL_ACTIVATION_TEMPLATE,
     EXPLICIT_SKILL_ACTIVATION_WITH_PROMPT_TEMPLATE,
 )
 from llm_agents_from_scratch.subagents import SubAgentSpec
+from llm_agents_from_scratch.tracing import Tracer
 
 
 def test_init(mock_llm: BaseLLM) -> None:
@@ -337,6 +355,76 @@ async def test_record_memory_raises_when_called_with_no_args(
         await handler.record_memory()
 
 
+def _slow_memory(recalled: str, delay: float) -> AsyncMock:
+    memory = AsyncMock(spec=Memory)
+
+    async def recall(task: Task) -> str:
+        await asyncio.sleep(delay)
+        return recalled
+
+    async def record(episode: Episode) -> None:
+        await asyncio.sleep(delay)
+
+    memory.recall.side_effect = recall
+    memory.record.side_effect = record
+    return memory
+
+
+@pytest.mark.asyncio
+async def test_load_memories_recalls_concurrently_and_skips_timeouts(
+    mock_llm: BaseLLM,
+) -> None:
+    """Tests recalls overlap and a recall past its deadline is skipped."""
+    fast_a = _slow_memory("memory a", 0.05)
+    fast_b = _slow_memory("memory b", 0.05)
+    stuck = _slow_memory("memory c", 10)
+    agent = LLMAgent(
+        llm=mock_llm,
+        memories=[fast_a, stuck, fast_b],
+        timeouts=Timeouts(memory_recall=0.1),
+    )
+    handler = agent.TaskHandler(
+        llm_agent=agent,
+        task=Task(instruction="mock instruction"),
+    )
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await handler.load_memories()
+
+    assert loop.time() - start < 0.5  # noqa: PLR2004
+    assert "memory a" in handler._recalled_memories
+    assert "memory b" in handler._recalled_memories
+    assert "memory c" not in handler._recalled_memories
+
+
+@pytest.mark.asyncio
+@patch.object(LLMAgent.TaskHandler, "get_next_step")
+async def test_run_with_memory_writer_records_in_background(
+    mock_get_next_step: AsyncMock,
+    mock_llm: BaseLLM,
+) -> None:
+    """Tests the task resolves before the episode is written."""
+    task = Task(instruction="mock instruction")
+    task_result = TaskResult(task_id=task.id_, content="mock result")
+    mock_get_next_step.side_effect = [task_result]
+    memory = _slow_memory("", 0.2)
+    memory.recall.side_effect = None
+    memory.recall.return_value = ""
+    writer = MemoryWriter()
+    agent = LLMAgent(llm=mock_llm, memories=[memory], memory_writer=writer)
+
+    result = await asyncio.wait_for(agent.run(task), timeout=0.15)
+
+    assert result == task_result
+    assert writer.pending == 1
+    await writer.flush()
+    ep: Episode = memory.record.call_args[0][0]
+    assert ep.result == task_result
+    assert writer.written == 1
+    await writer.close()
+
+
 # ---------------------------------------------------------------------------
 # Approval gate end-to-end loop tests (Chapter 8)
 # ---------------------------------------------------------------------------
@@ -542,3 +630,496 @@ def test_llm_agent_init_raises_on_duplicate_a2a_agent_names(
     spec = _a2a_spec("researcher")
     with pytest.raises(LLMAgentError, match="duplicate"):
         LLMAgent(llm=mock_llm, a2a_agents=[spec, spec])
+
+
+def _fused_mock_llm() -> AsyncMock:
+    """LLM that calls a tool, then wants another, then answers."""
+    mock_llm = AsyncMock()
+    tool_call = ToolCall(tool_name="my_mock_fn_1", arguments={"param1": 1})
+    mock_llm.chat.side_effect = [
+        (
+            ChatMessage(role=ChatRole.USER, content="instruction"),
+            ChatMessage(
+                role=ChatRole.ASSISTANT,
+                content="",
+                tool_calls=[tool_call],
+            ),
+        ),
+        (
+            ChatMessage(role=ChatRole.USER, content="continue"),
+            ChatMessage(role=ChatRole.ASSISTANT, content="final answer"),
+        ),
+    ]
+    mock_llm.continue_chat_with_tool_results.return_value = (
+        [ChatMessage(role=ChatRole.TOOL, content="1")],
+        ChatMessage(
+            role=ChatRole.ASSISTANT,
+            content="",
+            tool_calls=[tool_call],
+        ),
+    )
+    return mock_llm
+
+
+@pytest.mark.asyncio
+async def test_run_fused_step_mode_skips_routing_calls(
+    _test_tool: BaseTool,
+) -> None:
+    """Tests that fused mode never asks the LLM for a next step decision."""
+    mock_llm = _fused_mock_llm()
+    agent = LLMAgent(llm=mock_llm, tools=[_test_tool])
+
+    handler = agent.run(
+        Task(instruction="mock instruction"),
+        skills_scopes=[],
+        step_mode="fused",
+    )
+    result = await handler
+
+    assert handler.step_mode == StepMode.FUSED
+    assert result.content == "final answer"
+    assert handler.step_counter == 2  # noqa: PLR2004
+    mock_llm.structured_output.assert_not_awaited()
+    assert [c.site for c in handler.llm_calls] == [
+        "run_step",
+        "run_step_tool_results",
+        "run_step",
+    ]
+    # the continuation step is the fused continue instruction
+    second_input = mock_llm.chat.call_args_list[1].kwargs["input"]
+    assert second_input == agent.templates["fused_continue_instruction"]
+    system_message = mock_llm.chat.call_args_list[0].kwargs["chat_history"][0]
+    assert agent.templates["fused_step_guidance"] in system_message.content
+
+
+@pytest.mark.asyncio
+async def test_run_fused_step_mode_chains_tool_calls(
+    _test_tool: BaseTool,
+) -> None:
+    """Tests a tool call requested after tool results starts a new step."""
+    mock_llm = AsyncMock()
+    mock_llm.chat.side_effect = [
+        (
+            ChatMessage(role=ChatRole.USER, content=content),
+            ChatMessage(
+                role=ChatRole.ASSISTANT,
+                content="",
+                tool_calls=[
+                    ToolCall(tool_name="my_mock_fn_1", arguments={"param1": i}),
+                ],
+            ),
+        )
+        for i, content in enumerate(["instruction", "continue"])
+    ]
+    replies = [
+        ChatMessage(
+            role=ChatRole.ASSISTANT,
+            content="",
+            tool_calls=[
+                ToolCall(tool_name="my_mock_fn_1", arguments={"param1": 1}),
+            ],
+        ),
+        ChatMessage(role=ChatRole.ASSISTANT, content="final answer"),
+    ]
+
+    async def continue_chat(*args: Any, **kwargs: Any) -> Any:
+        tool_messages = [ChatMessage(role=ChatRole.TOOL, content="0")]
+        if kwargs.get("tools") is None:  # a model can't call tools unseen
+            return tool_messages, ChatMessage(
+                role=ChatRole.ASSISTANT,
+                content="Now I need to call my_mock_fn_1 again.",
+            )
+        return tool_messages, replies.pop(0)
+
+    mock_llm.continue_chat_with_tool_results.side_effect = continue_chat
+    agent = LLMAgent(llm=mock_llm, tools=[_test_tool])
+
+    handler = agent.run(
+        Task(instruction="mock instruction"),
+        skills_scopes=[],
+        step_mode="fused",
+    )
+    result = await handler
+
+    assert result.content == "final answer"
+    assert handler.step_counter == 2  # noqa: PLR2004
+    for call in mock_llm.continue_chat_with_tool_results.call_args_list:
+        assert [t.name for t in call.kwargs["tools"]] == ["my_mock_fn_1"]
+
+
+@pytest.mark.asyncio
+async def test_compare_step_modes(_test_tool: BaseTool) -> None:
+    """Tests per-mode LLM usage reports."""
+    mock_llm = _fused_mock_llm()
+    # classic: one decision after each of the two steps
+    mock_llm.structured_output.side_effect = [
+        NextStepDecision(kind="next_step", content="continue"),
+        NextStepDecision(kind="final_result", content=""),
+    ]
+    fused_chat_responses = list(mock_llm.chat.side_effect)
+    mock_llm.chat.side_effect = fused_chat_responses * 2
+    agent = LLMAgent(llm=mock_llm, tools=[_test_tool])
+
+    reports = await compare_step_modes(
+        agent,
+        [Task(instruction="mock instruction")],
+        skills_scopes=[],
+    )
+
+    classic = reports[StepMode.CLASSIC]
+    fused = reports[StepMode.FUSED]
+    assert classic.num_tasks == fused.num_tasks == 1
+    assert classic.num_failed == fused.num_failed == 0
+    assert classic.llm_calls == 5  # noqa: PLR2004
+    assert classic.llm_calls_by_site["get_next_step"] == 2  # noqa: PLR2004
+    assert fused.llm_calls == 3  # noqa: PLR2004
+    assert "get_next_step" not in fused.llm_calls_by_site
+    assert fused.llm_calls_per_task == 3.0  # noqa: PLR2004
+    assert str(fused).startswith("fused: 1 task(s), 3 LLM call(s)")
+
+
+def test_init_raises_error_invalid_max_tool_rounds(mock_llm: BaseLLM) -> None:
+    """Tests that a step must allow at least one tool round."""
+    with pytest.raises(LLMAgentError):
+        LLMAgent(llm=mock_llm, max_tool_rounds_per_step=0)
+
+
+def _batch_tasks(num_tasks: int, fail_at: int | None = None) -> list[Task]:
+    return [
+        Task(instruction="fail" if i == fail_at else f"task {i}")
+        for i in range(num_tasks)
+    ]
+
+
+@pytest.mark.asyncio
+@patch("llm_agents_from_scratch.agent.llm_agent.discover_skills")
+async def test_run_many(
+    mock_discover_skills: MagicMock,
+    mock_llm: BaseLLM,
+) -> None:
+    """Tests bounded concurrency, ordering and per-task error isolation."""
+    mock_discover_skills.return_value = {}
+    in_flight = 0
+    peak = 0
+
+    async def _get_next_step(
+        handler: LLMAgent.TaskHandler,
+        previous_step_result: object,
+    ) -> TaskResult:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # finish later tasks first
+        await asyncio.sleep(0.001 * (10 - int(handler.task.id_)))
+        in_flight -= 1
+        if handler.task.instruction == "fail":
+            raise RuntimeError("boom")
+        return TaskResult(task_id=handler.task.id_, content=handler.task.id_)
+
+    tasks = _batch_tasks(10, fail_at=3)
+    for i, task in enumerate(tasks):
+        task.id_ = str(i)
+    agent = LLMAgent(llm=mock_llm)
+
+    with patch.object(
+        LLMAgent.TaskHandler,
+        "get_next_step",
+        autospec=True,
+        side_effect=_get_next_step,
+    ):
+        batch = await agent.run_many(iter(tasks), concurrency=3)
+
+    assert peak == 3  # noqa: PLR2004
+    assert batch.num_tasks == 10  # noqa: PLR2004
+    assert batch.num_failed == 1
+    assert [item.index for item in batch.items] == list(range(10))
+    assert batch.items[3].error == "boom"
+    assert batch.items[3].error_type == "RuntimeError"
+    assert batch.results[3] is None
+    assert [r.content for r in batch.results if r] == [
+        str(i)
+        for i in range(10)
+        if i != 3  # noqa: PLR2004
+    ]
+    assert batch.throughput > 0
+    # skills are discovered once for the whole batch
+    mock_discover_skills.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch.object(LLMAgent.TaskHandler, "get_next_step")
+async def test_iter_run_many_yields_and_cancels_on_close(
+    mock_get_next_step: AsyncMock,
+    mock_llm: BaseLLM,
+) -> None:
+    """Tests results stream in and closing early cancels in-flight tasks."""
+    task_result = TaskResult(task_id="t", content="done")
+    never = asyncio.Event()
+
+    async def _get_next_step(previous_step_result: object) -> TaskResult:
+        if mock_get_next_step.await_count > 1:
+            await never.wait()
+        return task_result
+
+    mock_get_next_step.side_effect = _get_next_step
+    agent = LLMAgent(llm=mock_llm)
+    iterator = agent.iter_run_many(
+        _batch_tasks(5),
+        concurrency=2,
+        skills_scopes=[],
+    )
+
+    item = await anext(iterator)
+    assert item.result == task_result
+    assert item.succeeded
+    await iterator.aclose()
+    await asyncio.sleep(0)
+
+    # no further tasks were started and the one in flight was cancelled
+    assert mock_get_next_step.await_count == 2  # noqa: PLR2004
+    assert all(
+        t.done() for t in asyncio.all_tasks() if t is not asyncio.current_task()
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_many_raises_error_invalid_concurrency(
+    mock_llm: BaseLLM,
+) -> None:
+    """Tests that at least one task must be allowed in flight."""
+    agent = LLMAgent(llm=mock_llm)
+    with pytest.raises(LLMAgentError):
+        await agent.run_many(_batch_tasks(1), concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_run_with_tracer_records_nested_spans(
+    _test_tool: BaseTool,
+) -> None:
+    """Tests task, step, LLM call and tool call spans are nested."""
+    tracer = Tracer()
+    agent = LLMAgent(llm=_fused_mock_llm(), tools=[_test_tool], tracer=tracer)
+
+    await agent.run(
+        Task(instruction="mock instruction"),
+        skills_scopes=[],
+        step_mode="fused",
+    )
+
+    spans = {s.span_id: s for s in tracer.spans}
+    (task_span,) = [s for s in tracer.spans if s.name == "agent.task"]
+    step_spans = [s for s in tracer.spans if s.name == "agent.step"]
+    (tool_span,) = [s for s in tracer.spans if s.name == "agent.tool_call"]
+    chat_spans = [s for s in tracer.spans if s.name == "llm.chat"]
+    assert task_span.attributes["task.steps"] == 2  # noqa: PLR2004
+    # two steps run, the third iteration returns the final answer
+    assert len(step_spans) == 3  # noqa: PLR2004
+    assert all(s.parent_span_id == task_span.span_id for s in step_spans)
+    assert spans[tool_span.parent_span_id].name == "agent.step"
+    assert tool_span.attributes["tool.name"] == "my_mock_fn_1"
+    assert chat_spans[0].attributes["llm.site"] == "run_step"
+    assert chat_spans[1].attributes["llm.output_chars"] == len("final answer")
+    assert {s.name for s in tracer.spans} >= {
+        "memory.load_memories",
+        "memory.record_memory",
+        "llm.continue_chat_with_tool_results",
+    }
+    assert len({s.trace_id for s in tracer.spans}) == 1
+
+
+@pytest.mark.asyncio
+async def test_run_with_tracer_records_task_error(mock_llm: BaseLLM) -> None:
+    """Tests that a failed task marks its span as failed."""
+    tracer = Tracer()
+    agent = LLMAgent(llm=mock_llm, tracer=tracer)
+
+    with pytest.raises(MaxStepsReachedError):
+        await agent.run(Task(instruction="mock"), max_steps=0)
+
+    (task_span,) = [s for s in tracer.spans if s.name == "agent.task"]
+    assert task_span.status == "error"
+    assert task_span.error_type == "MaxStepsReachedError"
+
+
+@pytest.mark.asyncio
+async def test_resume_continues_after_last_checkpoint(tmp_path: Path) -> None:
+    """Tests a resumed task skips the steps completed before it stopped."""
+    checkpointer = FileCheckpointer(tmp_path)
+    task = Task(instruction="count to three")
+    agent = LLMAgent(
+        llm=ScriptedLLM(["one", "two", "three"]),
+        checkpointer=checkpointer,
+    )
+
+    with pytest.raises(MaxStepsReachedError):
+        await agent.run(task, max_steps=2, skills_scopes=[])
+
+    checkpoint = await checkpointer.load(task.id_)
+    assert checkpoint is not None
+    assert checkpoint.step_counter == 2  # noqa: PLR2004
+    assert checkpoint.last_step_result is not None
+    assert checkpoint.last_step_result.content == "two"
+
+    llm = ScriptedLLM(["three"])
+    resumed = LLMAgent(llm=llm, checkpointer=checkpointer)
+    handler = await resumed.resume(task.id_, skills_scopes=[])
+    result = await handler
+
+    assert result.task_id == task.id_
+    assert handler.step_counter == 3  # noqa: PLR2004
+    assert [
+        step.messages[-1].content for step in handler.structured_rollout.steps
+    ] == ["one", "two", "three"]
+    assert llm.calls["chat"] == 1
+    assert await checkpointer.load(task.id_) is None
+
+
+@pytest.mark.asyncio
+async def test_resume_with_exhausted_budget_raises(tmp_path: Path) -> None:
+    """Tests a budget below the checkpointed step count stops at once."""
+    checkpointer = FileCheckpointer(tmp_path)
+    task = Task(instruction="count to three")
+    agent = LLMAgent(
+        llm=ScriptedLLM(["one", "two", "three"]),
+        checkpointer=checkpointer,
+    )
+    with pytest.raises(MaxStepsReachedError):
+        await agent.run(task, max_steps=2, skills_scopes=[])
+
+    llm = ScriptedLLM(["three"])
+    resumed = LLMAgent(llm=llm, checkpointer=checkpointer)
+    handler = await resumed.resume(task.id_, max_steps=1, skills_scopes=[])
+
+    with pytest.raises(MaxStepsReachedError):
+        await handler
+    assert handler.step_counter == 2  # noqa: PLR2004
+    assert not llm.calls
+
+
+@pytest.mark.asyncio
+async def test_resume_raises_without_checkpoint(
+    mock_llm: BaseLLM,
+    tmp_path: Path,
+) -> None:
+    """Tests resuming requires a checkpointer and a checkpoint."""
+    with pytest.raises(LLMAgentError):
+        await LLMAgent(llm=mock_llm).resume("task-1")
+
+    agent = LLMAgent(llm=mock_llm, checkpointer=FileCheckpointer(tmp_path))
+    with pytest.raises(CheckpointNotFoundError):
+        await agent.resume("task-1")
+
+
+_DIAMOND_PLAN = {
+    "steps": [
+        {"id": "a", "instruction": "look up a"},
+        {"id": "b", "instruction": "look up b"},
+        {"id": "c", "instruction": "look up c"},
+        {"id": "d", "instruction": "merge", "depends_on": ["a", "b"]},
+    ],
+}
+
+
+def _track_chats(llm: ScriptedLLM) -> tuple[dict[str, str], list[int]]:
+    """Record each chat's system prompt and the peak of concurrent chats."""
+    prompts: dict[str, str] = {}
+    peak = [0, 0]  # in flight, peak
+    chat = llm.chat
+
+    async def _chat(input: str, chat_history: Any, **kwargs: Any) -> Any:
+        prompts[input] = chat_history[0].content
+        peak[0] += 1
+        peak[1] = max(peak)
+        try:
+            return await chat(input, chat_history, **kwargs)
+        finally:
+            peak[0] -= 1
+
+    llm.chat = _chat  # type: ignore[method-assign]
+    return prompts, peak
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("max_parallel_steps", "peak"), [(4, 3), (1, 1)])
+async def test_run_planned_step_mode_runs_steps_concurrently(
+    max_parallel_steps: int,
+    peak: int,
+) -> None:
+    """Tests ready plan steps run at once, bounded by the agent's cap."""
+    llm = ScriptedLLM(
+        latency=LatencyModel(mean=0.01),
+        structured_outputs={"TaskPlan": _DIAMOND_PLAN},
+    )
+    prompts, concurrency = _track_chats(llm)
+    agent = LLMAgent(llm=llm, max_parallel_steps=max_parallel_steps)
+
+    handler = agent.run(Task(instruction="x"), step_mode="planned")
+    result = await handler
+
+    assert result.content == "Done."
+    assert concurrency[1] == peak
+    # 4 planned steps + the answering step
+    assert handler.step_counter == 5  # noqa: PLR2004
+    assert [s.messages[-2].content for s in handler.structured_rollout.steps][
+        :4
+    ] == ["look up a", "look up b", "look up c", "merge"]
+    # each step sees only the steps it depends on
+    assert "look up a" in prompts["merge"]
+    assert "look up b" in prompts["merge"]
+    assert "look up c" not in prompts["merge"]
+    assert "look up b" not in prompts["look up a"]
+    assert llm.calls["structured_output"] == 2  # plan + routing  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_run_planned_step_mode_numbers_step_spans() -> None:
+    """Tests concurrent plan steps get distinct span indices, in order."""
+    llm = ScriptedLLM(
+        latency=LatencyModel(mean=0.01),
+        structured_outputs={"TaskPlan": _DIAMOND_PLAN},
+    )
+    tracer = Tracer()
+    # a step deadline lets the steps start before any of them is counted
+    agent = LLMAgent(llm=llm, tracer=tracer, timeouts=Timeouts(step=10))
+
+    await agent.run(Task(instruction="x"), step_mode="planned")
+
+    planned = {
+        s.attributes["step.plan_id"]: s.attributes["step.index"]
+        for s in tracer.spans
+        if "step.plan_id" in s.attributes
+    }
+    assert planned == {"a": 1, "b": 2, "c": 3, "d": 4}
+
+
+@pytest.mark.asyncio
+async def test_run_planned_step_mode_respects_max_steps() -> None:
+    """Tests a plan larger than the step budget fails before running."""
+    llm = ScriptedLLM(structured_outputs={"TaskPlan": _DIAMOND_PLAN})
+    agent = LLMAgent(llm=llm)
+
+    with pytest.raises(MaxStepsReachedError):
+        await agent.run(Task(instruction="x"), max_steps=3, step_mode="planned")
+    assert llm.calls["chat"] == 0
+
+
+@pytest.mark.asyncio
+async def test_execute_plan_cancels_running_steps_on_failure() -> None:
+    """Tests a failing step cancels its siblings and merges nothing."""
+    llm = ScriptedLLM(latency=LatencyModel(mean=10.0))
+    chat = llm.chat
+
+    async def _chat(input: str, *args: Any, **kwargs: Any) -> Any:
+        if input == "look up b":
+            raise RuntimeError("boom")
+        return await chat(input, *args, **kwargs)
+
+    llm.chat = _chat  # type: ignore[method-assign]
+    handler = LLMAgent.TaskHandler(LLMAgent(llm=llm), Task(instruction="x"), [])
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await asyncio.wait_for(
+            handler.execute_plan(TaskPlan.model_validate(_DIAMOND_PLAN)),
+            timeout=1,
+        )
+    assert handler.structured_rollout.steps == []
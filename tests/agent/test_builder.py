@@ -10,9 +10,15 @@ from llm_agents_from_scratch.a2a import A2AAgentSpec
 from llm_agents_from_scratch.agent import LLMAgent
 from llm_agents_from_scratch.agent.templates import default_templates
 from llm_agents_from_scratch.base.llm import BaseLLM
-from llm_agents_from_scratch.data_structures import Task
+from llm_agents_from_scratch.data_structures import (
+    PromptLayout,
+    Task,
+    Timeouts,
+    ToolResultPolicy,
+)
 from llm_agents_from_scratch.errors import LLMAgentBuilderError, LLMAgentError
 from llm_agents_from_scratch.memory.memory import Memory
+from llm_agents_from_scratch.skills import SkillIndex
 from llm_agents_from_scratch.subagents import SubAgentSpec, UseSubAgentTool
 from llm_agents_from_scratch.tools.mcp.tool import MCPTool
 
@@ -285,3 +291,36 @@ async def test_build_raises_on_duplicate_a2a_agent_names(
             .with_a2a_agents([spec_a, spec_b])
             .build()
         )
+
+
+@pytest.mark.asyncio
+async def test_build_passes_compactor_and_prompt_layout() -> None:
+    """Tests that step-prompt settings reach the built LLMAgent."""
+    mock_compactor = MagicMock()
+    skill_index = SkillIndex()
+    checkpointer = MagicMock()
+    memory_writer = MagicMock()
+
+    agent = await (
+        LLMAgentBuilder(llm=MagicMock())
+        .with_compactor(mock_compactor)
+        .with_prompt_layout(PromptLayout.STATIC_PREFIX)
+        .with_max_tool_rounds_per_step(4)
+        .with_skill_index(skill_index)
+        .with_timeouts(Timeouts(step=30.0))
+        .with_tool_result_policy(ToolResultPolicy(max_chars=100))
+        .with_checkpointer(checkpointer)
+        .with_max_parallel_steps(2)
+        .with_memory_writer(memory_writer)
+        .build()
+    )
+
+    assert agent.compactor is mock_compactor
+    assert agent.prompt_layout == PromptLayout.STATIC_PREFIX
+    assert agent.max_tool_rounds_per_step == 4  # noqa: PLR2004
+    assert agent.skill_index is skill_index
+    assert agent.timeouts == Timeouts(step=30.0)
+    assert agent.tool_result_policy == ToolResultPolicy(max_chars=100)
+    assert agent.checkpointer is checkpointer
+    assert agent.max_parallel_steps == 2  # noqa: PLR2004
+    assert agent.memory_writer is memory_writer
@@ -1,6 +1,7 @@
 import asyncio
 import contextlib
 import json
+from typing import Any, AsyncIterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -20,17 +21,32 @@ from llm_agents_from_scratch.base.tool import AsyncBaseTool, BaseTool
 from llm_agents_from_scratch.data_structures import (
     ChatMessage,
     ChatRole,
+    ChatStreamChunk,
+    CompactionReport,
     NextStepDecision,
+    PromptLayout,
     RejectedTaskResult,
+    StepMode,
     Task,
+    TaskEventKind,
+    TaskPlan,
     TaskResult,
     TaskStep,
     TaskStepResult,
+    Timeouts,
     ToolCall,
+    ToolResultPolicy,
 )
 from llm_agents_from_scratch.data_structures.skill import SkillScope
-from llm_agents_from_scratch.errors import TaskHandlerError
+from llm_agents_from_scratch.errors import (
+    LLMCallTimeoutError,
+    StepTimeoutError,
+    TaskHandlerError,
+    TaskTimeoutError,
+)
+from llm_agents_from_scratch.llms import LatencyModel, ScriptedLLM
 from llm_agents_from_scratch.memory.memory import Memory
+from llm_agents_from_scratch.skills.index import SkillIndex
 from llm_agents_from_scratch.skills.skill import Skill
 from llm_agents_from_scratch.subagents import SubAgentSpec, UseSubAgentTool
 from llm_agents_from_scratch.tools.simple_function import (
@@ -73,7 +89,7 @@ async def test_task_handler_init_discovers_skills(
             skills_scopes=[SkillScope.PROJECT],
         )
 
-    mock_discover.assert_called_once_with([SkillScope.PROJECT])
+    mock_discover.assert_called_once_with([SkillScope.PROJECT], index=None)
     assert handler.skills_registry == mock_skills
 
 
@@ -1704,3 +1720,726 @@ async def test_run_step_dispatches_to_a2a_agent() -> None:
         step_result = await handler.run_step(step)
 
     assert step_result.content == "Delegated and done."
+
+
+@pytest.mark.asyncio
+async def test_run_step_uses_compacted_rollout() -> None:
+    """Tests that a compactor's rollout, not the raw one, is prompted."""
+    mock_llm = AsyncMock()
+    mock_llm.chat.side_effect = [
+        (
+            ChatMessage(role=ChatRole.USER, content=f"instruction {i}"),
+            ChatMessage(role=ChatRole.ASSISTANT, content=f"response {i}"),
+        )
+        for i in range(2)
+    ]
+    mock_llm.structured_output.return_value = NextStepDecision(
+        kind="final_result",
+        content="",
+    )
+    mock_compactor = MagicMock()
+    mock_compactor.compact = AsyncMock(
+        return_value=(
+            "compacted rollout",
+            CompactionReport(
+                step=1,
+                original_tokens=100,
+                compacted_tokens=10,
+                verbatim_steps=0,
+                compacted_steps=1,
+            ),
+        ),
+    )
+    llm_agent = LLMAgent(llm=mock_llm, compactor=mock_compactor)
+    handler = LLMAgent.TaskHandler(
+        llm_agent=llm_agent,
+        task=Task(instruction="mock instruction"),
+    )
+
+    for i in range(2):
+        await handler.run_step(
+            TaskStep(task_id=handler.task.id_, instruction=f"instruction {i}"),
+        )
+    await handler.get_next_step(
+        TaskStepResult(task_step_id="1", content="response 1"),
+    )
+
+    # first step has nothing to compact
+    first_system_message = mock_llm.chat.call_args_list[0].kwargs[
+        "chat_history"
+    ][0]
+    assert "compacted rollout" not in first_system_message.content
+    second_system_message = mock_llm.chat.call_args_list[1].kwargs[
+        "chat_history"
+    ][0]
+    assert "compacted rollout" in second_system_message.content
+    assert "response 0" not in second_system_message.content
+    # compacted once per step, shared by get_next_step and run_step
+    assert mock_compactor.compact.await_count == 2  # noqa: PLR2004
+    assert len(handler.compaction_reports) == 2  # noqa: PLR2004
+    assert len(handler.structured_rollout.steps) == 2  # noqa: PLR2004
+    # raw rollout is still tracked in full
+    assert "response 0" in handler.rollout
+    assert "response 1" in handler.rollout
+    prompt = mock_llm.structured_output.call_args.kwargs["prompt"]
+    assert "compacted rollout" in prompt
+
+
+@pytest.mark.asyncio
+async def test_task_handler_rollout_setter_seeds_structured_rollout(
+    mock_llm: BaseLLM,
+) -> None:
+    """Tests that assigning rollout text seeds a fresh Rollout."""
+    handler = LLMAgent.TaskHandler(
+        llm_agent=LLMAgent(llm=mock_llm),
+        task=Task(instruction="mock instruction"),
+    )
+    handler.structured_rollout.append(
+        [ChatMessage(role=ChatRole.ASSISTANT, content="old step")],
+    )
+
+    handler.rollout = "some progress"
+
+    assert handler.structured_rollout.prefix == "some progress"
+    assert handler.structured_rollout.steps == []
+    assert handler.rollout == "some progress"
+
+
+@pytest.mark.asyncio
+async def test_run_step_static_prefix_layout() -> None:
+    """Tests static content first, then rollout, then instruction."""
+    mock_llm = AsyncMock()
+    mock_llm.prompt_cache_kwargs = MagicMock(
+        side_effect=lambda key: {"cache_key": key},
+    )
+    mock_llm.chat.return_value = (
+        ChatMessage(role=ChatRole.USER, content="Some instruction."),
+        ChatMessage(role=ChatRole.ASSISTANT, content="Some response."),
+    )
+    llm_agent = LLMAgent(
+        llm=mock_llm,
+        prompt_layout=PromptLayout.STATIC_PREFIX,
+    )
+    handler = LLMAgent.TaskHandler(
+        llm_agent=llm_agent,
+        task=Task(instruction="mock instruction"),
+        skills_scopes=[],
+    )
+    handler._recalled_memories = "some memories"
+    handler.rollout = "some progress"
+
+    await handler.run_step(
+        TaskStep(task_id=handler.task.id_, instruction="Some instruction."),
+    )
+
+    static_prompt = (
+        f"{default_templates['system_message'].strip()}\n\nsome memories"
+    )
+    chat_kwargs = mock_llm.chat.call_args.kwargs
+    assert chat_kwargs["input"] == "Some instruction."
+    assert chat_kwargs["chat_history"] == [
+        ChatMessage(role=ChatRole.SYSTEM, content=static_prompt),
+        ChatMessage(
+            role=ChatRole.SYSTEM,
+            content=default_templates["run_step_rollout_message"].format(
+                current_rollout="some progress",
+            ),
+        ),
+    ]
+    cache_key = chat_kwargs["cache_key"]
+    assert len(cache_key) == 32  # noqa: PLR2004
+
+    # the static prompt and its cache key are stable across steps
+    await handler.run_step(
+        TaskStep(task_id=handler.task.id_, instruction="Some instruction."),
+    )
+    chat_kwargs = mock_llm.chat.call_args.kwargs
+    assert chat_kwargs["chat_history"][0].content == static_prompt
+    assert chat_kwargs["cache_key"] == cache_key
+
+
+@pytest.mark.asyncio
+async def test_get_next_step_static_prefix_layout() -> None:
+    """Tests the next step prompt puts the rollout after static content."""
+    mock_llm = AsyncMock()
+    mock_llm.prompt_cache_kwargs = MagicMock(return_value={})
+    mock_llm.structured_output.return_value = NextStepDecision(
+        kind="final_result",
+        content="",
+    )
+    handler = LLMAgent.TaskHandler(
+        llm_agent=LLMAgent(
+            llm=mock_llm,
+            prompt_layout=PromptLayout.STATIC_PREFIX,
+        ),
+        task=Task(instruction="mock instruction"),
+        skills_scopes=[],
+    )
+    handler.rollout = "some progress"
+
+    await handler.get_next_step(
+        TaskStepResult(task_step_id="1", content="mock step result"),
+    )
+
+    prompt = mock_llm.structured_output.call_args.kwargs["prompt"]
+    prefix = default_templates["get_next_step_prefix"].format(
+        instruction="mock instruction",
+    )
+    assert prompt.startswith(prefix)
+    assert prompt.index("mock instruction") < prompt.index("some progress")
+    assert prompt.index("some progress") < prompt.index("mock step result")
+
+
+@pytest.mark.asyncio
+async def test_load_memories_invalidates_static_system_prompt(
+    mock_llm: BaseLLM,
+) -> None:
+    """Tests that recalled memories show up in the static system prompt."""
+    memory = MagicMock(spec=Memory)
+    memory.recall = AsyncMock(return_value="recalled episode")
+    handler = LLMAgent.TaskHandler(
+        llm_agent=LLMAgent(
+            llm=mock_llm,
+            memories=[memory],
+            prompt_layout=PromptLayout.STATIC_PREFIX,
+        ),
+        task=Task(instruction="mock instruction"),
+        skills_scopes=[],
+    )
+    assert "recalled episode" not in handler._static_system_prompt
+
+    await handler.load_memories()
+
+    assert "recalled episode" in handler._static_system_prompt
+
+
+@pytest.mark.asyncio
+async def test_get_next_step_fused_without_llm(mock_llm: BaseLLM) -> None:
+    """Tests fused routing: pending tool calls continue, otherwise final."""
+    handler = LLMAgent.TaskHandler(
+        llm_agent=LLMAgent(llm=mock_llm),
+        task=Task(instruction="mock instruction"),
+        skills_scopes=[],
+        step_mode=StepMode.FUSED,
+    )
+    step_result = TaskStepResult(task_step_id="1", content="mock result")
+
+    handler._has_pending_tool_calls = True
+    next_step = await handler.get_next_step(step_result)
+    assert isinstance(next_step, TaskStep)
+    assert (
+        next_step.instruction == default_templates["fused_continue_instruction"]
+    )
+
+    handler._has_pending_tool_calls = False
+    task_result = await handler.get_next_step(step_result)
+    assert isinstance(task_result, TaskResult)
+    assert task_result.content == "mock result"
+    assert handler.llm_calls == []
+
+
+@pytest.mark.asyncio
+async def test_call_llm_records_failed_calls() -> None:
+    """Tests that LLM calls are recorded even when they raise."""
+    mock_llm = AsyncMock()
+    mock_llm.structured_output.side_effect = RuntimeError("mock error")
+    handler = LLMAgent.TaskHandler(
+        llm_agent=LLMAgent(llm=mock_llm),
+        task=Task(instruction="mock instruction"),
+        skills_scopes=[],
+    )
+
+    with pytest.raises(TaskHandlerError):
+        await handler.get_next_step(
+            TaskStepResult(task_step_id="1", content="mock result"),
+        )
+
+    assert len(handler.llm_calls) == 1
+    record = handler.llm_calls[0]
+    assert record.site == "get_next_step"
+    assert record.method == "structured_output"
+    assert record.error
+    assert record.latency >= 0
+
+
+def _tool_call_message() -> ChatMessage:
+    return ChatMessage(
+        role=ChatRole.ASSISTANT,
+        content="",
+        tool_calls=[
+            ToolCall(tool_name="my_mock_fn_1", arguments={"param1": 1}),
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_step_runs_follow_up_tool_rounds(
+    _test_tool: BaseTool,
+) -> None:
+    """Tests that chained tool calls run within one step."""
+    mock_llm = AsyncMock()
+    mock_llm.chat.return_value = (
+        ChatMessage(role=ChatRole.USER, content="Some instruction."),
+        _tool_call_message(),
+    )
+    mock_llm.continue_chat_with_tool_results.side_effect = [
+        ([ChatMessage(role=ChatRole.TOOL, content="1")], _tool_call_message()),
+        (
+            [ChatMessage(role=ChatRole.TOOL, content="1")],
+            ChatMessage(role=ChatRole.ASSISTANT, content="Final content."),
+        ),
+    ]
+    llm_agent = LLMAgent(
+        llm=mock_llm,
+        tools=[_test_tool],
+        max_tool_rounds_per_step=3,
+    )
+    handler = LLMAgent.TaskHandler(
+        llm_agent=llm_agent,
+        task=Task(instruction="mock instruction"),
+        skills_scopes=[],
+    )
+
+    step_result = await handler.run_step(
+        TaskStep(task_id=handler.task.id_, instruction="Some instruction."),
+    )
+
+    assert step_result.content == "Final content."
+    assert not handler._has_pending_tool_calls
+    calls = mock_llm.continue_chat_with_tool_results.call_args_list
+    assert len(calls) == 2  # noqa: PLR2004
+    assert calls[0].kwargs["tools"] == [_test_tool]
+    # the second round sees the first round's tool messages
+    assert (
+        len(calls[1].kwargs["chat_history"])
+        == len(
+            calls[0].kwargs["chat_history"],
+        )
+        + 2
+    )
+    step_messages = handler.structured_rollout.steps[0].messages
+    assert [m.role for m in step_messages].count(ChatRole.TOOL) == 2  # noqa: PLR2004
+    mock_llm.chat.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_run_step_defers_tool_calls_after_round_budget(
+    _test_tool: BaseTool,
+) -> None:
+    """Tests tool calls left over after the budget are deferred."""
+    mock_llm = AsyncMock()
+    mock_llm.chat.return_value = (
+        ChatMessage(role=ChatRole.USER, content="Some instruction."),
+        _tool_call_message(),
+    )
+    mock_llm.continue_chat_with_tool_results.return_value = (
+        [ChatMessage(role=ChatRole.TOOL, content="1")],
+        _tool_call_message(),
+    )
+    handler = LLMAgent.TaskHandler(
+        llm_agent=LLMAgent(
+            llm=mock_llm,
+            tools=[_test_tool],
+            max_tool_rounds_per_step=2,
+        ),
+        task=Task(instruction="mock instruction"),
+        skills_scopes=[],
+    )
+
+    step_result = await handler.run_step(
+        TaskStep(task_id=handler.task.id_, instruction="Some instruction."),
+    )
+
+    assert mock_llm.continue_chat_with_tool_results.await_count == 2  # noqa: PLR2004
+    assert step_result.content.startswith(
+        "I need to make the following tool-calls:",
+    )
+    assert handler._has_pending_tool_calls
+
+
+@pytest.mark.asyncio
+async def test_task_handler_discovers_skills_with_agent_index(
+    mock_llm: BaseLLM,
+) -> None:
+    """Tests the agent's skill index is used for discovery."""
+    skill_index = SkillIndex()
+    llm_agent = LLMAgent(llm=mock_llm, skill_index=skill_index)
+
+    with patch(
+        "llm_agents_from_scratch.agent.llm_agent.discover_skills",
+        return_value={},
+    ) as mock_discover:
+        LLMAgent.TaskHandler(
+            llm_agent=llm_agent,
+            task=Task(instruction="mock instruction"),
+            skills_scopes=[SkillScope.PROJECT],
+        )
+
+    mock_discover.assert_called_once_with(
+        [SkillScope.PROJECT],
+        index=skill_index,
+    )
+
+
+def _add(x: int, y: int) -> int:
+    """Add two numbers."""
+    return x + y
+
+
+@pytest.mark.asyncio
+async def test_stream_step_yields_deltas_of_current_step() -> None:
+    """Tests stream_step streams the step's responses and then ends."""
+    llm = ScriptedLLM(
+        [ToolCall(tool_name="_add", arguments={"x": 1, "y": 2}), "It is 3"],
+    )
+    agent = LLMAgent(llm=llm, tools=[SimpleFunctionTool(_add)])
+    handler = LLMAgent.TaskHandler(agent, Task(instruction="add"), [])
+    step = TaskStep(task_id=handler.task.id_, instruction="add 1 and 2")
+
+    deltas = handler.stream_step()
+    step_result, streamed = await asyncio.gather(
+        handler.run_step(step),
+        _collect(deltas),
+    )
+
+    assert streamed == ["It ", "is ", "3"]
+    assert step_result.content == "It is 3"
+    assert not handler._delta_queues
+
+
+class _TwoDeltaLLM(ScriptedLLM):
+    """Streams two deltas per step, ``slow`` steps more slowly."""
+
+    async def stream_chat(
+        self,
+        input: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatStreamChunk]:
+        for part in ("1", "2"):
+            await asyncio.sleep(0.03 if input == "slow" else 0.02)
+            yield ChatStreamChunk(delta=f"{input}{part}")
+        yield ChatStreamChunk(
+            message=ChatMessage(role=ChatRole.ASSISTANT, content=input),
+        )
+
+
+@pytest.mark.asyncio
+async def test_stream_step_follows_one_of_concurrent_steps() -> None:
+    """Tests a sibling step neither feeds nor ends another step's stream."""
+    agent = LLMAgent(llm=_TwoDeltaLLM())
+    handler = LLMAgent.TaskHandler(agent, Task(instruction="x"), [])
+    events = handler.subscribe(tokens=True)  # streams every step
+
+    def _step(instruction: str) -> asyncio.Task[TaskStepResult]:
+        return asyncio.create_task(
+            handler.run_step(
+                TaskStep(task_id=handler.task.id_, instruction=instruction),
+            ),
+        )
+
+    fast_deltas = handler.stream_step()
+    fast = _step("fast")
+    await asyncio.sleep(0)
+    slow = _step("slow")
+
+    fast_streamed = await _collect(fast_deltas)
+    await asyncio.gather(fast, slow)
+    handler.set_result(TaskResult(task_id=handler.task.id_, content="ok"))
+
+    assert fast_streamed == ["fast1", "fast2"]
+    token_deltas = [
+        e.delta
+        for e in await _collect(events)
+        if e.kind == TaskEventKind.TOKEN_DELTA
+    ]
+    assert sorted(token_deltas) == ["fast1", "fast2", "slow1", "slow2"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_plan_steps_publish_their_own_index() -> None:
+    """Tests each plan step's events carry its index, not the latest one."""
+    agent = LLMAgent(llm=_TwoDeltaLLM())
+    handler = LLMAgent.TaskHandler(agent, Task(instruction="x"), [])
+    events = handler.subscribe(tokens=True)
+    plan = TaskPlan.model_validate(
+        {
+            "steps": [
+                {"id": "f", "instruction": "fast"},
+                {"id": "s", "instruction": "slow"},
+            ],
+        },
+    )
+
+    await handler.execute_plan(plan)
+    handler.set_result(TaskResult(task_id=handler.task.id_, content="ok"))
+
+    indices: dict[str, set[int]] = {"fast": set(), "slow": set()}
+    for e in await _collect(events):
+        if e.kind == TaskEventKind.STEP_STARTED:
+            assert e.step is not None
+            indices[e.step.instruction].add(e.step_index)
+        elif e.kind == TaskEventKind.TOKEN_DELTA:
+            assert e.delta is not None
+            indices[e.delta[:-1]].add(e.step_index)
+        elif e.kind == TaskEventKind.STEP_FINISHED:
+            assert e.step_result is not None
+            indices[e.step_result.content].add(e.step_index)
+    assert indices == {"fast": {1}, "slow": {2}}
+
+
+@pytest.mark.asyncio
+async def test_run_step_without_subscribers_does_not_stream() -> None:
+    """Tests the non-streaming LLM methods are used by default."""
+    llm = ScriptedLLM(["done"])
+    agent = LLMAgent(llm=llm)
+    handler = LLMAgent.TaskHandler(agent, Task(instruction="x"), [])
+
+    with patch.object(ScriptedLLM, "stream_chat") as mock_stream_chat:
+        await handler.run_step(
+            TaskStep(task_id=handler.task.id_, instruction="go"),
+        )
+
+    mock_stream_chat.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stream_step_ends_when_task_done() -> None:
+    """Tests open and late stream_step iterators end with the task."""
+    agent = LLMAgent(llm=ScriptedLLM())
+    handler = LLMAgent.TaskHandler(agent, Task(instruction="x"), [])
+    deltas = handler.stream_step()
+
+    handler.set_result(TaskResult(task_id=handler.task.id_, content="ok"))
+
+    assert await _collect(deltas) == []
+    assert await _collect(handler.stream_step()) == []
+
+
+@pytest.mark.asyncio
+async def test_subscribe_publishes_step_and_tool_events() -> None:
+    """Tests a run's events arrive in order and end with the result."""
+    llm = ScriptedLLM(
+        [ToolCall(tool_name="_add", arguments={"x": 1, "y": 2}), "It is 3"],
+    )
+    agent = LLMAgent(llm=llm, tools=[SimpleFunctionTool(_add)])
+    handler = agent.run(Task(instruction="add"), skills_scopes=[])
+
+    events = await _collect(handler.subscribe())
+
+    assert [e.kind for e in events] == [
+        TaskEventKind.STEP_STARTED,
+        TaskEventKind.TOOL_CALL_STARTED,
+        TaskEventKind.TOOL_CALL_FINISHED,
+        TaskEventKind.STEP_FINISHED,
+        TaskEventKind.RESULT,
+    ]
+    assert all(e.task_id == handler.task.id_ for e in events)
+    assert all(e.step_index == 1 for e in events)
+    assert events[2].tool_call_result.content == "3"
+    assert events[3].step_result.content == "It is 3"
+    assert events[4].result == handler.result()
+    assert not handler._event_queues
+
+
+@pytest.mark.asyncio
+async def test_subscribe_with_tokens_streams_step() -> None:
+    """Tests token deltas are only delivered to subscribers asking."""
+    agent = LLMAgent(llm=ScriptedLLM(["It is 3"]))
+    handler = agent.run(Task(instruction="x"), skills_scopes=[])
+
+    with_tokens, without_tokens = await asyncio.gather(
+        _collect(handler.subscribe(tokens=True)),
+        _collect(handler.subscribe()),
+    )
+
+    deltas = [e.delta for e in with_tokens if e.kind == "token_delta"]
+    assert deltas == ["It ", "is ", "3"]
+    assert len(with_tokens) == len(without_tokens) + len(deltas)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_drops_oldest_events_when_full() -> None:
+    """Tests a slow subscriber loses old events, never the result."""
+    agent = LLMAgent(llm=ScriptedLLM(["one", "two", "three"]))
+    handler = agent.run(Task(instruction="x"), skills_scopes=[])
+    events = handler.subscribe(maxsize=2)
+
+    await handler
+
+    received = await _collect(events)
+    assert [e.kind for e in received] == [
+        TaskEventKind.STEP_FINISHED,
+        TaskEventKind.RESULT,
+    ]
+    assert handler.events_dropped == 5  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_subscribe_ends_with_error_event() -> None:
+    """Tests open and late subscribers get the terminal error event."""
+    agent = LLMAgent(llm=ScriptedLLM())
+    handler = LLMAgent.TaskHandler(agent, Task(instruction="x"), [])
+    events = handler.subscribe()
+
+    handler.set_exception(TaskHandlerError("boom"))
+
+    for received in (
+        await _collect(events),
+        await _collect(handler.subscribe()),
+    ):
+        assert len(received) == 1
+        assert received[0].kind == TaskEventKind.ERROR
+        assert received[0].error == "boom"
+        assert received[0].error_type == "TaskHandlerError"
+
+
+async def _hang() -> str:
+    """Never finish."""
+    await asyncio.sleep(300)
+    return "unreachable"
+
+
+@pytest.mark.asyncio
+async def test_tool_call_timeout_returns_error_result() -> None:
+    """Tests a timed-out tool call is reported to the LLM as an error."""
+    llm = ScriptedLLM([ToolCall(tool_name="_hang", arguments={}), "gave up"])
+    agent = LLMAgent(
+        llm=llm,
+        tools=[AsyncSimpleFunctionTool(_hang)],
+        timeouts=Timeouts(tool_call=0.05),
+    )
+    handler = LLMAgent.TaskHandler(agent, Task(instruction="x"), [])
+    events = handler.subscribe()
+
+    step_result = await handler.run_step(
+        TaskStep(task_id=handler.task.id_, instruction="hang"),
+    )
+
+    assert step_result.content == "gave up"
+    handler.set_result(TaskResult(task_id=handler.task.id_, content="done"))
+    finished = [
+        e async for e in events if e.kind == TaskEventKind.TOOL_CALL_FINISHED
+    ]
+    tool_call_result = finished[0].tool_call_result
+    assert tool_call_result.error
+    assert json.loads(tool_call_result.content) == {
+        "error_type": "ToolCallTimeoutError",
+        "message": "Tool call timed out after 0.05s.",
+    }
+
+
+@pytest.mark.asyncio
+async def test_inner_timeout_is_not_reported_as_deadline(
+    mock_llm: BaseLLM,
+) -> None:
+    """Tests a TimeoutError raised by the provider itself is passed through."""
+    mock_llm.chat = AsyncMock(side_effect=TimeoutError("read timed out"))
+    agent = LLMAgent(llm=mock_llm, timeouts=Timeouts(llm_call=5))
+    handler = LLMAgent.TaskHandler(agent, Task(instruction="x"), [])
+
+    with pytest.raises(TimeoutError, match="read timed out") as exc_info:
+        await handler.run_step(
+            TaskStep(task_id=handler.task.id_, instruction="go"),
+        )
+
+    assert not isinstance(exc_info.value, LLMCallTimeoutError)
+
+
+@pytest.mark.asyncio
+async def test_llm_call_timeout_raises() -> None:
+    """Tests a slow LLM call fails the step."""
+    llm = ScriptedLLM(["slow"], latency=LatencyModel(mean=10.0))
+    agent = LLMAgent(llm=llm, timeouts=Timeouts(llm_call=0.05))
+    handler = LLMAgent.TaskHandler(agent, Task(instruction="x"), [])
+
+    with pytest.raises(LLMCallTimeoutError, match="`chat` timed out"):
+        await handler.run_step(
+            TaskStep(task_id=handler.task.id_, instruction="go"),
+        )
+
+    assert handler.llm_calls[0].error
+
+
+@pytest.mark.asyncio
+async def test_step_timeout_raises() -> None:
+    """Tests a step running past its deadline fails."""
+    llm = ScriptedLLM(["slow"], latency=LatencyModel(mean=10.0))
+    agent = LLMAgent(llm=llm, timeouts=Timeouts(step=0.05))
+    handler = LLMAgent.TaskHandler(agent, Task(instruction="x"), [])
+
+    with pytest.raises(StepTimeoutError):
+        await handler.run_step(
+            TaskStep(task_id=handler.task.id_, instruction="go"),
+        )
+
+
+@pytest.mark.asyncio
+async def test_task_timeout_fails_handler() -> None:
+    """Tests a run past its deadline fails and stops its loop."""
+    llm = ScriptedLLM(["slow"], latency=LatencyModel(mean=10.0))
+    agent = LLMAgent(llm=llm, timeouts=Timeouts(task=0.05))
+    handler = agent.run(Task(instruction="x"), skills_scopes=[])
+
+    with pytest.raises(TaskTimeoutError):
+        await handler
+
+    await asyncio.wait_for(handler.background_task, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_background_task() -> None:
+    """Tests cancelling the handler cancels the loop running it."""
+    llm = ScriptedLLM(["slow"], latency=LatencyModel(mean=10.0))
+    handler = LLMAgent(llm=llm).run(Task(instruction="x"), skills_scopes=[])
+    await asyncio.sleep(0.01)
+
+    assert handler.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await handler.background_task
+    assert handler.cancelled()
+
+
+def _dump() -> str:
+    """Return a large log."""
+    return "".join(f"line {i}\n" for i in range(1000))
+
+
+@pytest.mark.asyncio
+async def test_oversized_tool_result_is_spilled() -> None:
+    """Tests large results reach the LLM as a preview and a blob handle."""
+    llm = ScriptedLLM([ToolCall(tool_name="_dump", arguments={}), "ok"])
+    agent = LLMAgent(
+        llm=llm,
+        tools=[SimpleFunctionTool(_dump)],
+        tool_result_policy=ToolResultPolicy(max_chars=500, preview_chars=20),
+    )
+    handler = LLMAgent.TaskHandler(agent, Task(instruction="x"), [])
+
+    await handler.run_step(TaskStep(task_id=handler.task.id_, instruction="go"))
+
+    tool_message = handler.structured_rollout.steps[0].messages[-2]
+    content = json.loads(tool_message.content)["content"]
+    assert content.startswith("line 0\nline 1\nline 2\n")
+    assert len(content) < 500  # noqa: PLR2004
+    handle = handler.blob_store.handles[0]
+    assert handle in content
+    assert handler.blob_store.read(handle) == _dump()
+
+    read_result = await handler._execute_tool_call(
+        ToolCall(
+            tool_name="from_scratch__read_blob",
+            arguments={"handle": handle, "offset": 7, "length": 7},
+        ),
+    )
+    assert read_result.content.startswith("line 1\n")
+
+    blob_path = handler.blob_store.path
+    handler.set_result(TaskResult(task_id=handler.task.id_, content="done"))
+    await asyncio.sleep(0)
+    assert not blob_path.exists()
+
+
+async def _collect(deltas: AsyncIterator[Any]) -> list[Any]:
+    return [d async for d in deltas]
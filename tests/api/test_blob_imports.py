@@ -0,0 +1,15 @@
+import importlib
+
+import pytest
+
+from llm_agents_from_scratch.blobs import __all__ as _blobs_all
+
+
+@pytest.mark.parametrize("name", _blobs_all)
+def test_blobs_all_importable(name: str) -> None:
+    """Tests that all names listed in blobs __all__ are importable."""
+    mod = importlib.import_module("llm_agents_from_scratch.blobs")
+    attr = getattr(mod, name)
+
+    assert hasattr(mod, name)
+    assert attr is not None
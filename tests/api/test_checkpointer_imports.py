@@ -0,0 +1,15 @@
+import importlib
+
+import pytest
+
+from llm_agents_from_scratch.checkpointers import __all__ as _checkpointers_all
+
+
+@pytest.mark.parametrize("name", _checkpointers_all)
+def test_checkpointers_all_importable(name: str) -> None:
+    """Tests that all names listed in checkpointers __all__ are importable."""
+    mod = importlib.import_module("llm_agents_from_scratch.checkpointers")
+    attr = getattr(mod, name)
+
+    assert hasattr(mod, name)
+    assert attr is not None
@@ -0,0 +1,15 @@
+import importlib
+
+import pytest
+
+from llm_agents_from_scratch.compactors import __all__ as _compactors_all
+
+
+@pytest.mark.parametrize("name", _compactors_all)
+def test_compactors_all_importable(name: str) -> None:
+    """Tests that all names listed in compactors __all__ are importable."""
+    mod = importlib.import_module("llm_agents_from_scratch.compactors")
+    attr = getattr(mod, name)
+
+    assert hasattr(mod, name)
+    assert attr is not None
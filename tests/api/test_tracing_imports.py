@@ -0,0 +1,15 @@
+import importlib
+
+import pytest
+
+from llm_agents_from_scratch.tracing import __all__ as _tracing_all
+
+
+@pytest.mark.parametrize("name", _tracing_all)
+def test_tracing_all_importable(name: str) -> None:
+    """Tests that all names listed in tracing __all__ are importable."""
+    mod = importlib.import_module("llm_agents_from_scratch.tracing")
+    attr = getattr(mod, name)
+
+    assert hasattr(mod, name)
+    assert attr is not None
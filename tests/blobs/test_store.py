@@ -0,0 +1,84 @@
+"""Unit tests for BlobStore."""
+
+from pathlib import Path
+
+import pytest
+
+from llm_agents_from_scratch.blobs import BlobStore
+from llm_agents_from_scratch.blobs.constants import BLOB_CHECKPOINT_CHARS
+from llm_agents_from_scratch.errors import BlobNotFoundError
+
+
+def test_put_and_read_whole_blob(tmp_path: Path) -> None:
+    """Tests a stored blob reads back unchanged."""
+    store = BlobStore(tmp_path)
+
+    handle = store.put("hello world")
+
+    assert store.read(handle) == "hello world"
+    assert store.size(handle) == len("hello world")
+    assert store.handles == [handle]
+
+
+@pytest.mark.parametrize(
+    ("offset", "length"),
+    [
+        (0, 10),
+        (BLOB_CHECKPOINT_CHARS - 3, 7),
+        (BLOB_CHECKPOINT_CHARS * 2 + 5, BLOB_CHECKPOINT_CHARS),
+        (1, None),
+    ],
+)
+def test_read_range_across_checkpoints(
+    tmp_path: Path,
+    offset: int,
+    length: int | None,
+) -> None:
+    """Tests ranges of multi-byte text read back by character."""
+    text = "".join(f"{i}é✓" for i in range(5000))
+    store = BlobStore(tmp_path)
+    handle = store.put(text)
+
+    end = None if length is None else offset + length
+    assert store.read(handle, offset, length) == text[offset:end]
+
+
+def test_read_past_end_is_empty(tmp_path: Path) -> None:
+    """Tests reading past the end of a blob returns nothing."""
+    store = BlobStore(tmp_path)
+    handle = store.put("abc")
+
+    assert store.read(handle, offset=10) == ""
+    assert store.read(handle, offset=1, length=100) == "bc"
+
+
+def test_unknown_handle_raises(tmp_path: Path) -> None:
+    """Tests unknown handles raise BlobNotFoundError."""
+    store = BlobStore(tmp_path)
+
+    with pytest.raises(BlobNotFoundError, match="blob-missing"):
+        store.read("blob-missing")
+
+
+def test_close_removes_temporary_directory() -> None:
+    """Tests close() removes the directory the store created."""
+    store = BlobStore()
+    store.put("abc")
+    path = store.path
+    assert path.exists()
+
+    store.close()
+
+    assert not path.exists()
+    assert store.handles == []
+
+
+def test_close_keeps_given_directory(tmp_path: Path) -> None:
+    """Tests close() only deletes blobs from a caller's directory."""
+    (tmp_path / "keep.txt").write_text("mine")
+    store = BlobStore(tmp_path)
+    store.put("abc")
+
+    store.close()
+
+    assert [p.name for p in tmp_path.iterdir()] == ["keep.txt"]
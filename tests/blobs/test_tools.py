@@ -0,0 +1,57 @@
+"""Unit tests for ReadBlobTool."""
+
+import json
+from pathlib import Path
+
+from llm_agents_from_scratch.blobs import BlobStore, ReadBlobTool
+from llm_agents_from_scratch.data_structures import ToolCall
+
+TOOL_NAME = "from_scratch__read_blob"
+
+
+def _call(tool: ReadBlobTool, **arguments: object) -> ToolCall:
+    return ToolCall(tool_name=TOOL_NAME, arguments=arguments)
+
+
+def test_read_blob_tool_schema() -> None:
+    """Tests the schema caps length at max_chars."""
+    tool = ReadBlobTool(blob_store=BlobStore(), max_chars=100)
+
+    schema = tool.parameters_json_schema
+
+    assert tool.name == TOOL_NAME
+    assert schema["required"] == ["handle"]
+    assert schema["properties"]["length"]["maximum"] == 100  # noqa: PLR2004
+
+
+def test_read_blob_tool_pages(tmp_path: Path) -> None:
+    """Tests a page of the blob is returned with its range."""
+    store = BlobStore(tmp_path)
+    handle = store.put("0123456789")
+    tool = ReadBlobTool(blob_store=store, max_chars=4)
+
+    result = tool(tool_call=_call(tool, handle=handle, offset=3, length=50))
+
+    assert result.error is False
+    assert result.content.startswith("3456\n")
+    assert "characters 3-7 of 10" in result.content
+
+
+def test_read_blob_tool_unknown_handle(tmp_path: Path) -> None:
+    """Tests an unknown handle yields an error result."""
+    tool = ReadBlobTool(blob_store=BlobStore(tmp_path), max_chars=4)
+
+    result = tool(tool_call=_call(tool, handle="blob-nope"))
+
+    assert result.error is True
+    assert json.loads(result.content)["error_type"] == "BlobNotFoundError"
+
+
+def test_read_blob_tool_invalid_arguments(tmp_path: Path) -> None:
+    """Tests non-integer offsets yield an error result."""
+    tool = ReadBlobTool(blob_store=BlobStore(tmp_path), max_chars=4)
+
+    result = tool(tool_call=_call(tool, handle="blob-x", offset="3"))
+
+    assert result.error is True
+    assert json.loads(result.content)["error_type"] == "ValueError"
@@ -0,0 +1,23 @@
+import pytest
+
+from llm_agents_from_scratch.data_structures import (
+    ChatMessage,
+    ChatRole,
+    Rollout,
+    Task,
+    TaskCheckpoint,
+    TaskStepResult,
+)
+
+
+@pytest.fixture()
+def checkpoint() -> TaskCheckpoint:
+    rollout = Rollout()
+    rollout.append([ChatMessage(role=ChatRole.ASSISTANT, content="step 1")])
+    return TaskCheckpoint(
+        task=Task(id_="task-1", instruction="do it"),
+        step_counter=1,
+        rollout=rollout,
+        last_step_result=TaskStepResult(task_step_id="s1", content="ok"),
+        recalled_memories="remembered",
+    )
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+
+from llm_agents_from_scratch.checkpointers import FileCheckpointer
+from llm_agents_from_scratch.data_structures import TaskCheckpoint
+from llm_agents_from_scratch.errors import CheckpointError
+
+
+@pytest.mark.asyncio
+async def test_save_and_load_round_trip(
+    tmp_path: Path,
+    checkpoint: TaskCheckpoint,
+) -> None:
+    """Tests a saved checkpoint loads back unchanged."""
+    checkpointer = FileCheckpointer(tmp_path / "checkpoints")
+
+    await checkpointer.save(checkpoint)
+
+    assert (tmp_path / "checkpoints" / "task-1.json").exists()
+    assert await checkpointer.load("task-1") == checkpoint
+    assert await checkpointer.list_task_ids() == ["task-1"]
+
+
+@pytest.mark.asyncio
+async def test_save_replaces_previous_checkpoint(
+    tmp_path: Path,
+    checkpoint: TaskCheckpoint,
+) -> None:
+    """Tests saving again overwrites the task's checkpoint."""
+    checkpointer = FileCheckpointer(tmp_path)
+    await checkpointer.save(checkpoint)
+
+    await checkpointer.save(checkpoint.model_copy(update={"step_counter": 2}))
+
+    loaded = await checkpointer.load("task-1")
+    assert loaded is not None
+    assert loaded.step_counter == 2  # noqa: PLR2004
+    assert [p.name for p in tmp_path.iterdir()] == ["task-1.json"]
+
+
+@pytest.mark.asyncio
+async def test_load_and_delete_missing(tmp_path: Path) -> None:
+    """Tests missing checkpoints load as None and delete as a no-op."""
+    checkpointer = FileCheckpointer(tmp_path / "missing")
+
+    assert await checkpointer.load("nope") is None
+    await checkpointer.delete("nope")
+    assert await checkpointer.list_task_ids() == []
+
+
+@pytest.mark.asyncio
+async def test_delete(tmp_path: Path, checkpoint: TaskCheckpoint) -> None:
+    """Tests deleting removes the checkpoint file."""
+    checkpointer = FileCheckpointer(tmp_path)
+    await checkpointer.save(checkpoint)
+
+    await checkpointer.delete("task-1")
+
+    assert await checkpointer.load("task-1") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("task_id", ["", "../escape", ".hidden"])
+async def test_invalid_task_id_raises(tmp_path: Path, task_id: str) -> None:
+    """Tests task IDs that are unsafe as file names are rejected."""
+    checkpointer = FileCheckpointer(tmp_path)
+
+    with pytest.raises(CheckpointError):
+        await checkpointer.load(task_id)
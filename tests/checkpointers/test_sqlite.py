@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pytest
+
+from llm_agents_from_scratch.checkpointers import SQLiteCheckpointer
+from llm_agents_from_scratch.data_structures import TaskCheckpoint
+
+
+@pytest.mark.asyncio
+async def test_save_and_load_round_trip(
+    tmp_path: Path,
+    checkpoint: TaskCheckpoint,
+) -> None:
+    """Tests a saved checkpoint loads back unchanged."""
+    checkpointer = SQLiteCheckpointer(tmp_path / "db" / "checkpoints.db")
+
+    await checkpointer.save(checkpoint)
+
+    assert await checkpointer.load("task-1") == checkpoint
+    assert await checkpointer.list_task_ids() == ["task-1"]
+
+
+@pytest.mark.asyncio
+async def test_save_upserts(
+    tmp_path: Path,
+    checkpoint: TaskCheckpoint,
+) -> None:
+    """Tests saving again replaces the task's row."""
+    checkpointer = SQLiteCheckpointer(tmp_path / "checkpoints.db")
+    await checkpointer.save(checkpoint)
+
+    await checkpointer.save(checkpoint.model_copy(update={"step_counter": 2}))
+
+    loaded = await SQLiteCheckpointer(tmp_path / "checkpoints.db").load(
+        "task-1",
+    )
+    assert loaded is not None
+    assert loaded.step_counter == 2  # noqa: PLR2004
+    assert await checkpointer.list_task_ids() == ["task-1"]
+
+
+@pytest.mark.asyncio
+async def test_delete(tmp_path: Path, checkpoint: TaskCheckpoint) -> None:
+    """Tests deleting removes the checkpoint and tolerates missing ones."""
+    checkpointer = SQLiteCheckpointer(tmp_path / "checkpoints.db")
+    await checkpointer.save(checkpoint)
+
+    await checkpointer.delete("task-1")
+    await checkpointer.delete("task-1")
+
+    assert await checkpointer.load("task-1") is None
+    assert await checkpointer.list_task_ids() == []
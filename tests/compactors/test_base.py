@@ -0,0 +1,119 @@
+from typing import Sequence
+
+import pytest
+
+from llm_agents_from_scratch.base.compactor import (
+    BaseRolloutCompactor,
+    StepFormatter,
+)
+from llm_agents_from_scratch.data_structures import (
+    ChatMessage,
+    ChatRole,
+    Rollout,
+)
+
+
+class DropAllCompactor(BaseRolloutCompactor):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls: list[tuple[int, int]] = []
+
+    async def _compact_older_steps(
+        self,
+        steps: Sequence[list[ChatMessage]],
+        rendered: Sequence[str],
+        format_step: StepFormatter,
+        budget: int,
+    ) -> str:
+        self.calls.append((len(steps), budget))
+        return ""
+
+
+def _format(chat_history: Sequence[ChatMessage]) -> str:
+    return "|".join(m.content for m in chat_history)
+
+
+def _steps(n: int, size: int = 40) -> list[list[ChatMessage]]:
+    return [
+        [ChatMessage(role=ChatRole.ASSISTANT, content=f"{i}" * size)]
+        for i in range(n)
+    ]
+
+
+def _rollout(steps: Sequence[list[ChatMessage]]) -> Rollout:
+    rollout = Rollout()
+    for step in steps:
+        rollout.append(step)
+    return rollout
+
+
+@pytest.mark.asyncio
+async def test_compact_within_budget_is_verbatim() -> None:
+    compactor = DropAllCompactor(max_tokens=1000, keep_last_steps=1)
+    steps = _steps(3)
+
+    rollout, report = await compactor.compact(_rollout(steps), _format)
+
+    assert rollout == "\n\n".join(_format(s) for s in steps)
+    assert report.compacted_steps == 0
+    assert report.verbatim_steps == 3  # noqa: PLR2004
+    assert report.tokens_saved == 0
+    assert compactor.calls == []
+
+
+@pytest.mark.asyncio
+async def test_compact_over_budget_keeps_last_steps_verbatim() -> None:
+    compactor = DropAllCompactor(max_tokens=25, keep_last_steps=2)
+    steps = _steps(5)
+
+    rollout, report = await compactor.compact(_rollout(steps), _format)
+
+    assert rollout == "\n\n".join(_format(s) for s in steps[3:])
+    assert compactor.calls == [(3, 4)]
+    assert report.step == 5  # noqa: PLR2004
+    assert report.verbatim_steps == 2  # noqa: PLR2004
+    assert report.compacted_steps == 3  # noqa: PLR2004
+    assert report.tokens_saved > 0
+
+
+@pytest.mark.asyncio
+async def test_compact_never_touches_verbatim_window() -> None:
+    compactor = DropAllCompactor(max_tokens=1, keep_last_steps=3)
+    steps = _steps(2)
+
+    rollout, report = await compactor.compact(_rollout(steps), _format)
+
+    assert rollout == "\n\n".join(_format(s) for s in steps)
+    assert report.compacted_steps == 0
+    assert compactor.calls == []
+
+
+@pytest.mark.asyncio
+async def test_compact_uses_custom_token_counter() -> None:
+    compactor = DropAllCompactor(
+        max_tokens=2,
+        keep_last_steps=1,
+        token_counter=lambda text: text.count("|") + 1,
+    )
+    steps = [
+        [
+            ChatMessage(role=ChatRole.USER, content="a"),
+            ChatMessage(role=ChatRole.ASSISTANT, content="b"),
+        ],
+    ] * 2
+
+    _, report = await compactor.compact(_rollout(steps), _format)
+
+    assert report.original_tokens == 3  # noqa: PLR2004
+    assert report.compacted_tokens == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_compact_keeps_rollout_prefix() -> None:
+    compactor = DropAllCompactor(max_tokens=25, keep_last_steps=1)
+    rollout = _rollout(_steps(3))
+    rollout.prefix = "seed"
+
+    text, _ = await compactor.compact(rollout, _format)
+
+    assert text == "seed\n\n" + _format(rollout.steps[-1].messages)
@@ -0,0 +1,86 @@
+from typing import Sequence
+
+import pytest
+
+from llm_agents_from_scratch.compactors import ElidingRolloutCompactor
+from llm_agents_from_scratch.data_structures import (
+    ChatMessage,
+    ChatRole,
+    Rollout,
+    ToolCall,
+)
+
+
+def _tool_step(i: int) -> list[ChatMessage]:
+    return [
+        ChatMessage(role=ChatRole.USER, content=f"instruction {i}"),
+        ChatMessage(
+            role=ChatRole.ASSISTANT,
+            content="",
+            tool_calls=[
+                ToolCall(tool_name="search", arguments={"q": "x" * 50}),
+            ],
+        ),
+        ChatMessage(role=ChatRole.TOOL, content="payload " * 100),
+        ChatMessage(role=ChatRole.ASSISTANT, content=f"decision {i}"),
+    ]
+
+
+def format_step(chat_history: Sequence[ChatMessage]) -> str:
+    lines = []
+    for msg in chat_history:
+        content = msg.content
+        if msg.tool_calls:
+            content = "\n".join(t.model_dump_json() for t in msg.tool_calls)
+        lines.append(f"{msg.role.value}: {content}")
+    return "\n".join(lines)
+
+
+def _rollout(steps: Sequence[list[ChatMessage]]) -> Rollout:
+    rollout = Rollout()
+    for step in steps:
+        rollout.append(step)
+    return rollout
+
+
+@pytest.mark.asyncio
+async def test_eliding_drops_tool_payloads_keeps_decisions() -> None:
+    compactor = ElidingRolloutCompactor(max_tokens=700, keep_last_steps=1)
+    steps = [_tool_step(i) for i in range(3)]
+
+    rollout, report = await compactor.compact(_rollout(steps), format_step)
+
+    assert "decision 0" in rollout
+    assert "instruction 0" in rollout
+    assert "Called tools: search" in rollout
+    assert "[tool result elided: ~200 tokens]" in rollout
+    # last step is verbatim
+    assert rollout.endswith(format_step(steps[-1]))
+    assert rollout.count("payload") == 100  # noqa: PLR2004
+    assert report.compacted_steps == 2  # noqa: PLR2004
+    assert report.tokens_saved > 0
+    assert report.compacted_tokens <= 700  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_eliding_drops_oldest_steps_when_still_over_budget() -> None:
+    compactor = ElidingRolloutCompactor(max_tokens=320, keep_last_steps=1)
+    steps = [_tool_step(i) for i in range(5)]
+
+    rollout, report = await compactor.compact(_rollout(steps), format_step)
+
+    assert "earlier step(s) omitted to fit budget" in rollout
+    assert "decision 0" not in rollout
+    assert "decision 4" in rollout
+    assert report.compacted_steps == 4  # noqa: PLR2004
+    assert report.compacted_tokens <= 320  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_eliding_returns_only_recent_steps_when_no_budget_left() -> None:
+    compactor = ElidingRolloutCompactor(max_tokens=10, keep_last_steps=1)
+    steps: Sequence[list[ChatMessage]] = [_tool_step(i) for i in range(2)]
+
+    rollout, _ = await compactor.compact(_rollout(steps), format_step)
+
+    assert rollout == format_step(steps[-1])
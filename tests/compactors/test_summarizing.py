@@ -0,0 +1,123 @@
+from typing import Sequence
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llm_agents_from_scratch.compactors import SummarizingRolloutCompactor
+from llm_agents_from_scratch.data_structures import (
+    ChatMessage,
+    ChatRole,
+    CompleteResult,
+    Rollout,
+)
+
+
+def _format(chat_history: Sequence[ChatMessage]) -> str:
+    return "\n".join(m.content for m in chat_history)
+
+
+def _steps(n: int) -> list[list[ChatMessage]]:
+    return [
+        [ChatMessage(role=ChatRole.ASSISTANT, content=f"step {i} " * 20)]
+        for i in range(n)
+    ]
+
+
+def _mock_llm(*summaries: str) -> MagicMock:
+    llm = MagicMock()
+    llm.complete = AsyncMock(
+        side_effect=[
+            CompleteResult(response=s, prompt="mock prompt") for s in summaries
+        ],
+    )
+    return llm
+
+
+def _rollout(steps: Sequence[list[ChatMessage]]) -> Rollout:
+    rollout = Rollout()
+    for step in steps:
+        rollout.append(step)
+    return rollout
+
+
+@pytest.mark.asyncio
+async def test_summarizing_replaces_older_steps_with_summary() -> None:
+    llm = _mock_llm("summary of steps 0-1")
+    compactor = SummarizingRolloutCompactor(
+        llm=llm,
+        max_tokens=80,
+        keep_last_steps=1,
+    )
+    steps = _steps(3)
+
+    rollout, report = await compactor.compact(_rollout(steps), _format)
+
+    assert "=== Summary of 2 earlier step(s) ===" in rollout
+    assert "summary of steps 0-1" in rollout
+    assert "step 0" not in rollout
+    assert rollout.endswith(_format(steps[-1]))
+    assert report.compacted_steps == 2  # noqa: PLR2004
+    prompt = llm.complete.call_args.args[0]
+    assert "step 0" in prompt
+    assert "step 1" in prompt
+    assert "step 2" not in prompt
+
+
+@pytest.mark.asyncio
+async def test_summarizing_is_incremental_and_cached() -> None:
+    llm = _mock_llm("summary A", "summary B")
+    compactor = SummarizingRolloutCompactor(
+        llm=llm,
+        max_tokens=80,
+        keep_last_steps=1,
+    )
+    steps = _steps(4)
+
+    await compactor.compact(_rollout(steps[:3]), _format)
+    # same prefix again: served from cache
+    await compactor.compact(_rollout(steps[:3]), _format)
+    assert llm.complete.await_count == 1
+
+    # one more step slides out: only previous summary + new step sent
+    rollout, _ = await compactor.compact(_rollout(steps), _format)
+    assert llm.complete.await_count == 2  # noqa: PLR2004
+    prompt = llm.complete.call_args.args[0]
+    assert "summary A" in prompt
+    assert "step 2" in prompt
+    assert "step 0" not in prompt
+    assert "summary B" in rollout
+
+
+@pytest.mark.asyncio
+async def test_summarizing_evicts_least_recently_used() -> None:
+    llm = _mock_llm("a", "b", "c")
+    compactor = SummarizingRolloutCompactor(
+        llm=llm,
+        max_tokens=50,
+        keep_last_steps=1,
+        max_cache_size=1,
+    )
+    steps = _steps(3)
+
+    await compactor.compact(_rollout(steps[:2]), _format)
+    await compactor.compact(_rollout([steps[1], steps[2]]), _format)
+    await compactor.compact(_rollout(steps[:2]), _format)
+
+    assert llm.complete.await_count == 3  # noqa: PLR2004
+    assert len(compactor._cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_summarizing_skips_llm_when_no_budget_left() -> None:
+    llm = _mock_llm()
+    compactor = SummarizingRolloutCompactor(
+        llm=llm,
+        max_tokens=10,
+        keep_last_steps=1,
+    )
+    steps = _steps(2)
+
+    rollout, _ = await compactor.compact(_rollout(steps), _format)
+
+    assert rollout == _format(steps[-1])
+    llm.complete.assert_not_awaited()
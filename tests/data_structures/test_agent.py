@@ -1,7 +1,17 @@
 from unittest.mock import MagicMock, patch
 
+import pytest
+from pydantic import ValidationError
+
 from llm_agents_from_scratch.data_structures import Task, TaskStep
-from llm_agents_from_scratch.data_structures.agent import ApprovalResult
+from llm_agents_from_scratch.data_structures.agent import (
+    ApprovalResult,
+    BatchRunResult,
+    BatchTaskResult,
+    PlannedStep,
+    TaskPlan,
+    TaskResult,
+)
 
 
 @patch("llm_agents_from_scratch.data_structures.agent.uuid")
@@ -39,3 +49,63 @@ def test_approval_result_str_rejected() -> None:
     """Tests ApprovalResult.__str__ when rejected includes feedback."""
     result = ApprovalResult(approved=False, feedback="fix the math")
     assert str(result) == "rejected: fix the math"
+
+
+def test_batch_run_result_aggregates() -> None:
+    """Test BatchRunResult counts, throughput and string representation."""
+    task = Task(instruction="a fake instruction")
+    batch = BatchRunResult(
+        items=[
+            BatchTaskResult(
+                index=0,
+                task=task,
+                result=TaskResult(task_id=task.id_, content="done"),
+            ),
+            BatchTaskResult(index=1, task=task, error="boom"),
+        ],
+        concurrency=2,
+        wall_time=0.5,
+    )
+
+    assert batch.num_tasks == 2  # noqa: PLR2004
+    assert batch.num_failed == 1
+    assert batch.results[1] is None
+    assert batch.throughput == 4.0  # noqa: PLR2004
+    assert str(batch) == (
+        "2 task(s), 1 failed, concurrency 2, 0.50s wall (4.00 tasks/s)"
+    )
+
+
+def test_task_plan_topological_order() -> None:
+    """Tests steps come after their dependencies, ties in plan order."""
+    plan = TaskPlan(
+        steps=[
+            PlannedStep(id="c", instruction="c", depends_on=["a", "b"]),
+            PlannedStep(id="a", instruction="a"),
+            PlannedStep(id="b", instruction="b"),
+            PlannedStep(id="d", instruction="d", depends_on=["a"]),
+        ],
+    )
+
+    assert [s.id for s in plan.topological_order()] == ["a", "b", "c", "d"]
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        [],
+        [
+            PlannedStep(id="a", instruction="a"),
+            PlannedStep(id="a", instruction="again"),
+        ],
+        [PlannedStep(id="a", instruction="a", depends_on=["missing"])],
+        [
+            PlannedStep(id="a", instruction="a", depends_on=["b"]),
+            PlannedStep(id="b", instruction="b", depends_on=["a"]),
+        ],
+    ],
+)
+def test_task_plan_rejects_invalid_graphs(steps: list[PlannedStep]) -> None:
+    """Tests empty plans, duplicate IDs, unknown deps and cycles fail."""
+    with pytest.raises(ValidationError):
+        TaskPlan(steps=steps)
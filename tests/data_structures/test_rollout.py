@@ -0,0 +1,80 @@
+from unittest.mock import MagicMock
+
+from llm_agents_from_scratch.data_structures import (
+    ChatMessage,
+    ChatRole,
+    Rollout,
+)
+
+
+def _step(content: str) -> list[ChatMessage]:
+    return [ChatMessage(role=ChatRole.ASSISTANT, content=content)]
+
+
+def _formatter() -> MagicMock:
+    return MagicMock(side_effect=lambda messages: messages[0].content.upper())
+
+
+def test_rollout_append_does_not_render() -> None:
+    """Tests that appending a step does not format it."""
+    format_step = _formatter()
+    rollout = Rollout()
+
+    rollout.append(_step("a"))
+
+    format_step.assert_not_called()
+    assert rollout.steps[0].messages == _step("a")
+
+
+def test_rollout_render_is_incremental() -> None:
+    """Tests that each step is formatted once across renders."""
+    format_step = _formatter()
+    rollout = Rollout()
+    rollout.append(_step("a"))
+    rollout.append(_step("b"))
+
+    assert rollout.render(format_step) == "A\n\nB"
+    rollout.append(_step("c"))
+    assert rollout.render(format_step) == "A\n\nB\n\nC"
+    assert rollout.render(format_step) == "A\n\nB\n\nC"
+
+    assert format_step.call_count == 3  # noqa: PLR2004
+
+
+def test_rollout_render_with_prefix() -> None:
+    """Tests that the prefix precedes all steps."""
+    rollout = Rollout(prefix="earlier progress")
+
+    assert rollout.render(_formatter()) == "earlier progress"
+    rollout.append(_step("a"))
+    assert rollout.render(_formatter()) == "earlier progress\n\nA"
+
+
+def test_rollout_render_empty() -> None:
+    """Tests rendering a rollout with no prefix and no steps."""
+    assert Rollout().render(_formatter()) == ""
+
+
+def test_rollout_new_formatter_resets_cache() -> None:
+    """Tests that an alternative format re-renders every step."""
+    rollout = Rollout()
+    rollout.append(_step("a"))
+    rollout.render(_formatter())
+
+    def lower(messages: list[ChatMessage]) -> str:
+        return messages[0].content.lower()
+
+    assert rollout.render(lower) == "a"
+    assert rollout.rendered_steps(lower) == ["a"]
+
+
+def test_rollout_serialization_excludes_render_cache() -> None:
+    """Tests that a rollout round-trips through JSON without its cache."""
+    rollout = Rollout(prefix="p")
+    rollout.append(_step("a"))
+    rollout.render(_formatter())
+
+    restored = Rollout.model_validate_json(rollout.model_dump_json())
+
+    assert restored == Rollout(prefix="p", steps=rollout.steps)
+    assert restored.render(_formatter()) == "p\n\nA"
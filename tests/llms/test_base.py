@@ -1,4 +1,10 @@
-from llm_agents_from_scratch.base.llm import BaseLLM
+from typing import Any
+
+import pytest
+
+from llm_agents_from_scratch.base.llm import BaseLLM, WrappedLLM
+from llm_agents_from_scratch.data_structures import ChatMessage
+from llm_agents_from_scratch.llms import ScriptedLLM
 
 
 def test_base_abstract_attr() -> None:
@@ -9,3 +15,53 @@ def test_base_abstract_attr() -> None:
     assert "chat" in abstract_methods
     assert "structured_output" in abstract_methods
     assert "continue_chat_with_tool_results" in abstract_methods
+
+
+def test_base_prompt_cache_kwargs_default_empty(mock_llm: BaseLLM) -> None:
+    """Tests that providers need no cache kwargs by default."""
+    assert mock_llm.prompt_cache_kwargs("some-key") == {}
+
+
+@pytest.mark.asyncio
+async def test_wrapped_llm_routes_calls_through_invoke(
+    mock_llm: BaseLLM,
+) -> None:
+    """Tests that WrappedLLM routes every method through _invoke."""
+
+    class RecordingLLM(WrappedLLM):
+        def __init__(self, llm: BaseLLM) -> None:
+            super().__init__(llm)
+            self.methods: list[str] = []
+
+        async def _invoke(self, method: str, **kwargs: Any) -> Any:
+            self.methods.append(method)
+            return await self._call_wrapped(method, **kwargs)
+
+    llm = RecordingLLM(mock_llm)
+    _, response = await llm.chat("hi", chat_history=[])
+    await llm.continue_chat_with_tool_results([], chat_history=[])
+
+    assert response.content == "mock chat response"
+    assert llm.methods == ["chat", "continue_chat_with_tool_results"]
+    assert llm.prompt_cache_kwargs("some-key") == {}
+
+
+@pytest.mark.asyncio
+async def test_base_stream_chat_falls_back_to_chat(mock_llm: BaseLLM) -> None:
+    """Tests the default stream_chat yields chat's response once."""
+    chunks = [c async for c in mock_llm.stream_chat("hi", chat_history=[])]
+
+    assert len(chunks) == 1
+    assert chunks[0].delta == "mock chat response"
+    assert chunks[0].message == ChatMessage(
+        role="assistant",
+        content="mock chat response",
+    )
+
+
+@pytest.mark.asyncio
+async def test_base_stream_complete_falls_back_to_complete() -> None:
+    """Tests the default stream_complete yields the whole completion."""
+    llm = ScriptedLLM(final_answer="all of it")
+
+    assert [d async for d in llm.stream_complete("hi")] == ["all of it"]
@@ -0,0 +1,266 @@
+import json
+from pathlib import Path
+from typing import Any, Sequence
+
+import pytest
+from pydantic import BaseModel
+
+from llm_agents_from_scratch.base.llm import BaseLLM, StructuredOutputType
+from llm_agents_from_scratch.base.tool import BaseTool, Tool
+from llm_agents_from_scratch.data_structures import (
+    CassetteMatch,
+    CassetteMode,
+    ChatMessage,
+    ChatRole,
+    CompleteResult,
+    ToolCall,
+    ToolCallResult,
+)
+from llm_agents_from_scratch.errors import CassetteError, CassetteMissError
+from llm_agents_from_scratch.llms import CassetteLLM
+from llm_agents_from_scratch.llms.cassette.utils import (
+    canonicalize,
+    request_key,
+)
+from llm_agents_from_scratch.tools import AsyncSimpleFunctionTool
+
+
+class Answer(BaseModel):
+    value: int = 0
+
+
+class CountingLLM(BaseLLM):
+    """Answers every call with a numbered response."""
+
+    def __init__(self, model: str = "counting") -> None:
+        self.model = model
+        self.calls = 0
+
+    async def complete(self, prompt: str, **kwargs: Any) -> CompleteResult:
+        self.calls += 1
+        return CompleteResult(response=f"response {self.calls}", prompt=prompt)
+
+    async def structured_output(
+        self,
+        prompt: str,
+        mdl: type[StructuredOutputType],
+        **kwargs: Any,
+    ) -> StructuredOutputType:
+        self.calls += 1
+        return mdl.model_validate({"value": self.calls})
+
+    async def chat(
+        self,
+        input: str,
+        chat_history: Sequence[ChatMessage] | None = None,
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> tuple[ChatMessage, ChatMessage]:
+        self.calls += 1
+        return (
+            ChatMessage(role=ChatRole.USER, content=input),
+            ChatMessage(
+                role=ChatRole.ASSISTANT,
+                content=f"chat {self.calls}",
+                tool_calls=[ToolCall(tool_name="add", arguments={"x": 1})],
+            ),
+        )
+
+    async def continue_chat_with_tool_results(
+        self,
+        tool_call_results: Sequence[ToolCallResult],
+        chat_history: Sequence[ChatMessage],
+        tools: Sequence[Tool] | None = None,
+        **kwargs: Any,
+    ) -> tuple[list[ChatMessage], ChatMessage]:
+        self.calls += 1
+        return (
+            [ChatMessage.from_tool_call_result(r) for r in tool_call_results],
+            ChatMessage(role=ChatRole.ASSISTANT, content=f"done {self.calls}"),
+        )
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay_offline(tmp_path: Path) -> None:
+    """Tests that recorded calls replay without calling the LLM."""
+    path = tmp_path / "cassette.jsonl"
+    inner = CountingLLM()
+    recorder = CassetteLLM(inner, path, mode=CassetteMode.RECORD)
+
+    complete = await recorder.complete("hi")
+    answer = await recorder.structured_output("num?", mdl=Answer)
+    user_msg, chat_msg = await recorder.chat("go", chat_history=[])
+    assert chat_msg.tool_calls
+    tool_call_id = chat_msg.tool_calls[0].id_
+    results = [ToolCallResult(tool_call_id=tool_call_id, content=2)]
+    tool_msgs, final = await recorder.continue_chat_with_tool_results(
+        results,
+        chat_history=[user_msg, chat_msg],
+    )
+    assert inner.calls == 4  # noqa: PLR2004
+    assert len(path.read_text().splitlines()) == 4  # noqa: PLR2004
+
+    offline = CountingLLM()
+    player = CassetteLLM(offline, path, mode=CassetteMode.REPLAY)
+
+    assert await player.complete("hi") == complete
+    assert await player.structured_output("num?", mdl=Answer) == answer
+    assert await player.chat("go", chat_history=[]) == (user_msg, chat_msg)
+    assert await player.continue_chat_with_tool_results(
+        results,
+        chat_history=[user_msg, chat_msg],
+    ) == (tool_msgs, final)
+    assert offline.calls == 0
+    assert player.hits == 4  # noqa: PLR2004
+    assert player.misses == 0
+
+
+@pytest.mark.asyncio
+async def test_replay_strict_miss_raises(tmp_path: Path) -> None:
+    """Tests that an unrecorded request raises in replay mode."""
+    path = tmp_path / "cassette.jsonl"
+    await CassetteLLM(CountingLLM(), path, mode="record").complete("hi")
+
+    player = CassetteLLM(CountingLLM(), path, mode=CassetteMode.REPLAY)
+    with pytest.raises(CassetteMissError):
+        await player.complete("hello")
+
+
+@pytest.mark.asyncio
+async def test_replay_missing_cassette_raises(tmp_path: Path) -> None:
+    """Tests that replaying a missing cassette raises."""
+    player = CassetteLLM(CountingLLM(), tmp_path / "nope.jsonl", mode="replay")
+    with pytest.raises(CassetteError, match="Cassette not found"):
+        await player.complete("hi")
+
+
+@pytest.mark.asyncio
+async def test_replay_fuzzy_falls_back_to_method_order(tmp_path: Path) -> None:
+    """Tests that fuzzy matching replays unused recordings in order."""
+    path = tmp_path / "cassette.jsonl"
+    recorder = CassetteLLM(CountingLLM(), path, mode=CassetteMode.RECORD)
+    await recorder.complete("at 10:00")
+    await recorder.complete("at 10:01")
+
+    player = CassetteLLM(
+        CountingLLM(),
+        path,
+        mode=CassetteMode.REPLAY,
+        match=CassetteMatch.FUZZY,
+    )
+    first = await player.complete("at 11:00")
+    second = await player.complete("at 11:01")
+
+    assert first.response == "response 1"
+    assert second.response == "response 2"
+    with pytest.raises(CassetteMissError):
+        await player.complete("at 11:02")
+
+
+@pytest.mark.asyncio
+async def test_repeated_requests_replay_in_order(tmp_path: Path) -> None:
+    """Tests that identical requests replay in recorded order."""
+    path = tmp_path / "cassette.jsonl"
+    recorder = CassetteLLM(CountingLLM(), path, mode=CassetteMode.RECORD)
+    await recorder.complete("hi")
+    await recorder.complete("hi")
+
+    player = CassetteLLM(CountingLLM(), path, mode=CassetteMode.REPLAY)
+    responses = [(await player.complete("hi")).response for _ in range(3)]
+
+    assert responses == ["response 1", "response 2", "response 2"]
+
+
+@pytest.mark.asyncio
+async def test_auto_records_only_misses(tmp_path: Path) -> None:
+    """Tests that auto mode replays hits and records misses."""
+    path = tmp_path / "cassette.jsonl"
+    inner = CountingLLM()
+    await CassetteLLM(inner, path).complete("hi")
+
+    llm = CassetteLLM(inner, path, mode=CassetteMode.AUTO)
+    await llm.complete("hi")
+    await llm.complete("new")
+
+    assert inner.calls == 2  # noqa: PLR2004
+    assert (llm.hits, llm.misses) == (1, 1)
+    assert len(path.read_text().splitlines()) == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_record_replaces_cassette(tmp_path: Path) -> None:
+    """Tests that record mode starts a fresh cassette."""
+    path = tmp_path / "cassette.jsonl"
+    path.write_text(json.dumps({"key": "x", "method": "complete"}) + "\n")
+
+    await CassetteLLM(CountingLLM(), path, mode="record").complete("hi")
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["request"]["kwargs"] == {"prompt": "hi"}
+
+
+@pytest.mark.asyncio
+async def test_model_is_part_of_key(tmp_path: Path) -> None:
+    """Tests that recordings of another model are not replayed."""
+    path = tmp_path / "cassette.jsonl"
+    await CassetteLLM(CountingLLM("a"), path, mode="record").complete("hi")
+
+    player = CassetteLLM(CountingLLM("b"), path, mode=CassetteMode.REPLAY)
+    with pytest.raises(CassetteMissError):
+        await player.complete("hi")
+
+
+@pytest.mark.asyncio
+async def test_replay_with_async_tool(tmp_path: Path) -> None:
+    """Tests that async tools key requests by their schema, not identity."""
+
+    async def add(x: int) -> int:
+        """Add one to x."""
+        return x + 1
+
+    path = tmp_path / "cassette.jsonl"
+    recorder = CassetteLLM(CountingLLM(), path, mode=CassetteMode.RECORD)
+    recorded = await recorder.chat(
+        "go",
+        tools=[AsyncSimpleFunctionTool(add)],
+    )
+
+    player = CassetteLLM(CountingLLM(), path, mode=CassetteMode.REPLAY)
+
+    assert (
+        await player.chat("go", tools=[AsyncSimpleFunctionTool(add)])
+        == recorded
+    )
+    assert player.hits == 1
+
+
+def test_request_key_ignores_tool_call_ids() -> None:
+    """Tests that fresh tool call ids don't change the request key."""
+
+    def _key() -> str:
+        message = ChatMessage(
+            role=ChatRole.ASSISTANT,
+            content="",
+            tool_calls=[ToolCall(tool_name="add", arguments={"x": 1})],
+        )
+        return request_key(canonicalize({"chat_history": [message]}))
+
+    assert _key() == _key()
+
+
+def test_canonicalize_tools_and_models(
+    _test_tool: BaseTool,
+) -> None:
+    """Tests canonical forms of tools and structured output models."""
+    canonical = canonicalize({"tools": [_test_tool], "mdl": Answer})
+
+    assert canonical["tools"] == [
+        {
+            "name": _test_tool.name,
+            "description": _test_tool.description,
+            "parameters": _test_tool.parameters_json_schema,
+        },
+    ]
+    assert canonical["mdl"]["model"] == "Answer"
+    assert "properties" in canonical["mdl"]["schema"]
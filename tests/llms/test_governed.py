@@ -0,0 +1,175 @@
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from llm_agents_from_scratch.base.llm import WrappedLLM
+from llm_agents_from_scratch.data_structures import LLMPriority
+from llm_agents_from_scratch.errors import GovernorError
+from llm_agents_from_scratch.llms import (
+    GovernedLLM,
+    LatencyModel,
+    ScriptedLLM,
+    TokenBucket,
+    llm_priority,
+)
+
+
+class TrackingLLM(WrappedLLM):
+    """Records the order and peak concurrency of calls."""
+
+    def __init__(self, latency: float = 0.01) -> None:
+        super().__init__(ScriptedLLM(latency=LatencyModel(mean=latency)))
+        self.prompts: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _invoke(self, method: str, **kwargs: Any) -> Any:
+        self.prompts.append(kwargs["prompt"])
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            return await self._call_wrapped(method, **kwargs)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_max_in_flight_bounds_concurrency() -> None:
+    """Tests no more than max_in_flight calls run at once."""
+    inner = TrackingLLM()
+    llm = GovernedLLM(inner, max_in_flight=2)
+
+    await asyncio.gather(*(llm.complete(f"p{i}") for i in range(6)))
+
+    assert inner.peak == 2  # noqa: PLR2004
+    stats = llm.stats()
+    assert stats.admitted == 6  # noqa: PLR2004
+    assert stats.in_flight == 0
+    assert stats.queue_depth == 0
+    assert stats.peak_queue_depth >= 4  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_waiting_calls_are_admitted_by_priority() -> None:
+    """Tests interactive calls overtake queued default and background ones."""
+    inner = TrackingLLM(latency=0.02)
+    llm = GovernedLLM(inner, max_in_flight=1)
+
+    async def call(prompt: str, priority: LLMPriority) -> None:
+        with llm_priority(priority):
+            await llm.complete(prompt)
+
+    first = asyncio.create_task(call("first", LLMPriority.DEFAULT))
+    await asyncio.sleep(0.005)
+    queued = [
+        asyncio.create_task(call("background", LLMPriority.BACKGROUND)),
+        asyncio.create_task(call("default", LLMPriority.DEFAULT)),
+        asyncio.create_task(call("interactive", LLMPriority.INTERACTIVE)),
+    ]
+    await asyncio.sleep(0.005)
+
+    stats = llm.stats()
+    assert stats.in_flight == 1
+    assert stats.queue_depth == 3  # noqa: PLR2004
+    assert stats.queue_depth_by_priority == {
+        "background": 1,
+        "default": 1,
+        "interactive": 1,
+    }
+
+    await asyncio.gather(first, *queued)
+    assert inner.prompts == ["first", "interactive", "default", "background"]
+
+
+@pytest.mark.asyncio
+async def test_requests_per_second_spaces_out_calls() -> None:
+    """Tests calls beyond the burst wait for the request bucket."""
+    llm = GovernedLLM(TrackingLLM(latency=0), requests_per_second=50, burst=1)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(llm.complete("p") for _ in range(4)))
+
+    # the first call uses the burst, the next three wait 1/50s each
+    assert time.perf_counter() - start >= 0.05  # noqa: PLR2004
+    assert llm.stats().max_wait > 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue() -> None:
+    """Tests a call cancelled while queued frees its place."""
+    inner = TrackingLLM(latency=0.02)
+    llm = GovernedLLM(inner, max_in_flight=1)
+    running = asyncio.create_task(llm.complete("running"))
+    waiting = asyncio.create_task(llm.complete("cancelled"))
+    await asyncio.sleep(0.005)
+
+    waiting.cancel()
+    await asyncio.sleep(0)
+    await running
+    await llm.complete("after")
+
+    assert inner.prompts == ["running", "after"]
+    assert llm.stats().in_flight == 0
+
+
+def test_token_bucket_allows_debt() -> None:
+    """Tests a bucket waits out debt from oversized takes."""
+    bucket = TokenBucket(rate=100, capacity=10)
+
+    assert bucket.delay(5) == 0
+    bucket.take(30)
+
+    assert bucket.tokens < 0
+    # a full bucket is enough for requests larger than the capacity
+    assert bucket.delay(1000) == pytest.approx(0.3, abs=0.01)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_in_flight": 0},
+        {"requests_per_second": 0},
+        {"tokens_per_minute": -1},
+    ],
+)
+def test_invalid_limits_raise(kwargs: dict[str, Any]) -> None:
+    """Tests non-positive limits are rejected."""
+    with pytest.raises(GovernorError):
+        GovernedLLM(ScriptedLLM(), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_tokens_per_minute_charges_input_and_output() -> None:
+    """Tests requests and responses are charged to the token bucket."""
+    llm = GovernedLLM(ScriptedLLM(), tokens_per_minute=600)
+
+    await llm.complete("x" * 400)  # 100 tokens in, "Done." 2 tokens out
+
+    assert llm.tokens is not None
+    assert llm.tokens.tokens == pytest.approx(498, abs=1)
+
+
+@pytest.mark.asyncio
+async def test_stream_chat_is_forwarded_and_holds_its_slot() -> None:
+    """Tests streams come from the wrapped LLM, admitted until they end."""
+    llm = GovernedLLM(
+        ScriptedLLM(["one two three"]),
+        max_in_flight=1,
+        tokens_per_minute=600,
+    )
+
+    chunks = []
+    async for chunk in llm.stream_chat("x" * 40):
+        assert llm.stats().in_flight == 1
+        chunks.append(chunk)
+
+    assert [c.delta for c in chunks] == ["one ", "two ", "three", ""]
+    assert chunks[-1].message
+    assert chunks[-1].message.content == "one two three"
+    assert llm.stats().in_flight == 0
+    assert llm.stats().admitted == 1
+    # 10 tokens in, "one two three" 4 tokens out
+    assert llm.tokens is not None
+    assert llm.tokens.tokens == pytest.approx(586, abs=1)
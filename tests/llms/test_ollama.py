@@ -22,6 +22,7 @@ from llm_agents_from_scratch.llms.ollama.utils import (
     ollama_message_to_chat_message,
     tool_to_ollama_tool,
 )
+from llm_agents_from_scratch.tools import SimpleFunctionTool
 
 
 def test_ollama_llm_class() -> None:
@@ -170,6 +171,31 @@ async def test_structured_output_json_prompt_mode_strips_fences(
     assert new_pet.name == "rex"
 
 
+@pytest.mark.asyncio
+@patch("llm_agents_from_scratch.llms.ollama.llm.AsyncClient")
+async def test_chat_forwards_kwargs(mock_async_client_class: MagicMock) -> None:
+    """Test chat passes extra kwargs, e.g. sampling options, to Ollama."""
+    mock_instance = MagicMock()
+    mock_chat = AsyncMock()
+    mock_chat.return_value = ChatResponse(
+        model="llama3.2",
+        message=OllamaMessage(role="assistant", content="ok"),
+    )
+    mock_instance.chat = mock_chat
+    mock_async_client_class.return_value = mock_instance
+
+    llm = OllamaLLM(model="llama3.2")
+    await llm.chat("hi", options={"temperature": 0})
+
+    mock_chat.assert_awaited_once_with(
+        model="llama3.2",
+        messages=[OllamaMessage(role="user", content="hi")],
+        tools=None,
+        think=False,
+        options={"temperature": 0},
+    )
+
+
 @pytest.mark.asyncio
 @patch("llm_agents_from_scratch.llms.ollama.llm.AsyncClient")
 async def test_chat(mock_async_client_class: MagicMock) -> None:
@@ -459,3 +485,124 @@ def test_tool_to_ollama_tool() -> None:
     assert len(converted_tool.function.parameters.properties) == len(
         my_tool.parameters_json_schema["properties"],
     )
+
+
+def test_tool_to_ollama_tool_is_cached() -> None:
+    """Tests repeated conversion of the same tool reuses the payload."""
+    tool = SimpleFunctionTool(lambda x: x, desc="identity")
+
+    assert tool_to_ollama_tool(tool) is tool_to_ollama_tool(tool)
+
+
+async def _aiter(items: list[Any]) -> Any:
+    for item in items:
+        yield item
+
+
+@pytest.mark.asyncio
+@patch("llm_agents_from_scratch.llms.ollama.llm.AsyncClient")
+async def test_stream_chat(mock_async_client_class: MagicMock) -> None:
+    """Tests stream_chat yields deltas, then the assembled message."""
+    tool_call = OllamaMessage.ToolCall(
+        function=OllamaMessage.ToolCall.Function(
+            name="a_fake_tool",
+            arguments={"arg1": 1},
+        ),
+    )
+    parts = [
+        ChatResponse(
+            model="llama3.2",
+            message=OllamaMessage(role="assistant", content="some "),
+        ),
+        ChatResponse(
+            model="llama3.2",
+            message=OllamaMessage(role="assistant", content="fake content"),
+        ),
+        ChatResponse(
+            model="llama3.2",
+            message=OllamaMessage(
+                role="assistant",
+                content="",
+                tool_calls=[tool_call],
+            ),
+        ),
+    ]
+    mock_instance = MagicMock()
+    mock_instance.chat = AsyncMock(return_value=_aiter(parts))
+    mock_async_client_class.return_value = mock_instance
+    llm = OllamaLLM(model="llama3.2")
+
+    chunks = [c async for c in llm.stream_chat("Some new input.")]
+
+    assert [c.delta for c in chunks[:-1]] == ["some ", "fake content"]
+    message = chunks[-1].message
+    assert message is not None
+    assert message.content == "some fake content"
+    assert message.tool_calls
+    assert message.tool_calls[0].tool_name == "a_fake_tool"
+    mock_instance.chat.assert_awaited_once_with(
+        model="llama3.2",
+        messages=[OllamaMessage(role="user", content="Some new input.")],
+        tools=None,
+        think=False,
+        stream=True,
+    )
+
+
+@pytest.mark.asyncio
+@patch("llm_agents_from_scratch.llms.ollama.llm.AsyncClient")
+async def test_stream_continue_chat_with_tool_results(
+    mock_async_client_class: MagicMock,
+) -> None:
+    """Tests tool results are sent and the response streamed."""
+    parts = [
+        ChatResponse(
+            model="llama3.2",
+            message=OllamaMessage(role="assistant", content="done"),
+        ),
+    ]
+    mock_instance = MagicMock()
+    mock_instance.chat = AsyncMock(return_value=_aiter(parts))
+    mock_async_client_class.return_value = mock_instance
+    llm = OllamaLLM(model="llama3.2")
+    result = ToolCallResult(tool_call_id="1", content="2")
+
+    chunks = [
+        c
+        async for c in llm.stream_continue_chat_with_tool_results(
+            [result],
+            chat_history=[],
+        )
+    ]
+
+    assert chunks[-1].message
+    assert chunks[-1].message.content == "done"
+    sent = mock_instance.chat.call_args.kwargs["messages"]
+    assert sent == [
+        chat_message_to_ollama_message(
+            ChatMessage.from_tool_call_result(result),
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+@patch("llm_agents_from_scratch.llms.ollama.llm.AsyncClient")
+async def test_stream_complete(mock_async_client_class: MagicMock) -> None:
+    """Tests stream_complete yields generated text as it arrives."""
+    parts = [
+        GenerateResponse(model="llama3.2", response="fake "),
+        GenerateResponse(model="llama3.2", response="response"),
+    ]
+    mock_instance = MagicMock()
+    mock_instance.generate = AsyncMock(return_value=_aiter(parts))
+    mock_async_client_class.return_value = mock_instance
+    llm = OllamaLLM(model="llama3.2")
+
+    deltas = [d async for d in llm.stream_complete("prompt")]
+
+    assert deltas == ["fake ", "response"]
+    mock_instance.generate.assert_awaited_once_with(
+        model="llama3.2",
+        prompt="prompt",
+        stream=True,
+    )
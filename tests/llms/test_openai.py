@@ -3,7 +3,7 @@
 from importlib.util import find_spec
 from itertools import chain
 from pathlib import Path
-from typing import Literal
+from typing import Any, AsyncIterator, Literal
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -346,3 +346,109 @@ def test_chat_message_to_openai_response_input_param_raises_error() -> None:
 
     with pytest.raises(DataConversionError, match=msg):
         chat_message_to_openai_response_input_param(invalid_chat_message)
+
+
+@pytest.mark.skipif(not openai_installed, reason="openai is not installed")
+@patch("openai.AsyncOpenAI")
+def test_prompt_cache_kwargs(mock_async_client_class: MagicMock) -> None:
+    """Tests that the cache key is sent as prompt_cache_key."""
+    llm = OpenAILLM("gpt-5.2")
+
+    assert llm.prompt_cache_kwargs("some-key") == {
+        "prompt_cache_key": "some-key",
+    }
+
+
+async def _aiter(items: list) -> AsyncIterator:
+    for item in items:
+        yield item
+
+
+def _delta_event(delta: str) -> Any:
+    from openai.types.responses import ResponseTextDeltaEvent  # noqa: PLC0415
+
+    return ResponseTextDeltaEvent(
+        type="response.output_text.delta",
+        delta=delta,
+        content_index=0,
+        item_id="msg_1",
+        logprobs=[],
+        output_index=0,
+        sequence_number=0,
+    )
+
+
+def _completed_event(response: Any) -> Any:
+    from openai.types.responses import ResponseCompletedEvent  # noqa: PLC0415
+
+    return ResponseCompletedEvent(
+        type="response.completed",
+        response=response,
+        sequence_number=0,
+    )
+
+
+@pytest.mark.skipif(not openai_installed, reason="openai is not installed")
+@pytest.mark.asyncio
+@patch("openai.AsyncOpenAI")
+async def test_stream_chat(mock_async_client_class: MagicMock) -> None:
+    """Tests stream_chat yields text deltas, then the completed message."""
+    from openai import omit  # noqa: PLC0415
+    from openai.types.responses import Response  # noqa: PLC0415
+
+    with open(TEST_DATA_PATH / "mock_response_for_chat.json", "r") as f:
+        mock_response = Response.model_validate_json(f.read())
+    events = [
+        MagicMock(type="response.created"),
+        _delta_event("Hello! "),
+        _delta_event("How can I..."),
+        _completed_event(mock_response),
+    ]
+    mock_instance = MagicMock()
+    mock_instance.responses.create = AsyncMock(return_value=_aiter(events))
+    mock_async_client_class.return_value = mock_instance
+    llm = OpenAILLM("gpt-5.2")
+
+    chunks = [c async for c in llm.stream_chat("Some new input.")]
+
+    assert [c.delta for c in chunks[:-1]] == ["Hello! ", "How can I..."]
+    assert chunks[-1].message
+    assert chunks[-1].message.content == "Hello! How can I help you today?"
+    mock_instance.responses.create.assert_awaited_once_with(
+        model="gpt-5.2",
+        instructions=None,
+        input=[
+            {"type": "message", "content": "Some new input.", "role": "user"},
+        ],
+        tools=omit,
+        stream=True,
+    )
+
+
+@pytest.mark.skipif(not openai_installed, reason="openai is not installed")
+@pytest.mark.asyncio
+@patch("openai.AsyncOpenAI")
+async def test_stream_complete(mock_async_client_class: MagicMock) -> None:
+    """Tests stream_complete yields only text deltas."""
+    from openai.types.responses import Response  # noqa: PLC0415
+
+    with open(TEST_DATA_PATH / "mock_response_for_chat.json", "r") as f:
+        mock_response = Response.model_validate_json(f.read())
+    events = [
+        _delta_event("fake "),
+        _delta_event("response"),
+        _completed_event(mock_response),
+    ]
+    mock_instance = MagicMock()
+    mock_instance.responses.create = AsyncMock(return_value=_aiter(events))
+    mock_async_client_class.return_value = mock_instance
+    llm = OpenAILLM("gpt-5.2")
+
+    deltas = [d async for d in llm.stream_complete("prompt")]
+
+    assert deltas == ["fake ", "response"]
+    mock_instance.responses.create.assert_awaited_once_with(
+        model="gpt-5.2",
+        input="prompt",
+        stream=True,
+    )
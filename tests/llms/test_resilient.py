@@ -0,0 +1,195 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from llm_agents_from_scratch.base.llm import WrappedLLM
+from llm_agents_from_scratch.errors import ResilienceError
+from llm_agents_from_scratch.llms import (
+    ResilientLLM,
+    ScriptedLLM,
+    is_retryable,
+)
+
+
+class FlakyLLM(WrappedLLM):
+    """Raises the given errors, then answers; sleeps per call if asked."""
+
+    def __init__(
+        self,
+        errors: list[Exception] | None = None,
+        latencies: list[float] | None = None,
+    ) -> None:
+        super().__init__(ScriptedLLM(final_answer="ok"))
+        self.errors = list(errors or [])
+        self.latencies = list(latencies or [])
+        self.calls = 0
+
+    async def _invoke(self, method: str, **kwargs: Any) -> Any:
+        self.calls += 1
+        if self.latencies:
+            await asyncio.sleep(self.latencies.pop(0))
+        if self.errors:
+            raise self.errors.pop(0)
+        return await self._call_wrapped(method, **kwargs)
+
+
+class StatusError(Exception):
+    """Provider error carrying an HTTP status."""
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class APITimeoutError(Exception):
+    """Provider timeout recognised by class name."""
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (TimeoutError(), True),
+        (ConnectionResetError(), True),
+        (StatusError(429), True),
+        (StatusError(503), True),
+        (StatusError(400), False),
+        (StatusError(401), False),
+        (APITimeoutError(), True),
+        (ValueError("bad output"), False),
+    ],
+)
+def test_is_retryable(error: Exception, expected: bool) -> None:
+    """Tests transient errors are told apart from permanent ones."""
+    assert is_retryable(error) is expected
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors() -> None:
+    """Tests retryable errors are retried until the call succeeds."""
+    inner = FlakyLLM(errors=[StatusError(503), TimeoutError()])
+    llm = ResilientLLM(inner, max_retries=2, base_delay=0.001)
+
+    result = await llm.complete("hi")
+
+    assert result.response == "ok"
+    assert inner.calls == 3  # noqa: PLR2004
+    stats = llm.stats()
+    assert stats.calls == 1
+    assert stats.retries == 2  # noqa: PLR2004
+    assert stats.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_permanent_errors() -> None:
+    """Tests non-retryable errors are raised unchanged at once."""
+    inner = FlakyLLM(errors=[StatusError(400)])
+    llm = ResilientLLM(inner, base_delay=0.001)
+
+    with pytest.raises(StatusError):
+        await llm.complete("hi")
+
+    assert inner.calls == 1
+    assert llm.stats().failures == 1
+
+
+@pytest.mark.asyncio
+async def test_raises_last_error_when_retries_exhausted() -> None:
+    """Tests the last retryable error is raised after max_retries."""
+    inner = FlakyLLM(errors=[StatusError(503)] * 3)
+    llm = ResilientLLM(inner, max_retries=1, base_delay=0.001)
+
+    with pytest.raises(StatusError):
+        await llm.complete("hi")
+
+    assert inner.calls == 2  # noqa: PLR2004
+    assert llm.stats().retries == 1
+
+
+@pytest.mark.asyncio
+async def test_custom_retry_on() -> None:
+    """Tests retry_on overrides the error classification."""
+    inner = FlakyLLM(errors=[ValueError("bad output")])
+    llm = ResilientLLM(
+        inner,
+        base_delay=0.001,
+        retry_on=lambda e: isinstance(e, ValueError),
+    )
+
+    assert (await llm.complete("hi")).response == "ok"
+    assert inner.calls == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_hedge_wins_over_slow_request() -> None:
+    """Tests a slow request is hedged and the faster hedge answers."""
+    inner = FlakyLLM(latencies=[1.0, 0.0])
+    llm = ResilientLLM(inner, hedge_after=0.02)
+
+    result = await asyncio.wait_for(llm.complete("hi"), timeout=0.5)
+
+    assert result.response == "ok"
+    assert inner.calls == 2  # noqa: PLR2004
+    stats = llm.stats()
+    assert stats.hedges == 1
+    assert stats.hedge_wins == 1
+    assert stats.p99 < 0.5  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_fast_request_is_not_hedged() -> None:
+    """Tests requests answering before the hedge delay are not hedged."""
+    inner = FlakyLLM()
+    llm = ResilientLLM(inner, hedge_after=0.5)
+
+    await llm.complete("hi")
+
+    assert inner.calls == 1
+    assert llm.stats().hedges == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_to_second_backend() -> None:
+    """Tests hedge requests go to hedge_llm when given."""
+    primary = FlakyLLM(latencies=[1.0])
+    backup = FlakyLLM()
+    llm = ResilientLLM(primary, hedge_after=0.01, hedge_llm=backup)
+
+    await asyncio.wait_for(llm.complete("hi"), timeout=0.5)
+
+    assert primary.calls == 1
+    assert backup.calls == 1
+    assert llm.stats().hedge_wins == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_delay_follows_latency_percentile() -> None:
+    """Tests the hedge delay switches to the observed percentile."""
+    inner = FlakyLLM(latencies=[0.0] * 5)
+    llm = ResilientLLM(
+        inner,
+        hedge_after=1.0,
+        hedge_percentile=0.9,
+        min_samples=5,
+    )
+    assert llm.hedge_delay() == 1.0
+
+    for _ in range(5):
+        await llm.complete("hi")
+
+    assert llm.hedge_delay() == pytest.approx(0.0, abs=0.01)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_retries": -1},
+        {"hedge_percentile": 1.0},
+        {"hedge_llm": ScriptedLLM()},
+        {"min_samples": 10, "latency_window": 5},
+    ],
+)
+def test_invalid_settings_raise(kwargs: dict[str, Any]) -> None:
+    """Tests misconfiguration raises ResilienceError."""
+    with pytest.raises(ResilienceError):
+        ResilientLLM(ScriptedLLM(), **kwargs)
@@ -0,0 +1,97 @@
+from typing import Any
+
+import pytest
+
+from llm_agents_from_scratch import LLMAgent
+from llm_agents_from_scratch.base.llm import WrappedLLM
+from llm_agents_from_scratch.data_structures import LLMCallSite, Task
+from llm_agents_from_scratch.llms import LLMRouter, ScriptedLLM, llm_site
+
+
+class RecordingLLM(WrappedLLM):
+    """Records the kwargs of every call."""
+
+    def __init__(self, model: str) -> None:
+        super().__init__(ScriptedLLM(model=model))
+        self.model = model
+        self.kwargs: list[dict[str, Any]] = []
+
+    async def _invoke(self, method: str, **kwargs: Any) -> Any:
+        self.kwargs.append(kwargs)
+        return await self._call_wrapped(method, **kwargs)
+
+    def prompt_cache_kwargs(self, cache_key: str) -> dict[str, Any]:
+        return {f"{self.model}_cache_key": cache_key}
+
+
+@pytest.mark.asyncio
+async def test_agent_calls_are_routed_by_site() -> None:
+    """Tests TaskHandler calls reach the LLM of their call site."""
+    executor = ScriptedLLM(["done"], model="strong")
+    router_llm = ScriptedLLM(model="cheap")
+    llm = LLMRouter(
+        executor,
+        routes={LLMCallSite.GET_NEXT_STEP: router_llm},
+    )
+    agent = LLMAgent(llm=llm)
+
+    await agent.run(Task(instruction="do it"), skills_scopes=[])
+
+    assert router_llm.calls["structured_output"] >= 1
+    assert executor.calls["structured_output"] == 0
+    assert executor.calls["chat"] >= 1
+    stats = llm.stats()
+    assert stats["get_next_step"].model == "cheap"
+    assert stats["get_next_step"].calls == router_llm.calls["structured_output"]
+    assert stats["run_step"].model == "strong"
+    assert all(s.errors == 0 for s in stats.values())
+
+
+@pytest.mark.asyncio
+async def test_site_options_and_default_route() -> None:
+    """Tests site options are merged in and unrouted calls use llm."""
+    default = RecordingLLM("default")
+    cheap = RecordingLLM("cheap")
+    llm = LLMRouter(
+        default,
+        routes={"triage": cheap},
+        options={"triage": {"temperature": 0}},
+    )
+
+    with llm_site("triage"):
+        await llm.complete("a")
+    await llm.complete("b")
+
+    assert cheap.kwargs == [{"prompt": "a", "temperature": 0}]
+    assert default.kwargs == [{"prompt": "b"}]
+    assert set(llm.stats()) == {"triage", "default"}
+
+
+@pytest.mark.asyncio
+async def test_prompt_cache_kwargs_come_from_routed_llm() -> None:
+    """Tests prompt cache kwargs are built by the LLM a call goes to."""
+    default = RecordingLLM("default")
+    cheap = RecordingLLM("cheap")
+    llm = LLMRouter(default, routes={LLMCallSite.PLAN: cheap})
+    cache_kwargs = llm.prompt_cache_kwargs("k")
+
+    with llm_site(LLMCallSite.PLAN):
+        await llm.complete("a", **cache_kwargs)
+    await llm.complete("b", **cache_kwargs)
+
+    assert cheap.kwargs == [{"prompt": "a", "cheap_cache_key": "k"}]
+    assert default.kwargs == [{"prompt": "b", "default_cache_key": "k"}]
+
+
+@pytest.mark.asyncio
+async def test_streams_are_routed() -> None:
+    """Tests streaming calls are routed and counted like the others."""
+    cheap = ScriptedLLM(final_answer="fast", model="cheap")
+    llm = LLMRouter(ScriptedLLM(), routes={"triage": cheap})
+
+    with llm_site("triage"):
+        deltas = [d async for d in llm.stream_complete("a")]
+
+    assert "".join(deltas) == "fast"
+    assert cheap.calls["complete"] == 1
+    assert llm.stats()["triage"].calls == 1
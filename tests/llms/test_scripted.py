@@ -0,0 +1,192 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from llm_agents_from_scratch.agent import LLMAgent
+from llm_agents_from_scratch.data_structures import (
+    NextStepDecision,
+    StepMode,
+    Task,
+    Timeouts,
+    ToolCall,
+    ToolCallResult,
+)
+from llm_agents_from_scratch.llms import LatencyModel, ScriptedLLM
+from llm_agents_from_scratch.tools import SimpleFunctionTool
+
+
+def add(x: int, y: int) -> int:
+    """Add two numbers."""
+    return x + y
+
+
+class Verdict(BaseModel):
+    ok: bool = False
+
+
+def _script() -> list[str | ToolCall]:
+    return [ToolCall(tool_name="add", arguments={"x": 1, "y": 2}), "3"]
+
+
+@pytest.mark.asyncio
+async def test_chat_follows_script() -> None:
+    """Tests that chat turns follow the script, then the final answer."""
+    llm = ScriptedLLM(_script(), final_answer="all done")
+
+    _, first = await llm.chat("go")
+    tool_messages, second = await llm.continue_chat_with_tool_results(
+        [ToolCallResult(tool_call_id="1", content=3)],
+        chat_history=[],
+    )
+    _, third = await llm.chat("again")
+
+    assert first.tool_calls
+    assert first.tool_calls[0].tool_name == "add"
+    assert len(tool_messages) == 1
+    assert second.content == "3"
+    assert third.content == "all done"
+    assert llm.calls == {"chat": 2, "continue_chat_with_tool_results": 1}
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_get_fresh_ids() -> None:
+    """Tests that each played tool call gets a new id."""
+    script = [ToolCall(tool_name="add", arguments={"x": 1, "y": 2})] * 2
+    llm = ScriptedLLM(script)
+
+    _, first = await llm.chat("go")
+    _, second = await llm.chat("go")
+
+    assert first.tool_calls and second.tool_calls
+    assert first.tool_calls[0].id_ != second.tool_calls[0].id_
+
+
+@pytest.mark.asyncio
+async def test_structured_output_routes_by_script_position() -> None:
+    """Tests next-step routing and configured structured outputs."""
+    llm = ScriptedLLM(["only turn"], structured_outputs={"Verdict": {"ok": 1}})
+
+    before = await llm.structured_output("?", mdl=NextStepDecision)
+    await llm.chat("go")
+    after = await llm.structured_output("?", mdl=NextStepDecision)
+
+    assert before.kind == "next_step"
+    assert after.kind == "final_result"
+    assert (await llm.structured_output("?", mdl=Verdict)).ok
+
+
+@pytest.mark.asyncio
+async def test_each_asyncio_task_follows_script_from_start() -> None:
+    """Tests that concurrent tasks each see the whole script."""
+    llm = ScriptedLLM(["a", "b"])
+
+    async def _play() -> list[str]:
+        return [(await llm.chat("go"))[1].content for _ in range(2)]
+
+    results = await asyncio.gather(_play(), _play())
+
+    assert results == [["a", "b"], ["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_agent_runs_scripted_plan() -> None:
+    """Tests that an agent executes the scripted tool calls."""
+    llm = ScriptedLLM(_script())
+    agent = LLMAgent(llm=llm, tools=[SimpleFunctionTool(add)])
+
+    handler = agent.run(Task(instruction="add 1 and 2"), skills_scopes=[])
+    result = await handler
+
+    assert result.content == "3"
+    assert llm.calls["continue_chat_with_tool_results"] == 1
+
+
+@pytest.mark.asyncio
+async def test_agent_run_keeps_position_across_its_tasks() -> None:
+    """Tests that tasks spawned by a run (e.g. deadlines) share its place."""
+    llm = ScriptedLLM(_script())
+    agent = LLMAgent(
+        llm=llm,
+        tools=[SimpleFunctionTool(add)],
+        # asyncio.wait_for runs each call in a new task on Python < 3.12
+        timeouts=Timeouts(task=10, step=10, llm_call=10, tool_call=10),
+    )
+
+    tasks = [Task(instruction="add 1 and 2") for _ in range(2)]
+    results = [
+        await handler
+        for handler in [agent.run(task, skills_scopes=[]) for task in tasks]
+    ]
+
+    assert [r.content for r in results] == ["3", "3"]
+    assert llm.calls["chat"] == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_planned_steps_share_the_run_position() -> None:
+    """Tests that concurrent plan steps advance one script, not one each."""
+    script = ["first", "second", "answer"]
+    plan = {
+        "steps": [
+            {"id": "a", "instruction": "add 1 and 2"},
+            {"id": "b", "instruction": "add 1 and 2 again"},
+        ],
+    }
+    llm = ScriptedLLM(script, structured_outputs={"TaskPlan": plan})
+    agent = LLMAgent(llm=llm)
+
+    handler = agent.run(
+        Task(instruction="add twice"),
+        skills_scopes=[],
+        step_mode=StepMode.PLANNED,
+    )
+    result = await handler
+
+    # the answering step plays the turn after both plan steps' turns
+    assert result.content == "answer"
+    assert handler.step_counter == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_latency_is_simulated() -> None:
+    """Tests that each call sleeps for a sampled latency."""
+    llm = ScriptedLLM(latency=LatencyModel(mean=0.25))
+
+    with patch(
+        "llm_agents_from_scratch.llms.scripted.llm.asyncio.sleep",
+    ) as mock_sleep:
+        await llm.complete("hi")
+        await llm.complete("hi")
+
+    mock_sleep.assert_called_with(0.25)
+    assert llm.simulated_latency == 0.5  # noqa: PLR2004
+
+    llm.reset()
+    assert llm.simulated_latency == 0
+    assert not llm.calls
+
+
+@pytest.mark.parametrize(
+    "distribution",
+    ["constant", "uniform", "normal", "lognormal"],
+)
+def test_latency_model_samples(distribution: str) -> None:
+    """Tests that samples are non-negative and reproducible by seed."""
+    first = LatencyModel(distribution, mean=0.2, stddev=0.3, seed=7)
+    second = LatencyModel(distribution, mean=0.2, stddev=0.3, seed=7)
+
+    samples = [first.sample() for _ in range(50)]
+
+    assert all(s >= 0 for s in samples)
+    assert samples == [second.sample() for _ in range(50)]
+
+
+def test_latency_model_lognormal_mean() -> None:
+    """Tests that lognormal samples have roughly the requested mean."""
+    model = LatencyModel("lognormal", mean=0.2, stddev=0.1, seed=0)
+
+    samples = [model.sample() for _ in range(5000)]
+
+    assert sum(samples) / len(samples) == pytest.approx(0.2, rel=0.05)
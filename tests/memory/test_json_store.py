@@ -1,28 +1,47 @@
 """Unit tests for JSONMemoryStore."""
 
+import asyncio
 import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
 
 from llm_agents_from_scratch.data_structures import Task, TaskResult
-from llm_agents_from_scratch.data_structures.memory import Episode, RecallMode
-from llm_agents_from_scratch.errors import EpisodeNotFoundError
+from llm_agents_from_scratch.data_structures.memory import (
+    Durability,
+    Episode,
+    RecallMode,
+)
+from llm_agents_from_scratch.errors import (
+    EpisodeNotFoundError,
+    MemoryStoreError,
+)
 from llm_agents_from_scratch.memory import JSONMemoryStore
+from llm_agents_from_scratch.memory_stores import json as json_store
 
 
 def make_episode(
     instruction: str = "do something",
     content: str = "done",
+    completed_at: datetime | None = None,
 ) -> Episode:
     task = Task(instruction=instruction)
     return Episode(
         task=task,
         rollout="",
         result=TaskResult(task_id=task.id_, content=content),
+        completed_at=completed_at or datetime.now(),
     )
 
 
+def read_lines(path: Path) -> list[dict]:
+    return [json.loads(ln) for ln in path.read_text().splitlines()]
+
+
 def test_init_empty_when_file_missing(tmp_path: Path) -> None:
     """Tests store starts empty when backing file does not exist."""
     store = JSONMemoryStore(dir=tmp_path)
@@ -185,6 +204,7 @@ async def test_delete_removes_episode(tmp_path: Path) -> None:
     await store.delete(ep.id_)
 
     assert await store.count() == 0
+    await store.compact()
     assert store.path.read_text() == ""
 
 
@@ -259,3 +279,440 @@ async def test_update_warns_when_id_not_found(tmp_path: Path) -> None:
 
     with pytest.raises(EpisodeNotFoundError):
         await store.update(ep)
+
+
+# --- index, tombstones and compaction ---
+
+
+def test_invalid_compact_ratio_raises(tmp_path: Path) -> None:
+    """Tests compact_ratio outside (0, 1] raises MemoryStoreError."""
+    with pytest.raises(MemoryStoreError):
+        JSONMemoryStore(dir=tmp_path, compact_ratio=0)
+
+
+@pytest.mark.asyncio
+async def test_read_recent_orders_by_completed_at(tmp_path: Path) -> None:
+    """Tests recency follows completed_at, not write order."""
+    now = datetime.now()
+    store = JSONMemoryStore(dir=tmp_path)
+    await store.write(make_episode("newest", completed_at=now))
+    await store.write(
+        make_episode("oldest", completed_at=now - timedelta(hours=2)),
+    )
+    await store.write(
+        make_episode("middle", completed_at=now - timedelta(hours=1)),
+    )
+
+    recent = await store._read_recent(3)
+
+    assert [e.task.instruction for e in recent] == [
+        "newest",
+        "middle",
+        "oldest",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_mutations_append_records(tmp_path: Path) -> None:
+    """Tests update and delete append a record rather than rewrite."""
+    store = JSONMemoryStore(dir=tmp_path, compact_ratio=1.0)
+    ep1 = make_episode("first")
+    ep2 = make_episode("second")
+    await store.write(ep1)
+    await store.write(ep2)
+
+    await store.update(ep1.model_copy(update={"rollout": "updated"}))
+    await store.delete(ep2.id_)
+
+    records = read_lines(store.path)
+    assert len(records) == 4  # noqa: PLR2004
+    assert records[2]["rollout"] == "updated"
+    assert records[3] == {"deleted_id_": ep2.id_}
+    assert store.garbage_ratio == 0.75  # noqa: PLR2004
+
+    reloaded = JSONMemoryStore(dir=tmp_path)
+    assert [e.id_ for e in reloaded._episodes] == [ep1.id_]
+    assert reloaded._episodes[0].rollout == "updated"
+
+
+@pytest.mark.asyncio
+async def test_garbage_ratio_triggers_compaction(tmp_path: Path) -> None:
+    """Tests enough dead records compact the file in the background."""
+    store = JSONMemoryStore(dir=tmp_path, compact_ratio=0.5)
+    episodes = [make_episode(f"task {i}") for i in range(4)]
+    for ep in episodes:
+        await store.write(ep)
+
+    await store.delete(episodes[0].id_)
+    assert store._compaction is None  # 2 of 5 records dead
+    await store.delete(episodes[1].id_)
+    assert store._compaction is not None  # 4 of 6 records dead
+    await store._compaction
+
+    assert [r["id_"] for r in read_lines(store.path)] == [
+        episodes[2].id_,
+        episodes[3].id_,
+    ]
+    assert store.garbage_ratio == 0
+    recent = await store._read_recent(2)
+    assert [e.id_ for e in recent] == [episodes[3].id_, episodes[2].id_]
+
+
+@pytest.mark.asyncio
+async def test_compaction_keeps_records_appended_while_running(
+    tmp_path: Path,
+) -> None:
+    """Tests mutations made during compaction survive the swap."""
+    store = JSONMemoryStore(dir=tmp_path, compact_ratio=1.0)
+    old = make_episode("old")
+    doomed = make_episode("doomed")
+    await store.write(old)
+    await store.write(doomed)
+    await store.update(old.model_copy(update={"rollout": "v2"}))
+
+    compaction = asyncio.create_task(store._compact())
+    await asyncio.sleep(0)  # copying in a worker thread
+    assert not compaction.done()
+    new = make_episode("new")
+    await store.write(new)
+    await store.delete(doomed.id_)
+    await compaction
+
+    assert await store.count() == 2  # noqa: PLR2004
+    assert {e.task.instruction for e in store._episodes} == {"old", "new"}
+    assert (await store._read_recent(2))[1].rollout == "v2"
+    reloaded = JSONMemoryStore(dir=tmp_path)
+    assert {e.id_ for e in reloaded._episodes} == {old.id_, new.id_}
+    assert not list(tmp_path.glob(".*"))
+
+
+@pytest.mark.asyncio
+async def test_reads_during_compaction_swap(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests reads wait for a swap rather than use the old offsets."""
+    store = JSONMemoryStore(dir=tmp_path, compact_ratio=1.0)
+    episodes = [make_episode(f"task {i}") for i in range(3)]
+    for ep in episodes:
+        await store.write(ep)
+    await store.delete(episodes[0].id_)
+    swapped = threading.Event()
+    swap_in = store._swap_in
+
+    def slow_swap_in(*args: object) -> None:
+        swap_in(*args)  # type: ignore[arg-type]
+        swapped.set()
+        time.sleep(0.05)
+
+    monkeypatch.setattr(store, "_swap_in", slow_swap_in)
+    compaction = asyncio.create_task(store.compact())
+    await asyncio.to_thread(swapped.wait)
+
+    recent = await store._read_recent(5)
+    summary = await store.summary()
+    await compaction
+
+    assert [e.id_ for e in recent] == [episodes[2].id_, episodes[1].id_]
+    assert "task 2" in summary
+    assert "task 1" in summary
+
+
+# --- segments and lazy loading ---
+
+
+@pytest.mark.asyncio
+async def test_rolls_segments_by_size(tmp_path: Path) -> None:
+    """Tests a new segment starts once the newest reaches its size limit."""
+    store = JSONMemoryStore(dir=tmp_path, segment_max_bytes=1)
+    for i in range(3):
+        await store.write(make_episode(f"task {i}"))
+
+    names = [s.name for s in store.segments]
+    assert names == [
+        "episodes.000001.jsonl",
+        "episodes.000002.jsonl",
+        "episodes.000003.jsonl",
+    ]
+    assert all(len(read_lines(tmp_path / n)) == 1 for n in names)
+    assert (tmp_path / "episodes.manifest.json").exists()
+    assert store.segments[0].records == 1
+    assert store.segments[0].max_completed_at is not None
+
+    reloaded = JSONMemoryStore(dir=tmp_path)
+    assert [s.name for s in reloaded.segments] == names
+    assert [e.task.instruction for e in reloaded._episodes] == [
+        "task 0",
+        "task 1",
+        "task 2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rolls_segments_by_age(tmp_path: Path) -> None:
+    """Tests a new segment starts once the newest reaches its age limit."""
+    store = JSONMemoryStore(dir=tmp_path, segment_max_age=timedelta(hours=1))
+    await store.write(make_episode("old"))
+    await store.write(make_episode("old too"))
+    store.segments[-1].created_at -= timedelta(hours=2)
+
+    await store.write(make_episode("new"))
+
+    assert len(store.segments) == 2  # noqa: PLR2004
+    assert [s.records for s in store.segments] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_adopts_single_file_as_first_segment(tmp_path: Path) -> None:
+    """Tests an existing single-file store becomes the first segment."""
+    store = JSONMemoryStore(dir=tmp_path)
+    await store.write(make_episode("legacy"))
+
+    segmented = JSONMemoryStore(dir=tmp_path, segment_max_bytes=1)
+    await segmented.write(make_episode("new"))
+
+    assert [s.name for s in segmented.segments] == [
+        "episodes.jsonl",
+        "episodes.000001.jsonl",
+    ]
+    recent = await JSONMemoryStore(dir=tmp_path)._read_recent(2)
+    assert [e.task.instruction for e in recent] == ["new", "legacy"]
+
+
+@pytest.mark.asyncio
+async def test_recent_recall_reads_only_newest_segment(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests recall reads the newest segment backwards, without an index."""
+    store = JSONMemoryStore(dir=tmp_path, segment_max_bytes=2_000)
+    for i in range(9):  # three segments of three
+        await store.write(make_episode(f"task {i}", content="x" * 500))
+    reloaded = JSONMemoryStore(dir=tmp_path, max_results=2)
+    read: list[str] = []
+    reverse_lines = json_store._reverse_lines
+
+    def spy(path: Path) -> object:
+        read.append(path.name)
+        return reverse_lines(path)
+
+    monkeypatch.setattr(json_store, "_reverse_lines", spy)
+
+    recent = await reloaded.recall("ignored")
+
+    assert [e.task.instruction for e in recent] == ["task 8", "task 7"]
+    assert read == [reloaded.segments[-1].name]
+    assert reloaded._entries is None
+
+
+@pytest.mark.asyncio
+async def test_recent_recall_across_out_of_order_segments(
+    tmp_path: Path,
+) -> None:
+    """Tests segments written out of completion order are all considered."""
+    store = JSONMemoryStore(dir=tmp_path, segment_max_bytes=1)
+    now = datetime.now()
+    for name, hours_ago in [("a", 3), ("b", 23), ("c", 21)]:
+        await store.write(
+            make_episode(name, completed_at=now - timedelta(hours=hours_ago)),
+        )
+    assert len(store.segments) == 3  # noqa: PLR2004
+
+    reloaded = JSONMemoryStore(dir=tmp_path)
+    scanned = await reloaded._read_recent(1)
+    await reloaded.count()  # builds the index
+    indexed = await reloaded._read_recent(1)
+
+    assert [e.task.instruction for e in scanned] == ["a"]
+    assert [e.task.instruction for e in indexed] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_recent_recall_skips_deleted_and_superseded(
+    tmp_path: Path,
+) -> None:
+    """Tests reading backwards honours later updates and tombstones."""
+    store = JSONMemoryStore(dir=tmp_path, compact_ratio=1.0)
+    ep1 = make_episode("first")
+    ep2 = make_episode("second")
+    await store.write(ep1)
+    await store.write(ep2)
+    await store.update(ep1.model_copy(update={"rollout": "updated"}))
+    await store.delete(ep2.id_)
+
+    recent = await JSONMemoryStore(dir=tmp_path)._read_recent(5)
+
+    assert [(e.id_, e.rollout) for e in recent] == [(ep1.id_, "updated")]
+
+
+def test_reverse_lines_across_blocks(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests lines split over read blocks come back whole, with offsets."""
+    path = tmp_path / "log.jsonl"
+    data = b'{"a": 1}\n\n{"b": 22}\n{"c": 333}'
+    path.write_bytes(data)
+    monkeypatch.setattr(json_store, "_BLOCK_SIZE", 4)
+
+    lines = list(json_store._reverse_lines(path))
+
+    assert [line for _, line in lines] == [
+        b'{"c": 333}',
+        b'{"b": 22}',
+        b'{"a": 1}',
+    ]
+    assert all(data[o : o + len(line)] == line for o, line in lines)
+
+
+@pytest.mark.asyncio
+async def test_compaction_drops_empty_segments(tmp_path: Path) -> None:
+    """Tests sealed segments left without live records are removed."""
+    store = JSONMemoryStore(dir=tmp_path, segment_max_bytes=1)
+    episodes = [make_episode(f"task {i}") for i in range(3)]
+    for ep in episodes:
+        await store.write(ep)
+    first = store.segments[0].name
+
+    await store.delete(episodes[0].id_)
+    await store.compact()
+
+    assert first not in [s.name for s in store.segments]
+    assert not (tmp_path / first).exists()
+    reloaded = JSONMemoryStore(dir=tmp_path)
+    assert await reloaded.count() == 2  # noqa: PLR2004
+    assert await reloaded.count() == await store.count()
+
+
+@pytest.mark.asyncio
+async def test_compaction_swaps_segments_off_the_loop(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests the compaction swap runs on the I/O thread, not the loop."""
+    store = JSONMemoryStore(dir=tmp_path, segment_max_bytes=1)
+    threads: list[threading.Thread] = []
+    drop_empty_segments = store._drop_empty_segments
+
+    def spy() -> None:
+        threads.append(threading.current_thread())
+        drop_empty_segments()
+
+    monkeypatch.setattr(store, "_drop_empty_segments", spy)
+    episodes = [make_episode(f"task {i}") for i in range(3)]
+    for ep in episodes:
+        await store.write(ep)
+
+    await store.delete(episodes[0].id_)
+    await store.compact()
+
+    assert threads
+    assert all(t is not threading.main_thread() for t in threads)
+    assert await store.count() == 2  # noqa: PLR2004
+
+
+# --- group commit and durability ---
+
+
+def test_negative_commit_window_raises(tmp_path: Path) -> None:
+    """Tests a negative commit_window raises MemoryStoreError."""
+    with pytest.raises(MemoryStoreError):
+        JSONMemoryStore(dir=tmp_path, commit_window=-1)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_share_one_append(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests concurrent writes are appended together, off the loop thread."""
+    store = JSONMemoryStore(dir=tmp_path)
+    threads: list[threading.Thread] = []
+    append_batch = store._append_batch
+
+    def spy(lines: list[bytes]) -> list[tuple[str, int]]:
+        threads.append(threading.current_thread())
+        return append_batch(lines)
+
+    monkeypatch.setattr(store, "_append_batch", spy)
+    episodes = [make_episode(f"task {i}") for i in range(20)]
+
+    await asyncio.gather(*[store.write(ep) for ep in episodes])
+
+    assert len(threads) == 1
+    assert threads[0] is not threading.main_thread()
+    assert len(read_lines(store.path)) == 20  # noqa: PLR2004
+    assert await store.count() == 20  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_durability_none_returns_before_append(tmp_path: Path) -> None:
+    """Tests Durability.NONE only queues, and reads still see the write."""
+    store = JSONMemoryStore(dir=tmp_path, durability=Durability.NONE)
+    ep = make_episode()
+
+    await store.write(ep)
+
+    assert not store.path.exists()
+    assert [e.id_ for e in await store._read_recent(1)] == [ep.id_]
+    assert store.path.exists()
+
+
+@pytest.mark.asyncio
+async def test_durability_fsync_syncs_each_batch(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests Durability.FSYNC fsyncs once per append."""
+    synced: list[int] = []
+    monkeypatch.setattr(os, "fsync", synced.append)
+    store = JSONMemoryStore(dir=tmp_path, durability=Durability.FSYNC)
+
+    await asyncio.gather(*[store.write(make_episode()) for _ in range(5)])
+    await store.write(make_episode())
+
+    assert len(synced) == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_failed_append_raises_in_writer(tmp_path: Path) -> None:
+    """Tests an append error reaches the writers of its batch."""
+    store = JSONMemoryStore(dir=tmp_path / "missing")
+
+    with pytest.raises(FileNotFoundError):
+        await store.write(make_episode())
+
+
+def test_queued_writes_land_at_loop_shutdown(tmp_path: Path) -> None:
+    """Tests records still queued when asyncio.run() ends are written."""
+    store = JSONMemoryStore(dir=tmp_path, durability=Durability.NONE)
+
+    async def main() -> None:
+        for i in range(3):
+            await store.write(make_episode(f"task {i}"))
+
+    asyncio.run(main())
+
+    assert len(read_lines(store.path)) == 3  # noqa: PLR2004
+
+
+def test_batch_waiting_for_lock_lands_at_loop_shutdown(
+    tmp_path: Path,
+) -> None:
+    """Tests a batch taken from the queue but not yet submitted is written."""
+    store = JSONMemoryStore(dir=tmp_path, durability=Durability.NONE)
+    waiting: list[asyncio.Future[None] | None] = []
+
+    async def main() -> None:
+        await store._lock.acquire()  # as a compaction swapping files does
+        await store.write(make_episode("task"))
+        await asyncio.sleep(0)  # the committer waits for the lock
+        waiting.append(store._inflight_done)
+
+    asyncio.run(main())
+
+    assert len(read_lines(store.path)) == 1
+    done = waiting[0]
+    assert done is not None
+    assert done.done()
+    assert done.exception() is None
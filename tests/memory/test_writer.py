@@ -0,0 +1,131 @@
+"""Unit tests for MemoryWriter."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llm_agents_from_scratch.data_structures import Task, TaskResult
+from llm_agents_from_scratch.data_structures.memory import Episode
+from llm_agents_from_scratch.errors import MemoryWriterError
+from llm_agents_from_scratch.memory import Memory, MemoryWriter
+
+
+def make_episode(instruction: str = "do something") -> Episode:
+    task = Task(instruction=instruction)
+    return Episode(
+        task=task,
+        rollout="",
+        result=TaskResult(task_id=task.id_, content="done"),
+    )
+
+
+def make_memory(delay: float = 0.0) -> AsyncMock:
+    memory = AsyncMock(spec=Memory)
+
+    async def record(episode: Episode) -> None:
+        await asyncio.sleep(delay)
+
+    memory.record.side_effect = record
+    return memory
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_pending": 0}, {"max_workers": 0}],
+)
+def test_invalid_settings_raise(kwargs: dict[str, int]) -> None:
+    """Tests misconfiguration raises MemoryWriterError."""
+    with pytest.raises(MemoryWriterError):
+        MemoryWriter(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_submit_then_flush_records_episode() -> None:
+    """Tests submitted episodes are recorded into every memory."""
+    memories = [make_memory(0.01), make_memory()]
+    writer = MemoryWriter()
+    episode = make_episode()
+
+    await writer.submit(memories, episode)
+    assert writer.pending == 1
+    await writer.flush()
+
+    for memory in memories:
+        memory.record.assert_awaited_once_with(episode)
+    assert writer.pending == 0
+    assert writer.written == 2  # noqa: PLR2004
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_write_is_counted_and_reported() -> None:
+    """Tests a failing memory is logged, counted and passed to on_error."""
+    err = RuntimeError("store down")
+    bad = AsyncMock(spec=Memory)
+    bad.record.side_effect = err
+    good = make_memory()
+    on_error = MagicMock()
+    writer = MemoryWriter(on_error=on_error)
+    episode = make_episode()
+
+    await writer.submit([bad, good], episode)
+    await writer.flush()
+
+    assert writer.written == 1
+    assert writer.failed == 1
+    assert list(writer.failures) == [(episode, err)]
+    on_error.assert_called_once_with(bad, episode, err)
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_failing_on_error_does_not_stop_the_worker() -> None:
+    """Tests a raising on_error is logged and later episodes still land."""
+    bad = AsyncMock(spec=Memory)
+    bad.record.side_effect = RuntimeError("store down")
+    good = make_memory()
+    writer = MemoryWriter(on_error=MagicMock(side_effect=ValueError("oops")))
+
+    await writer.submit([bad], make_episode())
+    await writer.submit([good], make_episode())
+    await asyncio.wait_for(writer.flush(), timeout=1)
+
+    assert writer.failed == 1
+    assert writer.written == 1
+    assert writer.pending == 0
+    await asyncio.wait_for(writer.close(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_submit_waits_when_queue_is_full() -> None:
+    """Tests submit() applies backpressure at max_pending."""
+    memory = make_memory(0.05)
+    writer = MemoryWriter(max_pending=1)
+
+    await writer.submit([memory], make_episode())  # picked up by the worker
+    await asyncio.sleep(0)
+    await writer.submit([memory], make_episode())  # fills the queue
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(
+            writer.submit([memory], make_episode()),
+            timeout=0.01,
+        )
+
+    await writer.close()
+    assert memory.record.await_count == 2  # noqa: PLR2004
+
+
+def test_queued_episodes_are_written_at_loop_shutdown() -> None:
+    """Tests episodes still queued when asyncio.run() ends are written."""
+    memory = make_memory(0.01)
+    writer = MemoryWriter()
+
+    async def main() -> None:
+        for _ in range(3):
+            await writer.submit([memory], make_episode())
+
+    asyncio.run(main())
+
+    assert memory.record.await_count == 3  # noqa: PLR2004
+    assert writer.pending == 0
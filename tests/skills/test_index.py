@@ -0,0 +1,185 @@
+"""Unit tests for the persistent skill index."""
+
+import json
+import os
+import warnings
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from llm_agents_from_scratch.data_structures.skill import SkillScope
+from llm_agents_from_scratch.errors import (
+    EmptySkillBodyError,
+    NameMismatchWarning,
+    SkillSkippedWarning,
+)
+from llm_agents_from_scratch.skills.discovery import (
+    discover_skills,
+    validate_skill_dir,
+)
+from llm_agents_from_scratch.skills.index import SkillIndex
+
+
+def _write_skill(skills_path: Path, dir_name: str, name: str) -> Path:
+    skill_dir = skills_path / dir_name
+    skill_dir.mkdir(exist_ok=True)
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text(
+        f"---\nname: {name}\ndescription: A test skill.\n---\nBody content.",
+    )
+    return skill_md
+
+
+@pytest.fixture
+def skills_path(tmp_path: Path) -> Path:
+    path = tmp_path / "skills"
+    path.mkdir()
+    _write_skill(path, "my-skill", "my-skill")
+    return path
+
+
+def _discover(skills_path: Path, index: SkillIndex) -> dict:
+    with patch(
+        "llm_agents_from_scratch.skills.discovery.get_skills_path",
+        return_value=skills_path,
+    ):
+        return discover_skills([SkillScope.PROJECT], index=index)
+
+
+def test_unchanged_skills_served_from_index(
+    skills_path: Path,
+    tmp_path: Path,
+) -> None:
+    """Tests a second process reuses the index without reading SKILL.md."""
+    index_path = tmp_path / "index.json"
+    first = _discover(skills_path, SkillIndex(index_path))
+    assert index_path.exists()
+
+    index = SkillIndex(index_path)
+    with patch(
+        "llm_agents_from_scratch.skills.index.validate_skill_dir",
+    ) as mock_validate:
+        second = _discover(skills_path, index)
+
+    mock_validate.assert_not_called()
+    assert index.hits == 1
+    assert index.misses == 0
+    assert second["my-skill"].frontmatter == first["my-skill"].frontmatter
+    assert second["my-skill"].location == first["my-skill"].location
+
+
+def test_changed_skill_is_revalidated(
+    skills_path: Path,
+    tmp_path: Path,
+) -> None:
+    """Tests a modified SKILL.md is re-read and the index updated."""
+    index = SkillIndex(tmp_path / "index.json")
+    _discover(skills_path, index)
+
+    skill_md = skills_path / "my-skill" / "SKILL.md"
+    skill_md.write_text(
+        "---\nname: my-skill\ndescription: Updated.\n---\nBody content.",
+    )
+    stat = skill_md.stat()
+    os.utime(skill_md, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    skills = _discover(skills_path, index)
+
+    assert index.misses == 2  # noqa: PLR2004
+    assert skills["my-skill"].frontmatter.description == "Updated."
+    reloaded = SkillIndex(tmp_path / "index.json")
+    assert _discover(skills_path, reloaded)["my-skill"].frontmatter == (
+        skills["my-skill"].frontmatter
+    )
+
+
+def test_cached_warnings_and_errors_are_reemitted(
+    skills_path: Path,
+    tmp_path: Path,
+) -> None:
+    """Tests cosmetic warnings and fatal errors survive the index."""
+    _write_skill(skills_path, "other-dir", "mismatched")
+    (skills_path / "empty").mkdir()
+    (skills_path / "empty" / "SKILL.md").write_text(
+        "---\nname: empty\ndescription: No body.\n---\n",
+    )
+    _discover(skills_path, SkillIndex(tmp_path / "index.json"))
+
+    index = SkillIndex(tmp_path / "index.json")
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        skills = _discover(skills_path, index)
+
+    assert index.misses == 0
+    assert set(skills) == {"my-skill", "mismatched"}
+    assert {type(w.message) for w in caught} == {
+        NameMismatchWarning,
+        SkillSkippedWarning,
+    }
+    with pytest.raises(EmptySkillBodyError):
+        index.validate(skills_path / "empty")
+
+
+def test_removed_skills_are_pruned(
+    skills_path: Path,
+    tmp_path: Path,
+) -> None:
+    """Tests entries of deleted skills are dropped from the index."""
+    index = SkillIndex(tmp_path / "index.json")
+    _write_skill(skills_path, "gone", "gone")
+    _discover(skills_path, index)
+    assert len(index.entries) == 2  # noqa: PLR2004
+
+    (skills_path / "gone" / "SKILL.md").unlink()
+    (skills_path / "gone").rmdir()
+    _discover(skills_path, index)
+
+    saved = json.loads((tmp_path / "index.json").read_text())
+    assert list(saved["entries"]) == [
+        str((skills_path / "my-skill" / "SKILL.md").resolve()),
+    ]
+
+
+def test_unreadable_index_is_ignored(
+    skills_path: Path,
+    tmp_path: Path,
+) -> None:
+    """Tests a corrupt or outdated index file is rebuilt."""
+    index_path = tmp_path / "index.json"
+    index_path.write_text("not json")
+
+    index = SkillIndex(index_path)
+    skills = _discover(skills_path, index)
+
+    assert "my-skill" in skills
+    assert index.misses == 1
+    assert json.loads(index_path.read_text())["version"] == 1
+
+
+def test_save_skips_unchanged_index(
+    skills_path: Path,
+    tmp_path: Path,
+) -> None:
+    """Tests the index file is only rewritten when it changed."""
+    index_path = tmp_path / "index.json"
+    _discover(skills_path, SkillIndex(index_path))
+    mtime = index_path.stat().st_mtime_ns
+
+    with patch("llm_agents_from_scratch.skills.index.os.replace") as mock:
+        _discover(skills_path, SkillIndex(index_path))
+
+    mock.assert_not_called()
+    assert index_path.stat().st_mtime_ns == mtime
+
+
+def test_validate_matches_validate_skill_dir(
+    skills_path: Path,
+    tmp_path: Path,
+) -> None:
+    """Tests the index is a drop-in replacement for validate_skill_dir."""
+    index = SkillIndex(tmp_path / "index.json")
+    skill_dir = skills_path / "my-skill"
+
+    assert index.validate(skill_dir) == validate_skill_dir(skill_dir)
+    assert index.validate(skill_dir) == validate_skill_dir(skill_dir)
+    assert index.hits == 1
@@ -1,13 +1,40 @@
 """Unit tests for the logging module."""
 
 import logging
+from pathlib import Path
+from typing import Iterator
+
+import pytest
 
 from llm_agents_from_scratch.logger import (
+    ROOT_LOGGER_NAME,
     ColoredFormatter,
+    Lazy,
     current_subagent_name,
+    disable_console_logging,
+    disable_file_logging,
+    disable_queue_logging,
+    enable_console_logging,
+    enable_file_logging,
+    enable_queue_logging,
+    get_logger,
 )
 
 
+@pytest.fixture
+def library_logger() -> Iterator[logging.Logger]:
+    """The library logger, with its handlers and level restored afterwards."""
+    logger = logging.getLogger(ROOT_LOGGER_NAME)
+    handlers, level = list(logger.handlers), logger.level
+    logging.disable(logging.NOTSET)  # undo the suppress_logging fixture
+    yield logger
+    disable_queue_logging()
+    disable_file_logging()
+    disable_console_logging()
+    logger.handlers = handlers
+    logger.setLevel(level)
+
+
 def make_record(msg: str = "a message") -> logging.LogRecord:
     return logging.LogRecord(
         name="llm_agents_fs.TaskHandler",
@@ -46,3 +73,80 @@ def test_colored_formatter_prefix_reverts_after_reset() -> None:
     formatted = ColoredFormatter().format(make_record())
 
     assert "[hailstone]" not in formatted
+
+
+def test_lazy_argument_only_computed_when_emitted(
+    library_logger: logging.Logger,
+) -> None:
+    """Tests Lazy defers its call until a handler emits the record."""
+    calls = []
+
+    def expensive() -> str:
+        calls.append(1)
+        return "expensive"
+
+    library_logger.setLevel(logging.INFO)
+    logger = get_logger("test")
+    logger.debug("value: %s", Lazy(expensive))
+    assert calls == []
+
+    library_logger.setLevel(logging.DEBUG)
+    records: list[str] = []
+    library_logger.addHandler(_ListHandler(records))
+    logger.debug("value: %s", Lazy(expensive))
+
+    assert calls == [1]
+    assert records == ["value: expensive"]
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self, records: list[str]) -> None:
+        super().__init__()
+        self.records = records
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(self.format(record))
+
+
+def test_file_logging_writes_untruncated_records(
+    library_logger: logging.Logger,
+    tmp_path: Path,
+) -> None:
+    """Tests file logging appends full records and survives console toggles."""
+    path = tmp_path / "agent.log"
+    enable_file_logging(path, level="DEBUG")
+    enable_console_logging("DEBUG")
+    disable_console_logging()
+
+    get_logger("test").debug("x" * 500)
+    disable_file_logging()
+
+    line = path.read_text(encoding="utf-8").strip()
+    assert line.endswith("DEBUG (llm_agents_fs.test) " + "x" * 500)
+
+
+def test_queue_logging_writes_from_listener_thread(
+    library_logger: logging.Logger,
+    tmp_path: Path,
+) -> None:
+    """Tests queued records reach the handlers with their subagent name."""
+    path = tmp_path / "agent.log"
+    enable_file_logging(path)
+    enable_queue_logging()
+    assert not any(
+        isinstance(h, logging.FileHandler) for h in library_logger.handlers
+    )
+
+    token = current_subagent_name.set("hailstone")
+    try:
+        get_logger("test").info("from %s", "subagent")
+    finally:
+        current_subagent_name.reset(token)
+    disable_queue_logging()  # flushes the queue
+
+    assert any(
+        isinstance(h, logging.FileHandler) for h in library_logger.handlers
+    )
+    line = path.read_text(encoding="utf-8").strip()
+    assert line.startswith("[hailstone] ")
+    assert line.endswith("from subagent")
@@ -1,6 +1,8 @@
 """Unit tests for default tools."""
 
 import asyncio
+import json
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -144,7 +146,8 @@ def test_python_interpreter_tool_parameters_json_schema() -> None:
     assert "required" not in schema
 
 
-def test_python_interpreter_tool_runs_script(tmp_path: Path) -> None:
+@pytest.mark.asyncio
+async def test_python_interpreter_tool_runs_script(tmp_path: Path) -> None:
     """Tests PythonInterpreterTool returns stdout of a script."""
     script = tmp_path / "hello.py"
     script.write_text('print("hello from script")')
@@ -154,13 +157,14 @@ def test_python_interpreter_tool_runs_script(tmp_path: Path) -> None:
         arguments={"path": str(script)},
     )
 
-    result = tool(tool_call=tool_call)
+    result = await tool(tool_call=tool_call)
 
     assert result.error is False
     assert "hello from script" in result.content
 
 
-def test_python_interpreter_tool_error_on_missing_script(
+@pytest.mark.asyncio
+async def test_python_interpreter_tool_error_on_missing_script(
     tmp_path: Path,
 ) -> None:
     """Tests PythonInterpreterTool returns error for non-existent script."""
@@ -170,13 +174,58 @@ def test_python_interpreter_tool_error_on_missing_script(
         arguments={"path": str(tmp_path / "missing.py")},
     )
 
-    result = tool(tool_call=tool_call)
+    result = await tool(tool_call=tool_call)
 
     assert result.error is True
     assert "FileNotFoundError" in result.content
 
 
-def test_python_interpreter_tool_error_on_missing_path_and_code() -> None:
+@pytest.mark.asyncio
+async def test_python_interpreter_tool_kills_script_on_timeout() -> None:
+    """Tests PythonInterpreterTool returns an error when the script hangs."""
+    tool = PythonInterpreterTool(timeout=0.5)
+    tool_call = ToolCall(
+        tool_name="from_scratch__python_interpreter",
+        arguments={"code": "import time\ntime.sleep(30)"},
+    )
+
+    result = await tool(tool_call=tool_call)
+
+    assert result.error is True
+    assert json.loads(result.content)["error_type"] == "TimeoutError"
+
+
+@pytest.mark.asyncio
+async def test_python_interpreter_tool_kills_script_on_cancel(
+    tmp_path: Path,
+) -> None:
+    """Tests cancelling a call, e.g. at a deadline, kills the script."""
+    pid_file = tmp_path / "pid"
+    tool = PythonInterpreterTool()
+    tool_call = ToolCall(
+        tool_name="from_scratch__python_interpreter",
+        arguments={
+            "code": (
+                "import os, pathlib, time\n"
+                f"pathlib.Path({str(pid_file)!r}).write_text(str(os.getpid()))\n"
+                "time.sleep(30)"
+            ),
+        },
+    )
+
+    call = asyncio.create_task(tool(tool_call=tool_call))
+    while not (pid_file.exists() and pid_file.read_text()):
+        await asyncio.sleep(0.01)
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+
+    with pytest.raises(ProcessLookupError):
+        os.kill(int(pid_file.read_text()), 0)
+
+
+@pytest.mark.asyncio
+async def test_python_interpreter_tool_error_on_missing_path_and_code() -> None:
     """Tests PythonInterpreterTool returns error when neither path nor code."""
     tool = PythonInterpreterTool()
     tool_call = ToolCall(
@@ -184,13 +233,14 @@ def test_python_interpreter_tool_error_on_missing_path_and_code() -> None:
         arguments={},
     )
 
-    result = tool(tool_call=tool_call)
+    result = await tool(tool_call=tool_call)
 
     assert result.error is True
     assert "Missing" in result.content
 
 
-def test_python_interpreter_tool_runs_inline_code() -> None:
+@pytest.mark.asyncio
+async def test_python_interpreter_tool_runs_inline_code() -> None:
     """Tests PythonInterpreterTool executes inline code via 'code' param."""
     tool = PythonInterpreterTool()
     tool_call = ToolCall(
@@ -198,13 +248,14 @@ def test_python_interpreter_tool_runs_inline_code() -> None:
         arguments={"code": 'print("hello from inline")'},
     )
 
-    result = tool(tool_call=tool_call)
+    result = await tool(tool_call=tool_call)
 
     assert result.error is False
     assert "hello from inline" in result.content
 
 
-def test_python_interpreter_tool_inline_code_imports_from_cwd(
+@pytest.mark.asyncio
+async def test_python_interpreter_tool_inline_code_imports_from_cwd(
     tmp_path: Path,
 ) -> None:
     """Tests inline code can import modules from cwd."""
@@ -218,13 +269,14 @@ def test_python_interpreter_tool_inline_code_imports_from_cwd(
         },
     )
 
-    result = tool(tool_call=tool_call)
+    result = await tool(tool_call=tool_call)
 
     assert result.error is False
     assert "42" in result.content
 
 
-def test_python_interpreter_tool_inline_code_error() -> None:
+@pytest.mark.asyncio
+async def test_python_interpreter_tool_inline_code_error() -> None:
     """Tests inline code that raises returns a RuntimeError result."""
     tool = PythonInterpreterTool()
     tool_call = ToolCall(
@@ -232,13 +284,14 @@ def test_python_interpreter_tool_inline_code_error() -> None:
         arguments={"code": "raise ValueError('boom')"},
     )
 
-    result = tool(tool_call=tool_call)
+    result = await tool(tool_call=tool_call)
 
     assert result.error is True
     assert "RuntimeError" in result.content
 
 
-def test_python_interpreter_tool_error_on_script_failure(
+@pytest.mark.asyncio
+async def test_python_interpreter_tool_error_on_script_failure(
     tmp_path: Path,
 ) -> None:
     """Tests PythonInterpreterTool returns error when script raises."""
@@ -250,13 +303,14 @@ def test_python_interpreter_tool_error_on_script_failure(
         arguments={"path": str(script)},
     )
 
-    result = tool(tool_call=tool_call)
+    result = await tool(tool_call=tool_call)
 
     assert result.error is True
     assert "RuntimeError" in result.content
 
 
-def test_python_interpreter_tool_passes_stdin(tmp_path: Path) -> None:
+@pytest.mark.asyncio
+async def test_python_interpreter_tool_passes_stdin(tmp_path: Path) -> None:
     """Tests PythonInterpreterTool pipes stdin text into the script."""
     script = tmp_path / "echo_stdin.py"
     script.write_text("import sys\nprint(sys.stdin.read().strip())")
@@ -266,7 +320,7 @@ def test_python_interpreter_tool_passes_stdin(tmp_path: Path) -> None:
         arguments={"path": str(script), "stdin": "hello stdin"},
     )
 
-    result = tool(tool_call=tool_call)
+    result = await tool(tool_call=tool_call)
 
     assert result.error is False
     assert "hello stdin" in result.content
@@ -104,8 +104,8 @@ def test_function_tool_init() -> None:
     assert tool.func == my_mock_fn_1
 
 
-@patch("llm_agents_from_scratch.tools.utils.validate")
-def test_function_tool_call(mock_validate: MagicMock) -> None:
+@patch("llm_agents_from_scratch.tools.utils.get_validator")
+def test_function_tool_call(mock_get_validator: MagicMock) -> None:
     """Tests a function tool call."""
     tool = SimpleFunctionTool(my_mock_fn_1, desc="mock desc")
     tool_call = ToolCall(
@@ -116,9 +116,9 @@ def test_function_tool_call(mock_validate: MagicMock) -> None:
     result = tool(tool_call=tool_call)
 
     assert result.content == "1 and y"
-    mock_validate.assert_called_once_with(
+    mock_get_validator.assert_called_once_with(tool.parameters_json_schema)
+    mock_get_validator.return_value.iter_errors.assert_called_once_with(
         tool_call.arguments,
-        schema=tool.parameters_json_schema,
     )
     assert result.error is False
 
@@ -174,8 +174,8 @@ def test_async_function_tool_init() -> None:
 
 
 @pytest.mark.asyncio
-@patch("llm_agents_from_scratch.tools.utils.validate")
-async def test_async_function_tool_call(mock_validate: MagicMock) -> None:
+@patch("llm_agents_from_scratch.tools.utils.get_validator")
+async def test_async_function_tool_call(mock_get_validator: MagicMock) -> None:
     """Tests a function tool call."""
     tool = AsyncSimpleFunctionTool(my_mock_fn_3, desc="mock desc")
     tool_call = ToolCall(
@@ -186,9 +186,9 @@ async def test_async_function_tool_call(mock_validate: MagicMock) -> None:
     result = await tool(tool_call=tool_call)
 
     assert result.content == "1 and y"
-    mock_validate.assert_called_once_with(
+    mock_get_validator.assert_called_once_with(tool.parameters_json_schema)
+    mock_get_validator.return_value.iter_errors.assert_called_once_with(
         tool_call.arguments,
-        schema=tool.parameters_json_schema,
     )
     assert result.error is False
 
@@ -230,3 +230,18 @@ async def test_async_function_tool_call_returns_execution_error() -> None:
     )
     assert expected_content == result.content
     assert result.error is True
+
+
+def test_function_tool_schema_computed_once() -> None:
+    """Tests the parameters JSON schema is computed once per tool."""
+    tool = SimpleFunctionTool(my_mock_fn_1)
+
+    with patch(
+        "llm_agents_from_scratch.tools.simple_function."
+        "function_signature_to_json_schema",
+    ) as mock_to_schema:
+        first = tool.parameters_json_schema
+        second = tool.parameters_json_schema
+
+    assert first is second
+    mock_to_schema.assert_called_once_with(my_mock_fn_1)
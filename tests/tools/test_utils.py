@@ -0,0 +1,111 @@
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from llm_agents_from_scratch.data_structures import ToolCall
+from llm_agents_from_scratch.tools import SimpleFunctionTool
+from llm_agents_from_scratch.tools.utils import (
+    cached_tool_payload,
+    get_validator,
+    validate_tool_call_arguments,
+)
+
+
+def my_fn(x: int, y: str = "a") -> str:
+    """My fn."""
+    return f"{x}{y}"
+
+
+def test_get_validator_compiles_schema_once() -> None:
+    """Tests the same schema object reuses its compiled validator."""
+    schema = {"type": "object", "properties": {"x": {"type": "number"}}}
+
+    with patch(
+        "llm_agents_from_scratch.tools.utils.validator_for",
+    ) as mock_validator_for:
+        first = get_validator(schema)
+        second = get_validator(schema)
+        get_validator(dict(schema))
+
+    assert first is second
+    assert mock_validator_for.call_count == 2  # noqa: PLR2004
+    assert mock_validator_for.return_value.check_schema.call_count == 2  # noqa: PLR2004
+
+
+def test_validate_tool_call_arguments_invalid_schema() -> None:
+    """Tests an invalid schema is reported as a SchemaError."""
+    tool_call = ToolCall(tool_name="my_fn", arguments={"x": 1})
+
+    details = validate_tool_call_arguments(tool_call, {"type": 1})
+
+    assert details is not None
+    assert details["error_type"] == "SchemaError"
+
+
+def test_validate_tool_call_arguments_with_cached_validator() -> None:
+    """Tests repeated validation against a cached schema stays correct."""
+    tool = SimpleFunctionTool(my_fn)
+    valid = ToolCall(tool_name="my_fn", arguments={"x": 1})
+    invalid = ToolCall(tool_name="my_fn", arguments={"y": "b"})
+
+    for _ in range(2):
+        assert (
+            validate_tool_call_arguments(valid, tool.parameters_json_schema)
+            is None
+        )
+        details = validate_tool_call_arguments(
+            invalid,
+            tool.parameters_json_schema,
+        )
+        assert details == {
+            "error_type": "ValidationError",
+            "message": "'x' is a required property",
+        }
+
+
+def test_cached_tool_payload_builds_once_per_provider() -> None:
+    """Tests payloads are cached per tool and provider."""
+    tool = SimpleFunctionTool(my_fn)
+    build = MagicMock(side_effect=lambda t: {"name": t.name})
+
+    first = cached_tool_payload(tool, "p1", build)
+    second = cached_tool_payload(tool, "p1", build)
+    cached_tool_payload(tool, "p2", build)
+
+    assert first is second
+    assert build.call_count == 2  # noqa: PLR2004
+
+
+def test_cached_tool_payload_rebuilds_when_tool_changes() -> None:
+    """Tests a changed description or schema object invalidates the cache."""
+    tool = MagicMock()
+    tool.name = "my_tool"
+    tool.description = "before"
+    tool.parameters_json_schema = {"type": "object"}
+    build = MagicMock(side_effect=lambda t: {"description": t.description})
+
+    cached_tool_payload(tool, "p", build)
+    tool.description = "after"
+    payload = cached_tool_payload(tool, "p", build)
+    tool.parameters_json_schema = {"type": "object"}
+    cached_tool_payload(tool, "p", build)
+
+    assert payload == {"description": "after"}
+    assert build.call_count == 3  # noqa: PLR2004
+
+
+def test_cached_tool_payload_unhashable_tool() -> None:
+    """Tests tools that cannot be cached are converted every time."""
+
+    class UnhashableTool(SimpleFunctionTool):
+        def __eq__(self, other: Any) -> bool:
+            return self is other
+
+        __hash__ = None  # type: ignore[assignment]
+
+    tool = UnhashableTool(my_fn)
+    build = MagicMock(return_value={})
+
+    cached_tool_payload(tool, "p", build)
+    cached_tool_payload(tool, "p", build)
+
+    assert build.call_count == 2  # noqa: PLR2004
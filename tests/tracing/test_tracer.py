@@ -0,0 +1,134 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from llm_agents_from_scratch.logger import current_subagent_name
+from llm_agents_from_scratch.tracing import Tracer, current_tracer, trace_span
+
+
+def test_span_nesting() -> None:
+    """Tests that spans opened inside others become their children."""
+    tracer = Tracer()
+
+    with tracer.span("parent", size=1) as parent, tracer.span("child") as child:
+        pass
+    with tracer.span("other_root") as other_root:
+        pass
+
+    assert [s.name for s in tracer.spans] == ["child", "parent", "other_root"]
+    assert parent.parent_span_id is None
+    assert child.parent_span_id == parent.span_id
+    assert child.trace_id == parent.trace_id
+    assert other_root.trace_id != parent.trace_id
+    assert parent.attributes == {"size": 1}
+    assert parent.end_time_ns is not None
+    assert parent.duration >= child.duration
+
+
+def test_span_records_error() -> None:
+    """Tests that an exception marks the span as failed and propagates."""
+    tracer = Tracer()
+
+    with pytest.raises(ValueError), tracer.span("failing"):
+        raise ValueError("boom")
+
+    span = tracer.spans[0]
+    assert span.status == "error"
+    assert span.error == "boom"
+    assert span.error_type == "ValueError"
+    assert str(span).endswith("[error: boom]")
+
+
+@pytest.mark.asyncio
+async def test_span_nesting_across_tasks() -> None:
+    """Tests that asyncio tasks created inside a span are its children."""
+    tracer = Tracer()
+
+    async def _child(name: str) -> None:
+        with tracer.span(name):
+            await asyncio.sleep(0)
+
+    with tracer.span("parent") as parent:
+        await asyncio.gather(_child("a"), _child("b"))
+
+    children = [s for s in tracer.spans if s.name in ("a", "b")]
+    assert len(children) == 2  # noqa: PLR2004
+    assert all(c.parent_span_id == parent.span_id for c in children)
+
+
+def test_span_tagged_with_subagent_name() -> None:
+    """Tests spans inside a subagent dispatch carry the subagent's name."""
+    tracer = Tracer()
+    token = current_subagent_name.set("researcher")
+    try:
+        with tracer.span("inside"):
+            pass
+    finally:
+        current_subagent_name.reset(token)
+
+    assert tracer.spans[0].attributes["agent.subagent"] == "researcher"
+
+
+def test_trace_span_without_tracer_is_noop() -> None:
+    """Tests that trace_span yields None when no tracer is set."""
+    with trace_span("untraced") as span:
+        assert span is None
+
+
+def test_trace_span_uses_current_tracer() -> None:
+    """Tests that trace_span records into the current tracer."""
+    tracer = Tracer()
+    token = current_tracer.set(tracer)
+    try:
+        with trace_span("traced", n=1) as span:
+            assert span is not None
+    finally:
+        current_tracer.reset(token)
+
+    assert tracer.spans == [span]
+
+
+def test_export_otlp_json(tmp_path: Path) -> None:
+    """Tests export to an OTLP JSON file."""
+    tracer = Tracer(service_name="my-agent")
+    with (
+        tracer.span("parent", count=2, ratio=0.5, ok=True, label="x"),
+        pytest.raises(RuntimeError),
+        tracer.span("child"),
+    ):
+        raise RuntimeError("boom")
+
+    path = tracer.export(tmp_path / "traces" / "trace.json")
+    payload = json.loads(path.read_text())
+
+    resource_spans = payload["resourceSpans"][0]
+    assert resource_spans["resource"]["attributes"][0] == {
+        "key": "service.name",
+        "value": {"stringValue": "my-agent"},
+    }
+    child, parent = resource_spans["scopeSpans"][0]["spans"]
+    assert child["parentSpanId"] == parent["spanId"]
+    assert "parentSpanId" not in parent
+    assert child["status"] == {"code": 2, "message": "boom"}
+    assert child["events"][0]["name"] == "exception"
+    assert parent["status"] == {"code": 1}
+    assert int(parent["endTimeUnixNano"]) >= int(parent["startTimeUnixNano"])
+    assert parent["attributes"] == [
+        {"key": "count", "value": {"intValue": "2"}},
+        {"key": "ratio", "value": {"doubleValue": 0.5}},
+        {"key": "ok", "value": {"boolValue": True}},
+        {"key": "label", "value": {"stringValue": "x"}},
+    ]
+
+
+def test_clear() -> None:
+    """Tests that clear drops finished spans."""
+    tracer = Tracer()
+    with tracer.span("span"):
+        pass
+
+    tracer.clear()
+
+    assert tracer.spans == []